@@ -0,0 +1,132 @@
+"""add materialized user points balances
+
+Revision ID: 0039_user_points_balances
+Revises: 0038_workflow_preset_telemetry
+Create Date: 2026-02-21 09:30:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0039_user_points_balances"
+down_revision: str | None = "0038_workflow_preset_telemetry"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+_BACKFILL_SQL = """
+WITH bounds AS (
+    SELECT
+        DATE_TRUNC('day', NOW() AT TIME ZONE 'UTC') AS day_start,
+        DATE_TRUNC('week', NOW() AT TIME ZONE 'UTC') AS week_start,
+        DATE_TRUNC('month', NOW() AT TIME ZONE 'UTC') AS month_start
+),
+ledger AS (
+    SELECT
+        points_ledger.*,
+        points_ledger.created_at AT TIME ZONE 'UTC' AS created_at_utc,
+        (
+            points_ledger.amount < 0
+            AND points_ledger.event_type::text IN (
+                'FEEDBACK_PRIORITY_BOOST',
+                'GUARANTOR_PRIORITY_BOOST',
+                'APPEAL_PRIORITY_BOOST'
+            )
+        ) AS is_redemption
+    FROM points_ledger
+)
+INSERT INTO user_points_balances (
+    user_id,
+    balance,
+    total_earned,
+    total_spent,
+    operations_count,
+    last_redemption_at,
+    redemption_day_start,
+    redemptions_day_count,
+    redemptions_day_spent,
+    redemption_week_start,
+    redemptions_week_count,
+    redemptions_week_spent,
+    redemption_month_start,
+    redemptions_month_count,
+    redemptions_month_spent
+)
+SELECT
+    ledger.user_id,
+    SUM(ledger.amount),
+    COALESCE(SUM(ledger.amount) FILTER (WHERE ledger.amount > 0), 0),
+    COALESCE(SUM(-ledger.amount) FILTER (WHERE ledger.amount < 0), 0),
+    COUNT(*),
+    MAX(ledger.created_at) FILTER (WHERE ledger.is_redemption),
+    bounds.day_start::date,
+    COUNT(*) FILTER (WHERE ledger.is_redemption AND ledger.created_at_utc >= bounds.day_start),
+    COALESCE(SUM(-ledger.amount) FILTER (WHERE ledger.is_redemption AND ledger.created_at_utc >= bounds.day_start), 0),
+    bounds.week_start::date,
+    COUNT(*) FILTER (WHERE ledger.is_redemption AND ledger.created_at_utc >= bounds.week_start),
+    COALESCE(SUM(-ledger.amount) FILTER (WHERE ledger.is_redemption AND ledger.created_at_utc >= bounds.week_start), 0),
+    bounds.month_start::date,
+    COUNT(*) FILTER (WHERE ledger.is_redemption AND ledger.created_at_utc >= bounds.month_start),
+    COALESCE(SUM(-ledger.amount) FILTER (WHERE ledger.is_redemption AND ledger.created_at_utc >= bounds.month_start), 0)
+FROM ledger
+CROSS JOIN bounds
+GROUP BY ledger.user_id, bounds.day_start, bounds.week_start, bounds.month_start
+ON CONFLICT (user_id) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("user_points_balances"):
+        op.create_table(
+            "user_points_balances",
+            sa.Column("user_id", sa.BigInteger(), nullable=False),
+            sa.Column("balance", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("total_earned", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("total_spent", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            sa.Column("operations_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("last_redemption_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("redemption_day_start", sa.Date(), nullable=True),
+            sa.Column("redemptions_day_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("redemptions_day_spent", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("redemption_week_start", sa.Date(), nullable=True),
+            sa.Column("redemptions_week_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("redemptions_week_spent", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("redemption_month_start", sa.Date(), nullable=True),
+            sa.Column("redemptions_month_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("redemptions_month_spent", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"],
+                ["users.id"],
+                name=op.f("fk_user_points_balances_user_id_users"),
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("user_id", name=op.f("pk_user_points_balances")),
+        )
+
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("user_points_balances"):
+        op.drop_table("user_points_balances")
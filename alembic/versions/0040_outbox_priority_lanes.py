@@ -0,0 +1,37 @@
+"""add priority lanes to integration outbox
+
+Revision ID: 0040_outbox_priority_lanes
+Revises: 0039_user_points_balances
+Create Date: 2026-02-22 10:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0040_outbox_priority_lanes"
+down_revision: str | None = "0039_user_points_balances"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "integration_outbox",
+        sa.Column("priority", sa.SmallInteger(), server_default=sa.text("50"), nullable=False),
+    )
+    # Existing rows are GitHub issue events, which belong to the background lane.
+    op.execute("UPDATE integration_outbox SET priority = 100 WHERE event_type = 'feedback.approved'")
+    op.create_index(
+        "ix_integration_outbox_claim",
+        "integration_outbox",
+        ["status", "priority", "next_retry_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_integration_outbox_claim", table_name="integration_outbox")
+    op.drop_column("integration_outbox", "priority")
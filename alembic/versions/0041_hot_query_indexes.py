@@ -0,0 +1,69 @@
+"""add composite indexes for bid, post and moderation log hot queries
+
+Revision ID: 0041_hot_query_indexes
+Revises: 0040_outbox_priority_lanes
+Create Date: 2026-02-23 09:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0041_hot_query_indexes"
+down_revision: str | None = "0040_outbox_priority_lanes"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+# bids and moderation_logs take writes on every bid; build without blocking them.
+# CONCURRENTLY cannot run inside a transaction, hence the autocommit blocks. If a
+# build fails it leaves an INVALID index behind; IF NOT EXISTS would keep it, so
+# drop it manually before re-running the upgrade.
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_bids_auction_live_amount",
+            "bids",
+            ["auction_id", sa.text("amount DESC"), "created_at"],
+            unique=False,
+            postgresql_where=sa.text("is_removed IS false"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_bids_user_created_at",
+            "bids",
+            ["user_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_moderation_logs_auction_created_at",
+            "moderation_logs",
+            ["auction_id", "created_at"],
+            unique=False,
+            postgresql_where=sa.text("auction_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        # Superseded by ix_bids_auction_live_amount; every amount-ordered query skips removed bids.
+        op.drop_index("ix_bids_auction_amount", table_name="bids", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_bids_auction_amount",
+            "bids",
+            ["auction_id", "amount"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_moderation_logs_auction_created_at",
+            table_name="moderation_logs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_bids_user_created_at", table_name="bids", postgresql_concurrently=True)
+        op.drop_index("ix_bids_auction_live_amount", table_name="bids", postgresql_concurrently=True)
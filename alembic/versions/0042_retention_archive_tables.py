@@ -0,0 +1,110 @@
+"""add archive tables for retention of bids, moderation logs and fraud signals
+
+Revision ID: 0042_retention_archive_tables
+Revises: 0041_hot_query_indexes
+Create Date: 2026-02-24 09:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0042_retention_archive_tables"
+down_revision: str | None = "0041_hot_query_indexes"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def _archived_at() -> sa.Column:
+    return sa.Column(
+        "archived_at",
+        sa.DateTime(timezone=True),
+        server_default=sa.text("TIMEZONE('utc', NOW())"),
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    moderation_action = postgresql.ENUM(name="moderation_action", create_type=False)
+
+    op.create_table(
+        "bids_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("auction_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("is_removed", sa.Boolean(), nullable=False),
+        sa.Column("removed_reason", sa.Text(), nullable=True),
+        sa.Column("removed_by_user_id", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        _archived_at(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_bids_archive_auction_created_at", "bids_archive", ["auction_id", "created_at"], unique=False
+    )
+    op.create_index("ix_bids_archive_user_created_at", "bids_archive", ["user_id", "created_at"], unique=False)
+
+    op.create_table(
+        "moderation_logs_archive",
+        sa.Column("id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("actor_user_id", sa.BigInteger(), nullable=False),
+        sa.Column("target_user_id", sa.BigInteger(), nullable=True),
+        sa.Column("auction_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("bid_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("action", moderation_action, nullable=False),
+        sa.Column("reason", sa.Text(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        _archived_at(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_moderation_logs_archive_auction_created_at",
+        "moderation_logs_archive",
+        ["auction_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_moderation_logs_archive_created_at", "moderation_logs_archive", ["created_at"], unique=False
+    )
+
+    op.create_table(
+        "fraud_signals_archive",
+        sa.Column("id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("auction_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("bid_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("reasons", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("queue_chat_id", sa.BigInteger(), nullable=True),
+        sa.Column("queue_message_id", sa.BigInteger(), nullable=True),
+        sa.Column("resolved_by_user_id", sa.BigInteger(), nullable=True),
+        sa.Column("resolution_note", sa.Text(), nullable=True),
+        sa.Column("resolved_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        _archived_at(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_fraud_signals_archive_auction_created_at",
+        "fraud_signals_archive",
+        ["auction_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    # Archived rows are dropped with their tables; move them back first if they are still needed.
+    op.drop_index("ix_fraud_signals_archive_auction_created_at", table_name="fraud_signals_archive")
+    op.drop_table("fraud_signals_archive")
+    op.drop_index("ix_moderation_logs_archive_created_at", table_name="moderation_logs_archive")
+    op.drop_index("ix_moderation_logs_archive_auction_created_at", table_name="moderation_logs_archive")
+    op.drop_table("moderation_logs_archive")
+    op.drop_index("ix_bids_archive_user_created_at", table_name="bids_archive")
+    op.drop_index("ix_bids_archive_auction_created_at", table_name="bids_archive")
+    op.drop_table("bids_archive")
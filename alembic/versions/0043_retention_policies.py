@@ -0,0 +1,70 @@
+"""add retention run log and hourly preset telemetry rollups
+
+Revision ID: 0043_retention_policies
+Revises: 0042_retention_archive_tables
+Create Date: 2026-02-25 09:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0043_retention_policies"
+down_revision: str | None = "0042_retention_archive_tables"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+def upgrade() -> None:
+    op.create_table(
+        "admin_queue_preset_telemetry_hourly",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("queue_context", sa.String(length=32), nullable=False),
+        sa.Column("queue_key", sa.String(length=32), nullable=False),
+        sa.Column("preset_id", sa.BigInteger(), nullable=True),
+        sa.Column("action", sa.String(length=32), nullable=False),
+        sa.Column("events_total", sa.Integer(), nullable=False),
+        sa.Column("time_to_action_sum_ms", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("time_to_action_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("filter_churn_sum", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("reopen_total", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_admin_queue_preset_telemetry_hourly_bucket",
+        "admin_queue_preset_telemetry_hourly",
+        ["bucket_start", "queue_context", "queue_key", sa.text("COALESCE(preset_id, 0)"), "action"],
+        unique=True,
+    )
+
+    op.create_table(
+        "retention_runs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("policy", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("rows_affected", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("batches", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint("status IN ('ok', 'error')", name="retention_runs_status_values"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_retention_runs_policy_started_at",
+        "retention_runs",
+        ["policy", "started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_retention_runs_policy_started_at", table_name="retention_runs")
+    op.drop_table("retention_runs")
+    op.drop_index(
+        "uq_admin_queue_preset_telemetry_hourly_bucket",
+        table_name="admin_queue_preset_telemetry_hourly",
+    )
+    op.drop_table("admin_queue_preset_telemetry_hourly")
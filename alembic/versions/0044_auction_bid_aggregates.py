@@ -0,0 +1,70 @@
+"""add denormalized bid aggregates to auctions
+
+Revision ID: 0044_auction_bid_aggregates
+Revises: 0043_retention_policies
+Create Date: 2026-03-02 10:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0044_auction_bid_aggregates"
+down_revision: str | None = "0043_retention_policies"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_BACKFILL = """
+    WITH live_bids AS (
+        SELECT auction_id, user_id, amount, created_at FROM bids WHERE is_removed IS false
+        UNION ALL
+        SELECT auction_id, user_id, amount, created_at FROM bids_archive WHERE is_removed IS false
+    ),
+    stats AS (
+        SELECT auction_id, count(*) AS bid_count, max(created_at) AS last_bid_at
+        FROM live_bids
+        GROUP BY auction_id
+    ),
+    top_bids AS (
+        SELECT DISTINCT ON (auction_id) auction_id, user_id, amount
+        FROM live_bids
+        ORDER BY auction_id, amount DESC, created_at ASC
+    )
+    UPDATE auctions
+    SET bid_count = stats.bid_count,
+        current_price = top_bids.amount,
+        top_bidder_user_id = (SELECT users.id FROM users WHERE users.id = top_bids.user_id),
+        last_bid_at = stats.last_bid_at
+    FROM stats
+    JOIN top_bids ON top_bids.auction_id = stats.auction_id
+    WHERE auctions.id = stats.auction_id
+"""
+
+
+def upgrade() -> None:
+    op.add_column("auctions", sa.Column("bid_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column("auctions", sa.Column("current_price", sa.Integer(), nullable=True))
+    op.add_column("auctions", sa.Column("top_bidder_user_id", sa.BigInteger(), nullable=True))
+    op.add_column("auctions", sa.Column("last_bid_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_foreign_key(
+        "auctions_top_bidder_user_id_fkey",
+        "auctions",
+        "users",
+        ["top_bidder_user_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    op.execute(_BACKFILL)
+    op.execute("UPDATE auctions SET current_price = start_price WHERE current_price IS NULL")
+    op.alter_column("auctions", "current_price", nullable=False)
+
+
+def downgrade() -> None:
+    op.drop_constraint("auctions_top_bidder_user_id_fkey", "auctions", type_="foreignkey")
+    op.drop_column("auctions", "last_bid_at")
+    op.drop_column("auctions", "top_bidder_user_id")
+    op.drop_column("auctions", "current_price")
+    op.drop_column("auctions", "bid_count")
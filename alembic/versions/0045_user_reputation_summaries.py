@@ -0,0 +1,88 @@
+"""add user reputation summaries rolled up from trade feedback
+
+Revision ID: 0045_user_reputation_summaries
+Revises: 0044_auction_bid_aggregates
+Create Date: 2026-03-04 11:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0045_user_reputation_summaries"
+down_revision: str | None = "0044_auction_bid_aggregates"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_RATING_COLUMNS = [f"visible_rating_{rating}" for rating in range(1, 6)]
+
+_BACKFILL_SQL = f"""
+INSERT INTO user_reputation_summaries (
+    user_id,
+    total_received,
+    visible_received,
+    hidden_received,
+    visible_rating_sum,
+    {", ".join(_RATING_COLUMNS)}
+)
+SELECT
+    target_user_id,
+    count(*),
+    count(*) FILTER (WHERE status = 'VISIBLE'),
+    count(*) FILTER (WHERE status <> 'VISIBLE'),
+    coalesce(sum(rating) FILTER (WHERE status = 'VISIBLE'), 0),
+    {", ".join(f"count(*) FILTER (WHERE status = 'VISIBLE' AND rating = {rating})" for rating in range(1, 6))}
+FROM trade_feedback
+GROUP BY target_user_id
+ON CONFLICT (user_id) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("user_reputation_summaries"):
+        op.create_table(
+            "user_reputation_summaries",
+            sa.Column("user_id", sa.BigInteger(), nullable=False),
+            sa.Column("total_received", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("visible_received", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("hidden_received", sa.Integer(), nullable=False, server_default=sa.text("0")),
+            sa.Column("visible_rating_sum", sa.BigInteger(), nullable=False, server_default=sa.text("0")),
+            *(
+                sa.Column(column, sa.Integer(), nullable=False, server_default=sa.text("0"))
+                for column in _RATING_COLUMNS
+            ),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.ForeignKeyConstraint(
+                ["user_id"],
+                ["users.id"],
+                name=op.f("fk_user_reputation_summaries_user_id_users"),
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("user_id", name=op.f("pk_user_reputation_summaries")),
+        )
+
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("user_reputation_summaries"):
+        op.drop_table("user_reputation_summaries")
@@ -0,0 +1,60 @@
+"""add chat metadata registry for post link rendering
+
+Revision ID: 0046_chat_metadata
+Revises: 0045_user_reputation_summaries
+Create Date: 2026-03-06 10:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0046_chat_metadata"
+down_revision: str | None = "0045_user_reputation_summaries"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("chat_metadata"):
+        op.create_table(
+            "chat_metadata",
+            sa.Column("chat_id", sa.BigInteger(), autoincrement=False, nullable=False),
+            sa.Column("chat_type", sa.String(length=32), nullable=False),
+            sa.Column("title", sa.Text(), nullable=True),
+            sa.Column("username", sa.String(length=64), nullable=True),
+            sa.Column("is_forum", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+            sa.Column("bot_status", sa.String(length=32), nullable=True),
+            sa.Column(
+                "refreshed_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("TIMEZONE('utc', NOW())"),
+                nullable=False,
+            ),
+            sa.PrimaryKeyConstraint("chat_id", name=op.f("pk_chat_metadata")),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if inspector.has_table("chat_metadata"):
+        op.drop_table("chat_metadata")
@@ -0,0 +1,25 @@
+"""add content hash of the last applied caption to auction posts
+
+Revision ID: 0047_auction_post_content_hash
+Revises: 0046_chat_metadata
+Create Date: 2026-03-08 10:00:00
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0047_auction_post_content_hash"
+down_revision: str | None = "0046_chat_metadata"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("auction_posts", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("auction_posts", "content_hash")
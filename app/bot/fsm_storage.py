@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage, StateType, StorageKey
+
+from app.infra.metrics import FSM_BACKEND_CALLS_PER_UPDATE
+
+_MISSING: Any = object()
+
+
+@dataclass(slots=True)
+class _CachedEntry:
+    state: str | None | Any = _MISSING
+    data: dict[str, Any] | Any = _MISSING
+    state_dirty: bool = False
+    data_dirty: bool = False
+
+
+@dataclass(slots=True)
+class _UpdateScope:
+    key: StorageKey
+    entry: _CachedEntry = field(default_factory=_CachedEntry)
+    backend_calls: int = 0
+    closed: bool = False
+
+
+_current_scope: ContextVar[_UpdateScope | None] = ContextVar("fsm_update_scope", default=None)
+
+
+def _state_name(state: StateType) -> str | None:
+    return state.state if isinstance(state, State) else state
+
+
+class UpdateScopedStorage(BaseStorage):
+    """Memoizes the FSM state and data of the locked key for the lifetime of one update.
+
+    Reads inside an ``UpdateScopedEventIsolation.lock`` hit the backend at most once
+    per key; writes are merged in memory and flushed by the isolation wrapper right
+    before the backend lock is released. Other keys, and calls made outside a lock
+    (background tasks, admin tooling), go straight to the backend.
+    """
+
+    def __init__(self, backend: BaseStorage) -> None:
+        self.backend = backend
+
+    def _entry(self, key: StorageKey) -> tuple[_UpdateScope, _CachedEntry] | None:
+        scope = _current_scope.get()
+        if scope is None or scope.closed or scope.key != key:
+            return None
+        return scope, scope.entry
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        cached = self._entry(key)
+        if cached is None:
+            await self.backend.set_state(key, state)
+            return
+        _, entry = cached
+        entry.state = _state_name(state)
+        entry.state_dirty = True
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        cached = self._entry(key)
+        if cached is None:
+            return await self.backend.get_state(key)
+        scope, entry = cached
+        if entry.state is _MISSING:
+            scope.backend_calls += 1
+            entry.state = await self.backend.get_state(key)
+        return entry.state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]) -> None:
+        cached = self._entry(key)
+        if cached is None:
+            await self.backend.set_data(key, data)
+            return
+        _, entry = cached
+        entry.data = copy.deepcopy(dict(data))
+        entry.data_dirty = True
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        cached = self._entry(key)
+        if cached is None:
+            return await self.backend.get_data(key)
+        scope, entry = cached
+        if entry.data is _MISSING:
+            scope.backend_calls += 1
+            entry.data = await self.backend.get_data(key)
+        return copy.deepcopy(entry.data)
+
+    async def flush(self, scope: _UpdateScope) -> None:
+        entry = scope.entry
+        if entry.state_dirty:
+            scope.backend_calls += 1
+            await self.backend.set_state(scope.key, entry.state)
+            entry.state_dirty = False
+        if entry.data_dirty:
+            scope.backend_calls += 1
+            await self.backend.set_data(scope.key, entry.data)
+            entry.data_dirty = False
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+class UpdateScopedEventIsolation(BaseEventIsolation):
+    """Wraps the backend lock so cached FSM writes land before the lock is released."""
+
+    def __init__(self, backend: BaseEventIsolation, storage: UpdateScopedStorage) -> None:
+        self.backend = backend
+        self.storage = storage
+
+    @asynccontextmanager
+    async def lock(self, key: StorageKey) -> AsyncGenerator[None, None]:
+        async with self.backend.lock(key):
+            scope = _UpdateScope(key=key)
+            token = _current_scope.set(scope)
+            try:
+                yield None
+            finally:
+                _current_scope.reset(token)
+                # Tasks spawned by the handler inherit the scope; once it is closed
+                # they talk to the backend directly instead of a cache nobody flushes.
+                scope.closed = True
+                try:
+                    await self.storage.flush(scope)
+                finally:
+                    FSM_BACKEND_CALLS_PER_UPDATE.observe(scope.backend_calls)
+
+    async def close(self) -> None:
+        await self.backend.close()
@@ -1,6 +1,7 @@
 from aiogram import Router
 
 from .bid_actions import router as bid_actions_router
+from .chat_metadata import router as chat_metadata_router
 from .create_auction import router as create_auction_router
 from .error_boundary import router as error_boundary_router
 from .emoji_tools import router as emoji_tools_router
@@ -28,5 +29,6 @@ router.include_router(publish_auction_router)
 router.include_router(trade_feedback_router)
 router.include_router(suggested_posts_router)
 router.include_router(moderation_router)
+router.include_router(chat_metadata_router)
 
 __all__ = ["router"]
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+import logging
 import re
 import uuid
 from datetime import datetime, timedelta, timezone
 
 from aiogram import Bot, F, Router
-from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
-from aiogram.types import CallbackQuery, InputMediaPhoto, Message
+from aiogram.types import CallbackQuery, Message
 
 from app.bot.keyboards.auction import open_auction_post_keyboard
 from app.bot.keyboards.moderation import complaint_actions_keyboard, fraud_actions_keyboard
 from app.config import settings
 from app.db.session import SessionFactory
+from app.infra.metrics import BID_CALLBACK_PHASE_SECONDS
 from app.services.anti_fool_service import (
     acquire_bid_cooldown,
     acquire_complaint_cooldown,
@@ -19,10 +20,8 @@ from app.services.anti_fool_service import (
     arm_or_confirm_action,
 )
 from app.services.auction_service import (
-    load_auction_photo_ids,
     resolve_auction_post_link,
     resolve_auction_post_url,
-    load_auction_view,
     process_bid_action,
     refresh_auction_posts,
 )
@@ -39,6 +38,7 @@ from app.services.complaint_service import (
     set_complaint_queue_message,
 )
 from app.services.moderation_checklist_service import ensure_checklist, render_checklist_block
+from app.services.gallery_delivery_service import GalleryDeliveryStatus, deliver_auction_gallery
 from app.services.fraud_service import (
     load_fraud_signal_view,
     render_fraud_signal_text,
@@ -67,10 +67,25 @@ from app.services.notification_copy_service import (
     outbid_notification_text,
     short_auction_ref,
 )
+from app.services.outbox_service import (
+    OutboxDeliveryContext,
+    OutboxHandler,
+    OutboxJob,
+    OutboxLane,
+    OutboxRetryPolicy,
+    deliver_each,
+    dispatch_outbox_event,
+    register_outbox_handler,
+)
 from app.services.user_service import upsert_user
 
+logger = logging.getLogger(__name__)
+
 router = Router(name="bid_actions")
 
+OUTBOX_EVENT_OUTBID_NOTIFICATION = "telegram.outbid_notification"
+OUTBOX_EVENT_AUCTION_FINISH_NOTIFICATION = "telegram.auction_finish_notification"
+
 
 async def _record_bid_funnel(
     *,
@@ -217,37 +232,22 @@ async def handle_gallery_action(callback: CallbackQuery, bot: Bot) -> None:
         await callback.answer("Некорректная галерея", show_alert=True)
         return
 
-    async with SessionFactory() as session:
-        view = await load_auction_view(session, auction_id)
-        if view is None:
-            await callback.answer("Лот не найден", show_alert=True)
-            return
-        photo_ids = await load_auction_photo_ids(session, auction_id)
-
-    if not photo_ids:
-        photo_ids = [view.auction.photo_file_id]
-
-    caption = f"Фото лота #{str(auction_id)[:8]}"
-    try:
-        if len(photo_ids) == 1:
-            await bot.send_photo(callback.from_user.id, photo=photo_ids[0], caption=caption)
-        else:
-            for chunk_start in range(0, len(photo_ids), 10):
-                chunk = photo_ids[chunk_start : chunk_start + 10]
-                media = [
-                    InputMediaPhoto(
-                        media=file_id,
-                        caption=caption if chunk_start == 0 and idx == 0 else None,
-                    )
-                    for idx, file_id in enumerate(chunk)
-                ]
-                await bot.send_media_group(chat_id=callback.from_user.id, media=media)
-    except TelegramForbiddenError:
+    result = await deliver_auction_gallery(bot, auction_id=auction_id, chat_id=callback.from_user.id)
+    if result.status == GalleryDeliveryStatus.NOT_FOUND:
+        await callback.answer("Лот не найден", show_alert=True)
+        return
+    if result.status == GalleryDeliveryStatus.FORBIDDEN:
         await callback.answer(_soft_gate_alert_text(), show_alert=True)
         return
-    except TelegramBadRequest:
+    if result.status == GalleryDeliveryStatus.FAILED:
         await callback.answer("Не удалось отправить фото. Попробуйте еще раз.", show_alert=True)
         return
+    if result.status == GalleryDeliveryStatus.THROTTLED:
+        await callback.answer("Слишком часто. Попробуйте через пару секунд.")
+        return
+    if result.status in {GalleryDeliveryStatus.POINTED, GalleryDeliveryStatus.IN_PROGRESS}:
+        await callback.answer("Фото уже в личке")
+        return
 
     await callback.answer("Отправил фото в личку")
 
@@ -325,11 +325,14 @@ async def _notify_outbid(
     *,
     auction_id: uuid.UUID,
     post_url: str | None,
+    retrying: bool = False,
+    raise_retry_after: bool = False,
 ) -> None:
     if outbid_user_tg_id is None or outbid_user_tg_id == actor_tg_id:
         return
 
-    if should_apply_notification_debounce(NotificationEventType.AUCTION_OUTBID):
+    # A retried delivery already passed (and consumed) the debounce gate on its first attempt.
+    if not retrying and should_apply_notification_debounce(NotificationEventType.AUCTION_OUTBID):
         if not await acquire_outbid_notification_debounce(auction_id, outbid_user_tg_id):
             await record_notification_suppressed(
                 event_type=NotificationEventType.AUCTION_OUTBID,
@@ -366,6 +369,7 @@ async def _notify_outbid(
                         reply_markup=reply_markup,
                         notification_event=NotificationEventType.AUCTION_OUTBID,
                         auction_id=auction_id,
+                        raise_retry_after=raise_retry_after,
                     )
             return
 
@@ -381,6 +385,7 @@ async def _notify_outbid(
         message_effect_id=resolve_auction_message_effect_id(AuctionMessageEffectEvent.OUTBID),
         notification_event=NotificationEventType.AUCTION_OUTBID,
         auction_id=auction_id,
+        raise_retry_after=raise_retry_after,
     )
 
 
@@ -391,6 +396,7 @@ async def _notify_auction_finish(
     seller_tg_id: int | None,
     auction_id: uuid.UUID,
     post_url: str | None,
+    raise_retry_after: bool = False,
 ) -> None:
     resolved_post_url = post_url or await resolve_auction_post_url(bot, auction_id=auction_id)
     reply_markup = open_auction_post_keyboard(resolved_post_url) if resolved_post_url else None
@@ -407,6 +413,7 @@ async def _notify_auction_finish(
             ),
             notification_event=NotificationEventType.AUCTION_FINISH,
             auction_id=auction_id,
+            raise_retry_after=raise_retry_after,
         )
     if winner_tg_id is not None:
         await send_user_topic_message(
@@ -420,6 +427,7 @@ async def _notify_auction_finish(
             ),
             notification_event=NotificationEventType.AUCTION_WIN,
             auction_id=auction_id,
+            raise_retry_after=raise_retry_after,
         )
 
     seller_label = str(seller_tg_id) if seller_tg_id is not None else "нет"
@@ -436,6 +444,125 @@ async def _notify_auction_finish(
     )
 
 
+def _telegram_outbox_enabled(bot: Bot | None) -> bool:
+    return bot is not None and settings.telegram_outbox_enabled
+
+
+async def _deliver_outbid_notification(job: OutboxJob, context: OutboxDeliveryContext) -> None:
+    assert context.bot is not None
+    payload = job.event.payload
+    await _notify_outbid(
+        context.bot,
+        payload["outbid_tg_user_id"],
+        payload["actor_tg_user_id"],
+        auction_id=uuid.UUID(payload["auction_id"]),
+        post_url=payload.get("post_url"),
+        retrying=job.event.attempts > 0,
+        raise_retry_after=True,
+    )
+
+
+async def _deliver_auction_finish_notification(job: OutboxJob, context: OutboxDeliveryContext) -> None:
+    assert context.bot is not None
+    payload = job.event.payload
+    await _notify_auction_finish(
+        context.bot,
+        winner_tg_id=payload.get("winner_tg_user_id"),
+        seller_tg_id=payload.get("seller_tg_user_id"),
+        auction_id=uuid.UUID(payload["auction_id"]),
+        post_url=payload.get("post_url"),
+        raise_retry_after=True,
+    )
+
+
+register_outbox_handler(
+    OutboxHandler(
+        event_type=OUTBOX_EVENT_OUTBID_NOTIFICATION,
+        handle_batch=deliver_each(_deliver_outbid_notification),
+        lane=OutboxLane.REALTIME,
+        concurrency=8,
+        retry_policy=OutboxRetryPolicy(max_attempts=3, base_seconds=5, max_seconds=60),
+        is_enabled=_telegram_outbox_enabled,
+    )
+)
+register_outbox_handler(
+    OutboxHandler(
+        event_type=OUTBOX_EVENT_AUCTION_FINISH_NOTIFICATION,
+        handle_batch=deliver_each(_deliver_auction_finish_notification),
+        lane=OutboxLane.REALTIME,
+        concurrency=4,
+        retry_policy=OutboxRetryPolicy(max_attempts=5, base_seconds=10, max_seconds=300),
+        is_enabled=_telegram_outbox_enabled,
+    )
+)
+
+
+async def _dispatch_notification(*, event_type: str, payload: dict, dedupe_key: str) -> bool:
+    """Hands a notification to the outbox worker; False means the caller should deliver inline."""
+
+    if not settings.telegram_outbox_enabled:
+        return False
+    try:
+        await dispatch_outbox_event(event_type=event_type, payload=payload, dedupe_key=dedupe_key)
+    except Exception:
+        logger.warning("outbox_dispatch_failed event_type=%s dedupe_key=%s", event_type, dedupe_key, exc_info=True)
+        return False
+    return True
+
+
+async def _enqueue_outbid_notification(
+    bot: Bot,
+    outbid_user_tg_id: int | None,
+    actor_tg_id: int,
+    *,
+    auction_id: uuid.UUID,
+    post_url: str | None,
+    delivery_key: str,
+) -> None:
+    if outbid_user_tg_id is None or outbid_user_tg_id == actor_tg_id:
+        return
+    dispatched = await _dispatch_notification(
+        event_type=OUTBOX_EVENT_OUTBID_NOTIFICATION,
+        payload={
+            "auction_id": str(auction_id),
+            "outbid_tg_user_id": outbid_user_tg_id,
+            "actor_tg_user_id": actor_tg_id,
+            "post_url": post_url,
+        },
+        dedupe_key=f"{OUTBOX_EVENT_OUTBID_NOTIFICATION}:{delivery_key}",
+    )
+    if not dispatched:
+        await _notify_outbid(bot, outbid_user_tg_id, actor_tg_id, auction_id=auction_id, post_url=post_url)
+
+
+async def _enqueue_auction_finish_notification(
+    bot: Bot,
+    *,
+    winner_tg_id: int | None,
+    seller_tg_id: int | None,
+    auction_id: uuid.UUID,
+    post_url: str | None,
+) -> None:
+    dispatched = await _dispatch_notification(
+        event_type=OUTBOX_EVENT_AUCTION_FINISH_NOTIFICATION,
+        payload={
+            "auction_id": str(auction_id),
+            "winner_tg_user_id": winner_tg_id,
+            "seller_tg_user_id": seller_tg_id,
+            "post_url": post_url,
+        },
+        dedupe_key=f"{OUTBOX_EVENT_AUCTION_FINISH_NOTIFICATION}:{auction_id}",
+    )
+    if not dispatched:
+        await _notify_auction_finish(
+            bot,
+            winner_tg_id=winner_tg_id,
+            seller_tg_id=seller_tg_id,
+            auction_id=auction_id,
+            post_url=post_url,
+        )
+
+
 @router.callback_query(F.data.startswith("bid:"))
 async def handle_bid_action(callback: CallbackQuery, bot: Bot) -> None:
     if callback.from_user is None or callback.data is None:
@@ -460,7 +587,9 @@ async def handle_bid_action(callback: CallbackQuery, bot: Bot) -> None:
         context_key=bid_context,
     )
 
-    if not await acquire_bid_cooldown(auction_id, callback.from_user.id):
+    with BID_CALLBACK_PHASE_SECONDS.time(action="bid", phase="cooldown"):
+        cooldown_acquired = await acquire_bid_cooldown(auction_id, callback.from_user.id)
+    if not cooldown_acquired:
         await _record_bid_funnel(
             journey=BotFunnelJourney.BID,
             step=BotFunnelStep.FAIL,
@@ -479,18 +608,20 @@ async def handle_bid_action(callback: CallbackQuery, bot: Bot) -> None:
     result = None
     async with SessionFactory() as session:
         async with session.begin():
-            bidder = await upsert_user(session, callback.from_user)
+            with BID_CALLBACK_PHASE_SECONDS.time(action="bid", phase="upsert"):
+                bidder = await upsert_user(session, callback.from_user)
             blocked_by_soft_gate, soft_gate_hint = _soft_gate_decision(
                 private_started=bidder.private_started_at is not None
             )
             if not blocked_by_soft_gate:
-                result = await process_bid_action(
-                    session,
-                    auction_id=auction_id,
-                    bidder_user_id=bidder.id,
-                    multiplier=multiplier,
-                    is_buyout=False,
-                )
+                with BID_CALLBACK_PHASE_SECONDS.time(action="bid", phase="process_bid_action"):
+                    result = await process_bid_action(
+                        session,
+                        auction_id=auction_id,
+                        bidder_user_id=bidder.id,
+                        multiplier=multiplier,
+                        is_buyout=False,
+                    )
                 if soft_gate_hint and result.success:
                     show_soft_gate_hint, hint_ts = _should_emit_soft_gate_hint(bidder.soft_gate_hint_sent_at)
                     if show_soft_gate_hint:
@@ -539,19 +670,22 @@ async def handle_bid_action(callback: CallbackQuery, bot: Bot) -> None:
         await callback.answer(result.alert_text, show_alert=True)
 
     if result.should_refresh:
-        await refresh_auction_posts(bot, auction_id)
+        with BID_CALLBACK_PHASE_SECONDS.time(action="bid", phase="refresh"):
+            await refresh_auction_posts(bot, auction_id)
 
     post_url = _callback_post_url(callback)
-    await _notify_outbid(
-        bot,
-        result.outbid_tg_user_id,
-        callback.from_user.id,
-        auction_id=auction_id,
-        post_url=post_url,
-    )
+    with BID_CALLBACK_PHASE_SECONDS.time(action="bid", phase="notify"):
+        await _enqueue_outbid_notification(
+            bot,
+            result.outbid_tg_user_id,
+            callback.from_user.id,
+            auction_id=auction_id,
+            post_url=post_url,
+            delivery_key=str(result.created_bid_id or callback.id),
+        )
 
-    if result.fraud_signal_id is not None:
-        await _maybe_send_fraud_alert(bot, result.fraud_signal_id)
+        if result.fraud_signal_id is not None:
+            await _maybe_send_fraud_alert(bot, result.fraud_signal_id)
 
 
 @router.callback_query(F.data.startswith("buy:"))
@@ -588,7 +722,9 @@ async def handle_buyout_action(callback: CallbackQuery, bot: Bot) -> None:
         context_key="callback_buyout",
     )
 
-    if not await acquire_bid_cooldown(auction_id, callback.from_user.id):
+    with BID_CALLBACK_PHASE_SECONDS.time(action="buyout", phase="cooldown"):
+        cooldown_acquired = await acquire_bid_cooldown(auction_id, callback.from_user.id)
+    if not cooldown_acquired:
         await _record_bid_funnel(
             journey=BotFunnelJourney.BUYOUT,
             step=BotFunnelStep.FAIL,
@@ -607,18 +743,20 @@ async def handle_buyout_action(callback: CallbackQuery, bot: Bot) -> None:
     result = None
     async with SessionFactory() as session:
         async with session.begin():
-            bidder = await upsert_user(session, callback.from_user)
+            with BID_CALLBACK_PHASE_SECONDS.time(action="buyout", phase="upsert"):
+                bidder = await upsert_user(session, callback.from_user)
             blocked_by_soft_gate, soft_gate_hint = _soft_gate_decision(
                 private_started=bidder.private_started_at is not None
             )
             if not blocked_by_soft_gate:
-                result = await process_bid_action(
-                    session,
-                    auction_id=auction_id,
-                    bidder_user_id=bidder.id,
-                    multiplier=1,
-                    is_buyout=True,
-                )
+                with BID_CALLBACK_PHASE_SECONDS.time(action="buyout", phase="process_bid_action"):
+                    result = await process_bid_action(
+                        session,
+                        auction_id=auction_id,
+                        bidder_user_id=bidder.id,
+                        multiplier=1,
+                        is_buyout=True,
+                    )
                 if soft_gate_hint and result.success:
                     show_soft_gate_hint, hint_ts = _should_emit_soft_gate_hint(bidder.soft_gate_hint_sent_at)
                     if show_soft_gate_hint:
@@ -663,29 +801,32 @@ async def handle_buyout_action(callback: CallbackQuery, bot: Bot) -> None:
         await callback.answer(result.alert_text, show_alert=not result.success)
 
     if result.should_refresh:
-        await refresh_auction_posts(bot, auction_id)
+        with BID_CALLBACK_PHASE_SECONDS.time(action="buyout", phase="refresh"):
+            await refresh_auction_posts(bot, auction_id)
 
     post_url = _callback_post_url(callback)
-    await _notify_outbid(
-        bot,
-        result.outbid_tg_user_id,
-        callback.from_user.id,
-        auction_id=auction_id,
-        post_url=post_url,
-    )
-
-    if result.fraud_signal_id is not None:
-        await _maybe_send_fraud_alert(bot, result.fraud_signal_id)
-
-    if result.auction_finished:
-        await _notify_auction_finish(
+    with BID_CALLBACK_PHASE_SECONDS.time(action="buyout", phase="notify"):
+        await _enqueue_outbid_notification(
             bot,
-            winner_tg_id=result.winner_tg_user_id,
-            seller_tg_id=result.seller_tg_user_id,
+            result.outbid_tg_user_id,
+            callback.from_user.id,
             auction_id=auction_id,
             post_url=post_url,
+            delivery_key=str(result.created_bid_id or callback.id),
         )
 
+        if result.fraud_signal_id is not None:
+            await _maybe_send_fraud_alert(bot, result.fraud_signal_id)
+
+        if result.auction_finished:
+            await _enqueue_auction_finish_notification(
+                bot,
+                winner_tg_id=result.winner_tg_user_id,
+                seller_tg_id=result.seller_tg_user_id,
+                auction_id=auction_id,
+                post_url=post_url,
+            )
+
 
 @router.callback_query(F.data.startswith("report:"))
 async def handle_report_action(callback: CallbackQuery, bot: Bot) -> None:
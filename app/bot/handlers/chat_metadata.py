@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import logging
+
+from aiogram import F, Router
+from aiogram.enums import ChatType
+from aiogram.types import ChatMemberUpdated
+
+from app.services.chat_metadata_service import remember_chat
+
+logger = logging.getLogger(__name__)
+
+router = Router(name="chat_metadata")
+
+
+# Private chats also send my_chat_member when a user blocks or unblocks the bot; post
+# links only ever point into groups and channels, so those are not tracked.
+@router.my_chat_member(F.chat.type.in_({ChatType.GROUP, ChatType.SUPERGROUP, ChatType.CHANNEL}))
+async def track_bot_chat_membership(event: ChatMemberUpdated) -> None:
+    status = event.new_chat_member.status
+    bot_status = str(getattr(status, "value", status))
+    await remember_chat(event.chat, bot_status=bot_status)
+    logger.info("chat_metadata_membership chat_id=%s status=%s", event.chat.id, bot_status)
@@ -2,17 +2,19 @@ from __future__ import annotations
 
 import logging
 
-from aiogram import Bot, F, Router
+from aiogram import Bot, Dispatcher, F, Router
 from aiogram.enums import ChatType
 from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramForbiddenError
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
 from aiogram.types import CallbackQuery, Message
 
 from app.bot.keyboards.auction import draft_publish_keyboard
 from app.bot.states.auction_create import AuctionCreateStates
 from app.config import settings
 from app.db.session import SessionFactory
+from app.infra.media_group_buffer import AlbumFlushGuard, media_group_buffer
 from app.services.auction_create_wizard_service import (
     WIZARD_STEP_WAITING_ANTI_SNIPER,
     WIZARD_STEP_WAITING_BUYOUT_PRICE,
@@ -110,7 +112,18 @@ async def _update_wizard(
     )
 
 
-async def _append_photo_file_id(state: FSMContext, file_id: str) -> tuple[int, bool, bool]:
+async def _append_photo_file_ids(
+    state: FSMContext,
+    file_ids: list[str],
+    *,
+    media_group_id: str | None = None,
+) -> tuple[int, int, bool, bool]:
+    """Merges photos into the wizard state with one read and at most one write.
+
+    Returns the photo count, how many photos were added, whether the photo limit
+    rejected some of them and whether ``media_group_id`` is an album not seen before.
+    """
+
     data = await state.get_data()
     photo_ids_raw = data.get("photo_file_ids")
     if isinstance(photo_ids_raw, list):
@@ -119,29 +132,166 @@ async def _append_photo_file_id(state: FSMContext, file_id: str) -> tuple[int, b
         fallback = data.get("photo_file_id")
         photo_file_ids = [str(fallback)] if isinstance(fallback, str) and fallback else []
 
-    if file_id in photo_file_ids:
-        return len(photo_file_ids), False, False
-    if len(photo_file_ids) >= MAX_AUCTION_PHOTOS:
-        return len(photo_file_ids), False, True
+    added = 0
+    max_reached = False
+    for file_id in file_ids:
+        if file_id in photo_file_ids:
+            continue
+        if len(photo_file_ids) >= MAX_AUCTION_PHOTOS:
+            max_reached = True
+            break
+        photo_file_ids.append(file_id)
+        added += 1
 
-    photo_file_ids.append(file_id)
-    await state.update_data(photo_file_id=photo_file_ids[0], photo_file_ids=photo_file_ids)
-    return len(photo_file_ids), True, False
+    updates: dict[str, object] = {}
+    if added:
+        updates["photo_file_id"] = photo_file_ids[0]
+        updates["photo_file_ids"] = photo_file_ids
 
+    new_album = False
+    if media_group_id:
+        seen_raw = data.get("photo_media_group_ids")
+        seen_group_ids = [str(item) for item in seen_raw if str(item)] if isinstance(seen_raw, list) else []
+        if media_group_id not in seen_group_ids:
+            seen_group_ids.append(media_group_id)
+            updates["photo_media_group_ids"] = seen_group_ids[-20:]
+            new_album = True
 
-async def _mark_media_group_seen(state: FSMContext, media_group_id: str | None) -> bool:
-    if not media_group_id:
-        return False
+    if updates:
+        await state.update_data(**updates)
+    return len(photo_file_ids), added, max_reached, new_album
 
-    data = await state.get_data()
-    seen_raw = data.get("photo_media_group_ids")
-    seen_group_ids = [str(item) for item in seen_raw if str(item)] if isinstance(seen_raw, list) else []
-    if media_group_id in seen_group_ids:
-        return False
 
-    seen_group_ids.append(media_group_id)
-    await state.update_data(photo_media_group_ids=seen_group_ids[-20:])
-    return True
+def _album_scope(target: Message | CallbackQuery) -> tuple[int | None, int | None]:
+    message = _anchor_message(target)
+    chat_id = getattr(getattr(message, "chat", None), "id", None)
+    user_id = getattr(getattr(target, "from_user", None), "id", None)
+    return chat_id, user_id
+
+
+async def _flush_pending_albums(target: Message | CallbackQuery) -> None:
+    await media_group_buffer.flush_scope(_album_scope(target))
+
+
+async def _apply_wizard_photos(
+    message: Message,
+    state: FSMContext,
+    bot: Bot | None,
+    file_ids: list[str],
+    *,
+    step_name: str,
+    media_group_id: str | None = None,
+) -> None:
+    count, added, max_reached, new_album = await _append_photo_file_ids(
+        state,
+        file_ids,
+        media_group_id=media_group_id,
+    )
+    collecting_before_description = step_name == WIZARD_STEP_WAITING_DESCRIPTION
+    if max_reached:
+        await _update_wizard(
+            state=state,
+            bot=bot,
+            target=message,
+            step_name=step_name,
+            hint=(
+                "Пришлите описание лота текстом."
+                if collecting_before_description
+                else "Нажмите 'Готово' или удалите лишние фото."
+            ),
+            error=f"Можно добавить максимум {MAX_AUCTION_PHOTOS} фото.",
+            last_event=f"Лимит фото достигнут: {MAX_AUCTION_PHOTOS}/{MAX_AUCTION_PHOTOS}.",
+        )
+        return
+
+    if not added:
+        return
+
+    next_action = (
+        "Теперь пришлите описание текстом." if collecting_before_description else "Отправьте еще или нажмите 'Готово'."
+    )
+    if media_group_id is None:
+        await _update_wizard(
+            state=state,
+            bot=bot,
+            target=message,
+            step_name=step_name,
+            hint=f"Фото добавлено ({count}/{MAX_AUCTION_PHOTOS}). {next_action}",
+            last_event=f"Добавлено фото: {count}/{MAX_AUCTION_PHOTOS}.",
+            force_repost=True,
+        )
+        return
+
+    if new_album:
+        await _update_wizard(
+            state=state,
+            bot=bot,
+            target=message,
+            step_name=step_name,
+            hint=f"Альбом принят ({count}/{MAX_AUCTION_PHOTOS}). {next_action}",
+            last_event=f"Принят альбом: +{added} фото. Фото сейчас: {count}/{MAX_AUCTION_PHOTOS}.",
+            force_repost=True,
+        )
+
+
+def _wizard_lock(dispatcher: Dispatcher | None, state: FSMContext) -> AlbumFlushGuard | None:
+    """The FSM isolation lock of the wizard, taken by album flushes that run after the update."""
+
+    if dispatcher is None:
+        return None
+    events_isolation = dispatcher.fsm.events_isolation
+    return lambda: events_isolation.lock(key=state.key)
+
+
+async def _collect_wizard_photo(
+    message: Message,
+    state: FSMContext,
+    bot: Bot | None,
+    *,
+    step_name: str,
+    expected_state: State,
+    dispatcher: Dispatcher | None = None,
+) -> None:
+    if not message.photo:
+        return
+    file_id = message.photo[-1].file_id
+    media_group_id = message.media_group_id
+    if media_group_id is None:
+        # Albums still waiting for their quiet window go first, so photos keep the
+        # order they were sent in.
+        await _flush_pending_albums(message)
+        if await _ensure_auction_state_message(message, state, bot):
+            await _apply_wizard_photos(message, state, bot, [file_id], step_name=step_name)
+        return
+
+    # Album parts after the first one only land in memory: the part that opened the
+    # album checks routing once and applies the whole album in a single state write.
+    scope = _album_scope(message)
+    if not media_group_buffer.add(scope, media_group_id, message_id=message.message_id, item=file_id):
+        return
+    if not await _ensure_auction_state_message(message, state, bot):
+        media_group_buffer.discard(scope, media_group_id)
+        return
+
+    async def _apply_album(file_ids: list[str]) -> None:
+        if await state.get_state() != expected_state.state:
+            return
+        await _apply_wizard_photos(
+            message,
+            state,
+            bot,
+            file_ids,
+            step_name=step_name,
+            media_group_id=media_group_id,
+        )
+
+    media_group_buffer.schedule(
+        scope,
+        media_group_id,
+        _apply_album,
+        window_seconds=settings.auction_photo_album_window_ms / 1000,
+        guard=_wizard_lock(dispatcher, state),
+    )
 
 
 async def _store_expected_intake_scope(state: FSMContext, message: Message) -> None:
@@ -453,54 +603,27 @@ async def cancel_creation(message: Message, state: FSMContext) -> None:
 
 
 @router.message(AuctionCreateStates.waiting_photo, F.photo)
-async def create_photo_step(message: Message, state: FSMContext, bot: Bot | None = None) -> None:
-    if not await _ensure_auction_state_message(message, state, bot):
-        return
-    if not message.photo:
-        return
-    photo = message.photo[-1]
-    count, added, max_reached = await _append_photo_file_id(state, photo.file_id)
-    if max_reached:
-        await _update_wizard(
-            state=state,
-            bot=bot,
-            target=message,
-            step_name=WIZARD_STEP_WAITING_PHOTO,
-            hint="Нажмите 'Готово' или удалите лишние фото.",
-            error=f"Можно добавить максимум {MAX_AUCTION_PHOTOS} фото.",
-            last_event=f"Лимит фото достигнут: {MAX_AUCTION_PHOTOS}/{MAX_AUCTION_PHOTOS}.",
-        )
-        return
-
-    if not added:
-        return
-
-    if message.media_group_id is None:
-        await _update_wizard(
-            state=state,
-            bot=bot,
-            target=message,
-            step_name=WIZARD_STEP_WAITING_PHOTO,
-            hint=f"Фото добавлено ({count}/{MAX_AUCTION_PHOTOS}). Отправьте еще или нажмите 'Готово'.",
-            last_event=f"Добавлено фото: {count}/{MAX_AUCTION_PHOTOS}.",
-            force_repost=True,
-        )
-        return
-
-    if await _mark_media_group_seen(state, message.media_group_id):
-        await _update_wizard(
-            state=state,
-            bot=bot,
-            target=message,
-            step_name=WIZARD_STEP_WAITING_PHOTO,
-            hint="Альбом принят. После отправки всех фото нажмите 'Готово'.",
-            last_event=f"Принят альбом. Фото сейчас: {count}/{MAX_AUCTION_PHOTOS}.",
-            force_repost=True,
-        )
+async def create_photo_step(
+    message: Message,
+    state: FSMContext,
+    bot: Bot | None = None,
+    dispatcher: Dispatcher | None = None,
+) -> None:
+    await _collect_wizard_photo(
+        message,
+        state,
+        bot,
+        step_name=WIZARD_STEP_WAITING_PHOTO,
+        expected_state=AuctionCreateStates.waiting_photo,
+        dispatcher=dispatcher,
+    )
 
 
 @router.callback_query(AuctionCreateStates.waiting_photo, F.data == "create:photos:done")
 async def create_photos_done(callback: CallbackQuery, state: FSMContext, bot: Bot | None = None) -> None:
+    # Deliver buffered albums before the first state read so the cached update state
+    # already contains them.
+    await _flush_pending_albums(callback)
     if not await _ensure_auction_state_callback(callback, state, bot):
         return
     data = await state.get_data()
@@ -538,6 +661,7 @@ async def create_photo_step_invalid(message: Message, state: FSMContext, bot: Bo
 
 @router.message(AuctionCreateStates.waiting_description, F.text)
 async def create_description_step(message: Message, state: FSMContext, bot: Bot | None = None) -> None:
+    await _flush_pending_albums(message)
     if not await _ensure_auction_state_message(message, state, bot):
         return
     description = (message.text or "").strip()
@@ -565,50 +689,20 @@ async def create_description_step(message: Message, state: FSMContext, bot: Bot
 
 
 @router.message(AuctionCreateStates.waiting_description, F.photo)
-async def create_description_collect_photo(message: Message, state: FSMContext, bot: Bot | None = None) -> None:
-    if not await _ensure_auction_state_message(message, state, bot):
-        return
-    if not message.photo:
-        return
-    photo = message.photo[-1]
-    count, added, max_reached = await _append_photo_file_id(state, photo.file_id)
-    if max_reached:
-        await _update_wizard(
-            state=state,
-            bot=bot,
-            target=message,
-            step_name=WIZARD_STEP_WAITING_DESCRIPTION,
-            hint="Пришлите описание лота текстом.",
-            error=f"Можно добавить максимум {MAX_AUCTION_PHOTOS} фото.",
-            last_event=f"Лимит фото достигнут: {MAX_AUCTION_PHOTOS}/{MAX_AUCTION_PHOTOS}.",
-        )
-        return
-
-    if not added:
-        return
-
-    if message.media_group_id is None:
-        await _update_wizard(
-            state=state,
-            bot=bot,
-            target=message,
-            step_name=WIZARD_STEP_WAITING_DESCRIPTION,
-            hint=f"Фото добавлено ({count}/{MAX_AUCTION_PHOTOS}). Теперь пришлите описание текстом.",
-            last_event=f"Добавлено фото: {count}/{MAX_AUCTION_PHOTOS}.",
-            force_repost=True,
-        )
-        return
-
-    if await _mark_media_group_seen(state, message.media_group_id):
-        await _update_wizard(
-            state=state,
-            bot=bot,
-            target=message,
-            step_name=WIZARD_STEP_WAITING_DESCRIPTION,
-            hint="Альбом принят. После отправки всех фото пришлите описание текстом.",
-            last_event=f"Принят альбом. Фото сейчас: {count}/{MAX_AUCTION_PHOTOS}.",
-            force_repost=True,
-        )
+async def create_description_collect_photo(
+    message: Message,
+    state: FSMContext,
+    bot: Bot | None = None,
+    dispatcher: Dispatcher | None = None,
+) -> None:
+    await _collect_wizard_photo(
+        message,
+        state,
+        bot,
+        step_name=WIZARD_STEP_WAITING_DESCRIPTION,
+        expected_state=AuctionCreateStates.waiting_description,
+        dispatcher=dispatcher,
+    )
 
 
 @router.message(AuctionCreateStates.waiting_description)
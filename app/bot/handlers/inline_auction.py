@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import uuid
+
 from aiogram import Bot, F, Router
 from aiogram.enums import ParseMode
 from aiogram.types import ChosenInlineResult, InlineQuery, InlineQueryResultCachedPhoto
 
 from app.bot.keyboards.auction import auction_active_keyboard
+from app.config import settings
 from app.db.enums import AuctionStatus
 from app.db.session import SessionFactory
 from app.services.auction_service import (
@@ -14,6 +17,12 @@ from app.services.auction_service import (
     refresh_auction_posts,
     render_auction_caption,
 )
+from app.services.inline_query_cache_service import (
+    InlineAuctionEntry,
+    get_inline_auction_entry,
+    inline_query_cache_enabled,
+    store_inline_auction_entry,
+)
 from app.services.private_topics_service import PrivateTopicPurpose, send_user_topic_message
 from app.services.publish_gate_service import evaluate_seller_publish_gate
 from app.services.user_service import upsert_user
@@ -21,6 +30,10 @@ from app.services.user_service import upsert_user
 router = Router(name="inline_auction")
 
 
+# Hex form of a UUID; anything shorter is a lot ID that is still being typed.
+_AUCTION_ID_MIN_LENGTH = 32
+
+
 def _extract_auction_id(raw_query: str) -> str | None:
     query = raw_query.strip()
     if not query.startswith("auc_"):
@@ -28,55 +41,104 @@ def _extract_auction_id(raw_query: str) -> str | None:
     return query[4:]
 
 
+async def _answer_empty(inline_query: InlineQuery, *, personal: bool) -> None:
+    # Answers that do not depend on the sender can be cached by Telegram for everyone,
+    # which absorbs the per-keystroke queries users send while typing a lot ID.
+    if personal:
+        await inline_query.answer(
+            [],
+            cache_time=max(settings.inline_query_result_cache_time_seconds, 0),
+            is_personal=True,
+        )
+        return
+    await inline_query.answer(
+        [],
+        cache_time=max(settings.inline_query_empty_cache_time_seconds, 0),
+        is_personal=False,
+    )
+
+
+async def _load_inline_auction_entry(auction_uuid: uuid.UUID) -> InlineAuctionEntry | None:
+    async with SessionFactory() as session:
+        view = await load_auction_view(session, auction_uuid)
+        if view is None:
+            return None
+        publish_gate = await evaluate_seller_publish_gate(session, seller_user_id=view.seller.id)
+
+    is_draft = view.auction.status == AuctionStatus.DRAFT
+    return InlineAuctionEntry(
+        seller_tg_user_id=view.seller.tg_user_id,
+        status=view.auction.status.value,
+        publish_allowed=publish_gate.allowed,
+        photo_file_id=view.auction.photo_file_id,
+        caption=render_auction_caption(view, publish_pending=True) if is_draft else "",
+        min_step=view.auction.min_step,
+        has_buyout=view.auction.buyout_price is not None,
+    )
+
+
+async def _resolve_inline_auction_entry(auction_uuid: uuid.UUID) -> InlineAuctionEntry | None:
+    if not inline_query_cache_enabled():
+        return await _load_inline_auction_entry(auction_uuid)
+
+    lookup = await get_inline_auction_entry(auction_uuid)
+    if lookup.hit:
+        return lookup.entry
+
+    entry = await _load_inline_auction_entry(auction_uuid)
+    await store_inline_auction_entry(auction_uuid, entry, version=lookup.version)
+    return entry
+
+
 @router.inline_query()
 async def handle_inline_auction_query(inline_query: InlineQuery) -> None:
     auction_id_raw = _extract_auction_id(inline_query.query)
-    if auction_id_raw is None:
-        await inline_query.answer([], cache_time=1, is_personal=True)
+    if auction_id_raw is None or len(auction_id_raw) < _AUCTION_ID_MIN_LENGTH:
+        # Not a share query, or a partial lot ID: answered without a lookup.
+        await _answer_empty(inline_query, personal=False)
         return
 
     auction_uuid = parse_auction_uuid(auction_id_raw)
     if auction_uuid is None:
-        await inline_query.answer([], cache_time=1, is_personal=True)
+        await _answer_empty(inline_query, personal=False)
         return
 
-    async with SessionFactory() as session:
-        view = await load_auction_view(session, auction_uuid)
-        publish_gate = None
-        if view is not None:
-            publish_gate = await evaluate_seller_publish_gate(session, seller_user_id=view.seller.id)
-
-    if view is None:
-        await inline_query.answer([], cache_time=1, is_personal=True)
+    entry = await _resolve_inline_auction_entry(auction_uuid)
+    if entry is None:
+        await _answer_empty(inline_query, personal=False)
         return
 
-    if publish_gate is not None and not publish_gate.allowed:
-        await inline_query.answer([], cache_time=1, is_personal=True)
+    if not entry.publish_allowed:
+        await _answer_empty(inline_query, personal=True)
         return
 
-    if inline_query.from_user.id != view.seller.tg_user_id:
-        await inline_query.answer([], cache_time=1, is_personal=True)
+    if inline_query.from_user.id != entry.seller_tg_user_id:
+        await _answer_empty(inline_query, personal=True)
         return
 
-    if view.auction.status != AuctionStatus.DRAFT:
-        await inline_query.answer([], cache_time=1, is_personal=True)
+    if entry.status != AuctionStatus.DRAFT:
+        await _answer_empty(inline_query, personal=True)
         return
 
     result = InlineQueryResultCachedPhoto(
-        id=f"auc:{view.auction.id}",
-        photo_file_id=view.auction.photo_file_id,
-        caption=render_auction_caption(view, publish_pending=True),
+        id=f"auc:{auction_uuid}",
+        photo_file_id=entry.photo_file_id,
+        caption=entry.caption,
         parse_mode=ParseMode.HTML,
         reply_markup=auction_active_keyboard(
-            auction_id=str(view.auction.id),
-            min_step=view.auction.min_step,
-            has_buyout=view.auction.buyout_price is not None,
+            auction_id=str(auction_uuid),
+            min_step=entry.min_step,
+            has_buyout=entry.has_buyout,
         ),
-        title=f"Аукцион #{str(view.auction.id)[:8]}",
+        title=f"Аукцион #{str(auction_uuid)[:8]}",
         description="Опубликовать аукцион",
     )
 
-    await inline_query.answer([result], cache_time=1, is_personal=True)
+    await inline_query.answer(
+        [result],
+        cache_time=max(settings.inline_query_result_cache_time_seconds, 0),
+        is_personal=True,
+    )
 
 
 @router.chosen_inline_result(F.result_id.startswith("auc:"))
@@ -29,7 +29,7 @@ from app.bot.keyboards.auction import open_auction_post_keyboard
 from app.config import settings
 from app.db.enums import AppealSourceType, AppealStatus, AuctionStatus, ModerationAction, PointsEventType
 from app.db.models import Appeal, Auction, User
-from app.db.session import SessionFactory
+from app.db.session import SessionFactory, load_database_pool_snapshots, read_replica_scope
 from app.services.bot_profile_photo_service import (
     apply_bot_profile_photo_preset,
     list_bot_profile_photo_presets,
@@ -649,12 +649,15 @@ async def _ensure_moderation_callback_topic(callback: CallbackQuery, bot: Bot) -
 
 async def _render_mod_panel_home_text() -> str:
     async with SessionFactory() as session:
-        snapshot = await get_moderation_dashboard_snapshot(session)
-        active_appeals = (
-            await session.scalar(
-                select(func.count(Appeal.id)).where(Appeal.status.in_([AppealStatus.OPEN, AppealStatus.IN_REVIEW]))
-            )
-        ) or 0
+        async with read_replica_scope():
+            snapshot = await get_moderation_dashboard_snapshot(session)
+            active_appeals = (
+                await session.scalar(
+                    select(func.count(Appeal.id)).where(
+                        Appeal.status.in_([AppealStatus.OPEN, AppealStatus.IN_REVIEW])
+                    )
+                )
+            ) or 0
 
     return (
         "Мод-панель\n"
@@ -669,12 +672,15 @@ async def _render_mod_panel_home_text() -> str:
 
 async def _render_mod_stats_text() -> str:
     async with SessionFactory() as session:
-        snapshot = await get_moderation_dashboard_snapshot(session)
-        active_appeals = (
-            await session.scalar(
-                select(func.count(Appeal.id)).where(Appeal.status.in_([AppealStatus.OPEN, AppealStatus.IN_REVIEW]))
-            )
-        ) or 0
+        async with read_replica_scope():
+            snapshot = await get_moderation_dashboard_snapshot(session)
+            active_appeals = (
+                await session.scalar(
+                    select(func.count(Appeal.id)).where(
+                        Appeal.status.in_([AppealStatus.OPEN, AppealStatus.IN_REVIEW])
+                    )
+                )
+            ) or 0
 
     engaged_with_private = max(
         snapshot.users_with_engagement - snapshot.users_engaged_without_private_start,
@@ -764,10 +770,26 @@ async def _render_mod_stats_text() -> str:
         f"- min balance after redemption: {max(settings.points_redemption_min_balance, 0)} points\n"
         f"- min account age for redemption: {max(settings.points_redemption_min_account_age_seconds, 0)}s\n"
         f"- min earned points for redemption: {max(settings.points_redemption_min_earned_points, 0)} points\n"
-        f"- global cooldown: {max(settings.points_redemption_cooldown_seconds, 0)}s"
+        f"- global cooldown: {max(settings.points_redemption_cooldown_seconds, 0)}s\n"
+        "\n"
+        f"{_render_database_pool_text()}"
     )
 
 
+def _render_database_pool_text() -> str:
+    lines = ["DB pool"]
+    for pool in load_database_pool_snapshots():
+        lines.append(
+            f"- {pool.bind} ({pool.process_role}): in use {pool.checked_out}/{pool.capacity} "
+            f"({pool.saturation_percent}%), overflow {pool.overflow}/{pool.max_overflow}"
+        )
+        lines.append(
+            f"  checkout wait avg {pool.checkout_wait_avg_ms}ms | max {pool.checkout_wait_max_ms}ms | "
+            f"checkouts {pool.checkouts_total} | timeouts {pool.checkout_timeouts_total}"
+        )
+    return "\n".join(lines)
+
+
 def _notification_event_label(event_type: NotificationEventType) -> str:
     return _NOTIFICATION_EVENT_LABELS.get(event_type, event_type.value)
 
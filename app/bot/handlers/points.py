@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
-
 from aiogram import Bot, F, Router
 from aiogram.enums import ChatType
 from aiogram.filters import Command
@@ -11,22 +9,12 @@ from app.config import settings
 from app.db.enums import PointsEventType
 from app.db.models import PointsLedgerEntry
 from app.db.session import SessionFactory
-from app.services.appeal_service import AppealPriorityBoostPolicy, get_appeal_priority_boost_policy
-from app.services.feedback_service import FeedbackPriorityBoostPolicy, get_feedback_priority_boost_policy
-from app.services.guarantor_service import GuarantorPriorityBoostPolicy, get_guarantor_priority_boost_policy
-from app.services.points_service import (
-    UserPointsSummary,
-    get_points_redemption_account_age_remaining_seconds,
-    get_points_redemptions_spent_today,
-    get_points_redemptions_spent_this_week,
-    get_points_redemptions_spent_this_month,
-    get_points_redemptions_used_this_week,
-    get_points_redemptions_used_today,
-    get_points_redemption_cooldown_remaining_seconds,
-    get_user_points_summary,
-    list_user_points_entries,
-)
+from app.services.appeal_service import AppealPriorityBoostPolicy
+from app.services.feedback_service import FeedbackPriorityBoostPolicy
+from app.services.guarantor_service import GuarantorPriorityBoostPolicy
+from app.services.points_service import UserPointsSummary, list_user_points_entries
 from app.services.private_topics_service import PrivateTopicPurpose, enforce_message_topic
+from app.services.redemption_policy_service import RedemptionUtility, redemption_policy_engine
 from app.services.user_service import upsert_user
 
 router = Router(name="points")
@@ -373,61 +361,8 @@ async def command_points(message: Message, bot: Bot | None = None) -> None:
                 command_hint="/points",
             ):
                 return
-            now = datetime.now(UTC)
-            summary = await get_user_points_summary(session, user_id=user.id)
+            snapshot = await redemption_policy_engine.load_snapshot(session, user_id=user.id)
             entries = await list_user_points_entries(session, user_id=user.id, limit=limit)
-            feedback_boost_policy = await get_feedback_priority_boost_policy(
-                session,
-                submitter_user_id=user.id,
-                now=now,
-            )
-            guarantor_boost_policy = await get_guarantor_priority_boost_policy(
-                session,
-                submitter_user_id=user.id,
-                now=now,
-            )
-            appeal_boost_policy = await get_appeal_priority_boost_policy(
-                session,
-                appellant_user_id=user.id,
-                now=now,
-            )
-            redemptions_used_today = await get_points_redemptions_used_today(
-                session,
-                user_id=user.id,
-                now=now,
-            )
-            redemptions_used_this_week = await get_points_redemptions_used_this_week(
-                session,
-                user_id=user.id,
-                now=now,
-            )
-            redemptions_spent_today = await get_points_redemptions_spent_today(
-                session,
-                user_id=user.id,
-                now=now,
-            )
-            redemptions_spent_this_week = await get_points_redemptions_spent_this_week(
-                session,
-                user_id=user.id,
-                now=now,
-            )
-            redemptions_spent_this_month = await get_points_redemptions_spent_this_month(
-                session,
-                user_id=user.id,
-                now=now,
-            )
-            cooldown_remaining_seconds = await get_points_redemption_cooldown_remaining_seconds(
-                session,
-                user_id=user.id,
-                cooldown_seconds=settings.points_redemption_cooldown_seconds,
-                now=now,
-            )
-            account_age_remaining_seconds = await get_points_redemption_account_age_remaining_seconds(
-                session,
-                user_id=user.id,
-                min_account_age_seconds=settings.points_redemption_min_account_age_seconds,
-                now=now,
-            )
 
     render_points_text = _render_points_compact_text
     if mode == POINTS_VIEW_DETAILED:
@@ -435,18 +370,18 @@ async def command_points(message: Message, bot: Bot | None = None) -> None:
 
     await message.answer(
         render_points_text(
-            summary=summary,
+            summary=snapshot.summary,
             entries=entries,
             shown_limit=limit,
-            feedback_boost_policy=feedback_boost_policy,
-            guarantor_boost_policy=guarantor_boost_policy,
-            appeal_boost_policy=appeal_boost_policy,
-            redemptions_used_today=redemptions_used_today,
-            redemptions_used_this_week=redemptions_used_this_week,
-            redemptions_spent_today=redemptions_spent_today,
-            redemptions_spent_this_week=redemptions_spent_this_week,
-            redemptions_spent_this_month=redemptions_spent_this_month,
-            cooldown_remaining_seconds=cooldown_remaining_seconds,
-            account_age_remaining_seconds=account_age_remaining_seconds,
+            feedback_boost_policy=snapshot.utility(RedemptionUtility.FEEDBACK),
+            guarantor_boost_policy=snapshot.utility(RedemptionUtility.GUARANTOR),
+            appeal_boost_policy=snapshot.utility(RedemptionUtility.APPEAL),
+            redemptions_used_today=snapshot.used_today,
+            redemptions_used_this_week=snapshot.used_this_week,
+            redemptions_spent_today=snapshot.spent_today,
+            redemptions_spent_this_week=snapshot.spent_this_week,
+            redemptions_spent_this_month=snapshot.spent_this_month,
+            cooldown_remaining_seconds=snapshot.cooldown_remaining_seconds,
+            account_age_remaining_seconds=snapshot.account_age_remaining_seconds,
         )
     )
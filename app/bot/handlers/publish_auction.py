@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import uuid
+from dataclasses import dataclass
 
 from aiogram import Bot, F, Router
 from aiogram.enums import ChatType
-from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramForbiddenError
 from aiogram.filters import Command
 from aiogram.types import InputMediaPhoto, Message
 
 from app.bot.keyboards.auction import auction_active_keyboard, open_auction_post_keyboard
+from app.config import settings
 from app.db.enums import AuctionStatus
 from app.db.session import SessionFactory
+from app.infra.send_budget import SendBudget
 from app.services.auction_service import (
+    AuctionView,
     activate_auction_chat_post,
+    add_auction_chat_posts,
     load_auction_view,
     load_auction_photo_ids,
     parse_auction_uuid,
@@ -20,10 +27,17 @@ from app.services.auction_service import (
     render_auction_caption,
     resolve_auction_post_link,
 )
+from app.services.chat_metadata_service import (
+    cache_chat_metadata,
+    chat_metadata_from_chat,
+    upsert_chat_metadata,
+)
 from app.services.moderation_topic_router import ModerationTopicSection, send_section_message
 from app.services.publish_gate_service import evaluate_seller_publish_gate
 from app.services.user_service import upsert_user
 
+logger = logging.getLogger(__name__)
+
 router = Router(name="publish_auction")
 
 
@@ -41,6 +55,22 @@ def _chunk_photo_ids(photo_ids: list[str], chunk_size: int = 10) -> list[list[st
     return [photo_ids[index : index + chunk_size] for index in range(0, len(photo_ids), chunk_size)]
 
 
+@dataclass(slots=True)
+class _ChatPublishResult:
+    chat_id: int
+    post: Message | None
+    album_message_ids: list[int]
+    error: TelegramAPIError | None = None
+
+    def message_ids(self) -> list[int]:
+        post_ids = [self.post.message_id] if self.post is not None else []
+        return [*post_ids, *self.album_message_ids]
+
+
+# Caps /publish sends only; gallery deliveries have their own SendBudget.
+_publish_send_budget = SendBudget(lambda: settings.auction_publish_send_concurrency)
+
+
 async def _send_auction_album(
     bot: Bot,
     *,
@@ -58,15 +88,16 @@ async def _send_auction_album(
             for item_index, file_id in enumerate(chunk)
         ]
         try:
-            if message_thread_id is not None:
-                sent_chunk = await bot.send_media_group(
-                    chat_id=chat_id,
-                    message_thread_id=message_thread_id,
-                    media=media,
-                )
-            else:
-                sent_chunk = await bot.send_media_group(chat_id=chat_id, media=media)
-        except (TelegramBadRequest, TelegramForbiddenError):
+            async with _publish_send_budget():
+                if message_thread_id is not None:
+                    sent_chunk = await bot.send_media_group(
+                        chat_id=chat_id,
+                        message_thread_id=message_thread_id,
+                        media=media,
+                    )
+                else:
+                    sent_chunk = await bot.send_media_group(chat_id=chat_id, media=media)
+        except TelegramAPIError:
             await _safe_delete_messages(
                 bot,
                 chat_id=chat_id,
@@ -81,10 +112,94 @@ async def _safe_delete_messages(bot: Bot, *, chat_id: int, message_ids: list[int
     for message_id in dict.fromkeys(message_ids):
         try:
             await bot.delete_message(chat_id=chat_id, message_id=message_id)
-        except (TelegramForbiddenError, TelegramBadRequest):
+        except TelegramAPIError:
             continue
 
 
+async def _publish_to_chat(
+    bot: Bot,
+    *,
+    chat_id: int,
+    message_thread_id: int | None,
+    view: AuctionView,
+    photo_ids: list[str],
+) -> _ChatPublishResult:
+    """Sends the album and then the lot post to one chat, reusing the stored ``file_id``s.
+
+    Messages within a chat go out in order; a failed post removes that chat's album.
+    Any Bot API error (including flood control and network failures) is returned as
+    the chat's ``error`` so one slow or limited chat cannot abort the others.
+    """
+
+    album_message_ids: list[int] = []
+    if len(photo_ids) > 1:
+        album_messages = await _send_auction_album(
+            bot,
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+            photo_ids=photo_ids,
+        )
+        album_message_ids = [album_message.message_id for album_message in album_messages]
+
+    try:
+        async with _publish_send_budget():
+            post = await bot.send_photo(
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+                photo=view.auction.photo_file_id,
+                caption=render_auction_caption(view, publish_pending=True),
+                reply_markup=auction_active_keyboard(
+                    auction_id=str(view.auction.id),
+                    min_step=view.auction.min_step,
+                    has_buyout=view.auction.buyout_price is not None,
+                ),
+            )
+    except TelegramAPIError as exc:
+        if album_message_ids:
+            await _safe_delete_messages(bot, chat_id=chat_id, message_ids=album_message_ids)
+        return _ChatPublishResult(chat_id=chat_id, post=None, album_message_ids=[], error=exc)
+    return _ChatPublishResult(chat_id=chat_id, post=post, album_message_ids=album_message_ids)
+
+
+async def _publish_to_chats(
+    bot: Bot,
+    targets: list[tuple[int, int | None]],
+    *,
+    view: AuctionView,
+    photo_ids: list[str],
+) -> list[_ChatPublishResult]:
+    """Publishes to every ``(chat_id, message_thread_id)`` target concurrently.
+
+    If a chat fails with something other than a Bot API error, the posts already sent
+    to the other chats are deleted before the error is raised.
+    """
+
+    outcomes = await asyncio.gather(
+        *(
+            _publish_to_chat(
+                bot,
+                chat_id=chat_id,
+                message_thread_id=message_thread_id,
+                view=view,
+                photo_ids=photo_ids,
+            )
+            for chat_id, message_thread_id in targets
+        ),
+        return_exceptions=True,
+    )
+    results = [outcome for outcome in outcomes if isinstance(outcome, _ChatPublishResult)]
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            await _discard_published(bot, results)
+            raise outcome
+    return results
+
+
+async def _discard_published(bot: Bot, results: list[_ChatPublishResult]) -> None:
+    for result in results:
+        await _safe_delete_messages(bot, chat_id=result.chat_id, message_ids=result.message_ids())
+
+
 @router.message(Command("publish"), F.chat.type.in_({ChatType.GROUP, ChatType.SUPERGROUP}))
 async def publish_auction_to_current_chat(message: Message, bot: Bot) -> None:
     if message.from_user is None or message.chat is None:
@@ -127,39 +242,39 @@ async def publish_auction_to_current_chat(message: Message, bot: Bot) -> None:
     if view is None or publisher_user_id is None:
         return
 
-    album_message_ids: list[int] = []
-    if len(photo_ids) > 1:
-        album_messages = await _send_auction_album(
-            bot,
-            chat_id=message.chat.id,
-            message_thread_id=message.message_thread_id,
-            photo_ids=photo_ids,
-        )
-        album_message_ids = [album_message.message_id for album_message in album_messages]
+    targets: list[tuple[int, int | None]] = [(message.chat.id, message.message_thread_id)]
+    targets.extend(
+        (chat_id, None)
+        for chat_id in settings.parsed_auction_publish_mirror_chat_ids()
+        if chat_id != message.chat.id
+    )
+    primary, *mirror_results = await _publish_to_chats(bot, targets, view=view, photo_ids=photo_ids)
+    mirrors: list[_ChatPublishResult] = []
+    mirror_posts: list[Message] = []
+    for result in mirror_results:
+        if result.post is None:
+            logger.warning(
+                "auction_publish_mirror_failed auction_id=%s chat_id=%s error=%s",
+                auction_id,
+                result.chat_id,
+                result.error,
+            )
+            continue
+        mirrors.append(result)
+        mirror_posts.append(result.post)
 
-    try:
-        sent_message = await bot.send_photo(
-            chat_id=message.chat.id,
-            message_thread_id=message.message_thread_id,
-            photo=view.auction.photo_file_id,
-            caption=render_auction_caption(view, publish_pending=True),
-            reply_markup=auction_active_keyboard(
-                auction_id=str(view.auction.id),
-                min_step=view.auction.min_step,
-                has_buyout=view.auction.buyout_price is not None,
-            ),
-        )
-    except TelegramForbiddenError:
-        if album_message_ids:
-            await _safe_delete_messages(bot, chat_id=message.chat.id, message_ids=album_message_ids)
-        await message.answer("Бот не может публиковать в этом чате/разделе. Проверьте права бота.")
-        return
-    except TelegramBadRequest:
-        if album_message_ids:
-            await _safe_delete_messages(bot, chat_id=message.chat.id, message_ids=album_message_ids)
-        await message.answer("Не удалось опубликовать лот в этом чате/разделе")
+    if primary.post is None:
+        await _discard_published(bot, mirrors)
+        if isinstance(primary.error, TelegramForbiddenError):
+            await message.answer("Бот не может публиковать в этом чате/разделе. Проверьте права бота.")
+        else:
+            await message.answer("Не удалось опубликовать лот в этом чате/разделе")
         return
 
+    sent_message = primary.post
+    published = [primary, *mirrors]
+    chat_entries = [chat_metadata_from_chat(post.chat) for post in (sent_message, *mirror_posts)]
+    chat_entry = chat_entries[0]
     activated = None
     try:
         async with SessionFactory() as session:
@@ -171,28 +286,31 @@ async def publish_auction_to_current_chat(message: Message, bot: Bot) -> None:
                     chat_id=sent_message.chat.id,
                     message_id=sent_message.message_id,
                 )
+                if activated is not None:
+                    await add_auction_chat_posts(
+                        session,
+                        auction_id=auction_id,
+                        publisher_user_id=publisher_user_id,
+                        posts=[(post.chat.id, post.message_id) for post in mirror_posts],
+                    )
+                    for entry in chat_entries:
+                        await upsert_chat_metadata(session, entry)
     except Exception:
-        await _safe_delete_messages(
-            bot,
-            chat_id=sent_message.chat.id,
-            message_ids=[sent_message.message_id, *album_message_ids],
-        )
+        await _discard_published(bot, published)
         raise
 
     if activated is None:
-        await _safe_delete_messages(
-            bot,
-            chat_id=sent_message.chat.id,
-            message_ids=[sent_message.message_id, *album_message_ids],
-        )
+        await _discard_published(bot, published)
         await message.answer("Лот уже был опубликован. Обновите статус в личном чате с ботом.")
         return
 
-    post_username = sent_message.chat.username if isinstance(sent_message.chat.username, str) else None
+    for entry in chat_entries:
+        await cache_chat_metadata(entry)
+
     post_url = resolve_auction_post_link(
         chat_id=sent_message.chat.id,
         message_id=sent_message.message_id,
-        username=post_username,
+        username=chat_entry.username,
     )
     moderation_reply_markup = open_auction_post_keyboard(post_url) if post_url else None
     publisher_label = (
@@ -5,9 +5,9 @@ from datetime import UTC, datetime
 import uuid
 
 from aiogram import Bot
-from aiogram.exceptions import TelegramAPIError
 
 from app.db.enums import AuctionStatus
+from app.services.chat_metadata_service import get_chat_username
 from app.services.seller_dashboard_service import (
     SellerAuctionListItem,
     SellerAuctionPostItem,
@@ -226,15 +226,7 @@ async def _chat_username_by_id(bot: Bot, chat_id: int, cache: dict[int, str | No
     if chat_id in cache:
         return cache[chat_id]
 
-    username: str | None = None
-    try:
-        chat = await bot.get_chat(chat_id)
-        raw_username = getattr(chat, "username", None)
-        if isinstance(raw_username, str) and raw_username.strip():
-            username = raw_username.strip()
-    except TelegramAPIError:
-        username = None
-
+    username = await get_chat_username(bot, chat_id)
     cache[chat_id] = username
     return username
 
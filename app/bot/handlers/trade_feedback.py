@@ -9,7 +9,7 @@ from aiogram.types import Message
 
 from app.db.session import SessionFactory
 from app.services.private_topics_service import PrivateTopicPurpose, enforce_message_topic
-from app.services.trade_feedback_service import submit_trade_feedback
+from app.services.trade_feedback_service import invalidate_trade_feedback_summary_cache, submit_trade_feedback
 from app.services.user_service import upsert_user
 
 router = Router(name="trade_feedback")
@@ -73,4 +73,7 @@ async def command_tradefeedback(message: Message, bot: Bot | None = None) -> Non
         await message.answer(result.message)
         return
 
+    if result.item is not None:
+        await invalidate_trade_feedback_summary_cache([result.item.target_user_id])
+
     await message.answer(f"{result.message}. Оценка: {rating}/5")
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from aiogram import BaseMiddleware, Bot, Dispatcher
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import TelegramObject, Update
+
+from app.infra.metrics import (
+    DB_QUERIES_PER_UPDATE,
+    REGISTRY,
+    TELEGRAM_API_ERRORS_TOTAL,
+    TELEGRAM_API_SECONDS,
+    UPDATE_HANDLING_SECONDS,
+    count_db_queries,
+    install_db_query_counter,
+)
+
+
+def _update_type(event: TelegramObject) -> str:
+    if not isinstance(event, Update):
+        return type(event).__name__
+    try:
+        return event.event_type
+    except LookupError:
+        return "unknown"
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """Times each update and counts the database statements it issued."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        if not REGISTRY.enabled:
+            return await handler(event, data)
+
+        update_type = _update_type(event)
+        started = time.perf_counter()
+        with count_db_queries() as queries:
+            try:
+                return await handler(event, data)
+            finally:
+                UPDATE_HANDLING_SECONDS.observe(time.perf_counter() - started, update_type=update_type)
+                DB_QUERIES_PER_UPDATE.observe(queries.count, update_type=update_type)
+
+
+class TelegramApiMetricsMiddleware(BaseRequestMiddleware):
+    """Records Bot API latency and failures per method."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not REGISTRY.enabled:
+            return await make_request(bot, method)
+
+        api_method = getattr(method, "__api_method__", type(method).__name__)
+        started = time.perf_counter()
+        try:
+            return await make_request(bot, method)
+        except Exception as exc:
+            TELEGRAM_API_ERRORS_TOTAL.inc(method=api_method, error=type(exc).__name__)
+            raise
+        finally:
+            TELEGRAM_API_SECONDS.observe(time.perf_counter() - started, method=api_method)
+
+
+def install_bot_metrics(dp: Dispatcher, bot: Bot) -> None:
+    if not REGISTRY.enabled:
+        return
+    install_db_query_counter()
+    dp.update.outer_middleware(UpdateMetricsMiddleware())
+    bot.session.middleware(TelegramApiMetricsMiddleware())
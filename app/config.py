@@ -35,9 +35,29 @@ class Settings(BaseSettings):
     bot_username: str = ""
     database_url: str = "postgresql+asyncpg://auction:auction@db:5432/auction"
     redis_url: str = "redis://redis:6379/0"
+    database_replica_url: str = ""
+    db_replica_max_lag_seconds: int = 10
+    db_replica_lag_check_interval_seconds: int = 5
+    process_role: str = "bot"
+    db_pool_size_bot: int = 10
+    db_max_overflow_bot: int = 20
+    db_pool_size_admin: int = 5
+    db_max_overflow_admin: int = 5
+    db_pool_size_worker: int = 2
+    db_max_overflow_worker: int = 3
+    db_pool_timeout_seconds: int = 10
+    db_pool_recycle_seconds: int = 1800
+    db_statement_cache_size: int = 500
     tz: str = "Asia/Tashkent"
     app_config_file: str = "config/defaults.toml"
     log_level: str = "INFO"
+    metrics_enabled: bool = False
+    metrics_bind_host: str = "0.0.0.0"
+    metrics_port: int = 9102
+    metrics_auth_token: str = ""
+    metrics_buffer_enabled: bool = True
+    metrics_buffer_flush_interval_ms: int = 250
+    fsm_state_cache_enabled: bool = True
     admin_user_ids: str = ""
     admin_operator_user_ids: str = ""
     moderation_chat_id: str = ""
@@ -89,6 +109,7 @@ class Settings(BaseSettings):
     admin_web_auth_max_age_seconds: int = 86400
     admin_web_cookie_secure: bool = False
     admin_web_csrf_ttl_seconds: int = 7200
+    admin_web_base_url: str = ""
     anti_sniper_window_minutes: int = 2
     anti_sniper_extend_minutes: int = 3
     anti_sniper_max_extensions: int = 3
@@ -98,6 +119,12 @@ class Settings(BaseSettings):
     duplicate_bid_window_seconds: int = 15
     confirmation_ttl_seconds: int = 5
     complaint_cooldown_seconds: int = 60
+    inline_query_cache_ttl_seconds: int = 60
+    inline_query_result_cache_time_seconds: int = 10
+    inline_query_empty_cache_time_seconds: int = 300
+    trade_feedback_summary_cache_ttl_seconds: int = 300
+    chat_metadata_cache_ttl_seconds: int = 3600
+    chat_metadata_refresh_seconds: int = 86400
     soft_gate_require_private_start: bool = True
     soft_gate_mode: str = "grace"
     soft_gate_hint_interval_hours: int = 24
@@ -123,6 +150,13 @@ class Settings(BaseSettings):
     channel_dm_intake_chat_id: int = 0
     message_drafts_enabled: bool = True
     auction_watcher_interval_seconds: int = 5
+    auction_photo_album_window_ms: int = 700
+    auction_publish_mirror_chat_ids: str = ""
+    auction_publish_send_concurrency: int = 8
+    gallery_photo_cache_ttl_seconds: int = 3600
+    gallery_repeat_window_seconds: int = 600
+    gallery_chat_cooldown_seconds: int = 3
+    gallery_send_concurrency: int = 2
     fraud_alert_threshold: int = 60
     fraud_rapid_window_seconds: int = 120
     fraud_rapid_min_bids: int = 5
@@ -152,6 +186,9 @@ class Settings(BaseSettings):
     appeal_escalation_interval_seconds: int = 60
     appeal_escalation_batch_size: int = 50
     appeal_escalation_actor_tg_user_id: int = -1
+    appeal_escalation_digest_enabled: bool = True
+    appeal_escalation_digest_min_items: int = 3
+    appeal_escalation_digest_max_lines: int = 15
     feedback_intake_min_length: int = 10
     feedback_intake_cooldown_seconds: int = 90
     feedback_bug_reward_points: int = 30
@@ -170,6 +207,12 @@ class Settings(BaseSettings):
     points_redemption_min_balance: int = 0
     points_redemption_min_account_age_seconds: int = 0
     points_redemption_min_earned_points: int = 0
+    points_balance_reconcile_enabled: bool = True
+    points_balance_reconcile_interval_seconds: int = 3600
+    points_balance_reconcile_batch_size: int = 500
+    auction_aggregates_reconcile_enabled: bool = True
+    auction_aggregates_reconcile_interval_seconds: int = 3600
+    auction_aggregates_reconcile_batch_size: int = 500
     appeal_priority_boost_enabled: bool = True
     appeal_priority_boost_cost_points: int = 20
     appeal_priority_boost_daily_limit: int = 1
@@ -182,15 +225,32 @@ class Settings(BaseSettings):
     guarantor_priority_boost_cooldown_seconds: int = 0
     publish_high_risk_requires_guarantor: bool = True
     publish_guarantor_assignment_max_age_days: int = 30
+    retention_enabled: bool = True
+    retention_interval_seconds: int = 3600
+    retention_batch_size: int = 200
+    retention_batch_pause_ms: int = 50
+    retention_archive_auctions_enabled: bool = False
+    retention_archive_after_days: int = 180
+    retention_telemetry_rollup_after_days: int = 30
+    retention_notification_snooze_days: int = 7
+    retention_chat_owner_events_days: int = 180
+    retention_outbox_done_days: int = 14
+    retention_runs_days: int = 30
     github_automation_enabled: bool = False
     github_token: str = ""
     github_repo_owner: str = "Nombah501"
     github_repo_name: str = "LiteAuction"
+    github_api_base_url: str = "https://api.github.com"
+    github_http_pool_size: int = 8
     outbox_watcher_interval_seconds: int = 20
     outbox_batch_size: int = 20
     outbox_max_attempts: int = 5
     outbox_retry_base_seconds: int = 30
     outbox_retry_max_seconds: int = 1800
+    outbox_concurrency: int = 4
+    outbox_lease_seconds: int = 300
+    outbox_listen_enabled: bool = True
+    telegram_outbox_enabled: bool = True
     feedback_github_actor_tg_user_id: int = -998
 
     model_config = SettingsConfigDict(
@@ -227,6 +287,26 @@ class Settings(BaseSettings):
             return self.parsed_admin_user_ids()
         return [int(x) for x in raw]
 
+    def parsed_auction_publish_mirror_chat_ids(self) -> list[int]:
+        raw = [x.strip() for x in self.auction_publish_mirror_chat_ids.split(",") if x.strip()]
+        return list(dict.fromkeys(int(x) for x in raw))
+
+    def parsed_process_role(self) -> str:
+        normalized = self.process_role.strip().lower()
+        if normalized in {"bot", "admin", "worker"}:
+            return normalized
+        return "bot"
+
+    def parsed_db_pool_sizing(self, role: str | None = None) -> tuple[int, int]:
+        normalized_role = (role or self.parsed_process_role()).strip().lower()
+        raw_map = {
+            "bot": (self.db_pool_size_bot, self.db_max_overflow_bot),
+            "admin": (self.db_pool_size_admin, self.db_max_overflow_admin),
+            "worker": (self.db_pool_size_worker, self.db_max_overflow_worker),
+        }
+        pool_size, max_overflow = raw_map.get(normalized_role, raw_map["bot"])
+        return max(pool_size, 1), max(max_overflow, 0)
+
     def parsed_moderation_chat_id(self) -> int | None:
         value = self.moderation_chat_id.strip()
         if not value:
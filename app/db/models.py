@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import date, datetime
 
 from sqlalchemy import (
     BigInteger,
     Boolean,
     CheckConstraint,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
@@ -205,6 +206,10 @@ class UserRoleAssignment(Base):
     )
 
 
+def _default_current_price(context) -> int:
+    return context.get_current_parameters()["start_price"]
+
+
 class Auction(Base, TimestampMixin):
     __tablename__ = "auctions"
     __table_args__ = (
@@ -244,6 +249,14 @@ class Auction(Base, TimestampMixin):
     winner_user_id: Mapped[int | None] = mapped_column(
         ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
+    # Bid aggregates over live and archived bids that are not removed. Kept in step
+    # under the auction row lock by every bid write; see auction_aggregates_service.
+    bid_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    current_price: Mapped[int] = mapped_column(Integer, nullable=False, default=_default_current_price)
+    top_bidder_user_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+    last_bid_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
 class AuctionPhoto(Base):
@@ -265,11 +278,24 @@ class AuctionPhoto(Base):
 
 class Bid(Base):
     __tablename__ = "bids"
-    __table_args__ = (CheckConstraint("amount >= 1", name="bids_amount_positive"),)
+    __table_args__ = (
+        CheckConstraint("amount >= 1", name="bids_amount_positive"),
+        # Top bid / leaderboard: live bids of a lot by amount, earliest first on ties.
+        Index(
+            "ix_bids_auction_live_amount",
+            "auction_id",
+            text("amount DESC"),
+            "created_at",
+            postgresql_where=text("is_removed IS false"),
+        ),
+        # Bid history and fraud windows; also serves plain auction_id lookups.
+        Index("ix_bids_auction_created_at", "auction_id", "created_at"),
+        Index("ix_bids_user_created_at", "user_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     auction_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("auctions.id", ondelete="CASCADE"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("auctions.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
     amount: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -303,6 +329,8 @@ class AuctionPost(Base):
     published_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=text("TIMEZONE('utc', NOW())"), nullable=False
     )
+    # sha256 of the caption, keyboard and photo last applied to the message; NULL forces an edit.
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
 
 class BlacklistEntry(Base):
@@ -324,6 +352,14 @@ class BlacklistEntry(Base):
 
 class ModerationLog(Base):
     __tablename__ = "moderation_logs"
+    __table_args__ = (
+        Index(
+            "ix_moderation_logs_auction_created_at",
+            "auction_id",
+            "created_at",
+            postgresql_where=text("auction_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     actor_user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False)
@@ -417,6 +453,28 @@ class ChatOwnerServiceEventAudit(Base):
     )
 
 
+class ChatMetadata(Base, TimestampMixin):
+    """Registry of chats the bot posts to, used to build post links without ``getChat``.
+
+    Rows are written from ``my_chat_member`` updates, from publish results and from
+    ``getChat`` refreshes once ``refreshed_at`` is older than the configured TTL.
+    """
+
+    __tablename__ = "chat_metadata"
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    chat_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    title: Mapped[str | None] = mapped_column(Text, nullable=True)
+    username: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    is_forum: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default=text("false"))
+    bot_status: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("TIMEZONE('utc', NOW())"),
+        nullable=False,
+    )
+
+
 class RuntimeSettingOverride(Base):
     __tablename__ = "runtime_setting_overrides"
     __table_args__ = (
@@ -792,6 +850,30 @@ class TradeFeedback(Base, TimestampMixin):
     moderated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
+class UserReputationSummary(Base, TimestampMixin):
+    """Per-user rollup of received ``trade_feedback``, maintained by the feedback service.
+
+    ``visible_rating_<n>`` is the histogram of visible ratings; hidden feedback only
+    counts towards ``total_received`` and ``hidden_received``.
+    """
+
+    __tablename__ = "user_reputation_summaries"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_received: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visible_received: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    hidden_received: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visible_rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    visible_rating_1: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visible_rating_2: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visible_rating_3: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visible_rating_4: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    visible_rating_5: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+
 class GuarantorRequest(Base, TimestampMixin):
     __tablename__ = "guarantor_requests"
     __table_args__ = (
@@ -828,12 +910,14 @@ class IntegrationOutbox(Base, TimestampMixin):
     __table_args__ = (
         UniqueConstraint("dedupe_key", name="uq_integration_outbox_dedupe_key"),
         Index("ix_integration_outbox_status_next_retry_at", "status", "next_retry_at"),
+        Index("ix_integration_outbox_claim", "status", "priority", "next_retry_at"),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     event_type: Mapped[str] = mapped_column(String(120), nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
     dedupe_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    priority: Mapped[int] = mapped_column(SmallInteger, nullable=False, server_default="50")
     attempts: Mapped[int] = mapped_column(SmallInteger, nullable=False, server_default="0")
     next_retry_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -876,6 +960,35 @@ class PointsLedgerEntry(Base, TimestampMixin):
     payload: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
 
+class UserPointsBalance(Base, TimestampMixin):
+    """Per-user rollup of ``points_ledger``, maintained by ``grant_points``.
+
+    Redemption counters are bucketed by UTC day, ISO week and month; a counter whose
+    ``*_start`` is not the current period reads as zero.
+    """
+
+    __tablename__ = "user_points_balances"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    balance: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    total_earned: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    total_spent: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    operations_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    last_redemption_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    redemption_day_start: Mapped[date | None] = mapped_column(Date, nullable=True)
+    redemptions_day_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    redemptions_day_spent: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    redemption_week_start: Mapped[date | None] = mapped_column(Date, nullable=True)
+    redemptions_week_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    redemptions_week_spent: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    redemption_month_start: Mapped[date | None] = mapped_column(Date, nullable=True)
+    redemptions_month_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    redemptions_month_spent: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+
 class FraudSignal(Base):
     __tablename__ = "fraud_signals"
     __table_args__ = (
@@ -906,3 +1019,118 @@ class FraudSignal(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=text("TIMEZONE('utc', NOW())"), nullable=False, index=True
     )
+
+
+# Archive tables: rows moved out of the hot tables by app.services.retention_service once
+# their auction has been closed for longer than the retention horizon. Same columns as the
+# source table plus ``archived_at``; no foreign keys, so archived rows never block deletes.
+
+
+class BidArchive(Base):
+    __tablename__ = "bids_archive"
+    __table_args__ = (
+        Index("ix_bids_archive_auction_created_at", "auction_id", "created_at"),
+        Index("ix_bids_archive_user_created_at", "user_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    auction_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    amount: Mapped[int] = mapped_column(Integer, nullable=False)
+    is_removed: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    removed_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
+    removed_by_user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("TIMEZONE('utc', NOW())"), nullable=False
+    )
+
+
+class ModerationLogArchive(Base):
+    __tablename__ = "moderation_logs_archive"
+    __table_args__ = (
+        Index("ix_moderation_logs_archive_auction_created_at", "auction_id", "created_at"),
+        Index("ix_moderation_logs_archive_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    actor_user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    target_user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    auction_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    bid_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    action: Mapped[ModerationAction] = mapped_column(
+        Enum(ModerationAction, name="moderation_action"), nullable=False
+    )
+    reason: Mapped[str] = mapped_column(Text, nullable=False)
+    payload: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("TIMEZONE('utc', NOW())"), nullable=False
+    )
+
+
+class FraudSignalArchive(Base):
+    __tablename__ = "fraud_signals_archive"
+    __table_args__ = (Index("ix_fraud_signals_archive_auction_created_at", "auction_id", "created_at"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)
+    auction_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    bid_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+    reasons: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    queue_chat_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    queue_message_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    resolved_by_user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    resolution_note: Mapped[str | None] = mapped_column(Text, nullable=True)
+    resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=text("TIMEZONE('utc', NOW())"), nullable=False
+    )
+
+
+# Hourly rollup of admin_queue_preset_telemetry_events rows past the raw retention horizon.
+class AdminQueuePresetTelemetryHourly(Base):
+    __tablename__ = "admin_queue_preset_telemetry_hourly"
+    __table_args__ = (
+        Index(
+            "uq_admin_queue_preset_telemetry_hourly_bucket",
+            "bucket_start",
+            "queue_context",
+            "queue_key",
+            text("COALESCE(preset_id, 0)"),
+            "action",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    queue_context: Mapped[str] = mapped_column(String(32), nullable=False)
+    queue_key: Mapped[str] = mapped_column(String(32), nullable=False)
+    preset_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    action: Mapped[str] = mapped_column(String(32), nullable=False)
+    events_total: Mapped[int] = mapped_column(Integer, nullable=False)
+    time_to_action_sum_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    time_to_action_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    filter_churn_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    reopen_total: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+
+
+class RetentionRun(Base):
+    __tablename__ = "retention_runs"
+    __table_args__ = (
+        CheckConstraint("status IN ('ok', 'error')", name="retention_runs_status_values"),
+        Index("ix_retention_runs_policy_started_at", "policy", "started_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    policy: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    rows_affected: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    batches: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass(slots=True)
+class PoolCheckoutCounters:
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_total_seconds: float = 0.0
+    wait_max_seconds: float = 0.0
+
+    def observe(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_total_seconds += wait_seconds
+        if wait_seconds > self.wait_max_seconds:
+            self.wait_max_seconds = wait_seconds
+
+
+@dataclass(slots=True, frozen=True)
+class DatabasePoolSnapshot:
+    bind: str
+    process_role: str
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    checkouts_total: int
+    checkout_timeouts_total: int
+    checkout_wait_avg_ms: float
+    checkout_wait_max_ms: float
+
+    @property
+    def capacity(self) -> int:
+        return self.pool_size + max(self.max_overflow, 0)
+
+    @property
+    def saturation_percent(self) -> float:
+        if self.capacity <= 0:
+            return 0.0
+        return round((self.checked_out / self.capacity) * 100.0, 1)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection checkout."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkout_counters = PoolCheckoutCounters()
+
+    def recreate(self) -> InstrumentedAsyncQueuePool:
+        pool = super().recreate()
+        pool.checkout_counters = self.checkout_counters
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.checkout_counters.timeouts += 1
+            raise
+        self.checkout_counters.observe(time.perf_counter() - started)
+        return connection
+
+
+def build_pool_snapshot(
+    *,
+    bind: str,
+    process_role: str,
+    engine: AsyncEngine,
+    max_overflow: int,
+) -> DatabasePoolSnapshot:
+    pool = engine.sync_engine.pool
+    counters = getattr(pool, "checkout_counters", None) or PoolCheckoutCounters()
+    is_queue_pool = isinstance(pool, AsyncAdaptedQueuePool)
+    pool_size = pool.size() if is_queue_pool else 0
+    checked_out = pool.checkedout() if is_queue_pool else 0
+    overflow = max(pool.overflow(), 0) if is_queue_pool else 0
+
+    wait_avg_ms = 0.0
+    if counters.checkouts > 0:
+        wait_avg_ms = round((counters.wait_total_seconds / counters.checkouts) * 1000.0, 2)
+
+    return DatabasePoolSnapshot(
+        bind=bind,
+        process_role=process_role,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        checked_out=checked_out,
+        overflow=overflow,
+        checkouts_total=counters.checkouts,
+        checkout_timeouts_total=counters.timeouts,
+        checkout_wait_avg_ms=wait_avg_ms,
+        checkout_wait_max_ms=round(counters.wait_max_seconds * 1000.0, 2),
+    )
@@ -1,12 +1,213 @@
 from __future__ import annotations
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import functools
+import logging
+import time
+from typing import ParamSpec, TypeVar
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.db.pool_metrics import DatabasePoolSnapshot, InstrumentedAsyncQueuePool, build_pool_snapshot
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+PROCESS_ROLE = settings.parsed_process_role()
+_POOL_SIZE, _MAX_OVERFLOW = settings.parsed_db_pool_sizing(PROCESS_ROLE)
+_read_replica_requested: ContextVar[bool] = ContextVar("db_read_replica_requested", default=False)
+
+# A caught-up streaming replica reports zero lag even when the primary is idle.
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+
+def _build_engine(database_url: str) -> AsyncEngine:
+    statement_cache_size = max(settings.db_statement_cache_size, 0)
+    return create_async_engine(
+        database_url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_size=_POOL_SIZE,
+        max_overflow=_MAX_OVERFLOW,
+        pool_timeout=max(settings.db_pool_timeout_seconds, 1),
+        pool_recycle=settings.db_pool_recycle_seconds if settings.db_pool_recycle_seconds > 0 else -1,
+        connect_args={
+            "prepared_statement_cache_size": statement_cache_size,
+            "statement_cache_size": statement_cache_size,
+            "server_settings": {"application_name": f"liteauction-{PROCESS_ROLE}"},
+        },
+    )
+
+
+engine = _build_engine(settings.database_url)
+replica_engine: AsyncEngine | None = None
+if settings.database_replica_url.strip():
+    replica_engine = _build_engine(settings.database_replica_url.strip())
+
+
+_WROTE_TO_PRIMARY = "routing_wrote_to_primary"
+
+
+class RoutingSession(Session):
+    """Sends reads issued inside ``read_replica_scope()`` to the replica bind when one is configured.
+
+    Once the current transaction has written (a flush or a DML statement), every later
+    read of that transaction stays on the primary: the replica cannot see uncommitted
+    rows and would put stale ones into the identity map.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:  # type: ignore[override]
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info[_WROTE_TO_PRIMARY] = True
+        elif (
+            replica_engine is not None
+            and _read_replica_requested.get()
+            and not self.info.get(_WROTE_TO_PRIMARY)
+        ):
+            return replica_engine.sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _forget_primary_writes(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_WROTE_TO_PRIMARY, None)
+
+
+SessionFactory = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+)
+
+
+@dataclass(slots=True)
+class _ReplicaHealth:
+    checked_at: float = 0.0
+    usable: bool = False
+    lag_seconds: float | None = None
+
+
+_replica_health = _ReplicaHealth()
+_replica_health_lock = asyncio.Lock()
+
+
+async def _probe_replica_lag_seconds() -> float:
+    if replica_engine is None:
+        raise RuntimeError("Read replica is not configured")
+    async with replica_engine.connect() as connection:
+        lag = await connection.scalar(_REPLICA_LAG_SQL)
+    return float(lag or 0)
+
+
+async def _replica_is_usable() -> bool:
+    if replica_engine is None:
+        return False
+
+    interval = max(settings.db_replica_lag_check_interval_seconds, 0)
+    if _replica_health.checked_at and time.monotonic() - _replica_health.checked_at < interval:
+        return _replica_health.usable
+
+    async with _replica_health_lock:
+        if _replica_health.checked_at and time.monotonic() - _replica_health.checked_at < interval:
+            return _replica_health.usable
+
+        max_lag = max(settings.db_replica_max_lag_seconds, 0)
+        try:
+            lag_seconds: float | None = await _probe_replica_lag_seconds()
+        except Exception:
+            logger.warning("Read replica probe failed, reading from primary", exc_info=True)
+            lag_seconds = None
+
+        usable = lag_seconds is not None and lag_seconds <= max_lag
+        if lag_seconds is not None and not usable:
+            logger.warning(
+                "Read replica lag %.1fs exceeds %ss, reading from primary",
+                lag_seconds,
+                max_lag,
+            )
+        _replica_health.checked_at = time.monotonic()
+        _replica_health.usable = usable
+        _replica_health.lag_seconds = lag_seconds
+        return usable
+
+
+def reset_replica_health() -> None:
+    _replica_health.checked_at = 0.0
+    _replica_health.usable = False
+    _replica_health.lag_seconds = None
+
+
+@asynccontextmanager
+async def read_replica_scope() -> AsyncIterator[bool]:
+    """Routes reads to the replica while it is configured and within the allowed lag.
+
+    Yields whether the replica is actually used; writes flushed inside the scope
+    always go to the primary.
+    """
+
+    if _read_replica_requested.get():
+        yield True
+        return
+
+    if not await _replica_is_usable():
+        yield False
+        return
+
+    token = _read_replica_requested.set(True)
+    try:
+        yield True
+    finally:
+        _read_replica_requested.reset(token)
+
+
+def read_only(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Marks a query-only service function as safe to serve from the read replica."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        async with read_replica_scope():
+            return await func(*args, **kwargs)
+
+    return wrapper
+
 
-engine = create_async_engine(settings.database_url, pool_pre_ping=True)
-SessionFactory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+def load_database_pool_snapshots() -> tuple[DatabasePoolSnapshot, ...]:
+    snapshots = [
+        build_pool_snapshot(
+            bind="primary",
+            process_role=PROCESS_ROLE,
+            engine=engine,
+            max_overflow=_MAX_OVERFLOW,
+        )
+    ]
+    if replica_engine is not None:
+        snapshots.append(
+            build_pool_snapshot(
+                bind="replica",
+                process_role=PROCESS_ROLE,
+                engine=replica_engine,
+                max_overflow=_MAX_OVERFLOW,
+            )
+        )
+    return tuple(snapshots)
 
 
 async def ping_database() -> None:
@@ -16,3 +217,5 @@ async def ping_database() -> None:
 
 async def dispose_database() -> None:
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
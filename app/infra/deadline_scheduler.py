@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+from collections.abc import Hashable
+from datetime import UTC, datetime
+
+
+class DeadlineScheduler:
+    """Min-heap of deadlines keyed by an arbitrary hashable key.
+
+    Rescheduling a key replaces its deadline; stale heap entries are skipped lazily
+    when they reach the top. ``wait`` sleeps until the earliest deadline (or the
+    timeout) and wakes up early when an earlier deadline is scheduled meanwhile; the
+    caller then reloads what is due from its source of truth and calls ``replace``.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int, Hashable]] = []
+        self._deadlines: dict[Hashable, datetime] = {}
+        self._sequence = 0
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, key: Hashable, deadline: datetime) -> None:
+        if self._deadlines.get(key) == deadline:
+            return
+        earliest = self.next_deadline()
+        self._deadlines[key] = deadline
+        self._sequence += 1
+        heapq.heappush(self._heap, (deadline, self._sequence, key))
+        if earliest is None or deadline < earliest:
+            self._changed.set()
+
+    def cancel(self, key: Hashable) -> None:
+        self._deadlines.pop(key, None)
+
+    def replace(self, deadlines: dict[Hashable, datetime]) -> None:
+        """Makes ``deadlines`` the complete schedule, e.g. after reloading it from the database."""
+
+        for key in [key for key in self._deadlines if key not in deadlines]:
+            self.cancel(key)
+        for key, deadline in deadlines.items():
+            self.schedule(key, deadline)
+
+    def next_deadline(self) -> datetime | None:
+        while self._heap:
+            deadline, _, key = self._heap[0]
+            if self._deadlines.get(key) == deadline:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    async def wait(self, *, timeout: float) -> None:
+        """Returns once the earliest deadline has passed or ``timeout`` seconds elapsed."""
+
+        loop = asyncio.get_running_loop()
+        wake_at = loop.time() + max(timeout, 0.0)
+        while True:
+            delay = wake_at - loop.time()
+            deadline = self.next_deadline()
+            if deadline is not None:
+                delay = min(delay, (deadline - datetime.now(UTC)).total_seconds())
+            if delay <= 0:
+                return
+            self._changed.clear()
+            # Both a timeout and an earlier deadline loop back to recompute the delay.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._changed.wait(), timeout=delay)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+AlbumFlushCallback = Callable[[list[str]], Awaitable[None]]
+AlbumFlushGuard = Callable[[], AbstractAsyncContextManager[object]]
+
+
+@dataclass(slots=True)
+class _PendingAlbum:
+    parts: dict[int, str] = field(default_factory=dict)
+    last_part_at: float = 0.0
+    on_flush: AlbumFlushCallback | None = None
+    guard: AlbumFlushGuard | None = None
+    task: asyncio.Task[None] | None = None
+
+
+class MediaGroupBuffer:
+    """Collects the parts of a Telegram album and hands them over in a single call.
+
+    Telegram delivers every photo of an album as its own update. The part that opens
+    an album schedules a flush once no new part has arrived for ``window_seconds``;
+    later parts are only appended in memory. The flush callback receives the items
+    ordered by ``message_id``, which is the order the user arranged the album in.
+    Albums are grouped under a caller-defined scope (chat and user) so handlers can
+    flush everything still pending before they read the state the albums write to.
+
+    The timed flush runs outside any update, so it enters ``guard`` (the FSM event
+    isolation lock of the scope) before it takes the album: it never writes state
+    concurrently with a handler, and a handler holding that lock can still flush the
+    album itself without waiting for the timer.
+    """
+
+    def __init__(self) -> None:
+        self._albums: dict[tuple[Hashable, str], _PendingAlbum] = {}
+        self._delivering: dict[tuple[Hashable, str], asyncio.Task[None]] = {}
+
+    @property
+    def pending_albums(self) -> int:
+        return len(self._albums)
+
+    def add(self, scope: Hashable, media_group_id: str, *, message_id: int, item: str) -> bool:
+        """Buffers one album part; returns True when this part opened the album."""
+
+        key = (scope, media_group_id)
+        album = self._albums.get(key)
+        opened = album is None
+        if album is None:
+            album = _PendingAlbum()
+            self._albums[key] = album
+        album.parts.setdefault(message_id, item)
+        album.last_part_at = asyncio.get_running_loop().time()
+        return opened
+
+    def schedule(
+        self,
+        scope: Hashable,
+        media_group_id: str,
+        on_flush: AlbumFlushCallback,
+        *,
+        window_seconds: float,
+        guard: AlbumFlushGuard | None = None,
+    ) -> None:
+        key = (scope, media_group_id)
+        album = self._albums.get(key)
+        if album is None or album.task is not None:
+            return
+        album.on_flush = on_flush
+        album.guard = guard
+        album.task = asyncio.create_task(self._flush_after_quiet_window(key, max(window_seconds, 0.0)))
+
+    def discard(self, scope: Hashable, media_group_id: str) -> None:
+        album = self._albums.pop((scope, media_group_id), None)
+        if album is not None and album.task is not None:
+            album.task.cancel()
+
+    async def flush_scope(self, scope: Hashable) -> int:
+        """Delivers every pending album of ``scope`` now and waits for in-flight ones."""
+
+        flushed = 0
+        for key in [key for key in self._albums if key[0] == scope]:
+            album = self._albums.pop(key, None)
+            if album is None:
+                continue
+            if album.task is not None:
+                album.task.cancel()
+            await self._deliver(key, album)
+            flushed += 1
+        for key, task in list(self._delivering.items()):
+            if key[0] == scope and task is not asyncio.current_task():
+                await asyncio.shield(task)
+        return flushed
+
+    async def stop(self) -> None:
+        """Delivers everything still buffered; used on shutdown."""
+
+        for scope in {key[0] for key in self._albums}:
+            await self.flush_scope(scope)
+        for task in list(self._delivering.values()):
+            await asyncio.shield(task)
+
+    async def _flush_after_quiet_window(self, key: tuple[Hashable, str], window_seconds: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            album = self._albums.get(key)
+            if album is None:
+                return
+            delay = album.last_part_at + window_seconds - loop.time()
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+
+        async with album.guard() if album.guard is not None else nullcontext():
+            # A handler may have flushed the album while this task waited for the lock.
+            album = self._albums.pop(key, None)
+            if album is None:
+                return
+            self._delivering[key] = asyncio.current_task()
+            try:
+                await self._deliver(key, album)
+            finally:
+                self._delivering.pop(key, None)
+
+    async def _deliver(self, key: tuple[Hashable, str], album: _PendingAlbum) -> None:
+        if album.on_flush is None or not album.parts:
+            return
+        items = [album.parts[message_id] for message_id in sorted(album.parts)]
+        try:
+            await album.on_flush(items)
+        except Exception:  # pragma: no cover - defensive safety around handler callbacks
+            logger.warning(
+                "media_group_flush_failed scope=%s media_group_id=%s parts=%s",
+                key[0],
+                key[1],
+                len(items),
+                exc_info=True,
+            )
+
+
+media_group_buffer = MediaGroupBuffer()
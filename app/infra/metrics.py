@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import hmac
+import logging
+import math
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+LAG_BUCKETS: tuple[float, ...] = (1, 5, 15, 30, 60, 120, 300, 900, 1800, 3600, 21600)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, extra: tuple[str, str] | None = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    if not pairs:
+        return ""
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass(slots=True)
+class _Metric:
+    name: str
+    documentation: str
+    labelnames: tuple[str, ...]
+    registry: MetricsRegistry
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        try:
+            if len(labels) == len(self.labelnames):
+                return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            pass
+        raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+
+@dataclass(slots=True)
+class Counter(_Metric):
+    _values: dict[LabelValues, float] = field(default_factory=dict, repr=False)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = self._label_values(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+@dataclass(slots=True)
+class Gauge(_Metric):
+    _values: dict[LabelValues, float] = field(default_factory=dict, repr=False)
+
+    def set(self, value: float, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+@dataclass(slots=True)
+class _HistogramSeries:
+    bucket_counts: list[int]
+    count: int = 0
+    total: float = 0.0
+
+
+@dataclass(slots=True)
+class Histogram(_Metric):
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    _series: dict[LabelValues, _HistogramSeries] = field(default_factory=dict, repr=False)
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries(bucket_counts=[0] * len(self.buckets))
+                self._series[key] = series
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    series.bucket_counts[index] += 1
+                    break
+            series.count += 1
+            series.total += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        if not self.registry.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(
+                (key, list(series.bucket_counts), series.count, series.total)
+                for key, series in self._series.items()
+            )
+        for key, bucket_counts, count, total in items:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(upper_bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key, ("le", "+Inf"))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process metric store rendered in the Prometheus text exposition format.
+
+    Every recording call returns immediately while the registry is disabled, so
+    instrumented hot paths cost one attribute check when metrics are off. Collectors
+    run right before each render to set gauges that mirror state owned elsewhere.
+    """
+
+    def __init__(self, *, enabled: bool) -> None:
+        self.enabled = enabled
+        self._metrics: dict[str, Counter | Gauge | Histogram] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def _register(self, metric: Counter | Gauge | Histogram) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name=name, documentation=documentation, labelnames=labelnames, registry=self)
+        self._register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        metric = Gauge(name=name, documentation=documentation, labelnames=labelnames, registry=self)
+        self._register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labelnames,
+            registry=self,
+            buckets=tuple(sorted(buckets)),
+        )
+        self._register(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        if not self.enabled:
+            return
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                logger.exception("Metrics collector failed: %s", getattr(collector, "__name__", collector))
+
+    def render(self) -> str:
+        self.collect()
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry(enabled=settings.metrics_enabled)
+
+BID_CALLBACK_PHASE_SECONDS = REGISTRY.histogram(
+    "liteauction_bid_callback_phase_seconds",
+    "Time spent in each phase of bid and buyout callbacks.",
+    ("action", "phase"),
+)
+UPDATE_HANDLING_SECONDS = REGISTRY.histogram(
+    "liteauction_update_handling_seconds",
+    "Time spent handling one Telegram update.",
+    ("update_type",),
+)
+DB_QUERIES_PER_UPDATE = REGISTRY.histogram(
+    "liteauction_db_queries_per_update",
+    "Database statements executed while handling one Telegram update.",
+    ("update_type",),
+    buckets=QUERY_COUNT_BUCKETS,
+)
+FSM_BACKEND_CALLS_PER_UPDATE = REGISTRY.histogram(
+    "liteauction_fsm_backend_calls_per_update",
+    "FSM storage calls that reached Redis while handling one update.",
+    buckets=QUERY_COUNT_BUCKETS,
+)
+TELEGRAM_API_SECONDS = REGISTRY.histogram(
+    "liteauction_telegram_api_seconds",
+    "Telegram Bot API call latency by method.",
+    ("method",),
+)
+TELEGRAM_API_ERRORS_TOTAL = REGISTRY.counter(
+    "liteauction_telegram_api_errors_total",
+    "Telegram Bot API call failures by method and error class.",
+    ("method", "error"),
+)
+WATCHER_LOOP_SECONDS = REGISTRY.histogram(
+    "liteauction_watcher_loop_seconds",
+    "Duration of one background watcher iteration.",
+    ("watcher", "outcome"),
+)
+SLA_ESCALATION_LAG_SECONDS = REGISTRY.histogram(
+    "liteauction_sla_escalation_lag_seconds",
+    "Delay between an SLA deadline and the escalation that handled it.",
+    ("queue",),
+    buckets=LAG_BUCKETS,
+)
+AUCTION_POST_EDITS_TOTAL = REGISTRY.counter(
+    "liteauction_auction_post_edits_total",
+    "Auction post refreshes by outcome: applied, skipped (content unchanged) or failed.",
+    ("outcome",),
+)
+OUTBOX_EVENT_LAG_SECONDS = REGISTRY.histogram(
+    "liteauction_outbox_event_lag_seconds",
+    "Delay between enqueueing an outbox event and the attempt that processed it.",
+    ("event_type", "outcome"),
+    buckets=LAG_BUCKETS,
+)
+
+DB_POOL_CONNECTIONS_IN_USE = REGISTRY.gauge(
+    "liteauction_db_pool_connections_in_use",
+    "Connections currently checked out of the SQLAlchemy pool.",
+    ("bind", "process_role"),
+)
+DB_POOL_OVERFLOW = REGISTRY.gauge(
+    "liteauction_db_pool_overflow",
+    "Connections open beyond the pool size.",
+    ("bind", "process_role"),
+)
+DB_POOL_CAPACITY = REGISTRY.gauge(
+    "liteauction_db_pool_capacity",
+    "Pool size plus max overflow: the most connections the pool hands out.",
+    ("bind", "process_role"),
+)
+DB_POOL_CHECKOUT_WAIT_AVG_SECONDS = REGISTRY.gauge(
+    "liteauction_db_pool_checkout_wait_avg_seconds",
+    "Average time callers waited for a pool checkout since the process started.",
+    ("bind", "process_role"),
+)
+DB_POOL_CHECKOUT_WAIT_MAX_SECONDS = REGISTRY.gauge(
+    "liteauction_db_pool_checkout_wait_max_seconds",
+    "Longest pool checkout wait since the process started.",
+    ("bind", "process_role"),
+)
+
+
+def collect_database_pool_metrics() -> None:
+    # Imported here so loading the metrics module does not create the engines.
+    from app.db.session import load_database_pool_snapshots
+
+    for snapshot in load_database_pool_snapshots():
+        labels = {"bind": snapshot.bind, "process_role": snapshot.process_role}
+        DB_POOL_CONNECTIONS_IN_USE.set(snapshot.checked_out, **labels)
+        DB_POOL_OVERFLOW.set(snapshot.overflow, **labels)
+        DB_POOL_CAPACITY.set(snapshot.capacity, **labels)
+        DB_POOL_CHECKOUT_WAIT_AVG_SECONDS.set(snapshot.checkout_wait_avg_ms / 1000.0, **labels)
+        DB_POOL_CHECKOUT_WAIT_MAX_SECONDS.set(snapshot.checkout_wait_max_ms / 1000.0, **labels)
+
+
+REGISTRY.add_collector(collect_database_pool_metrics)
+
+
+@dataclass(slots=True)
+class _QueryCounter:
+    count: int = 0
+
+
+_update_query_counter: ContextVar[_QueryCounter | None] = ContextVar("metrics_update_query_counter", default=None)
+_db_listener_installed = False
+
+
+def _count_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _update_query_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+def install_db_query_counter() -> None:
+    global _db_listener_installed
+    if not REGISTRY.enabled or _db_listener_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _count_cursor_execute)
+    _db_listener_installed = True
+
+
+@contextmanager
+def count_db_queries() -> Iterator[_QueryCounter]:
+    """Counts statements issued by the current task (SQLAlchemy greenlets share its context)."""
+
+    counter = _QueryCounter()
+    token = _update_query_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _update_query_counter.reset(token)
+
+
+def is_metrics_request_authorized(authorization_header: str | None) -> bool:
+    expected = settings.metrics_auth_token.strip()
+    if not expected:
+        return True
+    if not authorization_header or not authorization_header.startswith("Bearer "):
+        return False
+    return hmac.compare_digest(authorization_header[len("Bearer ") :].strip(), expected)
+
+
+def _http_response(status: str, body: str, *, content_type: str = "text/plain; charset=utf-8") -> bytes:
+    payload = body.encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("ascii") + payload
+
+
+async def _handle_metrics_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        request_line = (await asyncio.wait_for(reader.readline(), timeout=5)).decode("latin-1")
+        authorization: str | None = None
+        while True:
+            header_line = (await asyncio.wait_for(reader.readline(), timeout=5)).decode("latin-1")
+            if header_line in {"\r\n", "\n", ""}:
+                break
+            name, _, value = header_line.partition(":")
+            if name.strip().lower() == "authorization":
+                authorization = value.strip()
+
+        parts = request_line.split()
+        path = parts[1].split("?", 1)[0] if len(parts) >= 2 else ""
+        if len(parts) < 2 or parts[0] != "GET" or path != "/metrics":
+            response = _http_response("404 Not Found", "not found\n")
+        elif not is_metrics_request_authorized(authorization):
+            response = _http_response("401 Unauthorized", "unauthorized\n")
+        else:
+            response = _http_response("200 OK", REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+        writer.write(response)
+        await writer.drain()
+    except (asyncio.TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_http_server() -> asyncio.Server | None:
+    """Serves ``GET /metrics`` for processes without a web app (the polling bot)."""
+
+    if not REGISTRY.enabled:
+        return None
+    server = await asyncio.start_server(
+        _handle_metrics_connection,
+        host=settings.metrics_bind_host,
+        port=settings.metrics_port,
+    )
+    logger.info("Metrics endpoint listening on %s:%s/metrics", settings.metrics_bind_host, settings.metrics_port)
+    return server
+
+
+async def stop_metrics_http_server(server: asyncio.Server | None) -> None:
+    if server is None:
+        return
+    server.close()
+    await server.wait_closed()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+from redis.asyncio import Redis
+
+from app.infra.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+_MAX_PENDING_KEYS = 20_000
+
+
+class RedisCounterBuffer:
+    """Accumulates Redis counter increments in memory and flushes them in one pipeline.
+
+    Increments are only buffered while the flush loop runs (see ``start``); otherwise
+    callers are expected to write through, so one-off scripts and the admin app never
+    lose counts to a buffer nobody flushes.
+    """
+
+    def __init__(self, redis: Redis | None = None, *, max_pending_keys: int = _MAX_PENDING_KEYS) -> None:
+        self._redis = redis
+        self._max_pending_keys = max(max_pending_keys, 1)
+        self._pending: dict[tuple[str, str | None], int] = {}
+        self._expire_seconds: dict[str, int] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def pending_keys(self) -> int:
+        return len(self._pending)
+
+    def incr(
+        self,
+        key: str,
+        amount: int = 1,
+        *,
+        field: str | None = None,
+        expire_seconds: int | None = None,
+    ) -> None:
+        """Adds ``amount`` to a plain counter, or to ``field`` of a hash when given."""
+
+        pending_key = (key, field)
+        self._pending[pending_key] = self._pending.get(pending_key, 0) + amount
+        if expire_seconds is not None:
+            self._expire_seconds[key] = expire_seconds
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+            expire_seconds, self._expire_seconds = self._expire_seconds, {}
+
+            redis = self._redis or redis_client
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for (key, field), amount in pending.items():
+                        if field is None:
+                            pipe.incrby(key, amount)
+                        else:
+                            pipe.hincrby(key, field, amount)
+                    for key, ttl in expire_seconds.items():
+                        pipe.expire(key, ttl)
+                    await pipe.execute()
+            except Exception:  # pragma: no cover - defensive safety around redis runtime
+                self._requeue(pending, expire_seconds)
+                logger.warning(
+                    "metrics_buffer_flush_failed keys=%s requeued=%s",
+                    len(pending),
+                    len(self._pending),
+                    exc_info=True,
+                )
+                return 0
+            return len(pending)
+
+    def _requeue(
+        self,
+        pending: dict[tuple[str, str | None], int],
+        expire_seconds: dict[str, int],
+    ) -> None:
+        for pending_key, amount in pending.items():
+            if pending_key not in self._pending and len(self._pending) >= self._max_pending_keys:
+                continue
+            self._pending[pending_key] = self._pending.get(pending_key, 0) + amount
+            key = pending_key[0]
+            if key in expire_seconds:
+                self._expire_seconds.setdefault(key, expire_seconds[key])
+
+    async def _run(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pragma: no cover - defensive safety around redis runtime
+                logger.warning("metrics_buffer_loop_failed", exc_info=True)
+
+    def start(self, *, interval_seconds: float) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(max(interval_seconds, 0.01)))
+
+    async def stop(self) -> None:
+        """Stops the flush loop and writes out whatever is still buffered."""
+
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+
+metrics_buffer = RedisCounterBuffer()
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+
+class SendBudget:
+    """Process-wide cap on concurrent Telegram sends of one kind.
+
+    ``limit`` is read when the semaphore is created for the running event loop, so
+    settings patched before the loop starts (or in tests, per loop) take effect.
+    Usage: ``async with budget(): await bot.send_...``.
+    """
+
+    def __init__(self, limit: Callable[[], int]) -> None:
+        self._limit = limit
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def __call__(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(max(self._limit(), 1))
+        return self._semaphore
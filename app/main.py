@@ -6,17 +6,26 @@ import logging
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage
 from aiogram.fsm.storage.redis import RedisEventIsolation, RedisStorage
 from aiogram.types import BotCommand, BotCommandScopeAllPrivateChats
 
+from app.bot.fsm_storage import UpdateScopedEventIsolation, UpdateScopedStorage
 from app.bot.handlers import router as start_router
+from app.bot.middlewares import install_bot_metrics
 from app.config import settings
 from app.db.session import dispose_database, ping_database
+from app.infra.media_group_buffer import media_group_buffer
+from app.infra.metrics import start_metrics_http_server, stop_metrics_http_server
+from app.infra.metrics_buffer import metrics_buffer
 from app.infra.redis_client import close_redis, ping_redis
 from app.logging_setup import configure_logging
 from app.services.appeal_escalation_watcher import run_appeal_escalation_watcher
+from app.services.auction_aggregates_watcher import run_auction_aggregates_watcher
 from app.services.auction_watcher import cancel_watcher, run_auction_watcher
 from app.services.outbox_watcher import run_outbox_watcher
+from app.services.points_reconciliation_watcher import run_points_reconciliation_watcher
+from app.services.retention_watcher import run_retention_watcher
 
 logger = logging.getLogger(__name__)
 
@@ -52,10 +61,12 @@ async def configure_bot_commands(bot: Bot) -> None:
 
 
 def build_dispatcher() -> Dispatcher:
-    dp = Dispatcher(
-        storage=RedisStorage.from_url(settings.redis_url),
-        events_isolation=RedisEventIsolation.from_url(settings.redis_url),
-    )
+    storage: BaseStorage = RedisStorage.from_url(settings.redis_url)
+    events_isolation: BaseEventIsolation = RedisEventIsolation.from_url(settings.redis_url)
+    if settings.fsm_state_cache_enabled:
+        storage = UpdateScopedStorage(storage)
+        events_isolation = UpdateScopedEventIsolation(events_isolation, storage)
+    dp = Dispatcher(storage=storage, events_isolation=events_isolation)
     dp.include_router(start_router)
     return dp
 
@@ -67,12 +78,25 @@ async def run() -> None:
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
     dp = build_dispatcher()
+    install_bot_metrics(dp, bot)
 
     await startup_checks()
     await configure_bot_commands(bot)
+    metrics_server = await start_metrics_http_server()
+    if settings.metrics_buffer_enabled:
+        metrics_buffer.start(interval_seconds=settings.metrics_buffer_flush_interval_ms / 1000)
     watcher_task: asyncio.Task[None] | None = asyncio.create_task(run_auction_watcher(bot))
     escalation_task: asyncio.Task[None] | None = asyncio.create_task(run_appeal_escalation_watcher(bot))
-    outbox_task: asyncio.Task[None] | None = asyncio.create_task(run_outbox_watcher())
+    outbox_task: asyncio.Task[None] | None = asyncio.create_task(run_outbox_watcher(bot))
+    points_reconcile_task: asyncio.Task[None] | None = None
+    if settings.points_balance_reconcile_enabled:
+        points_reconcile_task = asyncio.create_task(run_points_reconciliation_watcher())
+    aggregates_task: asyncio.Task[None] | None = None
+    if settings.auction_aggregates_reconcile_enabled:
+        aggregates_task = asyncio.create_task(run_auction_aggregates_watcher())
+    retention_task: asyncio.Task[None] | None = None
+    if settings.retention_enabled:
+        retention_task = asyncio.create_task(run_retention_watcher())
 
     try:
         await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
@@ -80,8 +104,14 @@ async def run() -> None:
         await cancel_watcher(watcher_task)
         await cancel_watcher(escalation_task)
         await cancel_watcher(outbox_task)
+        await cancel_watcher(points_reconcile_task)
+        await cancel_watcher(aggregates_task)
+        await cancel_watcher(retention_task)
+        await stop_metrics_http_server(metrics_server)
+        await media_group_buffer.stop()
         await dp.fsm.close()
         await bot.session.close()
+        await metrics_buffer.stop()
         await close_redis()
         await dispose_database()
 
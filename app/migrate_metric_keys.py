@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from app.infra.redis_client import close_redis
+from app.services.bot_funnel_metrics_service import migrate_legacy_bot_funnel_keys
+from app.services.notification_metrics_service import migrate_legacy_notification_metric_keys
+
+
+async def migrate(*, dry_run: bool, batch_size: int) -> int:
+    try:
+        notification_keys = await migrate_legacy_notification_metric_keys(dry_run=dry_run, batch_size=batch_size)
+        funnel_keys = await migrate_legacy_bot_funnel_keys(dry_run=dry_run, batch_size=batch_size)
+    finally:
+        await close_redis()
+
+    action = "would migrate" if dry_run else "migrated"
+    print(f"notification metrics: {action} {notification_keys} legacy keys")
+    print(f"bot funnel metrics: {action} {funnel_keys} legacy keys")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Convert legacy per-counter metric keys into the hash-based layout.",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count legacy keys.")
+    parser.add_argument("--batch-size", type=int, default=500, help="SCAN COUNT per batch.")
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(migrate(dry_run=args.dry_run, batch_size=args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -132,6 +132,33 @@ def _normalize_columns_payload(
     }
 
 
+def _with_new_columns(columns_payload: Any, *, allowed_columns: Sequence[str]) -> Any:
+    """Adds columns introduced after the preference was saved; they start out visible.
+
+    Each new column is placed right after the column that precedes it in
+    ``allowed_columns``, so it lands where the table defines it.
+    """
+
+    if not isinstance(columns_payload, Mapping):
+        return columns_payload
+    order = columns_payload.get("order")
+    visible = columns_payload.get("visible")
+    if not isinstance(order, list) or not isinstance(visible, list):
+        return columns_payload
+    merged_order = list(order)
+    merged_visible = list(visible)
+    previous: str | None = None
+    for column in _normalize_allowed_columns(allowed_columns):
+        if column not in merged_order:
+            position = merged_order.index(previous) + 1 if previous in merged_order else len(merged_order)
+            merged_order.insert(position, column)
+            merged_visible.append(column)
+        previous = column
+    if len(merged_order) == len(order):
+        return columns_payload
+    return {**columns_payload, "order": merged_order, "visible": merged_visible}
+
+
 async def load_admin_list_preference(
     session: AsyncSession,
     *,
@@ -157,7 +184,10 @@ async def load_admin_list_preference(
         }
 
     density = _normalize_density(row.density)
-    columns = _normalize_columns_payload(row.columns_json, allowed_columns=allowed_columns)
+    columns = _normalize_columns_payload(
+        _with_new_columns(row.columns_json, allowed_columns=allowed_columns),
+        allowed_columns=allowed_columns,
+    )
     return {
         "density": density,
         "columns": columns,
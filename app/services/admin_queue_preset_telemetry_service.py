@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Float, case, cast, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import AdminQueuePresetTelemetryEvent
+from app.db.models import AdminQueuePresetTelemetryEvent, AdminQueuePresetTelemetryHourly
+from app.db.session import read_only
 from app.services.admin_list_preferences_service import _normalize_subject_key
 from app.web.auth import AdminAuthContext
 
@@ -103,6 +104,7 @@ async def record_workflow_preset_telemetry_event(
     session.add(event)
 
 
+@read_only
 async def load_workflow_preset_telemetry_segments(
     session: AsyncSession,
     *,
@@ -116,33 +118,49 @@ async def load_workflow_preset_telemetry_segments(
     normalized_context = _normalize_queue_context(queue_context) if queue_context is not None else None
 
     async def _load_window(*, start: datetime, end: datetime) -> dict[tuple[str, str, int | None], dict[str, float | int | None]]:
-        stmt = (
-            select(
-                AdminQueuePresetTelemetryEvent.queue_context,
-                AdminQueuePresetTelemetryEvent.queue_key,
-                AdminQueuePresetTelemetryEvent.preset_id,
-                func.count(AdminQueuePresetTelemetryEvent.id).label("events_total"),
-                func.avg(AdminQueuePresetTelemetryEvent.time_to_action_ms).label("avg_time_to_action_ms"),
-                func.avg(AdminQueuePresetTelemetryEvent.filter_churn_count).label("avg_filter_churn_count"),
-                func.sum(
-                    case(
-                        (AdminQueuePresetTelemetryEvent.reopen_signal.is_(True), 1),
-                        else_=0,
-                    )
-                ).label("reopen_total"),
-            )
-            .where(
-                AdminQueuePresetTelemetryEvent.created_at >= start,
-                AdminQueuePresetTelemetryEvent.created_at < end,
-            )
-            .group_by(
-                AdminQueuePresetTelemetryEvent.queue_context,
-                AdminQueuePresetTelemetryEvent.queue_key,
-                AdminQueuePresetTelemetryEvent.preset_id,
-            )
-        )
+        # Raw events past the retention horizon live on as hourly rollups; read both.
+        events = AdminQueuePresetTelemetryEvent
+        hourly = AdminQueuePresetTelemetryHourly
+        raw_stmt = select(
+            events.queue_context,
+            events.queue_key,
+            events.preset_id,
+            literal(1).label("events_total"),
+            func.coalesce(events.time_to_action_ms, 0).label("time_to_action_sum_ms"),
+            case((events.time_to_action_ms.is_not(None), 1), else_=0).label("time_to_action_count"),
+            events.filter_churn_count.label("filter_churn_sum"),
+            case((events.reopen_signal.is_(True), 1), else_=0).label("reopen_total"),
+        ).where(events.created_at >= start, events.created_at < end)
+        hourly_stmt = select(
+            hourly.queue_context,
+            hourly.queue_key,
+            hourly.preset_id,
+            hourly.events_total,
+            hourly.time_to_action_sum_ms,
+            hourly.time_to_action_count,
+            hourly.filter_churn_sum,
+            hourly.reopen_total,
+        ).where(hourly.bucket_start >= start, hourly.bucket_start < end)
         if normalized_context is not None:
-            stmt = stmt.where(AdminQueuePresetTelemetryEvent.queue_context == normalized_context)
+            raw_stmt = raw_stmt.where(events.queue_context == normalized_context)
+            hourly_stmt = hourly_stmt.where(hourly.queue_context == normalized_context)
+        combined = union_all(raw_stmt, hourly_stmt).subquery()
+
+        events_total = func.sum(combined.c.events_total)
+        stmt = select(
+            combined.c.queue_context,
+            combined.c.queue_key,
+            combined.c.preset_id,
+            events_total.label("events_total"),
+            (
+                cast(func.sum(combined.c.time_to_action_sum_ms), Float)
+                / func.nullif(func.sum(combined.c.time_to_action_count), 0)
+            ).label("avg_time_to_action_ms"),
+            (cast(func.sum(combined.c.filter_churn_sum), Float) / func.nullif(events_total, 0)).label(
+                "avg_filter_churn_count"
+            ),
+            func.sum(combined.c.reopen_total).label("reopen_total"),
+        ).group_by(combined.c.queue_context, combined.c.queue_key, combined.c.preset_id)
 
         rows = (await session.execute(stmt)).all()
         window: dict[tuple[str, str, int | None], dict[str, float | int | None]] = {}
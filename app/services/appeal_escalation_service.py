@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from aiogram import Bot
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,9 +14,15 @@ from app.config import settings
 from app.db.enums import AppealSourceType, ModerationAction
 from app.db.models import Appeal, User
 from app.db.session import SessionFactory
-from app.services.appeal_service import escalate_overdue_appeals, resolve_appeal_auction_id
+from app.infra.deadline_scheduler import DeadlineScheduler
+from app.infra.metrics import SLA_ESCALATION_LAG_SECONDS
+from app.services.appeal_service import (
+    escalate_overdue_appeals,
+    load_upcoming_appeal_deadlines,
+    resolve_appeal_auction_ids,
+)
 from app.services.moderation_topic_router import ModerationTopicSection, send_section_message
-from app.services.moderation_service import log_moderation_action
+from app.services.moderation_service import ModerationLogEntry, log_moderation_actions
 
 
 @dataclass(slots=True)
@@ -69,6 +76,68 @@ def _render_escalation_text(item: EscalatedAppealView) -> str:
     )
 
 
+def _overdue_appeals_path() -> str:
+    return "/appeals?overdue=only"
+
+
+def _overdue_appeals_url() -> str | None:
+    base_url = settings.admin_web_base_url.strip().rstrip("/")
+    if not base_url:
+        return None
+    return f"{base_url}{_overdue_appeals_path()}"
+
+
+def _render_escalation_digest_line(item: EscalatedAppealView) -> str:
+    return (
+        f"• #{item.appeal_id} {item.appeal_ref} | {item.status} | "
+        f"{_source_label(item.source_type, item.source_id)} | "
+        f"{_user_label(item.appellant_tg_user_id, item.appellant_username)} | "
+        f"SLA {_format_dt(item.sla_deadline_at)}"
+    )
+
+
+def _render_escalation_digest(items: list[EscalatedAppealView], *, appeals_url: str | None) -> str:
+    max_lines = max(settings.appeal_escalation_digest_max_lines, 1)
+    lines = [f"Эскалация апелляций: {len(items)}"]
+    lines.extend(_render_escalation_digest_line(item) for item in items[:max_lines])
+    hidden = len(items) - max_lines
+    if hidden > 0:
+        lines.append(f"…и ещё {hidden}")
+    if appeals_url is None:
+        lines.append(f"Просроченные в веб-панели: {_overdue_appeals_path()}")
+    return "\n".join(lines)
+
+
+def _should_send_digest(escalated_count: int) -> bool:
+    if not settings.appeal_escalation_digest_enabled:
+        return False
+    return escalated_count >= max(settings.appeal_escalation_digest_min_items, 1)
+
+
+async def _notify_escalations(bot: Bot, items: list[EscalatedAppealView]) -> None:
+    if _should_send_digest(len(items)):
+        appeals_url = _overdue_appeals_url()
+        reply_markup = None
+        if appeals_url is not None:
+            reply_markup = InlineKeyboardMarkup(
+                inline_keyboard=[[InlineKeyboardButton(text="Открыть просроченные", url=appeals_url)]]
+            )
+        await send_section_message(
+            bot,
+            section=ModerationTopicSection.APPEALS,
+            text=_render_escalation_digest(items, appeals_url=appeals_url),
+            reply_markup=reply_markup,
+        )
+        return
+
+    for item in items:
+        await send_section_message(
+            bot,
+            section=ModerationTopicSection.APPEALS,
+            text=_render_escalation_text(item),
+        )
+
+
 async def _resolve_escalation_actor_user_id(session: AsyncSession) -> int:
     actor_tg_user_id = settings.appeal_escalation_actor_tg_user_id
     actor = await session.scalar(select(User).where(User.tg_user_id == actor_tg_user_id))
@@ -112,29 +181,38 @@ async def process_overdue_appeal_escalations(bot: Bot) -> int:
                 )
             ).all()
 
-            for appeal, _appellant, _resolver in rows:
-                related_auction_id = await resolve_appeal_auction_id(session, appeal)
-                await log_moderation_action(
-                    session,
-                    actor_user_id=actor_user_id,
-                    action=ModerationAction.ESCALATE_APPEAL,
-                    reason="Апелляция просрочена по SLA и эскалирована",
-                    target_user_id=appeal.appellant_user_id,
-                    auction_id=related_auction_id,
-                    payload={
-                        "appeal_id": appeal.id,
-                        "appeal_ref": appeal.appeal_ref,
-                        "source_type": appeal.source_type,
-                        "source_id": appeal.source_id,
-                        "status": str(appeal.status),
-                        "sla_deadline_at": appeal.sla_deadline_at.isoformat() if appeal.sla_deadline_at else None,
-                        "escalated_at": appeal.escalated_at.isoformat() if appeal.escalated_at else None,
-                        "escalation_level": appeal.escalation_level,
-                    },
-                )
+            auction_ids = await resolve_appeal_auction_ids(session, [appeal for appeal, _appellant, _resolver in rows])
+            await log_moderation_actions(
+                session,
+                actor_user_id=actor_user_id,
+                action=ModerationAction.ESCALATE_APPEAL,
+                reason="Апелляция просрочена по SLA и эскалирована",
+                entries=[
+                    ModerationLogEntry(
+                        target_user_id=appeal.appellant_user_id,
+                        auction_id=auction_ids.get(appeal.id),
+                        payload={
+                            "appeal_id": appeal.id,
+                            "appeal_ref": appeal.appeal_ref,
+                            "source_type": appeal.source_type,
+                            "source_id": appeal.source_id,
+                            "status": str(appeal.status),
+                            "sla_deadline_at": appeal.sla_deadline_at.isoformat() if appeal.sla_deadline_at else None,
+                            "escalated_at": appeal.escalated_at.isoformat() if appeal.escalated_at else None,
+                            "escalation_level": appeal.escalation_level,
+                        },
+                    )
+                    for appeal, _appellant, _resolver in rows
+                ],
+            )
 
     escalated_items: list[EscalatedAppealView] = []
     for appeal, appellant, resolver in rows:
+        if appeal.sla_deadline_at is not None and appeal.escalated_at is not None:
+            SLA_ESCALATION_LAG_SECONDS.observe(
+                max((appeal.escalated_at - appeal.sla_deadline_at).total_seconds(), 0.0),
+                queue="appeals",
+            )
         escalated_items.append(
             EscalatedAppealView(
                 appeal_id=appeal.id,
@@ -151,11 +229,22 @@ async def process_overdue_appeal_escalations(bot: Bot) -> int:
             )
         )
 
-    for item in escalated_items:
-        await send_section_message(
-            bot,
-            section=ModerationTopicSection.APPEALS,
-            text=_render_escalation_text(item),
-        )
-
+    await _notify_escalations(bot, escalated_items)
     return len(escalated_items)
+
+
+async def refresh_appeal_escalation_schedule(scheduler: DeadlineScheduler, *, horizon_seconds: float) -> int:
+    """Loads the appeal SLA deadlines of the next ``horizon_seconds`` into ``scheduler``."""
+
+    if not settings.appeal_escalation_enabled:
+        scheduler.replace({})
+        return 0
+
+    async with SessionFactory() as session:
+        deadlines = await load_upcoming_appeal_deadlines(
+            session,
+            horizon=timedelta(seconds=horizon_seconds),
+            limit=max(settings.appeal_escalation_batch_size, 1),
+        )
+    scheduler.replace({("appeals", appeal_id): deadline for appeal_id, deadline in deadlines.items()})
+    return len(deadlines)
@@ -2,25 +2,38 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
 from aiogram import Bot
 
 from app.config import settings
-from app.services.appeal_escalation_service import process_overdue_appeal_escalations
+from app.infra.deadline_scheduler import DeadlineScheduler
+from app.infra.metrics import WATCHER_LOOP_SECONDS
+from app.services.appeal_escalation_service import (
+    process_overdue_appeal_escalations,
+    refresh_appeal_escalation_schedule,
+)
 
 logger = logging.getLogger(__name__)
 
 
 async def run_appeal_escalation_watcher(bot: Bot) -> None:
     interval = max(settings.appeal_escalation_interval_seconds, 1)
+    # Deadlines due before the next regular pass are scheduled so escalations fire on time
+    # instead of up to one interval late.
+    scheduler = DeadlineScheduler()
     while True:
+        started = time.perf_counter()
         try:
             escalated_count = await process_overdue_appeal_escalations(bot)
+            await refresh_appeal_escalation_schedule(scheduler, horizon_seconds=interval)
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="appeal_escalation", outcome="ok")
             if escalated_count:
                 logger.warning("Appeal escalation watcher escalated %s appeal(s)", escalated_count)
-            await asyncio.sleep(interval)
+            await scheduler.wait(timeout=interval)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="appeal_escalation", outcome="error")
             logger.exception("Appeal escalation watcher failed: %s", exc)
             await asyncio.sleep(interval)
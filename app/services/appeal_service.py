@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,18 +13,14 @@ from app.config import settings
 from app.db.enums import AppealSourceType, AppealStatus, PointsEventType
 from app.db.models import Appeal, Complaint, FraudSignal
 from app.services.points_service import (
-    get_points_redemption_account_age_remaining_seconds,
-    get_points_event_redemption_cooldown_remaining_seconds,
-    get_points_redemptions_spent_today,
-    get_points_redemptions_spent_this_week,
-    get_points_redemptions_spent_this_month,
-    get_points_redemptions_used_today,
-    get_points_redemptions_used_this_week,
-    get_points_redemption_cooldown_remaining_seconds,
     get_user_points_balance,
-    get_user_points_summary,
     spend_points,
 )
+from app.services.redemption_policy_service import (
+    BoostUtilityPolicy,
+    RedemptionUtility,
+    redemption_policy_engine,
+)
 
 
 @dataclass(slots=True)
@@ -46,15 +43,7 @@ class AppealPriorityBoostResult:
     changed: bool = False
 
 
-@dataclass(slots=True)
-class AppealPriorityBoostPolicy:
-    enabled: bool
-    cost_points: int
-    daily_limit: int
-    used_today: int
-    remaining_today: int
-    cooldown_seconds: int
-    cooldown_remaining_seconds: int
+AppealPriorityBoostPolicy = BoostUtilityPolicy
 
 
 def parse_appeal_ref(appeal_ref: str) -> tuple[AppealSourceType, int | None]:
@@ -181,6 +170,39 @@ async def resolve_appeal_auction_id(session: AsyncSession, appeal: Appeal) -> uu
     return None
 
 
+async def resolve_appeal_auction_ids(session: AsyncSession, appeals: Sequence[Appeal]) -> dict[int, uuid.UUID | None]:
+    complaint_ids: set[int] = set()
+    signal_ids: set[int] = set()
+    for appeal in appeals:
+        if appeal.source_id is None:
+            continue
+        source_type = AppealSourceType(appeal.source_type)
+        if source_type == AppealSourceType.COMPLAINT:
+            complaint_ids.add(appeal.source_id)
+        elif source_type == AppealSourceType.RISK:
+            signal_ids.add(appeal.source_id)
+
+    complaint_auctions: dict[int, uuid.UUID] = {}
+    if complaint_ids:
+        rows = await session.execute(select(Complaint.id, Complaint.auction_id).where(Complaint.id.in_(complaint_ids)))
+        complaint_auctions = {row.id: row.auction_id for row in rows}
+    signal_auctions: dict[int, uuid.UUID] = {}
+    if signal_ids:
+        rows = await session.execute(select(FraudSignal.id, FraudSignal.auction_id).where(FraudSignal.id.in_(signal_ids)))
+        signal_auctions = {row.id: row.auction_id for row in rows}
+
+    resolved: dict[int, uuid.UUID | None] = {}
+    for appeal in appeals:
+        source_type = AppealSourceType(appeal.source_type)
+        if source_type == AppealSourceType.COMPLAINT and appeal.source_id is not None:
+            resolved[appeal.id] = complaint_auctions.get(appeal.source_id)
+        elif source_type == AppealSourceType.RISK and appeal.source_id is not None:
+            resolved[appeal.id] = signal_auctions.get(appeal.source_id)
+        else:
+            resolved[appeal.id] = None
+    return resolved
+
+
 def _can_finalize(status: AppealStatus) -> bool:
     return status in {AppealStatus.OPEN, AppealStatus.IN_REVIEW}
 
@@ -286,6 +308,30 @@ async def escalate_overdue_appeals(
     return AppealEscalationResult(escalated=escalated)
 
 
+async def load_upcoming_appeal_deadlines(
+    session: AsyncSession,
+    *,
+    now: datetime | None = None,
+    horizon: timedelta,
+    limit: int = 500,
+) -> dict[int, datetime]:
+    """Returns SLA deadlines of not yet escalated active appeals due within ``horizon``."""
+
+    current_time = now or datetime.now(UTC)
+    rows = await session.execute(
+        select(Appeal.id, Appeal.sla_deadline_at)
+        .where(
+            Appeal.status.in_([AppealStatus.OPEN, AppealStatus.IN_REVIEW]),
+            Appeal.escalated_at.is_(None),
+            Appeal.sla_deadline_at > current_time,
+            Appeal.sla_deadline_at <= current_time + horizon,
+        )
+        .order_by(Appeal.sla_deadline_at.asc(), Appeal.id.asc())
+        .limit(max(limit, 1))
+    )
+    return {row.id: row.sla_deadline_at for row in rows}
+
+
 async def resolve_appeal(
     session: AsyncSession,
     *,
@@ -324,39 +370,8 @@ async def get_appeal_priority_boost_policy(
     appellant_user_id: int,
     now: datetime | None = None,
 ) -> AppealPriorityBoostPolicy:
-    current_time = now or datetime.now(UTC)
-    day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    daily_limit = max(settings.appeal_priority_boost_daily_limit, 1)
-    cost_points = max(settings.appeal_priority_boost_cost_points, 1)
-    cooldown_seconds = max(settings.appeal_priority_boost_cooldown_seconds, 0)
-    used_today = int(
-        await session.scalar(
-            select(func.count(Appeal.id)).where(
-                Appeal.appellant_user_id == appellant_user_id,
-                Appeal.priority_boosted_at.is_not(None),
-                Appeal.priority_boosted_at >= day_start,
-            )
-        )
-        or 0
-    )
-    remaining_today = max(daily_limit - used_today, 0)
-    cooldown_remaining_seconds = await get_points_event_redemption_cooldown_remaining_seconds(
-        session,
-        user_id=appellant_user_id,
-        event_types=(PointsEventType.APPEAL_PRIORITY_BOOST,),
-        cooldown_seconds=cooldown_seconds,
-        now=current_time,
-    )
-    return AppealPriorityBoostPolicy(
-        enabled=settings.appeal_priority_boost_enabled,
-        cost_points=cost_points,
-        daily_limit=daily_limit,
-        used_today=used_today,
-        remaining_today=remaining_today,
-        cooldown_seconds=cooldown_seconds,
-        cooldown_remaining_seconds=cooldown_remaining_seconds,
-    )
+    snapshot = await redemption_policy_engine.load_snapshot(session, user_id=appellant_user_id, now=now)
+    return snapshot.utility(RedemptionUtility.APPEAL)
 
 
 async def redeem_appeal_priority_boost(
@@ -380,136 +395,16 @@ async def redeem_appeal_priority_boost(
         return AppealPriorityBoostResult(True, "Приоритет уже повышен", appeal=appeal, changed=False)
 
     now = datetime.now(UTC)
-    if not settings.points_redemption_enabled:
-        return AppealPriorityBoostResult(False, "Редимпшены points временно отключены")
-    account_age_remaining = await get_points_redemption_account_age_remaining_seconds(
+    decision = await redemption_policy_engine.decide(
         session,
         user_id=appellant_user_id,
-        min_account_age_seconds=settings.points_redemption_min_account_age_seconds,
+        utility=RedemptionUtility.APPEAL,
         now=now,
     )
-    if account_age_remaining > 0:
-        return AppealPriorityBoostResult(
-            False,
-            f"Бусты станут доступны через {account_age_remaining} сек после регистрации",
-        )
-    min_earned_points = max(settings.points_redemption_min_earned_points, 0)
-    if min_earned_points > 0:
-        points_summary = await get_user_points_summary(session, user_id=appellant_user_id)
-        if points_summary.total_earned < min_earned_points:
-            remaining_earned_points = min_earned_points - points_summary.total_earned
-            return AppealPriorityBoostResult(
-                False,
-                (
-                    "Для буста нужно заработать минимум "
-                    f"{min_earned_points} points (сейчас {points_summary.total_earned}, "
-                    f"осталось {remaining_earned_points})"
-                ),
-            )
-    policy = await get_appeal_priority_boost_policy(session, appellant_user_id=appellant_user_id, now=now)
-    if not policy.enabled:
-        return AppealPriorityBoostResult(False, "Буст апелляции временно отключен")
-    if policy.cooldown_remaining_seconds > 0:
-        return AppealPriorityBoostResult(
-            False,
-            f"Повторный буст апелляции доступен через {policy.cooldown_remaining_seconds} сек",
-        )
-    if policy.remaining_today <= 0:
-        return AppealPriorityBoostResult(False, f"Достигнут дневной лимит бустов ({policy.daily_limit})")
-
-    global_daily_limit = max(settings.points_redemption_daily_limit, 0)
-    if global_daily_limit > 0:
-        used_today = await get_points_redemptions_used_today(
-            session,
-            user_id=appellant_user_id,
-            now=now,
-        )
-        if used_today >= global_daily_limit:
-            return AppealPriorityBoostResult(
-                False,
-                f"Достигнут глобальный дневной лимит бустов ({global_daily_limit})",
-            )
-
-    global_weekly_limit = max(settings.points_redemption_weekly_limit, 0)
-    if global_weekly_limit > 0:
-        used_this_week = await get_points_redemptions_used_this_week(
-            session,
-            user_id=appellant_user_id,
-            now=now,
-        )
-        if used_this_week >= global_weekly_limit:
-            return AppealPriorityBoostResult(
-                False,
-                f"Достигнут глобальный недельный лимит бустов ({global_weekly_limit})",
-            )
-
-    global_daily_spend_cap = max(settings.points_redemption_daily_spend_cap, 0)
-    if global_daily_spend_cap > 0:
-        spent_today = await get_points_redemptions_spent_today(
-            session,
-            user_id=appellant_user_id,
-            now=now,
-        )
-        if spent_today + policy.cost_points > global_daily_spend_cap:
-            return AppealPriorityBoostResult(
-                False,
-                (
-                    "Достигнут глобальный дневной лимит списания на бусты "
-                    f"({global_daily_spend_cap} points)"
-                ),
-            )
-
-    global_weekly_spend_cap = max(settings.points_redemption_weekly_spend_cap, 0)
-    if global_weekly_spend_cap > 0:
-        spent_this_week = await get_points_redemptions_spent_this_week(
-            session,
-            user_id=appellant_user_id,
-            now=now,
-        )
-        if spent_this_week + policy.cost_points > global_weekly_spend_cap:
-            return AppealPriorityBoostResult(
-                False,
-                (
-                    "Достигнут глобальный недельный лимит списания на бусты "
-                    f"({global_weekly_spend_cap} points)"
-                ),
-            )
-
-    global_monthly_spend_cap = max(settings.points_redemption_monthly_spend_cap, 0)
-    if global_monthly_spend_cap > 0:
-        spent_this_month = await get_points_redemptions_spent_this_month(
-            session,
-            user_id=appellant_user_id,
-            now=now,
-        )
-        if spent_this_month + policy.cost_points > global_monthly_spend_cap:
-            return AppealPriorityBoostResult(
-                False,
-                (
-                    "Достигнут глобальный месячный лимит списания на бусты "
-                    f"({global_monthly_spend_cap} points)"
-                ),
-            )
-
-    cooldown_remaining = await get_points_redemption_cooldown_remaining_seconds(
-        session,
-        user_id=appellant_user_id,
-        cooldown_seconds=settings.points_redemption_cooldown_seconds,
-        now=now,
-    )
-    if cooldown_remaining > 0:
-        return AppealPriorityBoostResult(False, f"Следующий буст доступен через {cooldown_remaining} сек")
-
-    cost = policy.cost_points
-    min_balance = max(settings.points_redemption_min_balance, 0)
-    if min_balance > 0:
-        current_balance = await get_user_points_balance(session, user_id=appellant_user_id)
-        if current_balance - cost < min_balance:
-            return AppealPriorityBoostResult(
-                False,
-                f"Нужно сохранить минимум {min_balance} points после буста (доступно {current_balance})",
-            )
+    if not decision.allowed:
+        return AppealPriorityBoostResult(False, decision.message)
 
+    cost = decision.cost_points
     spend_result = await spend_points(
         session,
         user_id=appellant_user_id,
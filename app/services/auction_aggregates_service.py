@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import Select, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import Auction, Bid, BidArchive
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class AuctionBidAggregates:
+    bid_count: int
+    current_price: int
+    top_bidder_user_id: int | None
+    last_bid_at: datetime | None
+
+
+def stored_bid_aggregates(auction: Auction) -> AuctionBidAggregates:
+    return AuctionBidAggregates(
+        bid_count=auction.bid_count,
+        current_price=auction.current_price,
+        top_bidder_user_id=auction.top_bidder_user_id,
+        last_bid_at=auction.last_bid_at,
+    )
+
+
+def _apply_bid_aggregates(auction: Auction, aggregates: AuctionBidAggregates) -> None:
+    auction.bid_count = aggregates.bid_count
+    auction.current_price = aggregates.current_price
+    auction.top_bidder_user_id = aggregates.top_bidder_user_id
+    auction.last_bid_at = aggregates.last_bid_at
+
+
+def record_placed_bid(auction: Auction, *, user_id: int, amount: int, placed_at: datetime) -> None:
+    """Folds a new bid into the aggregates; the caller holds the auction row lock."""
+
+    leads = auction.top_bidder_user_id is None or amount > auction.current_price
+    auction.bid_count += 1
+    if auction.last_bid_at is None or placed_at > auction.last_bid_at:
+        auction.last_bid_at = placed_at
+    if leads:
+        auction.current_price = amount
+        auction.top_bidder_user_id = user_id
+
+
+def _bid_aggregate_rollup(auction_ids: Sequence[uuid.UUID]) -> Select:
+    """Aggregates per auction over live and archived bids that are not removed.
+
+    Top bid ordering matches the bid leaderboard: highest amount, earliest first.
+    """
+
+    bids = union_all(
+        select(Bid.auction_id, Bid.user_id, Bid.amount, Bid.created_at).where(
+            Bid.auction_id.in_(auction_ids),
+            Bid.is_removed.is_(False),
+        ),
+        select(BidArchive.auction_id, BidArchive.user_id, BidArchive.amount, BidArchive.created_at).where(
+            BidArchive.auction_id.in_(auction_ids),
+            BidArchive.is_removed.is_(False),
+        ),
+    ).subquery("bids_all")
+    ranked = select(
+        bids.c.auction_id,
+        bids.c.user_id,
+        bids.c.amount,
+        func.count().over(partition_by=bids.c.auction_id).label("bid_count"),
+        func.max(bids.c.created_at).over(partition_by=bids.c.auction_id).label("last_bid_at"),
+        func.row_number()
+        .over(partition_by=bids.c.auction_id, order_by=(bids.c.amount.desc(), bids.c.created_at.asc()))
+        .label("position"),
+    ).subquery("ranked_bids")
+    return select(
+        ranked.c.auction_id,
+        ranked.c.bid_count,
+        ranked.c.amount,
+        ranked.c.user_id,
+        ranked.c.last_bid_at,
+    ).where(ranked.c.position == 1)
+
+
+async def _expected_bid_aggregates(
+    session: AsyncSession,
+    auctions: Sequence[Auction],
+) -> dict[uuid.UUID, AuctionBidAggregates]:
+    expected = {
+        auction.id: AuctionBidAggregates(
+            bid_count=0,
+            current_price=auction.start_price,
+            top_bidder_user_id=None,
+            last_bid_at=None,
+        )
+        for auction in auctions
+    }
+    rows = (await session.execute(_bid_aggregate_rollup(list(expected)))).all()
+    for auction_id, bid_count, amount, user_id, last_bid_at in rows:
+        expected[auction_id] = AuctionBidAggregates(
+            bid_count=int(bid_count),
+            current_price=int(amount),
+            top_bidder_user_id=user_id,
+            last_bid_at=last_bid_at,
+        )
+    return expected
+
+
+async def recompute_auction_bid_aggregates(session: AsyncSession, auction: Auction) -> None:
+    """Rebuilds the aggregates of one auction from its bids, e.g. after a bid removal."""
+
+    expected = await _expected_bid_aggregates(session, [auction])
+    _apply_bid_aggregates(auction, expected[auction.id])
+
+
+async def reconcile_auction_bid_aggregates(
+    session: AsyncSession,
+    *,
+    after_auction_id: uuid.UUID | None = None,
+    limit: int = 500,
+) -> tuple[int, uuid.UUID | None]:
+    """Checks one batch of auctions against their bids and repairs drifted rows.
+
+    Auctions locked by an in-flight bid are skipped rather than waited for; the next
+    pass picks them up. Returns ``(corrected_rows, next_cursor)``; ``next_cursor`` is
+    ``None`` once every auction has been visited.
+    """
+
+    safe_limit = max(int(limit), 1)
+    stmt = select(Auction).order_by(Auction.id).limit(safe_limit).with_for_update(skip_locked=True)
+    if after_auction_id is not None:
+        stmt = stmt.where(Auction.id > after_auction_id)
+    auctions = list((await session.execute(stmt)).scalars())
+    if not auctions:
+        return 0, None
+
+    expected = await _expected_bid_aggregates(session, auctions)
+    corrected = 0
+    for auction in auctions:
+        stored = stored_bid_aggregates(auction)
+        actual = expected[auction.id]
+        if stored == actual:
+            continue
+        logger.warning(
+            "auction_bid_aggregates_drift auction_id=%s stored_bid_count=%s bid_count=%s "
+            "stored_price=%s price=%s",
+            auction.id,
+            stored.bid_count,
+            actual.bid_count,
+            stored.current_price,
+            actual.current_price,
+        )
+        _apply_bid_aggregates(auction, actual)
+        corrected += 1
+
+    next_cursor = auctions[-1].id if len(auctions) == safe_limit else None
+    return corrected, next_cursor
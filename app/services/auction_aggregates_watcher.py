@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+
+from app.config import settings
+from app.db.session import SessionFactory
+from app.infra.metrics import WATCHER_LOOP_SECONDS
+from app.services.auction_aggregates_service import reconcile_auction_bid_aggregates
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_all_auction_bid_aggregates() -> int:
+    """Walks every auction in short per-batch transactions."""
+
+    batch_size = max(settings.auction_aggregates_reconcile_batch_size, 1)
+    cursor: uuid.UUID | None = None
+    corrected_total = 0
+    while True:
+        async with SessionFactory() as session:
+            async with session.begin():
+                corrected, cursor = await reconcile_auction_bid_aggregates(
+                    session,
+                    after_auction_id=cursor,
+                    limit=batch_size,
+                )
+        corrected_total += corrected
+        if cursor is None:
+            return corrected_total
+
+
+async def run_auction_aggregates_watcher() -> None:
+    interval = max(settings.auction_aggregates_reconcile_interval_seconds, 1)
+    while True:
+        started = time.perf_counter()
+        try:
+            corrected = await reconcile_all_auction_bid_aggregates()
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="auction_aggregates", outcome="ok")
+            if corrected:
+                logger.warning("Auction aggregates reconciliation corrected %s auction row(s)", corrected)
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            WATCHER_LOOP_SECONDS.observe(
+                time.perf_counter() - started,
+                watcher="auction_aggregates",
+                outcome="error",
+            )
+            logger.exception("Auction aggregates watcher failed: %s", exc)
+            await asyncio.sleep(interval)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import html
 import logging
 import uuid
@@ -18,7 +19,8 @@ from aiogram.exceptions import (
     TelegramServerError,
 )
 from aiogram.types import InlineKeyboardMarkup, InputMediaPhoto
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, case, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bot.keyboards.auction import auction_active_keyboard, open_auction_post_keyboard
@@ -26,7 +28,11 @@ from app.config import settings
 from app.db.enums import AuctionStatus
 from app.db.models import Auction, AuctionPhoto, AuctionPost, Bid, BlacklistEntry, Complaint, User
 from app.db.session import SessionFactory
+from app.infra.metrics import AUCTION_POST_EDITS_TOTAL, BID_CALLBACK_PHASE_SECONDS
+from app.services.auction_aggregates_service import record_placed_bid
+from app.services.chat_metadata_service import get_chat_username
 from app.services.fraud_service import evaluate_and_store_bid_fraud_signal
+from app.services.inline_query_cache_service import bump_inline_auction_version
 from app.services.message_effects_service import (
     AuctionMessageEffectEvent,
     resolve_auction_message_effect_id,
@@ -216,13 +222,7 @@ async def resolve_auction_post_url(
 
     username: str | None = None
     if isinstance(post.chat_id, int):
-        try:
-            chat = await bot.get_chat(post.chat_id)
-            raw_username = getattr(chat, "username", None)
-            if isinstance(raw_username, str) and raw_username.strip():
-                username = raw_username.strip()
-        except TelegramAPIError:
-            username = None
+        username = await get_chat_username(bot, post.chat_id)
 
     return resolve_auction_post_link(
         chat_id=post.chat_id,
@@ -231,48 +231,79 @@ async def resolve_auction_post_url(
     )
 
 
+_CAPTION_STATUS_TEXT: dict[AuctionStatus, str] = {
+    AuctionStatus.DRAFT: "Черновик",
+    AuctionStatus.ACTIVE: "Активен",
+    AuctionStatus.ENDED: "Завершен",
+    AuctionStatus.BOUGHT_OUT: "Выкуплен",
+    AuctionStatus.CANCELLED: "Отменен",
+    AuctionStatus.FROZEN: "Заморожен",
+}
+# Static layout; rendering only fills the fields, whose values are never parsed as templates.
+_CAPTION_TEMPLATE = (
+    "<b>🔥 Аукцион #{short_id}</b>{pending_line}\n"
+    "\n"
+    "📝 {description}\n"
+    "🎯 Статус: <b>{status_text}</b>\n"
+    "👤 Продавец: {seller}\n"
+    "💸 Текущая ставка: <b>${current_price}</b>\n"
+    "🏁 Старт: ${start_price}\n"
+    "💰 Выкуп: {buyout_text}\n"
+    "🛡 Антиснайпер: {anti_sniper_text}\n"
+    "⏰ Финиш: <b>{ending_line}</b>\n"
+    "\n"
+    "🏆 <b>Топ-3 ставок</b>\n"
+    "{top_bids}"
+)
+_CAPTION_WINNER_TEMPLATE = "\n\nПобедитель: <b>{winner}</b>"
+_CAPTION_PENDING_LINE = "\n⏳ Публикуется..."
+_CAPTION_MAX_LENGTH = 1024
+_CAPTION_DESCRIPTION_MAX_LENGTH = 420
+
+
 def render_auction_caption(view: AuctionView, *, publish_pending: bool = False) -> str:
-    status_text = {
-        AuctionStatus.DRAFT: "Черновик",
-        AuctionStatus.ACTIVE: "Активен",
-        AuctionStatus.ENDED: "Завершен",
-        AuctionStatus.BOUGHT_OUT: "Выкуплен",
-        AuctionStatus.CANCELLED: "Отменен",
-        AuctionStatus.FROZEN: "Заморожен",
-    }[view.auction.status]
-
-    description = html.escape(view.auction.description)
-    if len(description) > 420:
-        description = f"{description[:420]}..."
-
-    anti_sniper_text = "вкл" if view.auction.anti_sniper_enabled else "выкл"
-
-    ending_line = _format_dt(view.auction.ends_at)
-    if view.auction.status == AuctionStatus.ACTIVE:
-        ending_line = f"{ending_line} ({_human_time_left(view.auction.ends_at)})"
-
-    pending_line = "\n⏳ Публикуется..." if publish_pending else ""
-
-    lines = [
-        f"<b>🔥 Аукцион #{str(view.auction.id)[:8]}</b>{pending_line}",
-        "",
-        f"📝 {description}",
-        f"🎯 Статус: <b>{status_text}</b>",
-        f"👤 Продавец: {_format_user_mention(view.seller)}",
-        f"💸 Текущая ставка: <b>${view.current_price}</b>",
-        f"🏁 Старт: ${view.auction.start_price}",
-        f"💰 Выкуп: {'$' + str(view.auction.buyout_price) if view.auction.buyout_price is not None else 'нет'}",
-        f"🛡 Антиснайпер: {anti_sniper_text}",
-        f"⏰ Финиш: <b>{ending_line}</b>",
-        "",
-        "🏆 <b>Топ-3 ставок</b>",
-        _format_top_bids(view.top_bids),
-    ]
+    auction = view.auction
+    description = html.escape(auction.description)
+    if len(description) > _CAPTION_DESCRIPTION_MAX_LENGTH:
+        description = f"{description[:_CAPTION_DESCRIPTION_MAX_LENGTH]}..."
+
+    ending_line = _format_dt(auction.ends_at)
+    if auction.status == AuctionStatus.ACTIVE:
+        ending_line = f"{ending_line} ({_human_time_left(auction.ends_at)})"
+
+    caption = _CAPTION_TEMPLATE.format(
+        short_id=str(auction.id)[:8],
+        pending_line=_CAPTION_PENDING_LINE if publish_pending else "",
+        description=description,
+        status_text=_CAPTION_STATUS_TEXT[auction.status],
+        seller=_format_user_mention(view.seller),
+        current_price=view.current_price,
+        start_price=auction.start_price,
+        buyout_text=f"${auction.buyout_price}" if auction.buyout_price is not None else "нет",
+        anti_sniper_text="вкл" if auction.anti_sniper_enabled else "выкл",
+        ending_line=ending_line,
+        top_bids=_format_top_bids(view.top_bids),
+    )
+    if auction.status in {AuctionStatus.ENDED, AuctionStatus.BOUGHT_OUT}:
+        caption += _CAPTION_WINNER_TEMPLATE.format(winner=_format_user_mention(view.winner))
 
-    if view.auction.status in {AuctionStatus.ENDED, AuctionStatus.BOUGHT_OUT}:
-        lines.extend(["", f"Победитель: <b>{_format_user_mention(view.winner)}</b>"])
+    return caption[:_CAPTION_MAX_LENGTH]
 
-    return "\n".join(lines)[:1024]
+
+def auction_post_content_hash(
+    *,
+    caption: str,
+    reply_markup: InlineKeyboardMarkup | None,
+    photo_file_id: str,
+) -> str:
+    """Fingerprint of what a refresh would put into a post: photo, caption and keyboard."""
+
+    markup_json = reply_markup.model_dump_json(exclude_none=True) if reply_markup is not None else ""
+    digest = hashlib.sha256()
+    for part in (photo_file_id, caption, markup_json):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 async def create_draft_auction(
@@ -371,12 +402,12 @@ async def load_auction_view(session: AsyncSession, auction_id: uuid.UUID) -> Auc
     if seller is None:
         return None
 
-    top_bids = await _top_bids_for_auction(session, auction_id, limit=3)
+    top_bids = await _top_bids_for_auction(session, auction_id, limit=3) if auction.bid_count else []
     winner: User | None = None
     if auction.winner_user_id is not None:
         winner = await session.scalar(select(User).where(User.id == auction.winner_user_id))
 
-    current_price = top_bids[0].amount if top_bids else auction.start_price
+    current_price = auction.current_price
     minimum_next_bid = current_price + auction.min_step
 
     open_complaints = (
@@ -483,6 +514,34 @@ async def activate_auction_chat_post(
     return auction
 
 
+async def add_auction_chat_posts(
+    session: AsyncSession,
+    *,
+    auction_id: uuid.UUID,
+    publisher_user_id: int,
+    posts: list[tuple[int, int]],
+) -> None:
+    """Records additional ``(chat_id, message_id)`` posts of an auction in one insert."""
+
+    if not posts:
+        return
+    await session.execute(
+        insert(AuctionPost)
+        .values(
+            [
+                {
+                    "auction_id": auction_id,
+                    "chat_id": chat_id,
+                    "message_id": message_id,
+                    "published_by_user_id": publisher_user_id,
+                }
+                for chat_id, message_id in posts
+            ]
+        )
+        .on_conflict_do_nothing(constraint="uq_auction_posts_message")
+    )
+
+
 async def _finalize_auction_locked(
     session: AsyncSession,
     auction: Auction,
@@ -494,8 +553,7 @@ async def _finalize_auction_locked(
         return None
 
     if winner_user_id is None:
-        top_bids = await _top_bids_for_auction(session, auction.id, limit=1)
-        winner_user_id = top_bids[0].user_id if top_bids else None
+        winner_user_id = auction.top_bidder_user_id
 
     now = datetime.now(UTC)
     auction.status = status
@@ -562,14 +620,15 @@ async def process_bid_action(
     if is_blacklisted is not None:
         return BidActionResult(False, False, "Вы заблокированы и не можете делать ставки")
 
-    top_bids = await _top_bids_for_auction(session, auction.id, limit=1)
-    current_price = top_bids[0].amount if top_bids else auction.start_price
-    leader_user_id = top_bids[0].user_id if top_bids else None
-    outbid_tg_user_id = top_bids[0].tg_user_id if top_bids else None
-
+    current_price = auction.current_price
+    leader_user_id = auction.top_bidder_user_id
     if leader_user_id == bidder_user_id:
         return BidActionResult(False, False, "Вы уже лидируете")
 
+    outbid_tg_user_id: int | None = None
+    if leader_user_id is not None:
+        outbid_tg_user_id = await session.scalar(select(User.tg_user_id).where(User.id == leader_user_id))
+
     buyout_triggered = is_buyout
     if is_buyout:
         if auction.buyout_price is None:
@@ -592,16 +651,18 @@ async def process_bid_action(
     if duplicate is not None:
         return BidActionResult(False, False, "Эта ставка уже отправлена недавно")
 
-    created_bid = Bid(auction_id=auction.id, user_id=bidder_user_id, amount=bid_amount)
+    created_bid = Bid(auction_id=auction.id, user_id=bidder_user_id, amount=bid_amount, created_at=now)
     session.add(created_bid)
+    record_placed_bid(auction, user_id=bidder_user_id, amount=bid_amount, placed_at=now)
     await session.flush()
 
-    fraud_signal_id = await evaluate_and_store_bid_fraud_signal(
-        session,
-        auction_id=auction.id,
-        user_id=bidder_user_id,
-        bid_id=created_bid.id,
-    )
+    with BID_CALLBACK_PHASE_SECONDS.time(action="buyout" if is_buyout else "bid", phase="fraud"):
+        fraud_signal_id = await evaluate_and_store_bid_fraud_signal(
+            session,
+            auction_id=auction.id,
+            user_id=bidder_user_id,
+            bid_id=created_bid.id,
+        )
 
     winner_tg_user_id: int | None = None
     seller_tg_user_id: int | None = None
@@ -652,6 +713,8 @@ async def process_bid_action(
 
 
 async def refresh_auction_posts(bot: Bot, auction_id: uuid.UUID) -> None:
+    # Every bid, status change and moderation action ends here once committed.
+    await bump_inline_auction_version(auction_id)
     async with SessionFactory() as session:
         view = await load_auction_view(session, auction_id)
         if view is None:
@@ -672,14 +735,49 @@ async def refresh_auction_posts(bot: Bot, auction_id: uuid.UUID) -> None:
             has_buyout=view.auction.buyout_price is not None,
         )
 
+    content_hash = auction_post_content_hash(
+        caption=caption,
+        reply_markup=reply_markup,
+        photo_file_id=view.auction.photo_file_id,
+    )
+    applied: list[AuctionPost] = []
     for post in posts:
-        await _refresh_auction_post_message(
+        if post.content_hash == content_hash:
+            AUCTION_POST_EDITS_TOTAL.inc(outcome="skipped")
+            continue
+        if await _refresh_auction_post_message(
             bot,
             post=post,
             caption=caption,
             reply_markup=reply_markup,
             photo_file_id=view.auction.photo_file_id,
-        )
+        ):
+            AUCTION_POST_EDITS_TOTAL.inc(outcome="applied")
+            applied.append(post)
+        else:
+            AUCTION_POST_EDITS_TOTAL.inc(outcome="failed")
+
+    if applied:
+        await _store_post_content_hashes(applied, content_hash=content_hash)
+
+
+async def _store_post_content_hashes(posts: list[AuctionPost], *, content_hash: str) -> None:
+    """Records the hash of the content just applied to each post.
+
+    The write only lands if the stored hash is still the one read before the edit;
+    otherwise a concurrent refresh edited the same message and it is unknown which
+    edit Telegram applied last, so the hash is cleared and the next refresh edits.
+    """
+
+    async with SessionFactory() as session:
+        async with session.begin():
+            for post in posts:
+                unchanged = AuctionPost.content_hash.is_not_distinct_from(post.content_hash)
+                await session.execute(
+                    update(AuctionPost)
+                    .where(AuctionPost.id == post.id)
+                    .values(content_hash=case((unchanged, content_hash), else_=None))
+                )
 
 
 def _is_not_modified_error(exc: TelegramBadRequest) -> bool:
@@ -725,7 +823,9 @@ async def _refresh_auction_post_message(
     caption: str,
     reply_markup: InlineKeyboardMarkup | None,
     photo_file_id: str,
-) -> None:
+) -> bool:
+    """Edits one post to the given content; returns whether the message now shows it."""
+
     try:
         if post.inline_message_id:
             await bot.edit_message_caption(
@@ -733,7 +833,7 @@ async def _refresh_auction_post_message(
                 caption=caption,
                 reply_markup=reply_markup,
             )
-            return
+            return True
         if post.chat_id is not None and post.message_id is not None:
             await bot.edit_message_caption(
                 chat_id=post.chat_id,
@@ -741,17 +841,17 @@ async def _refresh_auction_post_message(
                 caption=caption,
                 reply_markup=reply_markup,
             )
-            return
-        return
+            return True
+        return False
     except TelegramBadRequest as exc:
         if _is_not_modified_error(exc):
-            return
+            return True
         if not _should_upgrade_text_post(exc):
             logger.warning("Failed to refresh auction post %s: %s", post.id, exc)
-            return
+            return False
     except TelegramForbiddenError as exc:
         logger.warning("No rights to edit auction post %s: %s", post.id, exc)
-        return
+        return False
     except TelegramRetryAfter as exc:
         logger.warning(
             "Rate limited while refreshing auction post %s (retry_after=%s): %s",
@@ -759,20 +859,21 @@ async def _refresh_auction_post_message(
             exc.retry_after,
             exc,
         )
-        return
+        return False
     except (TelegramNetworkError, TelegramServerError) as exc:
         logger.warning("Transient error while refreshing auction post %s: %s", post.id, exc)
-        return
+        return False
     except TelegramAPIError as exc:
         logger.warning("Unexpected Telegram API error while refreshing auction post %s: %s", post.id, exc)
-        return
+        return False
 
     media = InputMediaPhoto(media=photo_file_id, caption=caption, parse_mode=ParseMode.HTML)
     try:
         await _edit_post_media(bot, post=post, media=media, reply_markup=reply_markup)
+        return True
     except TelegramBadRequest as exc:
         if _is_not_modified_error(exc):
-            return
+            return True
         logger.warning("Failed to attach media while refreshing auction post %s: %s", post.id, exc)
     except TelegramForbiddenError as exc:
         logger.warning("No rights to attach media for auction post %s: %s", post.id, exc)
@@ -787,6 +888,7 @@ async def _refresh_auction_post_message(
         logger.warning("Transient error while attaching media for auction post %s: %s", post.id, exc)
     except TelegramAPIError as exc:
         logger.warning("Unexpected Telegram API error while attaching media for auction post %s: %s", post.id, exc)
+    return False
 
 
 async def _safe_refresh_auction_posts(bot: Bot, auction_id: uuid.UUID) -> None:
@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
+import time
 
 from aiogram import Bot
 
 from app.config import settings
+from app.infra.metrics import WATCHER_LOOP_SECONDS
 from app.services.auction_service import finalize_expired_auctions
 
 logger = logging.getLogger(__name__)
@@ -15,14 +17,17 @@ logger = logging.getLogger(__name__)
 async def run_auction_watcher(bot: Bot) -> None:
     interval = max(settings.auction_watcher_interval_seconds, 1)
     while True:
+        started = time.perf_counter()
         try:
             closed = await finalize_expired_auctions(bot)
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="auction", outcome="ok")
             if closed:
                 logger.info("Auction watcher finalized %s auction(s)", closed)
             await asyncio.sleep(interval)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="auction", outcome="error")
             logger.exception("Auction watcher failed: %s", exc)
             await asyncio.sleep(interval)
 
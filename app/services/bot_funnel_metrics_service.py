@@ -5,10 +5,16 @@ import logging
 import re
 from enum import StrEnum
 
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+
+from app.infra.metrics_buffer import metrics_buffer
 from app.infra.redis_client import redis_client
 
 logger = logging.getLogger(__name__)
-_METRIC_SCAN_MATCH = "bot:funnel:*"
+# One hash, field ``{journey}:{step}:{role}:{context}:{reason}``, read with a single HGETALL.
+_METRIC_TOTALS_KEY = "bot:funnel:totals"
+_LEGACY_METRIC_SCAN_MATCH = "bot:funnel:*"
 
 
 class BotFunnelJourney(StrEnum):
@@ -70,7 +76,7 @@ def _normalize_segment(value: str | None, *, fallback: str) -> str:
     return normalized or fallback
 
 
-def _metric_key(
+def _metric_field(
     *,
     journey: BotFunnelJourney,
     step: BotFunnelStep,
@@ -79,31 +85,38 @@ def _metric_key(
     reason: str,
 ) -> str:
     return (
-        f"bot:funnel:{journey.value}:{step.value}:{actor_role.value}:"
+        f"{journey.value}:{step.value}:{actor_role.value}:"
         f"{_normalize_segment(context_key, fallback='unknown')}:{_normalize_segment(reason, fallback='unknown')}"
     )
 
 
-def _parse_metric_key(
-    key: str,
+def _parse_metric_field(
+    field: str,
 ) -> tuple[BotFunnelJourney, BotFunnelStep, BotFunnelActorRole, str, str] | None:
-    parts = key.split(":", 6)
-    if len(parts) != 7:
-        return None
-    if parts[0] != "bot" or parts[1] != "funnel":
+    parts = field.split(":", 4)
+    if len(parts) != 5:
         return None
     try:
-        journey = BotFunnelJourney(parts[2])
-        step = BotFunnelStep(parts[3])
-        actor_role = BotFunnelActorRole(parts[4])
+        journey = BotFunnelJourney(parts[0])
+        step = BotFunnelStep(parts[1])
+        actor_role = BotFunnelActorRole(parts[2])
     except ValueError:
         return None
 
-    context_key = _normalize_segment(parts[5], fallback="unknown")
-    reason = _normalize_segment(parts[6], fallback="unknown")
+    context_key = _normalize_segment(parts[3], fallback="unknown")
+    reason = _normalize_segment(parts[4], fallback="unknown")
     return journey, step, actor_role, context_key, reason
 
 
+def _parse_legacy_metric_key(
+    key: str,
+) -> tuple[BotFunnelJourney, BotFunnelStep, BotFunnelActorRole, str, str] | None:
+    prefix = "bot:funnel:"
+    if not key.startswith(prefix):
+        return None
+    return _parse_metric_field(key[len(prefix) :])
+
+
 async def record_bot_funnel_event(
     *,
     journey: BotFunnelJourney,
@@ -118,7 +131,7 @@ async def record_bot_funnel_event(
     normalized_reason = (
         _normalize_segment(failure_reason, fallback="unknown") if step == BotFunnelStep.FAIL else "ok"
     )
-    key = _metric_key(
+    field = _metric_field(
         journey=journey,
         step=step,
         actor_role=actor_role,
@@ -126,8 +139,12 @@ async def record_bot_funnel_event(
         reason=normalized_reason,
     )
 
+    if metrics_buffer.is_running:
+        metrics_buffer.incr(_METRIC_TOTALS_KEY, normalized_count, field=field)
+        return None
+
     try:
-        total = await redis_client.incrby(key, normalized_count)
+        total = await redis_client.hincrby(_METRIC_TOTALS_KEY, field, normalized_count)
     except Exception:  # pragma: no cover - defensive safety around redis runtime
         logger.warning(
             "bot_funnel_metric_failed journey=%s step=%s actor=%s context=%s reason=%s",
@@ -142,44 +159,15 @@ async def record_bot_funnel_event(
     return int(total)
 
 
-async def _scan_metric_keys() -> list[str]:
-    cursor: int | str = 0
-    keys: list[str] = []
-    while True:
-        cursor, batch = await redis_client.scan(cursor=cursor, match=_METRIC_SCAN_MATCH, count=500)
-        keys.extend(batch)
-        if int(cursor) == 0:
-            break
-    return keys
-
-
 async def load_bot_funnel_snapshot(*, top_limit: int = 5) -> BotFunnelSnapshot:
     normalized_top_limit = max(int(top_limit), 1)
     try:
-        keys = await _scan_metric_keys()
+        raw_counters = await redis_client.hgetall(_METRIC_TOTALS_KEY)
     except Exception:  # pragma: no cover - defensive safety around redis runtime
-        logger.warning("bot_funnel_snapshot_scan_failed", exc_info=True)
-        return BotFunnelSnapshot(
-            journey_summaries=(),
-            top_drop_offs=(),
-            total_starts=0,
-            total_completes=0,
-            total_fails=0,
-        )
-
-    if not keys:
-        return BotFunnelSnapshot(
-            journey_summaries=(),
-            top_drop_offs=(),
-            total_starts=0,
-            total_completes=0,
-            total_fails=0,
-        )
+        logger.warning("bot_funnel_snapshot_load_failed", exc_info=True)
+        raw_counters = {}
 
-    try:
-        raw_values = await redis_client.mget(keys)
-    except Exception:  # pragma: no cover - defensive safety around redis runtime
-        logger.warning("bot_funnel_snapshot_mget_failed", exc_info=True)
+    if not raw_counters:
         return BotFunnelSnapshot(
             journey_summaries=(),
             top_drop_offs=(),
@@ -194,8 +182,8 @@ async def load_bot_funnel_snapshot(*, top_limit: int = 5) -> BotFunnelSnapshot:
     dropoffs_by_journey: dict[BotFunnelJourney, dict[tuple[str, str, BotFunnelActorRole], int]] = {}
     global_dropoffs: dict[tuple[BotFunnelJourney, str, str, BotFunnelActorRole], int] = {}
 
-    for key, raw_value in zip(keys, raw_values, strict=False):
-        parsed = _parse_metric_key(key)
+    for field, raw_value in raw_counters.items():
+        parsed = _parse_metric_field(str(field))
         if parsed is None:
             continue
         try:
@@ -274,3 +262,70 @@ async def load_bot_funnel_snapshot(*, top_limit: int = 5) -> BotFunnelSnapshot:
         total_completes=sum(completes_by_journey.values()),
         total_fails=sum(fails_by_journey.values()),
     )
+
+
+def _queue_legacy_funnel_moves(
+    pipe: Pipeline,
+    legacy: list[tuple[str, tuple[BotFunnelJourney, BotFunnelStep, BotFunnelActorRole, str, str]]],
+    raw_values: list[str | None],
+) -> None:
+    for (key, parsed), raw_value in zip(legacy, raw_values, strict=True):
+        pipe.delete(key)
+        try:
+            value = int(raw_value or 0)
+        except (TypeError, ValueError):
+            continue
+        if value <= 0:
+            continue
+        journey, step, actor_role, context_key, reason = parsed
+        field = _metric_field(
+            journey=journey,
+            step=step,
+            actor_role=actor_role,
+            context_key=context_key,
+            reason=reason,
+        )
+        pipe.hincrby(_METRIC_TOTALS_KEY, field, value)
+
+
+async def migrate_legacy_bot_funnel_keys(*, dry_run: bool = False, batch_size: int = 500) -> int:
+    """Folds pre-hash ``bot:funnel:*`` string counters into the funnel hash.
+
+    Each SCAN batch moves in one MULTI/EXEC (HINCRBY plus DEL of the legacy keys), so
+    the tool is safe to re-run. The batch keys are WATCHed before they are read, so an
+    increment from an older bot aborts EXEC and the batch is re-read instead of lost.
+    Returns the number of legacy keys found.
+    """
+
+    cursor = 0
+    migrated = 0
+    while True:
+        next_cursor, keys = await redis_client.scan(
+            cursor=cursor,
+            match=_LEGACY_METRIC_SCAN_MATCH,
+            count=max(batch_size, 1),
+        )
+        cursor = int(next_cursor)
+        legacy = [
+            (str(key), parsed)
+            for key in keys
+            if (parsed := _parse_legacy_metric_key(str(key))) is not None
+        ]
+        if legacy:
+            migrated += len(legacy)
+            if not dry_run:
+                legacy_keys = [key for key, _ in legacy]
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    while True:
+                        try:
+                            await pipe.watch(*legacy_keys)
+                            raw_values = await pipe.mget(legacy_keys)
+                            pipe.multi()
+                            _queue_legacy_funnel_moves(pipe, legacy, raw_values)
+                            await pipe.execute()
+                            break
+                        except WatchError:
+                            continue
+        if cursor == 0:
+            break
+    return migrated
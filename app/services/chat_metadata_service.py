@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.models import ChatMetadata
+from app.db.session import SessionFactory
+from app.infra.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class ChatMetadataEntry:
+    chat_id: int
+    chat_type: str
+    title: str | None
+    username: str | None
+    is_forum: bool
+
+
+def _clean_text(value: object) -> str | None:
+    if not isinstance(value, str):
+        return None
+    cleaned = value.strip()
+    return cleaned or None
+
+
+def chat_metadata_from_chat(chat: Any) -> ChatMetadataEntry:
+    """Builds a registry entry from an aiogram ``Chat`` (or any object shaped like one)."""
+
+    chat_type = getattr(chat, "type", None)
+    return ChatMetadataEntry(
+        chat_id=int(chat.id),
+        chat_type=str(getattr(chat_type, "value", chat_type)) if chat_type else "unknown",
+        title=_clean_text(getattr(chat, "title", None)),
+        username=_clean_text(getattr(chat, "username", None)),
+        is_forum=bool(getattr(chat, "is_forum", False)),
+    )
+
+
+def _cache_key(chat_id: int) -> str:
+    return f"chat:metadata:{chat_id}"
+
+
+def _entry_from_row(row: ChatMetadata) -> ChatMetadataEntry:
+    return ChatMetadataEntry(
+        chat_id=row.chat_id,
+        chat_type=row.chat_type,
+        title=row.title,
+        username=row.username,
+        is_forum=row.is_forum,
+    )
+
+
+async def _read_cached_entry(chat_id: int) -> tuple[bool, ChatMetadataEntry | None]:
+    """Returns ``(hit, entry)``; chats that ``getChat`` could not resolve are cached as ``None``."""
+
+    if settings.chat_metadata_cache_ttl_seconds <= 0:
+        return False, None
+    try:
+        raw = await redis_client.get(_cache_key(chat_id))
+    except RedisError as exc:
+        logger.warning("chat_metadata_cache_unavailable op=get chat_id=%s error=%s", chat_id, exc)
+        return False, None
+    if raw is None:
+        return False, None
+    payload = json.loads(raw)
+    return True, ChatMetadataEntry(**payload) if payload is not None else None
+
+
+async def _write_cached_entry(chat_id: int, entry: ChatMetadataEntry | None) -> None:
+    if settings.chat_metadata_cache_ttl_seconds <= 0:
+        return
+    payload = asdict(entry) if entry is not None else None
+    try:
+        await redis_client.set(
+            _cache_key(chat_id),
+            json.dumps(payload),
+            ex=settings.chat_metadata_cache_ttl_seconds,
+        )
+    except RedisError as exc:
+        logger.warning("chat_metadata_cache_unavailable op=set chat_id=%s error=%s", chat_id, exc)
+
+
+async def cache_chat_metadata(entry: ChatMetadataEntry) -> None:
+    """Publishes a stored entry to Redis; call after the transaction that upserted it commits."""
+
+    await _write_cached_entry(entry.chat_id, entry)
+
+
+async def upsert_chat_metadata(
+    session: AsyncSession,
+    entry: ChatMetadataEntry,
+    *,
+    bot_status: str | None = None,
+) -> None:
+    """Inserts or refreshes a registry row; ``bot_status`` is kept when not given."""
+
+    now = datetime.now(UTC)
+    values = {
+        "chat_type": entry.chat_type,
+        "title": entry.title,
+        "username": entry.username,
+        "is_forum": entry.is_forum,
+        "refreshed_at": now,
+        "updated_at": now,
+    }
+    if bot_status is not None:
+        values["bot_status"] = bot_status
+    stmt = insert(ChatMetadata).values(chat_id=entry.chat_id, **values)
+    await session.execute(
+        stmt.on_conflict_do_update(index_elements=[ChatMetadata.chat_id], set_=values)
+    )
+
+
+async def remember_chat(chat: Any, *, bot_status: str | None = None) -> ChatMetadataEntry:
+    """Stores what an update tells us about a chat, e.g. from ``my_chat_member``."""
+
+    entry = chat_metadata_from_chat(chat)
+    async with SessionFactory() as session:
+        async with session.begin():
+            await upsert_chat_metadata(session, entry, bot_status=bot_status)
+    await cache_chat_metadata(entry)
+    return entry
+
+
+async def get_chat_metadata(bot: Bot, chat_id: int) -> ChatMetadataEntry | None:
+    """Resolves chat metadata from Redis, then the registry table, then ``getChat``.
+
+    Registry rows older than ``CHAT_METADATA_REFRESH_SECONDS`` are refreshed through
+    ``getChat``; when that fails the stale row is still served. Chats the bot cannot
+    see at all are cached as missing, so link builders fall back to ``t.me/c`` links
+    without asking Telegram again until the cache entry expires.
+    """
+
+    hit, cached = await _read_cached_entry(chat_id)
+    if hit:
+        return cached
+
+    async with SessionFactory() as session:
+        row = await session.scalar(select(ChatMetadata).where(ChatMetadata.chat_id == chat_id))
+    stored = _entry_from_row(row) if row is not None else None
+    refresh_after = timedelta(seconds=max(settings.chat_metadata_refresh_seconds, 0))
+    if row is not None and datetime.now(UTC) - row.refreshed_at < refresh_after:
+        await _write_cached_entry(chat_id, stored)
+        return stored
+
+    try:
+        chat = await bot.get_chat(chat_id)
+    except TelegramAPIError as exc:
+        logger.info("chat_metadata_refresh_failed chat_id=%s stored=%s error=%s", chat_id, row is not None, exc)
+        await _write_cached_entry(chat_id, stored)
+        return stored
+
+    entry = chat_metadata_from_chat(chat)
+    async with SessionFactory() as session:
+        async with session.begin():
+            await upsert_chat_metadata(session, entry)
+    await _write_cached_entry(chat_id, entry)
+    return entry
+
+
+async def get_chat_username(bot: Bot, chat_id: int) -> str | None:
+    entry = await get_chat_metadata(bot, chat_id)
+    return entry.username if entry is not None else None
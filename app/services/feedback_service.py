@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -12,19 +12,15 @@ from app.db.models import FeedbackItem, User
 from app.services.outbox_service import enqueue_feedback_issue_event
 from app.services.points_service import (
     feedback_reward_dedupe_key,
-    get_points_redemption_account_age_remaining_seconds,
-    get_points_event_redemption_cooldown_remaining_seconds,
-    get_points_redemptions_spent_today,
-    get_points_redemptions_spent_this_week,
-    get_points_redemptions_spent_this_month,
-    get_points_redemptions_used_today,
-    get_points_redemptions_used_this_week,
-    get_points_redemption_cooldown_remaining_seconds,
     get_user_points_balance,
-    get_user_points_summary,
     grant_points,
     spend_points,
 )
+from app.services.redemption_policy_service import (
+    BoostUtilityPolicy,
+    RedemptionUtility,
+    redemption_policy_engine,
+)
 
 
 @dataclass(slots=True)
@@ -50,15 +46,7 @@ class FeedbackPriorityBoostResult:
     changed: bool = False
 
 
-@dataclass(slots=True)
-class FeedbackPriorityBoostPolicy:
-    enabled: bool
-    cost_points: int
-    daily_limit: int
-    used_today: int
-    remaining_today: int
-    cooldown_seconds: int
-    cooldown_remaining_seconds: int
+FeedbackPriorityBoostPolicy = BoostUtilityPolicy
 
 
 @dataclass(slots=True)
@@ -311,136 +299,16 @@ async def redeem_feedback_priority_boost(
         return FeedbackPriorityBoostResult(True, "Приоритет уже повышен", item=item, changed=False)
 
     now = datetime.now(UTC)
-    if not settings.points_redemption_enabled:
-        return FeedbackPriorityBoostResult(False, "Редимпшены points временно отключены")
-    account_age_remaining = await get_points_redemption_account_age_remaining_seconds(
-        session,
-        user_id=submitter_user_id,
-        min_account_age_seconds=settings.points_redemption_min_account_age_seconds,
-        now=now,
-    )
-    if account_age_remaining > 0:
-        return FeedbackPriorityBoostResult(
-            False,
-            f"Бусты станут доступны через {account_age_remaining} сек после регистрации",
-        )
-    min_earned_points = max(settings.points_redemption_min_earned_points, 0)
-    if min_earned_points > 0:
-        points_summary = await get_user_points_summary(session, user_id=submitter_user_id)
-        if points_summary.total_earned < min_earned_points:
-            remaining_earned_points = min_earned_points - points_summary.total_earned
-            return FeedbackPriorityBoostResult(
-                False,
-                (
-                    "Для буста нужно заработать минимум "
-                    f"{min_earned_points} points (сейчас {points_summary.total_earned}, "
-                    f"осталось {remaining_earned_points})"
-                ),
-            )
-    policy = await get_feedback_priority_boost_policy(session, submitter_user_id=submitter_user_id, now=now)
-    if not policy.enabled:
-        return FeedbackPriorityBoostResult(False, "Буст фидбека временно отключен")
-    if policy.cooldown_remaining_seconds > 0:
-        return FeedbackPriorityBoostResult(
-            False,
-            f"Повторный буст фидбека доступен через {policy.cooldown_remaining_seconds} сек",
-        )
-    if policy.remaining_today <= 0:
-        return FeedbackPriorityBoostResult(False, f"Достигнут дневной лимит бустов ({policy.daily_limit})")
-
-    global_daily_limit = max(settings.points_redemption_daily_limit, 0)
-    if global_daily_limit > 0:
-        used_today = await get_points_redemptions_used_today(
-            session,
-            user_id=submitter_user_id,
-            now=now,
-        )
-        if used_today >= global_daily_limit:
-            return FeedbackPriorityBoostResult(
-                False,
-                f"Достигнут глобальный дневной лимит бустов ({global_daily_limit})",
-            )
-
-    global_weekly_limit = max(settings.points_redemption_weekly_limit, 0)
-    if global_weekly_limit > 0:
-        used_this_week = await get_points_redemptions_used_this_week(
-            session,
-            user_id=submitter_user_id,
-            now=now,
-        )
-        if used_this_week >= global_weekly_limit:
-            return FeedbackPriorityBoostResult(
-                False,
-                f"Достигнут глобальный недельный лимит бустов ({global_weekly_limit})",
-            )
-
-    global_daily_spend_cap = max(settings.points_redemption_daily_spend_cap, 0)
-    if global_daily_spend_cap > 0:
-        spent_today = await get_points_redemptions_spent_today(
-            session,
-            user_id=submitter_user_id,
-            now=now,
-        )
-        if spent_today + policy.cost_points > global_daily_spend_cap:
-            return FeedbackPriorityBoostResult(
-                False,
-                (
-                    "Достигнут глобальный дневной лимит списания на бусты "
-                    f"({global_daily_spend_cap} points)"
-                ),
-            )
-
-    global_weekly_spend_cap = max(settings.points_redemption_weekly_spend_cap, 0)
-    if global_weekly_spend_cap > 0:
-        spent_this_week = await get_points_redemptions_spent_this_week(
-            session,
-            user_id=submitter_user_id,
-            now=now,
-        )
-        if spent_this_week + policy.cost_points > global_weekly_spend_cap:
-            return FeedbackPriorityBoostResult(
-                False,
-                (
-                    "Достигнут глобальный недельный лимит списания на бусты "
-                    f"({global_weekly_spend_cap} points)"
-                ),
-            )
-
-    global_monthly_spend_cap = max(settings.points_redemption_monthly_spend_cap, 0)
-    if global_monthly_spend_cap > 0:
-        spent_this_month = await get_points_redemptions_spent_this_month(
-            session,
-            user_id=submitter_user_id,
-            now=now,
-        )
-        if spent_this_month + policy.cost_points > global_monthly_spend_cap:
-            return FeedbackPriorityBoostResult(
-                False,
-                (
-                    "Достигнут глобальный месячный лимит списания на бусты "
-                    f"({global_monthly_spend_cap} points)"
-                ),
-            )
-
-    cooldown_remaining = await get_points_redemption_cooldown_remaining_seconds(
+    decision = await redemption_policy_engine.decide(
         session,
         user_id=submitter_user_id,
-        cooldown_seconds=settings.points_redemption_cooldown_seconds,
+        utility=RedemptionUtility.FEEDBACK,
         now=now,
     )
-    if cooldown_remaining > 0:
-        return FeedbackPriorityBoostResult(False, f"Следующий буст доступен через {cooldown_remaining} сек")
-
-    cost = policy.cost_points
-    min_balance = max(settings.points_redemption_min_balance, 0)
-    if min_balance > 0:
-        current_balance = await get_user_points_balance(session, user_id=submitter_user_id)
-        if current_balance - cost < min_balance:
-            return FeedbackPriorityBoostResult(
-                False,
-                f"Нужно сохранить минимум {min_balance} points после буста (доступно {current_balance})",
-            )
+    if not decision.allowed:
+        return FeedbackPriorityBoostResult(False, decision.message)
 
+    cost = decision.cost_points
     spend_result = await spend_points(
         session,
         user_id=submitter_user_id,
@@ -469,37 +337,5 @@ async def get_feedback_priority_boost_policy(
     submitter_user_id: int,
     now: datetime | None = None,
 ) -> FeedbackPriorityBoostPolicy:
-    current_time = now or datetime.now(UTC)
-    day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    daily_limit = max(settings.feedback_priority_boost_daily_limit, 1)
-    cost_points = max(settings.feedback_priority_boost_cost_points, 1)
-    cooldown_seconds = max(settings.feedback_priority_boost_cooldown_seconds, 0)
-    used_today = int(
-        await session.scalar(
-            select(func.count(FeedbackItem.id)).where(
-                FeedbackItem.submitter_user_id == submitter_user_id,
-                FeedbackItem.priority_boosted_at.is_not(None),
-                FeedbackItem.priority_boosted_at >= day_start,
-            )
-        )
-        or 0
-    )
-    remaining_today = max(daily_limit - used_today, 0)
-    cooldown_remaining_seconds = await get_points_event_redemption_cooldown_remaining_seconds(
-        session,
-        user_id=submitter_user_id,
-        event_types=(PointsEventType.FEEDBACK_PRIORITY_BOOST,),
-        cooldown_seconds=cooldown_seconds,
-        now=current_time,
-    )
-
-    return FeedbackPriorityBoostPolicy(
-        enabled=settings.feedback_priority_boost_enabled,
-        cost_points=cost_points,
-        daily_limit=daily_limit,
-        used_today=used_today,
-        remaining_today=remaining_today,
-        cooldown_seconds=cooldown_seconds,
-        cooldown_remaining_seconds=cooldown_remaining_seconds,
-    )
+    snapshot = await redemption_policy_engine.load_snapshot(session, user_id=submitter_user_id, now=now)
+    return snapshot.utility(RedemptionUtility.FEEDBACK)
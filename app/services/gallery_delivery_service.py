@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass
+from enum import StrEnum
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from aiogram.types import InputMediaPhoto, ReplyParameters
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.models import Auction
+from app.db.session import SessionFactory
+from app.infra.redis_client import redis_client
+from app.infra.send_budget import SendBudget
+from app.services.auction_service import load_auction_photo_ids
+
+_PENDING = "pending"
+
+_gallery_send_budget = SendBudget(lambda: settings.gallery_send_concurrency)
+
+
+class GalleryDeliveryStatus(StrEnum):
+    SENT = "sent"
+    POINTED = "pointed"
+    IN_PROGRESS = "in_progress"
+    THROTTLED = "throttled"
+    NOT_FOUND = "not_found"
+    FORBIDDEN = "forbidden"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class GalleryDeliveryResult:
+    status: GalleryDeliveryStatus
+    message_id: int | None = None
+
+
+def _photos_key(auction_id: uuid.UUID) -> str:
+    return f"gallery:photos:{auction_id}"
+
+
+def _delivery_key(chat_id: int, auction_id: uuid.UUID) -> str:
+    return f"gallery:sent:{chat_id}:{auction_id}"
+
+
+def _chat_throttle_key(chat_id: int) -> str:
+    return f"gallery:throttle:{chat_id}"
+
+
+def gallery_caption(auction_id: uuid.UUID) -> str:
+    return f"Фото лота #{str(auction_id)[:8]}"
+
+
+async def load_gallery_photo_ids(auction_id: uuid.UUID) -> list[str] | None:
+    """Returns the lot's photo ``file_id``s in album order, or ``None`` for an unknown lot.
+
+    Photos are fixed once the draft is created, so the list is cached in Redis for
+    ``GALLERY_PHOTO_CACHE_TTL_SECONDS`` without invalidation.
+    """
+
+    ttl = settings.gallery_photo_cache_ttl_seconds
+    if ttl > 0:
+        raw = await redis_client.get(_photos_key(auction_id))
+        if raw is not None:
+            return list(json.loads(raw))
+
+    async with SessionFactory() as session:
+        cover_file_id = await session.scalar(select(Auction.photo_file_id).where(Auction.id == auction_id))
+        if cover_file_id is None:
+            return None
+        photo_ids = await load_auction_photo_ids(session, auction_id)
+    if not photo_ids:
+        photo_ids = [cover_file_id]
+
+    if ttl > 0:
+        await redis_client.set(_photos_key(auction_id), json.dumps(photo_ids), ex=ttl)
+    return photo_ids
+
+
+async def _send_gallery(bot: Bot, *, chat_id: int, auction_id: uuid.UUID, photo_ids: list[str]) -> int:
+    caption = gallery_caption(auction_id)
+    async with _gallery_send_budget():
+        if len(photo_ids) == 1:
+            message = await bot.send_photo(chat_id, photo=photo_ids[0], caption=caption)
+            return message.message_id
+
+        first_message_id: int | None = None
+        for chunk_start in range(0, len(photo_ids), 10):
+            chunk = photo_ids[chunk_start : chunk_start + 10]
+            media = [
+                InputMediaPhoto(
+                    media=file_id,
+                    caption=caption if chunk_start == 0 and idx == 0 else None,
+                )
+                for idx, file_id in enumerate(chunk)
+            ]
+            messages = await bot.send_media_group(chat_id=chat_id, media=media)
+            if first_message_id is None and messages:
+                first_message_id = messages[0].message_id
+        return first_message_id or 0
+
+
+async def _point_to_previous_album(bot: Bot, *, chat_id: int, auction_id: uuid.UUID, message_id: int) -> bool:
+    try:
+        await bot.send_message(
+            chat_id,
+            f"{gallery_caption(auction_id)} уже здесь ⬆️",
+            reply_parameters=ReplyParameters(message_id=message_id, allow_sending_without_reply=False),
+        )
+    except TelegramBadRequest:
+        return False
+    return True
+
+
+async def deliver_auction_gallery(bot: Bot, *, auction_id: uuid.UUID, chat_id: int) -> GalleryDeliveryResult:
+    """Sends a lot's photos to ``chat_id`` (the tapping user's private chat).
+
+    A repeat tap within ``GALLERY_REPEAT_WINDOW_SECONDS`` answers with a reply to the
+    album sent before instead of the whole album again; the album is only resent
+    when that message is gone. New galleries for one chat are spaced by
+    ``GALLERY_CHAT_COOLDOWN_SECONDS`` and all gallery sends of the process share
+    ``GALLERY_SEND_CONCURRENCY`` slots, so a popular lot cannot take the Telegram
+    send capacity that bid notifications need.
+    """
+
+    delivery_key = _delivery_key(chat_id, auction_id)
+    window = max(settings.gallery_repeat_window_seconds, 0)
+    if window > 0:
+        previous = await redis_client.get(delivery_key)
+        if previous == _PENDING:
+            return GalleryDeliveryResult(GalleryDeliveryStatus.IN_PROGRESS)
+        if previous is not None:
+            previous_message_id = int(previous)
+            try:
+                pointed = await _point_to_previous_album(
+                    bot,
+                    chat_id=chat_id,
+                    auction_id=auction_id,
+                    message_id=previous_message_id,
+                )
+            except TelegramForbiddenError:
+                await redis_client.delete(delivery_key)
+                return GalleryDeliveryResult(GalleryDeliveryStatus.FORBIDDEN)
+            if pointed:
+                return GalleryDeliveryResult(GalleryDeliveryStatus.POINTED, message_id=previous_message_id)
+            await redis_client.delete(delivery_key)
+
+    cooldown = max(settings.gallery_chat_cooldown_seconds, 0)
+    if cooldown > 0:
+        acquired = await redis_client.set(_chat_throttle_key(chat_id), "1", ex=cooldown, nx=True)
+        if not acquired:
+            return GalleryDeliveryResult(GalleryDeliveryStatus.THROTTLED)
+
+    if window > 0:
+        claimed = await redis_client.set(delivery_key, _PENDING, ex=window, nx=True)
+        if not claimed:
+            return GalleryDeliveryResult(GalleryDeliveryStatus.IN_PROGRESS)
+
+    status = GalleryDeliveryStatus.FAILED
+    message_id: int | None = None
+    try:
+        photo_ids = await load_gallery_photo_ids(auction_id)
+        if photo_ids is None:
+            status = GalleryDeliveryStatus.NOT_FOUND
+        else:
+            message_id = await _send_gallery(bot, chat_id=chat_id, auction_id=auction_id, photo_ids=photo_ids)
+            status = GalleryDeliveryStatus.SENT
+    except TelegramForbiddenError:
+        status = GalleryDeliveryStatus.FORBIDDEN
+    except TelegramBadRequest:
+        status = GalleryDeliveryStatus.FAILED
+    finally:
+        if window > 0:
+            if status == GalleryDeliveryStatus.SENT and message_id:
+                await redis_client.set(delivery_key, str(message_id), ex=window)
+            else:
+                await redis_client.delete(delivery_key)
+
+    return GalleryDeliveryResult(status, message_id=message_id)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-import asyncio
 import json
+import time
 from dataclasses import dataclass
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import Any
+
+import aiohttp
 
 from app.config import settings
 from app.db.enums import FeedbackType
 from app.db.models import FeedbackItem, User
 
+_REQUEST_TIMEOUT_SECONDS = 15
+# GitHub asks clients to wait at least a minute after a secondary rate limit without Retry-After.
+_SECONDARY_RATE_LIMIT_SECONDS = 60
+
 
 @dataclass(slots=True)
 class GitHubIssueRef:
@@ -24,16 +29,57 @@ class FeedbackIssueDraft:
     labels: list[str]
 
 
+class GitHubRateLimitError(RuntimeError):
+    def __init__(self, message: str, *, retry_after_seconds: float) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    validator_header: str
+    validator: str
+    data: Any
+
+
 class FeedbackIssueClient:
     async def create_issue(self, *, title: str, body: str, labels: list[str]) -> GitHubIssueRef:
         raise NotImplementedError
 
+    async def find_issue(self, *, title: str, labels: list[str]) -> GitHubIssueRef | None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
 
 class GitHubApiIssueClient(FeedbackIssueClient):
-    def __init__(self, *, token: str, repo_owner: str, repo_name: str) -> None:
+    """Long-lived GitHub REST client.
+
+    One pooled keep-alive ``aiohttp`` session serves every request until ``close``.
+    GETs are conditional (``If-None-Match``/``If-Modified-Since``), so unchanged
+    listings come back as 304 and do not count against the rate limit. Once GitHub
+    reports an exhausted or secondary rate limit, every call fails fast with
+    ``GitHubRateLimitError`` until the reset time instead of hitting the API.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str,
+        repo_owner: str,
+        repo_name: str,
+        api_base_url: str = "https://api.github.com",
+        pool_size: int = 8,
+    ) -> None:
         self._token = token.strip()
         self._repo_owner = repo_owner.strip()
         self._repo_name = repo_name.strip()
+        self._api_base_url = api_base_url.strip().rstrip("/")
+        self._pool_size = max(pool_size, 1)
+        self._session: aiohttp.ClientSession | None = None
+        self._conditional_cache: dict[str, _CachedResponse] = {}
+        self._paused_until = 0.0
 
     @classmethod
     def from_settings(cls) -> GitHubApiIssueClient:
@@ -41,47 +87,153 @@ class GitHubApiIssueClient(FeedbackIssueClient):
             token=settings.github_token,
             repo_owner=settings.github_repo_owner,
             repo_name=settings.github_repo_name,
+            api_base_url=settings.github_api_base_url,
+            pool_size=settings.github_http_pool_size,
         )
 
-    async def create_issue(self, *, title: str, body: str, labels: list[str]) -> GitHubIssueRef:
+    @property
+    def paused_for_seconds(self) -> float:
+        return max(self._paused_until - time.monotonic(), 0.0)
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=_REQUEST_TIMEOUT_SECONDS),
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "Authorization": f"Bearer {self._token}",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                    "User-Agent": "LiteAuctionBotAutomation/1.0",
+                },
+            )
+        return self._session
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self) -> GitHubApiIssueClient:
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    def _repo_path(self) -> str:
         if not self._token:
             raise RuntimeError("GITHUB_TOKEN is empty")
         if not self._repo_owner or not self._repo_name:
             raise RuntimeError("GitHub target repository is not configured")
+        return f"/repos/{self._repo_owner}/{self._repo_name}"
+
+    def _pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + max(seconds, 1.0))
 
-        url = f"https://api.github.com/repos/{self._repo_owner}/{self._repo_name}/issues"
-        payload = json.dumps({"title": title, "body": body, "labels": labels}).encode("utf-8")
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "Authorization": f"Bearer {self._token}",
-            "X-GitHub-Api-Version": "2022-11-28",
-            "User-Agent": "LiteAuctionBotAutomation/1.0",
-            "Content-Type": "application/json",
-        }
-        request = Request(url=url, data=payload, headers=headers, method="POST")
-
-        def _send() -> tuple[int, str]:
-            with urlopen(request, timeout=15) as response:  # noqa: S310
-                return int(response.status), response.read().decode("utf-8")
+    def _rate_limit_delay(self, status: int, headers: Any, body: str) -> float | None:
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and retry_after.strip().isdigit():
+            return float(retry_after)
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset = headers.get("X-RateLimit-Reset", "")
+            if reset.strip().isdigit():
+                return max(float(reset) - time.time(), 1.0)
+            return float(_SECONDARY_RATE_LIMIT_SECONDS)
+        if status == 429 or (status == 403 and "rate limit" in body.lower()):
+            return float(_SECONDARY_RATE_LIMIT_SECONDS)
+        return None
+
+    async def _request(self, method: str, path: str, *, params=None, payload=None) -> Any:
+        paused_for = self.paused_for_seconds
+        if paused_for > 0:
+            raise GitHubRateLimitError("GitHub API rate limit: paused", retry_after_seconds=paused_for)
+
+        url = f"{self._api_base_url}{path}"
+        cache_key = f"{url}?{sorted((params or {}).items())}"
+        headers: dict[str, str] = {}
+        cached = self._conditional_cache.get(cache_key) if method == "GET" else None
+        if cached is not None:
+            headers[cached.validator_header] = cached.validator
 
         try:
-            status, raw_body = await asyncio.to_thread(_send)
-        except HTTPError as exc:
-            error_body = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"GitHub API error: HTTP {exc.code}: {error_body[:400]}") from exc
-        except URLError as exc:
-            raise RuntimeError(f"GitHub API unavailable: {exc}") from exc
+            async with self._ensure_session().request(
+                method,
+                url,
+                params=params,
+                json=payload,
+                headers=headers,
+            ) as response:
+                raw_body = await response.text()
+                status = response.status
+                response_headers = response.headers
+        except (aiohttp.ClientError, TimeoutError) as exc:
+            raise RuntimeError(f"GitHub API unavailable: {exc!r}") from exc
+
+        if status in {403, 429}:
+            delay = self._rate_limit_delay(status, response_headers, raw_body)
+            if delay is not None:
+                self._pause(delay)
+                raise GitHubRateLimitError(
+                    f"GitHub API rate limit: HTTP {status}, retry in {delay:.0f}s",
+                    retry_after_seconds=delay,
+                )
+        if response_headers.get("X-RateLimit-Remaining") == "0":
+            # The budget is spent: stop before GitHub starts rejecting requests.
+            delay = self._rate_limit_delay(status, response_headers, raw_body)
+            if delay is not None:
+                self._pause(delay)
 
+        if status == 304 and cached is not None:
+            return cached.data
+        if status >= 400:
+            raise RuntimeError(f"GitHub API error: HTTP {status}: {raw_body[:400]}")
         if status not in {200, 201}:
             raise RuntimeError(f"GitHub API unexpected status: {status}")
 
         data = json.loads(raw_body)
-        issue_number = data.get("number")
-        issue_url = data.get("html_url")
-        if not isinstance(issue_number, int) or not isinstance(issue_url, str) or not issue_url:
-            raise RuntimeError("GitHub API returned malformed issue payload")
+        if method == "GET":
+            if etag := response_headers.get("ETag"):
+                self._conditional_cache[cache_key] = _CachedResponse("If-None-Match", etag, data)
+            elif last_modified := response_headers.get("Last-Modified"):
+                self._conditional_cache[cache_key] = _CachedResponse("If-Modified-Since", last_modified, data)
+        return data
+
+    async def create_issue(self, *, title: str, body: str, labels: list[str]) -> GitHubIssueRef:
+        data = await self._request(
+            "POST",
+            f"{self._repo_path()}/issues",
+            payload={"title": title, "body": body, "labels": labels},
+        )
+        return _issue_ref(data)
+
+    async def find_issue(self, *, title: str, labels: list[str]) -> GitHubIssueRef | None:
+        """Looks up a recently created issue by exact title, e.g. after an ambiguous create failure."""
+
+        data = await self._request(
+            "GET",
+            f"{self._repo_path()}/issues",
+            params={
+                "state": "all",
+                "labels": ",".join(labels),
+                "sort": "created",
+                "direction": "desc",
+                "per_page": "100",
+            },
+        )
+        if not isinstance(data, list):
+            raise RuntimeError("GitHub API returned malformed issue list")
+        for item in data:
+            if isinstance(item, dict) and item.get("title") == title and "pull_request" not in item:
+                return _issue_ref(item)
+        return None
+
 
-        return GitHubIssueRef(number=issue_number, url=issue_url)
+def _issue_ref(data: Any) -> GitHubIssueRef:
+    issue_number = data.get("number") if isinstance(data, dict) else None
+    issue_url = data.get("html_url") if isinstance(data, dict) else None
+    if not isinstance(issue_number, int) or not isinstance(issue_url, str) or not issue_url:
+        raise RuntimeError("GitHub API returned malformed issue payload")
+    return GitHubIssueRef(number=issue_number, url=issue_url)
 
 
 def labels_for_feedback_type(feedback_type: FeedbackType) -> list[str]:
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import asdict, dataclass
+
+from app.config import settings
+from app.infra.redis_client import redis_client
+
+
+@dataclass(slots=True)
+class InlineAuctionEntry:
+    seller_tg_user_id: int
+    status: str
+    publish_allowed: bool
+    photo_file_id: str
+    caption: str
+    min_step: int
+    has_buyout: bool
+
+
+@dataclass(slots=True)
+class InlineAuctionLookup:
+    hit: bool
+    version: str | None
+    entry: InlineAuctionEntry | None
+
+
+def _version_key(auction_id: uuid.UUID) -> str:
+    return f"inline:auction:{auction_id}:version"
+
+
+def _entry_key(auction_id: uuid.UUID) -> str:
+    return f"inline:auction:{auction_id}:entry"
+
+
+def inline_query_cache_enabled() -> bool:
+    return settings.inline_query_cache_ttl_seconds > 0
+
+
+async def get_inline_auction_entry(auction_id: uuid.UUID) -> InlineAuctionLookup:
+    """Reads the cached inline answer for an auction in one round trip.
+
+    An entry only counts as a hit when it was stored under the current version, so
+    a bump that races with a reload can never resurrect a stale answer. A missing
+    auction is cached as a hit with ``entry=None``.
+    """
+
+    version, raw_entry = await redis_client.mget(_version_key(auction_id), _entry_key(auction_id))
+    if raw_entry is None:
+        return InlineAuctionLookup(hit=False, version=version, entry=None)
+
+    payload = json.loads(raw_entry)
+    if payload.get("version") != version:
+        return InlineAuctionLookup(hit=False, version=version, entry=None)
+
+    entry_payload = payload.get("entry")
+    entry = InlineAuctionEntry(**entry_payload) if entry_payload is not None else None
+    return InlineAuctionLookup(hit=True, version=version, entry=entry)
+
+
+async def store_inline_auction_entry(
+    auction_id: uuid.UUID,
+    entry: InlineAuctionEntry | None,
+    *,
+    version: str | None,
+) -> None:
+    payload = {"version": version, "entry": asdict(entry) if entry is not None else None}
+    await redis_client.set(
+        _entry_key(auction_id),
+        json.dumps(payload, ensure_ascii=False),
+        ex=max(settings.inline_query_cache_ttl_seconds, 1),
+    )
+
+
+async def bump_inline_auction_version(auction_id: uuid.UUID) -> None:
+    """Invalidates cached inline answers after a bid, status change or moderation action.
+
+    Versions are random tokens rather than a counter: the version key expires, and a
+    counter restarting at zero could match an entry stored under an old version again.
+    """
+
+    if not inline_query_cache_enabled():
+        return
+    await redis_client.set(
+        _version_key(auction_id),
+        uuid.uuid4().hex,
+        ex=max(settings.inline_query_cache_ttl_seconds, 1) * 2,
+    )
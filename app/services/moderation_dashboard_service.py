@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.enums import AuctionStatus, PointsEventType
 from app.db.models import Auction, Bid, BlacklistEntry, Complaint, FraudSignal, PointsLedgerEntry, User
+from app.db.session import read_only
 
 
 @dataclass(slots=True)
@@ -42,6 +43,7 @@ class ModerationDashboardSnapshot:
     appeal_boost_redeems_24h: int
 
 
+@read_only
 async def get_moderation_dashboard_snapshot(session: AsyncSession) -> ModerationDashboardSnapshot:
     now = datetime.now(UTC)
     one_hour = now - timedelta(hours=1)
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.db.enums import AuctionStatus, ModerationAction, UserRole
-from app.db.models import Auction, Bid, BlacklistEntry, ModerationLog, User, UserRoleAssignment
+from app.db.models import (
+    Auction,
+    Bid,
+    BlacklistEntry,
+    ModerationLog,
+    ModerationLogArchive,
+    User,
+    UserRoleAssignment,
+)
+from app.db.session import read_only
+from app.services.auction_aggregates_service import recompute_auction_bid_aggregates
 from app.services.rbac_service import (
     resolve_allowlist_role,
     resolve_tg_user_scopes,
@@ -26,6 +37,14 @@ class ModerationResult:
     target_tg_user_id: int | None = None
 
 
+@dataclass(slots=True)
+class ModerationLogEntry:
+    target_user_id: int | None = None
+    auction_id: uuid.UUID | None = None
+    bid_id: uuid.UUID | None = None
+    payload: dict | None = None
+
+
 @dataclass(slots=True)
 class BidListItem:
     bid_id: uuid.UUID
@@ -200,15 +219,6 @@ async def _get_auction_for_update(session: AsyncSession, auction_id: uuid.UUID)
     return await session.scalar(stmt)
 
 
-async def _top_bid(session: AsyncSession, auction_id: uuid.UUID) -> Bid | None:
-    return await session.scalar(
-        select(Bid)
-        .where(Bid.auction_id == auction_id, Bid.is_removed.is_(False))
-        .order_by(Bid.amount.desc(), Bid.created_at.asc())
-        .limit(1)
-    )
-
-
 async def log_moderation_action(
     session: AsyncSession,
     *,
@@ -233,6 +243,35 @@ async def log_moderation_action(
     )
 
 
+async def log_moderation_actions(
+    session: AsyncSession,
+    *,
+    actor_user_id: int,
+    action: ModerationAction,
+    reason: str,
+    entries: Sequence[ModerationLogEntry],
+) -> None:
+    """Writes one moderation log row per entry in a single multi-row insert."""
+
+    if not entries:
+        return
+    await session.execute(
+        insert(ModerationLog),
+        [
+            {
+                "actor_user_id": actor_user_id,
+                "target_user_id": entry.target_user_id,
+                "auction_id": entry.auction_id,
+                "bid_id": entry.bid_id,
+                "action": action,
+                "reason": reason,
+                "payload": entry.payload,
+            }
+            for entry in entries
+        ],
+    )
+
+
 async def _log_action(
     session: AsyncSession,
     *,
@@ -336,13 +375,10 @@ async def end_auction(
     if auction.status not in {AuctionStatus.ACTIVE, AuctionStatus.FROZEN}:
         return ModerationResult(False, "Завершить можно только активный/замороженный аукцион")
 
-    top_bid = await _top_bid(session, auction.id)
     winner_user: User | None = None
-    if top_bid is not None:
-        auction.winner_user_id = top_bid.user_id
-        winner_user = await session.scalar(select(User).where(User.id == top_bid.user_id))
-    else:
-        auction.winner_user_id = None
+    auction.winner_user_id = auction.top_bidder_user_id
+    if auction.top_bidder_user_id is not None:
+        winner_user = await session.scalar(select(User).where(User.id == auction.top_bidder_user_id))
 
     now = datetime.now(UTC)
     auction.status = AuctionStatus.ENDED
@@ -389,15 +425,13 @@ async def remove_bid(
     if auction is None:
         return ModerationResult(False, "Аукцион по ставке не найден")
 
-    top_bid = await _top_bid(session, auction.id)
+    await recompute_auction_bid_aggregates(session, auction)
     winner_user: User | None = None
 
     if auction.status in {AuctionStatus.ENDED, AuctionStatus.BOUGHT_OUT}:
-        if top_bid is None:
-            auction.winner_user_id = None
-        else:
-            auction.winner_user_id = top_bid.user_id
-            winner_user = await session.scalar(select(User).where(User.id == top_bid.user_id))
+        auction.winner_user_id = auction.top_bidder_user_id
+        if auction.top_bidder_user_id is not None:
+            winner_user = await session.scalar(select(User).where(User.id == auction.top_bidder_user_id))
 
     auction.updated_at = datetime.now(UTC)
 
@@ -521,13 +555,20 @@ async def list_recent_bids(session: AsyncSession, auction_id: uuid.UUID, limit:
     ]
 
 
+@read_only
 async def list_moderation_logs(
     session: AsyncSession,
     *,
     auction_id: uuid.UUID | None,
     limit: int = 15,
-) -> list[ModerationLog]:
-    stmt = select(ModerationLog).order_by(ModerationLog.created_at.desc()).limit(limit)
-    if auction_id is not None:
-        stmt = stmt.where(ModerationLog.auction_id == auction_id)
-    return list((await session.execute(stmt)).scalars().all())
+) -> list[ModerationLog | ModerationLogArchive]:
+    """Newest moderation logs, including ones the retention job moved to the archive."""
+
+    logs: list[ModerationLog | ModerationLogArchive] = []
+    for model in (ModerationLog, ModerationLogArchive):
+        stmt = select(model).order_by(model.created_at.desc()).limit(limit)
+        if auction_id is not None:
+            stmt = stmt.where(model.auction_id == auction_id)
+        logs.extend((await session.execute(stmt)).scalars().all())
+    logs.sort(key=lambda log: (log.created_at, log.id), reverse=True)
+    return logs[:limit]
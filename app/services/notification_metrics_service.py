@@ -6,11 +6,20 @@ import logging
 import re
 from enum import StrEnum
 
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+
+from app.infra.metrics_buffer import metrics_buffer
 from app.infra.redis_client import redis_client
 from app.services.notification_policy_service import NotificationEventType
 
 logger = logging.getLogger(__name__)
-_METRIC_SCAN_MATCH = "notif:metrics:*"
+# Counters live in hashes (field ``{kind}:{event}:{reason}``): one all-time hash plus
+# one hash per UTC hour, so a window read is a fixed number of HGETALLs.
+_METRIC_TOTALS_KEY = "notif:metrics:totals"
+_METRIC_HOURLY_KEY_PREFIX = "notif:metrics:hourly:"
+_SNAPSHOT_WINDOW_HOURS = 24 * 7
+_LEGACY_METRIC_SCAN_MATCH = "notif:metrics:*"
 _METRIC_HOURLY_RETENTION_HOURS = 10 * 24
 _METRIC_HOURLY_RETENTION_SECONDS = _METRIC_HOURLY_RETENTION_HOURS * 3600
 _SUPPRESSED_DELTA_WARNING_THRESHOLD = 30
@@ -91,25 +100,33 @@ def _normalize_reason(reason: str) -> str:
     return normalized.strip("_") or "unknown"
 
 
-def _metric_key(*, kind: NotificationMetricKind, event_type: NotificationEventType, reason: str) -> str:
-    return f"notif:metrics:{kind.value}:{event_type.value}:{reason}"
+def _metric_field(*, kind: NotificationMetricKind, event_type: NotificationEventType, reason: str) -> str:
+    return f"{kind.value}:{event_type.value}:{reason}"
 
 
 def _hour_bucket(now_utc: datetime) -> str:
     return now_utc.strftime("%Y%m%d%H")
 
 
-def _hourly_metric_key(
-    *,
-    hour_bucket: str,
-    kind: NotificationMetricKind,
-    event_type: NotificationEventType,
-    reason: str,
-) -> str:
-    return f"notif:metrics:h:{hour_bucket}:{kind.value}:{event_type.value}:{reason}"
+def _hourly_metric_key(hour_bucket: str) -> str:
+    return f"{_METRIC_HOURLY_KEY_PREFIX}{hour_bucket}"
+
+
+def _parse_metric_field(field: str) -> tuple[NotificationMetricKind, NotificationEventType, str] | None:
+    parts = field.split(":", 2)
+    if len(parts) != 3:
+        return None
+
+    try:
+        kind = NotificationMetricKind(parts[0])
+        event_type = NotificationEventType(parts[1])
+    except ValueError:
+        return None
 
+    return kind, event_type, _normalize_reason(parts[2])
 
-def _parse_metric_key(key: str) -> tuple[NotificationMetricKind, NotificationEventType, str] | None:
+
+def _parse_legacy_metric_key(key: str) -> tuple[NotificationMetricKind, NotificationEventType, str] | None:
     parts = key.split(":", 4)
     if len(parts) != 5:
         return None
@@ -126,7 +143,7 @@ def _parse_metric_key(key: str) -> tuple[NotificationMetricKind, NotificationEve
     return kind, event_type, reason
 
 
-def _parse_hourly_metric_key(key: str) -> tuple[str, NotificationMetricKind, NotificationEventType, str] | None:
+def _parse_legacy_hourly_metric_key(key: str) -> tuple[str, NotificationMetricKind, NotificationEventType, str] | None:
     parts = key.split(":", 6)
     if len(parts) != 7:
         return None
@@ -324,10 +341,28 @@ async def _record_metric(
 ) -> int | None:
     safe_count = max(int(count), 1)
     normalized_reason = _normalize_reason(reason)
-    key = _metric_key(kind=kind, event_type=event_type, reason=normalized_reason)
+    field = _metric_field(kind=kind, event_type=event_type, reason=normalized_reason)
+    hourly_key = _hourly_metric_key(_hour_bucket(datetime.now(timezone.utc)))
+
+    if metrics_buffer.is_running:
+        metrics_buffer.incr(_METRIC_TOTALS_KEY, safe_count, field=field)
+        metrics_buffer.incr(
+            hourly_key,
+            safe_count,
+            field=field,
+            expire_seconds=_METRIC_HOURLY_RETENTION_SECONDS,
+        )
+        logger.info(
+            "notification_metric kind=%s event=%s reason=%s count=%s total=buffered",
+            kind.value,
+            event_type.value,
+            normalized_reason,
+            safe_count,
+        )
+        return None
 
     try:
-        total = await redis_client.incrby(key, safe_count)
+        total = await redis_client.hincrby(_METRIC_TOTALS_KEY, field, safe_count)
     except Exception as exc:  # noqa: BLE001
         logger.warning(
             "notification_metric_failed kind=%s event=%s reason=%s count=%s error=%s",
@@ -348,15 +383,8 @@ async def _record_metric(
         total,
     )
 
-    hour_bucket = _hour_bucket(datetime.now(timezone.utc))
-    hourly_key = _hourly_metric_key(
-        hour_bucket=hour_bucket,
-        kind=kind,
-        event_type=event_type,
-        reason=normalized_reason,
-    )
     try:
-        await redis_client.incrby(hourly_key, safe_count)
+        await redis_client.hincrby(hourly_key, field, safe_count)
         await redis_client.expire(hourly_key, _METRIC_HOURLY_RETENTION_SECONDS)
     except Exception as exc:  # noqa: BLE001
         logger.warning(
@@ -409,140 +437,88 @@ async def record_notification_aggregated(
     )
 
 
-async def _load_all_time_totals_and_top(
+def _aggregate_metric_hashes(
+    hashes: list[dict[str, str]],
     *,
     top_limit: int,
     event_type_filter: NotificationEventType | None,
     reason_filter: str | None,
-) -> tuple[dict[NotificationMetricKind, int], tuple[NotificationMetricBucket, ...]]:
-    cursor = 0
+) -> tuple[dict[NotificationMetricKind, int], tuple[NotificationMetricBucket, ...], int]:
     totals = _empty_totals_map()
     suppressed_groups: dict[tuple[NotificationEventType, str], int] = {}
+    forbidden_bad_request_suppressed_total = 0
 
-    try:
-        while True:
-            next_cursor, keys = await redis_client.scan(
-                cursor=cursor,
-                match=_METRIC_SCAN_MATCH,
-                count=200,
-            )
-            cursor = int(next_cursor)
-            if keys:
-                raw_values = await redis_client.mget(keys)
-                for key, raw_value in zip(keys, raw_values, strict=False):
-                    parsed = _parse_metric_key(str(key))
-                    if parsed is None or raw_value is None:
-                        continue
-
-                    try:
-                        value = max(int(raw_value), 0)
-                    except (TypeError, ValueError):
-                        continue
-
-                    kind, event_type, reason = parsed
-                    if not _matches_metric_filters(
-                        event_type=event_type,
-                        reason=reason,
-                        event_type_filter=event_type_filter,
-                        reason_filter=reason_filter,
-                    ):
-                        continue
-
-                    totals[kind] += value
-                    if kind == NotificationMetricKind.SUPPRESSED:
-                        group_key = (event_type, reason)
-                        suppressed_groups[group_key] = suppressed_groups.get(group_key, 0) + value
-
-            if cursor == 0:
-                break
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("notification_metrics_snapshot_failed error=%s", exc)
+    for fields in hashes:
+        for field, raw_value in fields.items():
+            parsed = _parse_metric_field(str(field))
+            if parsed is None or raw_value is None:
+                continue
+            kind, event_type, reason = parsed
+            if not _matches_metric_filters(
+                event_type=event_type,
+                reason=reason,
+                event_type_filter=event_type_filter,
+                reason_filter=reason_filter,
+            ):
+                continue
+
+            try:
+                value = max(int(raw_value), 0)
+            except (TypeError, ValueError):
+                continue
+
+            totals[kind] += value
+            if kind == NotificationMetricKind.SUPPRESSED:
+                group_key = (event_type, reason)
+                suppressed_groups[group_key] = suppressed_groups.get(group_key, 0) + value
+                if reason in {"forbidden", "bad_request"}:
+                    forbidden_bad_request_suppressed_total += value
 
-    top_suppressed = _top_suppressed_from_groups(
-        suppressed_groups=suppressed_groups,
-        top_limit=top_limit,
+    return (
+        totals,
+        _top_suppressed_from_groups(suppressed_groups=suppressed_groups, top_limit=top_limit),
+        forbidden_bad_request_suppressed_total,
     )
 
-    return totals, top_suppressed
+
+async def _load_metric_hashes(
+    *,
+    now_utc: datetime,
+) -> tuple[dict[str, str], dict[str, dict[str, str]]]:
+    hour_buckets = _window_hour_buckets(
+        now_utc=now_utc,
+        start_offset_hours=0,
+        duration_hours=_SNAPSHOT_WINDOW_HOURS,
+    )
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hgetall(_METRIC_TOTALS_KEY)
+        for hour_bucket in hour_buckets:
+            pipe.hgetall(_hourly_metric_key(hour_bucket))
+        results = await pipe.execute()
+
+    totals_hash = results[0] or {}
+    hourly_hashes = {
+        hour_bucket: fields or {}
+        for hour_bucket, fields in zip(hour_buckets, results[1:], strict=True)
+    }
+    return totals_hash, hourly_hashes
 
 
-async def _load_recent_window_totals(
+def _window_hashes(
+    hourly_hashes: dict[str, dict[str, str]],
     *,
     now_utc: datetime,
     start_offset_hours: int,
     duration_hours: int,
-    top_limit: int,
-    event_type_filter: NotificationEventType | None,
-    reason_filter: str | None,
-) -> tuple[dict[NotificationMetricKind, int], tuple[NotificationMetricBucket, ...], int]:
-    buckets = set(
-        _window_hour_buckets(
+) -> list[dict[str, str]]:
+    return [
+        hourly_hashes.get(hour_bucket, {})
+        for hour_bucket in _window_hour_buckets(
             now_utc=now_utc,
             start_offset_hours=start_offset_hours,
             duration_hours=duration_hours,
         )
-    )
-    totals = _empty_totals_map()
-    suppressed_groups: dict[tuple[NotificationEventType, str], int] = {}
-    forbidden_bad_request_suppressed_total = 0
-
-    try:
-        for hour_bucket in buckets:
-            cursor = 0
-            match_pattern = f"notif:metrics:h:{hour_bucket}:*"
-            while True:
-                next_cursor, keys = await redis_client.scan(
-                    cursor=int(cursor),
-                    match=match_pattern,
-                    count=200,
-                )
-                cursor = int(next_cursor)
-                if keys:
-                    raw_values = await redis_client.mget(keys)
-                    for key, raw_value in zip(keys, raw_values, strict=False):
-                        parsed = _parse_hourly_metric_key(str(key))
-                        if parsed is None or raw_value is None:
-                            continue
-                        parsed_hour_bucket, kind, _event_type, _reason = parsed
-                        event_type = _event_type
-                        reason = _reason
-                        if parsed_hour_bucket not in buckets:
-                            continue
-                        if not _matches_metric_filters(
-                            event_type=event_type,
-                            reason=reason,
-                            event_type_filter=event_type_filter,
-                            reason_filter=reason_filter,
-                        ):
-                            continue
-
-                        try:
-                            value = max(int(raw_value), 0)
-                        except (TypeError, ValueError):
-                            continue
-
-                        totals[kind] += value
-                        if kind == NotificationMetricKind.SUPPRESSED:
-                            group_key = (event_type, reason)
-                            suppressed_groups[group_key] = suppressed_groups.get(group_key, 0) + value
-                            if reason in {"forbidden", "bad_request"}:
-                                forbidden_bad_request_suppressed_total += value
-
-                if cursor == 0:
-                    break
-    except Exception as exc:  # noqa: BLE001
-        logger.warning(
-            "notification_metrics_window_snapshot_failed start_offset_hours=%s duration_hours=%s error=%s",
-            start_offset_hours,
-            duration_hours,
-            exc,
-        )
-
-    return (
-        totals,
-        _top_suppressed_from_groups(suppressed_groups=suppressed_groups, top_limit=top_limit),
-        forbidden_bad_request_suppressed_total,
-    )
+    ]
 
 
 async def load_notification_metrics_snapshot(
@@ -562,34 +538,34 @@ async def load_notification_metrics_snapshot(
         if normalized and normalized != "unknown":
             normalized_reason_filter = normalized
 
-    all_time_totals_map, top_suppressed = await _load_all_time_totals_and_top(
-        top_limit=top_limit,
-        event_type_filter=event_type_filter,
-        reason_filter=normalized_reason_filter,
-    )
-    last_24h_totals_map = await _load_recent_window_totals(
-        now_utc=effective_now_utc,
-        start_offset_hours=0,
-        duration_hours=24,
-        top_limit=top_limit,
-        event_type_filter=event_type_filter,
-        reason_filter=normalized_reason_filter,
+    try:
+        totals_hash, hourly_hashes = await _load_metric_hashes(now_utc=effective_now_utc)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("notification_metrics_snapshot_failed error=%s", exc)
+        totals_hash, hourly_hashes = {}, {}
+
+    def _aggregate(hashes: list[dict[str, str]]):
+        return _aggregate_metric_hashes(
+            hashes,
+            top_limit=top_limit,
+            event_type_filter=event_type_filter,
+            reason_filter=normalized_reason_filter,
+        )
+
+    all_time_totals_map, top_suppressed, _ = _aggregate([totals_hash])
+    last_24h_totals_map = _aggregate(
+        _window_hashes(hourly_hashes, now_utc=effective_now_utc, start_offset_hours=0, duration_hours=24)
     )
-    previous_24h_totals_map = await _load_recent_window_totals(
-        now_utc=effective_now_utc,
-        start_offset_hours=24,
-        duration_hours=24,
-        top_limit=top_limit,
-        event_type_filter=event_type_filter,
-        reason_filter=normalized_reason_filter,
+    previous_24h_totals_map = _aggregate(
+        _window_hashes(hourly_hashes, now_utc=effective_now_utc, start_offset_hours=24, duration_hours=24)
     )
-    last_7d_totals_map = await _load_recent_window_totals(
-        now_utc=effective_now_utc,
-        start_offset_hours=0,
-        duration_hours=24 * 7,
-        top_limit=top_limit,
-        event_type_filter=event_type_filter,
-        reason_filter=normalized_reason_filter,
+    last_7d_totals_map = _aggregate(
+        _window_hashes(
+            hourly_hashes,
+            now_utc=effective_now_utc,
+            start_offset_hours=0,
+            duration_hours=_SNAPSHOT_WINDOW_HOURS,
+        )
     )
 
     (
@@ -623,3 +599,95 @@ async def load_notification_metrics_snapshot(
             forbidden_bad_request_suppressed_24h_total=forbidden_bad_request_suppressed_24h_total,
         ),
     )
+
+
+def _legacy_hourly_ttl_seconds(hour_bucket: str, *, now_utc: datetime) -> int:
+    bucket_start = datetime.strptime(hour_bucket, "%Y%m%d%H").replace(tzinfo=timezone.utc)
+    expires_at = bucket_start + timedelta(hours=1, seconds=_METRIC_HOURLY_RETENTION_SECONDS)
+    return int((expires_at - now_utc).total_seconds())
+
+
+def _queue_legacy_metric_moves(
+    pipe: Pipeline,
+    legacy_keys: list[str],
+    raw_values: list[str | None],
+    *,
+    now_utc: datetime,
+) -> None:
+    for key, raw_value in zip(legacy_keys, raw_values, strict=True):
+        pipe.delete(key)
+        try:
+            value = int(raw_value or 0)
+        except (TypeError, ValueError):
+            continue
+        if value <= 0:
+            continue
+
+        hourly = _parse_legacy_hourly_metric_key(key)
+        if hourly is not None:
+            hour_bucket, kind, event_type, reason = hourly
+            ttl_seconds = _legacy_hourly_ttl_seconds(hour_bucket, now_utc=now_utc)
+            if ttl_seconds <= 0:
+                continue
+            target_key = _hourly_metric_key(hour_bucket)
+            field = _metric_field(kind=kind, event_type=event_type, reason=reason)
+            pipe.hincrby(target_key, field, value)
+            pipe.expire(target_key, ttl_seconds)
+            continue
+
+        parsed = _parse_legacy_metric_key(key)
+        if parsed is None:
+            continue
+        kind, event_type, reason = parsed
+        field = _metric_field(kind=kind, event_type=event_type, reason=reason)
+        pipe.hincrby(_METRIC_TOTALS_KEY, field, value)
+
+
+async def migrate_legacy_notification_metric_keys(
+    *,
+    dry_run: bool = False,
+    batch_size: int = 500,
+    now_utc: datetime | None = None,
+) -> int:
+    """Folds pre-hash ``notif:metrics:*`` string counters into the hash layout.
+
+    Each SCAN batch is moved in one MULTI/EXEC (HINCRBY into the hashes, DEL of the
+    legacy keys), so an interrupted run can simply be restarted. The batch keys are
+    WATCHed before they are read: if an older bot still increments one of them, EXEC
+    aborts and the batch is read again instead of losing that increment. Returns the
+    number of legacy keys found.
+    """
+
+    effective_now_utc = now_utc or datetime.now(timezone.utc)
+    cursor = 0
+    migrated = 0
+    while True:
+        next_cursor, keys = await redis_client.scan(
+            cursor=cursor,
+            match=_LEGACY_METRIC_SCAN_MATCH,
+            count=max(batch_size, 1),
+        )
+        cursor = int(next_cursor)
+        legacy_keys = [
+            str(key)
+            for key in keys
+            if _parse_legacy_hourly_metric_key(str(key)) is not None
+            or _parse_legacy_metric_key(str(key)) is not None
+        ]
+        if legacy_keys:
+            migrated += len(legacy_keys)
+            if not dry_run:
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    while True:
+                        try:
+                            await pipe.watch(*legacy_keys)
+                            raw_values = await pipe.mget(legacy_keys)
+                            pipe.multi()
+                            _queue_legacy_metric_moves(pipe, legacy_keys, raw_values, now_utc=effective_now_utc)
+                            await pipe.execute()
+                            break
+                        except WatchError:
+                            continue
+        if cursor == 0:
+            break
+    return migrated
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from enum import StrEnum
 
-from sqlalchemy import select
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,14 +19,156 @@ from app.config import settings
 from app.db.enums import FeedbackStatus, IntegrationOutboxStatus, ModerationAction
 from app.db.models import FeedbackItem, IntegrationOutbox, User
 from app.db.session import SessionFactory
+from app.infra.metrics import OUTBOX_EVENT_LAG_SECONDS
 from app.services.github_automation_service import (
     FeedbackIssueClient,
+    FeedbackIssueDraft,
     GitHubApiIssueClient,
+    GitHubIssueRef,
+    GitHubRateLimitError,
     build_feedback_issue_draft,
 )
-from app.services.moderation_service import log_moderation_action
+from app.services.moderation_service import ModerationLogEntry, log_moderation_actions
+
+logger = logging.getLogger(__name__)
 
 OUTBOX_EVENT_FEEDBACK_APPROVED = "feedback.approved"
+OUTBOX_NOTIFY_CHANNEL = "integration_outbox"
+
+
+class OutboxLane(StrEnum):
+    REALTIME = "realtime"
+    DEFAULT = "default"
+    BACKGROUND = "background"
+
+
+_LANE_PRIORITY = {
+    OutboxLane.REALTIME: 0,
+    OutboxLane.DEFAULT: 50,
+    OutboxLane.BACKGROUND: 100,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class OutboxRetryPolicy:
+    max_attempts: int
+    base_seconds: int
+    max_seconds: int
+
+    @classmethod
+    def from_settings(cls) -> OutboxRetryPolicy:
+        return cls(
+            max_attempts=settings.outbox_max_attempts,
+            base_seconds=settings.outbox_retry_base_seconds,
+            max_seconds=settings.outbox_retry_max_seconds,
+        )
+
+    def backoff_seconds(self, attempt_number: int) -> int:
+        base = max(self.base_seconds, 1)
+        cap = max(self.max_seconds, base)
+        power = max(attempt_number - 1, 0)
+        return min(base * (2**power), cap)
+
+
+@dataclass(slots=True, frozen=True)
+class ClaimedOutboxEvent:
+    id: int
+    event_type: str
+    payload: dict
+    dedupe_key: str
+    attempts: int
+    created_at: datetime
+
+
+@dataclass(slots=True)
+class OutboxJob:
+    event: ClaimedOutboxEvent
+    error: Exception | None = None
+    retry_after_seconds: float | None = None
+
+    def fail(self, error: Exception) -> None:
+        self.error = error
+        if isinstance(error, TelegramRetryAfter):
+            self.retry_after_seconds = float(error.retry_after)
+        elif isinstance(error, GitHubRateLimitError):
+            self.retry_after_seconds = error.retry_after_seconds
+
+
+@dataclass(slots=True, frozen=True)
+class OutboxDeliveryContext:
+    bot: Bot | None
+    issue_client: FeedbackIssueClient | None
+    semaphore: asyncio.Semaphore
+
+
+OutboxBatchHandler = Callable[[list[OutboxJob], OutboxDeliveryContext], Awaitable[None]]
+OutboxEventHandler = Callable[[OutboxJob, OutboxDeliveryContext], Awaitable[None]]
+
+
+def _always_enabled(_bot: Bot | None) -> bool:
+    return True
+
+
+@dataclass(slots=True, frozen=True)
+class OutboxHandler:
+    """Delivers one event type; registered with ``register_outbox_handler``.
+
+    ``handle_batch`` receives every claimed event of its type at once and reports
+    failures through ``OutboxJob.fail``. ``concurrency`` bounds the semaphore handed
+    in the context (``None`` = ``outbox_concurrency``); ``retry_policy`` ``None``
+    falls back to the ``outbox_*`` retry settings.
+    """
+
+    event_type: str
+    handle_batch: OutboxBatchHandler
+    lane: OutboxLane = OutboxLane.DEFAULT
+    concurrency: int | None = None
+    retry_policy: OutboxRetryPolicy | None = None
+    is_enabled: Callable[[Bot | None], bool] = field(default=_always_enabled)
+
+    def resolved_retry_policy(self) -> OutboxRetryPolicy:
+        return self.retry_policy or OutboxRetryPolicy.from_settings()
+
+    def resolved_concurrency(self) -> int:
+        return max(self.concurrency if self.concurrency is not None else settings.outbox_concurrency, 1)
+
+
+_HANDLERS: dict[str, OutboxHandler] = {}
+# Monotonic deadlines; a lane whose upstream answered with a rate limit is not claimed until then.
+_LANE_PAUSED_UNTIL: dict[OutboxLane, float] = {}
+
+
+def register_outbox_handler(handler: OutboxHandler) -> None:
+    _HANDLERS[handler.event_type] = handler
+
+
+def get_outbox_handler(event_type: str) -> OutboxHandler | None:
+    return _HANDLERS.get(event_type)
+
+
+def pause_outbox_lane(lane: OutboxLane, *, seconds: float) -> None:
+    paused_until = time.monotonic() + max(seconds, 0.0)
+    _LANE_PAUSED_UNTIL[lane] = max(_LANE_PAUSED_UNTIL.get(lane, 0.0), paused_until)
+
+
+def outbox_lane_paused_for(lane: OutboxLane) -> float:
+    return max(_LANE_PAUSED_UNTIL.get(lane, 0.0) - time.monotonic(), 0.0)
+
+
+def deliver_each(handle_event: OutboxEventHandler) -> OutboxBatchHandler:
+    """Adapts a per-event handler; events run concurrently under the context semaphore."""
+
+    async def _handle_batch(jobs: list[OutboxJob], context: OutboxDeliveryContext) -> None:
+        async def _run(job: OutboxJob) -> None:
+            async with context.semaphore:
+                try:
+                    await handle_event(job, context)
+                except Exception as exc:
+                    job.fail(exc)
+
+        await asyncio.gather(*(_run(job) for job in jobs))
+
+    return _handle_batch
 
 
 def feedback_issue_dedupe_key(feedback_id: int) -> str:
@@ -31,7 +181,13 @@ async def enqueue_outbox_event(
     event_type: str,
     payload: dict,
     dedupe_key: str,
+    lane: OutboxLane | None = None,
 ) -> bool:
+    """Inserts an event unless ``dedupe_key`` was already enqueued; returns whether it was inserted."""
+
+    if lane is None:
+        handler = get_outbox_handler(event_type)
+        lane = handler.lane if handler is not None else OutboxLane.DEFAULT
     now = datetime.now(UTC)
     stmt = (
         insert(IntegrationOutbox)
@@ -39,6 +195,7 @@ async def enqueue_outbox_event(
             event_type=event_type,
             payload=payload,
             dedupe_key=dedupe_key,
+            priority=_LANE_PRIORITY[lane],
             attempts=0,
             next_retry_at=now,
             status=IntegrationOutboxStatus.PENDING,
@@ -49,7 +206,24 @@ async def enqueue_outbox_event(
         .returning(IntegrationOutbox.id)
     )
     inserted_id = await session.scalar(stmt)
-    return inserted_id is not None
+    if inserted_id is None:
+        return False
+    # Delivered on commit; wakes outbox workers blocked in LISTEN instead of waiting for the next poll.
+    await session.execute(select(func.pg_notify(OUTBOX_NOTIFY_CHANNEL, event_type)))
+    return True
+
+
+async def dispatch_outbox_event(*, event_type: str, payload: dict, dedupe_key: str) -> bool:
+    """Enqueues an event in its own transaction, for callers that hold no session."""
+
+    async with SessionFactory() as session:
+        async with session.begin():
+            return await enqueue_outbox_event(
+                session,
+                event_type=event_type,
+                payload=payload,
+                dedupe_key=dedupe_key,
+            )
 
 
 async def enqueue_feedback_issue_event(session: AsyncSession, *, feedback_id: int) -> bool:
@@ -80,142 +254,381 @@ async def _resolve_feedback_issue_actor_user_id(session: AsyncSession) -> int:
         return existing_actor.id
 
 
-def _backoff_seconds(attempt_number: int) -> int:
-    base = max(settings.outbox_retry_base_seconds, 1)
-    cap = max(settings.outbox_retry_max_seconds, base)
-    power = max(attempt_number - 1, 0)
-    return min(base * (2**power), cap)
+@dataclass(slots=True)
+class _FeedbackIssueJob:
+    job: OutboxJob
+    feedback_id: int | None = None
+    submitter_user_id: int | None = None
+    feedback_type: str | None = None
+    draft: FeedbackIssueDraft | None = None
+    issue_ref: GitHubIssueRef | None = None
 
 
-def _mark_outbox_done(event: IntegrationOutbox, *, now: datetime) -> None:
-    event.attempts += 1
-    event.status = IntegrationOutboxStatus.DONE
-    event.next_retry_at = now
-    event.last_error = None
-    event.updated_at = now
+async def _prepare_feedback_issue_jobs(session: AsyncSession, jobs: list[_FeedbackIssueJob]) -> None:
+    for job in jobs:
+        raw_feedback_id = job.job.event.payload.get("feedback_id")
+        if not isinstance(raw_feedback_id, int):
+            job.job.fail(RuntimeError("Outbox payload has no valid feedback_id"))
+            continue
+        job.feedback_id = raw_feedback_id
 
+    feedback_ids = {job.feedback_id for job in jobs if job.job.error is None and job.feedback_id is not None}
+    if not feedback_ids:
+        return
+    items = {
+        item.id: item
+        for item in (await session.execute(select(FeedbackItem).where(FeedbackItem.id.in_(feedback_ids)))).scalars()
+    }
+    user_ids = {item.submitter_user_id for item in items.values()}
+    user_ids.update(item.moderator_user_id for item in items.values() if item.moderator_user_id is not None)
+    users = {user.id: user for user in (await session.execute(select(User).where(User.id.in_(user_ids)))).scalars()}
+
+    for job in jobs:
+        if job.job.error is not None:
+            continue
+        item = items.get(job.feedback_id)
+        if item is None:
+            job.job.fail(RuntimeError(f"Feedback item #{job.feedback_id} not found"))
+            continue
+        if FeedbackStatus(item.status) != FeedbackStatus.APPROVED or item.github_issue_url:
+            continue
+        job.submitter_user_id = item.submitter_user_id
+        job.feedback_type = str(item.type)
+        job.draft = build_feedback_issue_draft(
+            item=item,
+            submitter=users.get(item.submitter_user_id),
+            moderator=users.get(item.moderator_user_id) if item.moderator_user_id is not None else None,
+        )
 
-def _mark_outbox_retry_or_fail(event: IntegrationOutbox, *, now: datetime, error: Exception) -> None:
-    max_attempts = max(settings.outbox_max_attempts, 1)
-    event.attempts += 1
-    event.last_error = str(error)[:1000]
-    event.updated_at = now
 
-    if event.attempts >= max_attempts:
-        event.status = IntegrationOutboxStatus.FAILED
-        event.next_retry_at = now
+async def _record_feedback_issue_results(session: AsyncSession, jobs: list[_FeedbackIssueJob], *, now: datetime) -> None:
+    created = [job for job in jobs if job.issue_ref is not None and job.job.error is None]
+    if not created:
         return
 
-    event.status = IntegrationOutboxStatus.PENDING
-    event.next_retry_at = now + timedelta(seconds=_backoff_seconds(event.attempts))
+    await session.execute(
+        update(FeedbackItem.__table__)
+        .where(
+            FeedbackItem.__table__.c.id == bindparam("b_feedback_id"),
+            FeedbackItem.__table__.c.github_issue_url.is_(None),
+        )
+        .values(github_issue_url=bindparam("b_issue_url"), updated_at=now),
+        [{"b_feedback_id": job.feedback_id, "b_issue_url": job.issue_ref.url} for job in created],
+    )
+    actor_user_id = await _resolve_feedback_issue_actor_user_id(session)
+    await log_moderation_actions(
+        session,
+        actor_user_id=actor_user_id,
+        action=ModerationAction.CREATE_FEEDBACK_GITHUB_ISSUE,
+        reason="Создан GitHub issue по одобренному фидбеку",
+        entries=[
+            ModerationLogEntry(
+                target_user_id=job.submitter_user_id,
+                payload={
+                    "feedback_id": job.feedback_id,
+                    "feedback_type": job.feedback_type,
+                    "github_issue_number": job.issue_ref.number,
+                    "github_issue_url": job.issue_ref.url,
+                    "outbox_event_id": job.job.event.id,
+                    "outbox_dedupe_key": job.job.event.dedupe_key,
+                },
+            )
+            for job in created
+        ],
+    )
+
 
+async def _handle_feedback_approved_batch(jobs: list[OutboxJob], context: OutboxDeliveryContext) -> None:
+    feedback_jobs = [_FeedbackIssueJob(job=job) for job in jobs]
+    async with SessionFactory() as session:
+        await _prepare_feedback_issue_jobs(session, feedback_jobs)
 
-async def _handle_feedback_approved_event(
-    session: AsyncSession,
-    *,
-    event: IntegrationOutbox,
-    issue_client: FeedbackIssueClient,
-) -> None:
-    payload = event.payload if isinstance(event.payload, dict) else {}
-    raw_feedback_id = payload.get("feedback_id")
-    if not isinstance(raw_feedback_id, int):
-        raise RuntimeError("Outbox payload has no valid feedback_id")
+    owned_client = None
+    issue_client = context.issue_client
+    if issue_client is None:
+        owned_client = issue_client = GitHubApiIssueClient.from_settings()
 
-    item = await session.scalar(
-        select(FeedbackItem).where(FeedbackItem.id == raw_feedback_id).with_for_update()
-    )
-    if item is None:
-        raise RuntimeError(f"Feedback item #{raw_feedback_id} not found")
+    async def _create_issue(job: _FeedbackIssueJob) -> None:
+        assert job.draft is not None
+        async with context.semaphore:
+            try:
+                # A failed attempt may still have created the issue (e.g. a timeout after
+                # GitHub accepted the request); look it up before creating a duplicate.
+                if job.job.event.attempts > 0 and isinstance(issue_client, FeedbackIssueClient):
+                    job.issue_ref = await issue_client.find_issue(title=job.draft.title, labels=job.draft.labels)
+                if job.issue_ref is None:
+                    job.issue_ref = await issue_client.create_issue(
+                        title=job.draft.title,
+                        body=job.draft.body,
+                        labels=job.draft.labels,
+                    )
+            except Exception as exc:
+                job.job.fail(exc)
 
-    if FeedbackStatus(item.status) != FeedbackStatus.APPROVED:
-        return
+    try:
+        await asyncio.gather(
+            *(_create_issue(job) for job in feedback_jobs if job.job.error is None and job.draft is not None)
+        )
+    finally:
+        if owned_client is not None:
+            await owned_client.close()
 
-    if item.github_issue_url:
-        return
+    async with SessionFactory() as session:
+        async with session.begin():
+            await _record_feedback_issue_results(session, feedback_jobs, now=datetime.now(UTC))
 
-    submitter = await session.scalar(select(User).where(User.id == item.submitter_user_id))
-    moderator = None
-    if item.moderator_user_id is not None:
-        moderator = await session.scalar(select(User).where(User.id == item.moderator_user_id))
 
-    draft = build_feedback_issue_draft(item=item, submitter=submitter, moderator=moderator)
-    issue_ref = await issue_client.create_issue(
-        title=draft.title,
-        body=draft.body,
-        labels=draft.labels,
+register_outbox_handler(
+    OutboxHandler(
+        event_type=OUTBOX_EVENT_FEEDBACK_APPROVED,
+        handle_batch=_handle_feedback_approved_batch,
+        lane=OutboxLane.BACKGROUND,
+        is_enabled=lambda _bot: settings.github_automation_enabled,
     )
+)
 
-    now = datetime.now(UTC)
-    item.github_issue_url = issue_ref.url
-    item.updated_at = now
 
-    actor_user_id = await _resolve_feedback_issue_actor_user_id(session)
-    await log_moderation_action(
-        session,
-        actor_user_id=actor_user_id,
-        action=ModerationAction.CREATE_FEEDBACK_GITHUB_ISSUE,
-        reason="Создан GitHub issue по одобренному фидбеку",
-        target_user_id=item.submitter_user_id,
-        payload={
-            "feedback_id": item.id,
-            "feedback_type": str(item.type),
-            "github_issue_number": issue_ref.number,
-            "github_issue_url": issue_ref.url,
-            "outbox_event_id": event.id,
-            "outbox_dedupe_key": event.dedupe_key,
-        },
+def _outbox_result_values(job: OutboxJob, *, now: datetime, policy: OutboxRetryPolicy) -> dict:
+    attempts = job.event.attempts + 1
+    if job.error is None:
+        return {
+            "attempts": attempts,
+            "status": IntegrationOutboxStatus.DONE,
+            "next_retry_at": now,
+            "last_error": None,
+        }
+
+    last_error = str(job.error)[:1000]
+    if job.retry_after_seconds is not None:
+        # Rate-limit deferrals are the upstream saying "not now", not a failed delivery:
+        # they reschedule without spending one of the event's attempts.
+        return {
+            "attempts": job.event.attempts,
+            "status": IntegrationOutboxStatus.PENDING,
+            "next_retry_at": now + timedelta(seconds=max(job.retry_after_seconds, 1.0)),
+            "last_error": last_error,
+        }
+    if attempts >= max(policy.max_attempts, 1):
+        return {
+            "attempts": attempts,
+            "status": IntegrationOutboxStatus.FAILED,
+            "next_retry_at": now,
+            "last_error": last_error,
+        }
+    return {
+        "attempts": attempts,
+        "status": IntegrationOutboxStatus.PENDING,
+        "next_retry_at": now + timedelta(seconds=policy.backoff_seconds(attempts)),
+        "last_error": last_error,
+    }
+
+
+async def _claim_outbox_batch(
+    session: AsyncSession,
+    *,
+    now: datetime,
+    lease_until: datetime,
+    limit: int,
+    event_types: list[str] | None = None,
+) -> list[ClaimedOutboxEvent]:
+    """Leases up to ``limit`` due events in one statement, highest priority lane first.
+
+    A leased event stays ``pending`` but is hidden from other workers until
+    ``next_retry_at`` (the lease) passes, so a crashed worker's batch is retried
+    automatically.
+    """
+
+    claimable_ids = (
+        select(IntegrationOutbox.id)
+        .where(
+            IntegrationOutbox.status == IntegrationOutboxStatus.PENDING,
+            IntegrationOutbox.next_retry_at <= now,
+        )
+        .order_by(
+            IntegrationOutbox.priority.asc(),
+            IntegrationOutbox.next_retry_at.asc(),
+            IntegrationOutbox.id.asc(),
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
     )
+    if event_types is not None:
+        claimable_ids = claimable_ids.where(IntegrationOutbox.event_type.in_(event_types))
+    rows = await session.execute(
+        update(IntegrationOutbox)
+        .where(IntegrationOutbox.id.in_(claimable_ids.scalar_subquery()))
+        .values(next_retry_at=lease_until, updated_at=now)
+        .returning(
+            IntegrationOutbox.id,
+            IntegrationOutbox.event_type,
+            IntegrationOutbox.payload,
+            IntegrationOutbox.dedupe_key,
+            IntegrationOutbox.attempts,
+            IntegrationOutbox.created_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    claimed = [
+        ClaimedOutboxEvent(
+            id=row.id,
+            event_type=row.event_type,
+            payload=row.payload if isinstance(row.payload, dict) else {},
+            dedupe_key=row.dedupe_key,
+            attempts=row.attempts,
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
+    claimed.sort(key=lambda event: event.id)
+    return claimed
 
 
-async def _handle_outbox_event(
-    session: AsyncSession,
+async def _deliver_outbox_jobs(
+    handler: OutboxHandler,
+    jobs: list[OutboxJob],
     *,
-    event: IntegrationOutbox,
-    issue_client: FeedbackIssueClient,
+    bot: Bot | None,
+    issue_client: FeedbackIssueClient | None,
 ) -> None:
-    if event.event_type == OUTBOX_EVENT_FEEDBACK_APPROVED:
-        await _handle_feedback_approved_event(session, event=event, issue_client=issue_client)
-        return
-    raise RuntimeError(f"Unsupported outbox event type: {event.event_type}")
+    context = OutboxDeliveryContext(
+        bot=bot,
+        issue_client=issue_client,
+        semaphore=asyncio.Semaphore(handler.resolved_concurrency()),
+    )
+    try:
+        await handler.handle_batch(jobs, context)
+    except Exception as exc:
+        logger.warning(
+            "outbox_batch_failed event_type=%s events=%s",
+            handler.event_type,
+            len(jobs),
+            exc_info=True,
+        )
+        for job in jobs:
+            if job.error is None:
+                job.fail(exc)
+
+    retry_after = max((job.retry_after_seconds or 0.0 for job in jobs), default=0.0)
+    if retry_after > 0:
+        pause_outbox_lane(handler.lane, seconds=retry_after)
+        logger.warning(
+            "outbox_lane_paused lane=%s event_type=%s seconds=%.0f",
+            handler.lane,
+            handler.event_type,
+            retry_after,
+        )
 
 
-async def _process_next_outbox_event(*, issue_client: FeedbackIssueClient) -> bool:
-    now = datetime.now(UTC)
+async def _record_outbox_results(
+    jobs: list[OutboxJob],
+    *,
+    now: datetime,
+    lease_until: datetime,
+) -> list[dict]:
+    outbox = IntegrationOutbox.__table__
+    results: list[dict] = []
+    for job in jobs:
+        handler = get_outbox_handler(job.event.event_type)
+        policy = handler.resolved_retry_policy() if handler is not None else OutboxRetryPolicy.from_settings()
+        results.append(_outbox_result_values(job, now=now, policy=policy))
+
     async with SessionFactory() as session:
         async with session.begin():
-            event = await session.scalar(
-                select(IntegrationOutbox)
+            # The lease guard skips events whose lease expired and were re-claimed meanwhile.
+            await session.execute(
+                update(outbox)
                 .where(
-                    IntegrationOutbox.status == IntegrationOutboxStatus.PENDING,
-                    IntegrationOutbox.next_retry_at <= now,
+                    outbox.c.id == bindparam("b_id"),
+                    outbox.c.next_retry_at == bindparam("b_lease_until"),
                 )
-                .order_by(IntegrationOutbox.next_retry_at.asc(), IntegrationOutbox.id.asc())
-                .limit(1)
-                .with_for_update(skip_locked=True)
+                .values(
+                    attempts=bindparam("b_attempts"),
+                    status=bindparam("b_status"),
+                    next_retry_at=bindparam("b_next_retry_at"),
+                    last_error=bindparam("b_last_error"),
+                    updated_at=now,
+                ),
+                [
+                    {
+                        "b_id": job.event.id,
+                        "b_lease_until": lease_until,
+                        **{f"b_{key}": value for key, value in values.items()},
+                    }
+                    for job, values in zip(jobs, results, strict=True)
+                ],
             )
-            if event is None:
-                return False
-
-            try:
-                await _handle_outbox_event(session, event=event, issue_client=issue_client)
-                _mark_outbox_done(event, now=now)
-            except Exception as exc:
-                _mark_outbox_retry_or_fail(event, now=now, error=exc)
-            return True
+    return results
+
+
+def _observe_outbox_outcomes(jobs: list[OutboxJob], results: list[dict], *, now: datetime) -> None:
+    for job, values in zip(jobs, results, strict=True):
+        status = values["status"]
+        if status == IntegrationOutboxStatus.DONE:
+            outcome = "done"
+        elif status == IntegrationOutboxStatus.PENDING:
+            outcome = "retry"
+        else:
+            outcome = "failed"
+        OUTBOX_EVENT_LAG_SECONDS.observe(
+            max((now - job.event.created_at).total_seconds(), 0.0),
+            event_type=job.event.event_type,
+            outcome=outcome,
+        )
 
 
-async def process_pending_outbox_events(*, issue_client: FeedbackIssueClient | None = None) -> int:
-    if not settings.github_automation_enabled:
+async def process_pending_outbox_events(
+    *,
+    bot: Bot | None = None,
+    issue_client: FeedbackIssueClient | None = None,
+    lanes: Collection[OutboxLane] | None = None,
+) -> int:
+    """Claims one batch of due events and dispatches it; returns the number of claimed events.
+
+    Only event types whose registered handler is enabled and whose lane is not paused
+    by an upstream rate limit are claimed; ``lanes`` narrows the claim further. The
+    watcher runs one loop per lane, so a slow background batch never holds back
+    realtime events. Each type runs through its own handler with its own concurrency
+    limit, outside any database transaction; outcomes are written back in one
+    batched update.
+    """
+
+    event_types = [
+        handler.event_type
+        for handler in _HANDLERS.values()
+        if (lanes is None or handler.lane in lanes)
+        and handler.is_enabled(bot)
+        and outbox_lane_paused_for(handler.lane) <= 0
+    ]
+    if not event_types:
         return 0
 
     batch_size = max(settings.outbox_batch_size, 1)
-    client = issue_client or GitHubApiIssueClient.from_settings()
+    now = datetime.now(UTC)
+    lease_until = now + timedelta(seconds=max(settings.outbox_lease_seconds, 1))
+    async with SessionFactory() as session:
+        async with session.begin():
+            events = await _claim_outbox_batch(
+                session,
+                now=now,
+                lease_until=lease_until,
+                limit=batch_size,
+                event_types=event_types,
+            )
+    if not events:
+        return 0
 
-    processed = 0
-    for _ in range(batch_size):
-        handled = await _process_next_outbox_event(issue_client=client)
-        if not handled:
-            break
-        processed += 1
+    jobs = [OutboxJob(event=event) for event in events]
+    jobs_by_type: dict[str, list[OutboxJob]] = {}
+    for job in jobs:
+        jobs_by_type.setdefault(job.event.event_type, []).append(job)
+    await asyncio.gather(
+        *(
+            _deliver_outbox_jobs(_HANDLERS[event_type], typed_jobs, bot=bot, issue_client=issue_client)
+            for event_type, typed_jobs in jobs_by_type.items()
+        )
+    )
 
-    return processed
+    finished_at = datetime.now(UTC)
+    results = await _record_outbox_results(jobs, now=finished_at, lease_until=lease_until)
+    _observe_outbox_outcomes(jobs, results, now=finished_at)
+    return len(jobs)
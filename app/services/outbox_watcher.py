@@ -1,24 +1,126 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import time
+
+from aiogram import Bot
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 from app.config import settings
-from app.services.outbox_service import process_pending_outbox_events
+from app.db.session import engine
+from app.infra.metrics import WATCHER_LOOP_SECONDS
+from app.services.github_automation_service import FeedbackIssueClient, GitHubApiIssueClient
+from app.services.outbox_service import (
+    OUTBOX_NOTIFY_CHANNEL,
+    OutboxLane,
+    process_pending_outbox_events,
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def run_outbox_watcher() -> None:
+class OutboxNotifyListener:
+    """Keeps one connection in ``LISTEN`` so enqueued events wake the worker immediately.
+
+    Polling stays as the fallback: ``wait`` always returns after ``timeout`` and a
+    dropped connection is re-established on the next ``wait``. Every ``waiter`` (one
+    per lane loop) has its own wake-up flag, so a notification reaches each loop even
+    when it arrives while that loop is busy delivering.
+    """
+
+    def __init__(self, bind: AsyncEngine, *, channel: str = OUTBOX_NOTIFY_CHANNEL) -> None:
+        self._bind = bind
+        self._channel = channel
+        self._connection: AsyncConnection | None = None
+        self._connect_lock = asyncio.Lock()
+        self._notified: dict[str, asyncio.Event] = {}
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None and not self._driver_connection().is_closed()
+
+    def _driver_connection(self):
+        assert self._connection is not None
+        return self._connection.sync_connection.connection.driver_connection
+
+    def _on_notify(self, *_args) -> None:
+        for notified in self._notified.values():
+            notified.set()
+
+    async def _listen(self) -> None:
+        await self.close()
+        try:
+            connection = await self._bind.connect()
+            self._connection = connection
+            await self._driver_connection().add_listener(self._channel, self._on_notify)
+        except Exception:
+            logger.warning("outbox_listen_failed channel=%s", self._channel, exc_info=True)
+            await self.close()
+
+    async def wait(self, *, timeout: float, waiter: str = "default") -> None:
+        notified = self._notified.setdefault(waiter, asyncio.Event())
+        async with self._connect_lock:
+            if not self.listening:
+                await self._listen()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(notified.wait(), timeout=max(timeout, 0.0))
+        notified.clear()
+
+    async def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        with contextlib.suppress(Exception):
+            await connection.invalidate()
+            await connection.close()
+
+
+async def _run_outbox_lane(
+    lane: OutboxLane,
+    *,
+    bot: Bot | None,
+    issue_client: FeedbackIssueClient,
+    listener: OutboxNotifyListener | None,
+) -> None:
     interval = max(settings.outbox_watcher_interval_seconds, 1)
+    batch_size = max(settings.outbox_batch_size, 1)
     while True:
+        started = time.perf_counter()
         try:
-            processed = await process_pending_outbox_events()
+            processed = await process_pending_outbox_events(bot=bot, issue_client=issue_client, lanes=(lane,))
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="outbox", outcome="ok")
             if processed:
-                logger.info("Outbox watcher processed %s event(s)", processed)
-            await asyncio.sleep(interval)
+                logger.info("Outbox watcher processed %s event(s) lane=%s", processed, lane)
+            if processed >= batch_size:
+                continue
+            if listener is not None:
+                await listener.wait(timeout=interval, waiter=lane)
+            else:
+                await asyncio.sleep(interval)
         except asyncio.CancelledError:
             raise
         except Exception as exc:
-            logger.exception("Outbox watcher failed: %s", exc)
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="outbox", outcome="error")
+            logger.exception("Outbox watcher failed lane=%s: %s", lane, exc)
             await asyncio.sleep(interval)
+
+
+async def run_outbox_watcher(bot: Bot | None = None) -> None:
+    """Runs one claim/deliver loop per outbox lane until cancelled."""
+
+    listener = OutboxNotifyListener(engine) if settings.outbox_listen_enabled else None
+    # One pooled client for the worker's lifetime keeps GitHub connections and ETags warm.
+    issue_client = GitHubApiIssueClient.from_settings()
+    try:
+        await asyncio.gather(
+            *(
+                _run_outbox_lane(lane, bot=bot, issue_client=issue_client, listener=listener)
+                for lane in OutboxLane
+            )
+        )
+    finally:
+        await issue_client.close()
+        if listener is not None:
+            await listener.close()
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.db.session import SessionFactory
+from app.infra.metrics import WATCHER_LOOP_SECONDS
+from app.services.points_service import reconcile_user_points_balances
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_all_points_balances() -> int:
+    """Walks every user with points in short per-batch transactions."""
+
+    batch_size = max(settings.points_balance_reconcile_batch_size, 1)
+    cursor: int | None = 0
+    corrected_total = 0
+    while cursor is not None:
+        async with SessionFactory() as session:
+            async with session.begin():
+                corrected, cursor = await reconcile_user_points_balances(
+                    session,
+                    after_user_id=cursor,
+                    limit=batch_size,
+                )
+        corrected_total += corrected
+    return corrected_total
+
+
+async def run_points_reconciliation_watcher() -> None:
+    interval = max(settings.points_balance_reconcile_interval_seconds, 1)
+    while True:
+        started = time.perf_counter()
+        try:
+            corrected = await reconcile_all_points_balances()
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="points_reconciliation", outcome="ok")
+            if corrected:
+                logger.warning("Points reconciliation corrected %s balance row(s)", corrected)
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            WATCHER_LOOP_SECONDS.observe(
+                time.perf_counter() - started,
+                watcher="points_reconciliation",
+                outcome="error",
+            )
+            logger.exception("Points reconciliation watcher failed: %s", exc)
+            await asyncio.sleep(interval)
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+import logging
 import math
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
 
-from sqlalchemy import case, func, select
+from sqlalchemy import case, func, literal, select, union
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.enums import PointsEventType
-from app.db.models import PointsLedgerEntry, User
+from app.db.models import PointsLedgerEntry, User, UserPointsBalance
+
+logger = logging.getLogger(__name__)
 
 BOOST_REDEMPTION_EVENT_TYPES: tuple[PointsEventType, ...] = (
     PointsEventType.FEEDBACK_PRIORITY_BOOST,
@@ -46,6 +49,75 @@ def feedback_reward_dedupe_key(feedback_id: int) -> str:
     return f"feedback:{feedback_id}:reward"
 
 
+def remaining_seconds(*, since: datetime, duration_seconds: int, now: datetime) -> int:
+    elapsed_seconds = (now - since).total_seconds()
+    if elapsed_seconds >= duration_seconds:
+        return 0
+    return max(math.ceil(duration_seconds - elapsed_seconds), 0)
+
+
+def redemption_period_starts(moment: datetime) -> tuple[date, date, date]:
+    day_start = moment.astimezone(UTC).date()
+    return day_start, day_start - timedelta(days=day_start.weekday()), day_start.replace(day=1)
+
+
+def _is_boost_redemption(*, amount: int, event_type: PointsEventType) -> bool:
+    return amount < 0 and event_type in BOOST_REDEMPTION_EVENT_TYPES
+
+
+async def _apply_points_balance_delta(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    amount: int,
+    event_type: PointsEventType,
+    now: datetime,
+) -> None:
+    earned = max(amount, 0)
+    spent = max(-amount, 0)
+    values: dict[str, object] = {
+        "user_id": user_id,
+        "balance": amount,
+        "total_earned": earned,
+        "total_spent": spent,
+        "operations_count": 1,
+        "created_at": now,
+        "updated_at": now,
+    }
+    set_: dict[str, object] = {
+        "balance": UserPointsBalance.balance + amount,
+        "total_earned": UserPointsBalance.total_earned + earned,
+        "total_spent": UserPointsBalance.total_spent + spent,
+        "operations_count": UserPointsBalance.operations_count + 1,
+        "updated_at": now,
+    }
+
+    if _is_boost_redemption(amount=amount, event_type=event_type):
+        values["last_redemption_at"] = now
+        set_["last_redemption_at"] = func.greatest(UserPointsBalance.last_redemption_at, now)
+        periods = zip(
+            ("day", "week", "month"),
+            redemption_period_starts(now),
+            strict=True,
+        )
+        for period, period_start in periods:
+            start_column = getattr(UserPointsBalance, f"redemption_{period}_start")
+            count_column = getattr(UserPointsBalance, f"redemptions_{period}_count")
+            spent_column = getattr(UserPointsBalance, f"redemptions_{period}_spent")
+            values[start_column.key] = period_start
+            values[count_column.key] = 1
+            values[spent_column.key] = spent
+            set_[start_column.key] = period_start
+            set_[count_column.key] = case((start_column == period_start, count_column + 1), else_=1)
+            set_[spent_column.key] = case((start_column == period_start, spent_column + spent), else_=spent)
+
+    await session.execute(
+        insert(UserPointsBalance)
+        .values(**values)
+        .on_conflict_do_update(index_elements=[UserPointsBalance.user_id], set_=set_)
+    )
+
+
 async def grant_points(
     session: AsyncSession,
     *,
@@ -82,53 +154,177 @@ async def grant_points(
         )
         return PointsGrantResult(changed=False, entry=existing)
 
+    await _apply_points_balance_delta(
+        session,
+        user_id=user_id,
+        amount=amount,
+        event_type=event_type,
+        now=now,
+    )
     entry = await session.scalar(select(PointsLedgerEntry).where(PointsLedgerEntry.id == inserted_id))
     return PointsGrantResult(changed=True, entry=entry)
 
 
 async def get_user_points_balance(session: AsyncSession, *, user_id: int) -> int:
-    total = await session.scalar(
-        select(func.coalesce(func.sum(PointsLedgerEntry.amount), 0)).where(PointsLedgerEntry.user_id == user_id)
-    )
+    total = await session.scalar(select(UserPointsBalance.balance).where(UserPointsBalance.user_id == user_id))
     return int(total or 0)
 
 
 async def get_user_points_summary(session: AsyncSession, *, user_id: int) -> UserPointsSummary:
-    balance, total_earned, total_spent, operations_count = (
-        await session.execute(
-            select(
-                func.coalesce(func.sum(PointsLedgerEntry.amount), 0),
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (PointsLedgerEntry.amount > 0, PointsLedgerEntry.amount),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                ),
-                func.coalesce(
-                    func.sum(
-                        case(
-                            (PointsLedgerEntry.amount < 0, -PointsLedgerEntry.amount),
-                            else_=0,
-                        )
-                    ),
-                    0,
-                ),
-                func.count(PointsLedgerEntry.id),
-            ).where(PointsLedgerEntry.user_id == user_id)
-        )
-    ).one()
+    row = await session.scalar(select(UserPointsBalance).where(UserPointsBalance.user_id == user_id))
+    if row is None:
+        return UserPointsSummary(balance=0, total_earned=0, total_spent=0, operations_count=0)
 
     return UserPointsSummary(
-        balance=int(balance or 0),
-        total_earned=int(total_earned or 0),
-        total_spent=int(total_spent or 0),
-        operations_count=int(operations_count or 0),
+        balance=int(row.balance),
+        total_earned=int(row.total_earned),
+        total_spent=int(row.total_spent),
+        operations_count=int(row.operations_count),
+    )
+
+
+def _ledger_balance_rollup(*, user_ids: list[int], now: datetime):
+    day_start, week_start, month_start = redemption_period_starts(now)
+    redemption = (PointsLedgerEntry.amount < 0) & PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES)
+    spent = -PointsLedgerEntry.amount
+    columns = {
+        "balance": func.coalesce(func.sum(PointsLedgerEntry.amount), 0),
+        "total_earned": func.coalesce(func.sum(PointsLedgerEntry.amount).filter(PointsLedgerEntry.amount > 0), 0),
+        "total_spent": func.coalesce(func.sum(spent).filter(PointsLedgerEntry.amount < 0), 0),
+        "operations_count": func.count(PointsLedgerEntry.id),
+        "last_redemption_at": func.max(PointsLedgerEntry.created_at).filter(redemption),
+    }
+    for period, period_start in (("day", day_start), ("week", week_start), ("month", month_start)):
+        in_period = redemption & (
+            PointsLedgerEntry.created_at >= datetime.combine(period_start, datetime.min.time(), tzinfo=UTC)
+        )
+        columns[f"redemption_{period}_start"] = literal(period_start)
+        columns[f"redemptions_{period}_count"] = func.count(PointsLedgerEntry.id).filter(in_period)
+        columns[f"redemptions_{period}_spent"] = func.coalesce(func.sum(spent).filter(in_period), 0)
+
+    return (
+        select(PointsLedgerEntry.user_id, *(column.label(name) for name, column in columns.items()))
+        .where(PointsLedgerEntry.user_id.in_(user_ids))
+        .group_by(PointsLedgerEntry.user_id)
     )
 
 
+_RECONCILED_COLUMNS: tuple[str, ...] = (
+    "balance",
+    "total_earned",
+    "total_spent",
+    "operations_count",
+    "last_redemption_at",
+    "redemptions_day_count",
+    "redemptions_day_spent",
+    "redemptions_week_count",
+    "redemptions_week_spent",
+    "redemptions_month_count",
+    "redemptions_month_spent",
+)
+
+
+def _balance_row_counters(row: UserPointsBalance | None, *, now: datetime) -> dict[str, object]:
+    if row is None:
+        return {}
+    day_start, week_start, month_start = redemption_period_starts(now)
+    starts = {"day": day_start, "week": week_start, "month": month_start}
+    counters: dict[str, object] = {
+        "balance": int(row.balance),
+        "total_earned": int(row.total_earned),
+        "total_spent": int(row.total_spent),
+        "operations_count": int(row.operations_count),
+        "last_redemption_at": row.last_redemption_at,
+    }
+    for period, period_start in starts.items():
+        current = getattr(row, f"redemption_{period}_start") == period_start
+        for suffix in ("count", "spent"):
+            value = getattr(row, f"redemptions_{period}_{suffix}")
+            counters[f"redemptions_{period}_{suffix}"] = int(value) if current else 0
+    return counters
+
+
+async def reconcile_user_points_balances(
+    session: AsyncSession,
+    *,
+    after_user_id: int = 0,
+    limit: int = 500,
+    now: datetime | None = None,
+) -> tuple[int, int | None]:
+    """Recomputes one batch of ``user_points_balances`` rows from the ledger.
+
+    Balance rows are locked before the ledger is read, so grants racing with the
+    job wait instead of being overwritten. Returns ``(corrected_rows, next_cursor)``;
+    ``next_cursor`` is ``None`` once every user has been visited.
+    """
+
+    current_time = now or datetime.now(UTC)
+    safe_limit = max(int(limit), 1)
+    candidate_ids = union(
+        select(PointsLedgerEntry.user_id.label("user_id")).where(PointsLedgerEntry.user_id > after_user_id),
+        select(UserPointsBalance.user_id.label("user_id")).where(UserPointsBalance.user_id > after_user_id),
+    ).subquery()
+    user_ids = list(
+        (
+            await session.execute(
+                select(candidate_ids.c.user_id).order_by(candidate_ids.c.user_id).limit(safe_limit)
+            )
+        ).scalars()
+    )
+    if not user_ids:
+        return 0, None
+
+    existing_rows = {
+        row.user_id: row
+        for row in (
+            await session.execute(
+                select(UserPointsBalance)
+                .where(UserPointsBalance.user_id.in_(user_ids))
+                .order_by(UserPointsBalance.user_id)
+                .with_for_update()
+            )
+        ).scalars()
+    }
+    rollups = {
+        row.user_id: row._asdict()
+        for row in (await session.execute(_ledger_balance_rollup(user_ids=user_ids, now=current_time))).all()
+    }
+
+    corrected = 0
+    for user_id in user_ids:
+        expected = rollups.get(user_id)
+        existing = existing_rows.get(user_id)
+        actual = _balance_row_counters(existing, now=current_time)
+        if expected is None:
+            if existing is not None and any(actual[name] for name in _RECONCILED_COLUMNS):
+                logger.warning("points_balance_drift user_id=%s ledger=empty", user_id)
+                await session.delete(existing)
+                corrected += 1
+            continue
+        if actual and all(actual[name] == expected[name] for name in _RECONCILED_COLUMNS):
+            continue
+
+        logger.warning(
+            "points_balance_drift user_id=%s stored_balance=%s ledger_balance=%s",
+            user_id,
+            actual.get("balance"),
+            expected["balance"],
+        )
+        values = dict(expected, updated_at=current_time)
+        await session.execute(
+            insert(UserPointsBalance)
+            .values(**values, created_at=current_time)
+            .on_conflict_do_update(
+                index_elements=[UserPointsBalance.user_id],
+                set_={name: value for name, value in values.items() if name != "user_id"},
+            )
+        )
+        corrected += 1
+
+    next_cursor = user_ids[-1] if len(user_ids) == safe_limit else None
+    return corrected, next_cursor
+
+
 async def list_user_points_entries(
     session: AsyncSession,
     *,
@@ -256,184 +452,3 @@ async def spend_points(
         balance_before=balance_before,
         balance_after=balance_after,
     )
-
-
-async def get_points_redemption_cooldown_remaining_seconds(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    cooldown_seconds: int,
-    now: datetime | None = None,
-) -> int:
-    safe_cooldown = max(int(cooldown_seconds), 0)
-    if safe_cooldown <= 0:
-        return 0
-
-    current_time = now or datetime.now(UTC)
-    last_redemption_at = await session.scalar(
-        select(func.max(PointsLedgerEntry.created_at)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES),
-        )
-    )
-    if last_redemption_at is None:
-        return 0
-
-    elapsed_seconds = (current_time - last_redemption_at).total_seconds()
-    if elapsed_seconds >= safe_cooldown:
-        return 0
-
-    return max(math.ceil(safe_cooldown - elapsed_seconds), 0)
-
-
-async def get_points_event_redemption_cooldown_remaining_seconds(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    event_types: tuple[PointsEventType, ...],
-    cooldown_seconds: int,
-    now: datetime | None = None,
-) -> int:
-    safe_cooldown = max(int(cooldown_seconds), 0)
-    if safe_cooldown <= 0 or not event_types:
-        return 0
-
-    current_time = now or datetime.now(UTC)
-    last_redemption_at = await session.scalar(
-        select(func.max(PointsLedgerEntry.created_at)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(event_types),
-        )
-    )
-    if last_redemption_at is None:
-        return 0
-
-    elapsed_seconds = (current_time - last_redemption_at).total_seconds()
-    if elapsed_seconds >= safe_cooldown:
-        return 0
-
-    return max(math.ceil(safe_cooldown - elapsed_seconds), 0)
-
-
-async def get_points_redemption_account_age_remaining_seconds(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    min_account_age_seconds: int,
-    now: datetime | None = None,
-) -> int:
-    safe_min_age = max(int(min_account_age_seconds), 0)
-    if safe_min_age <= 0:
-        return 0
-
-    current_time = now or datetime.now(UTC)
-    created_at = await session.scalar(select(User.created_at).where(User.id == user_id))
-    if created_at is None:
-        return 0
-    if created_at.tzinfo is None:
-        created_at = created_at.replace(tzinfo=UTC)
-
-    elapsed_seconds = (current_time - created_at).total_seconds()
-    if elapsed_seconds >= safe_min_age:
-        return 0
-
-    return max(math.ceil(safe_min_age - elapsed_seconds), 0)
-
-
-async def get_points_redemptions_used_today(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    now: datetime | None = None,
-) -> int:
-    current_time = now or datetime.now(UTC)
-    day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    used_today = await session.scalar(
-        select(func.count(PointsLedgerEntry.id)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES),
-            PointsLedgerEntry.created_at >= day_start,
-        )
-    )
-    return int(used_today or 0)
-
-
-async def get_points_redemptions_used_this_week(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    now: datetime | None = None,
-) -> int:
-    current_time = now or datetime.now(UTC)
-    day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = day_start - timedelta(days=day_start.weekday())
-    used_this_week = await session.scalar(
-        select(func.count(PointsLedgerEntry.id)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES),
-            PointsLedgerEntry.created_at >= week_start,
-        )
-    )
-    return int(used_this_week or 0)
-
-
-async def get_points_redemptions_spent_today(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    now: datetime | None = None,
-) -> int:
-    current_time = now or datetime.now(UTC)
-    day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    spent_today = await session.scalar(
-        select(func.coalesce(func.sum(-PointsLedgerEntry.amount), 0)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES),
-            PointsLedgerEntry.created_at >= day_start,
-        )
-    )
-    return int(spent_today or 0)
-
-
-async def get_points_redemptions_spent_this_week(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    now: datetime | None = None,
-) -> int:
-    current_time = now or datetime.now(UTC)
-    day_start = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    week_start = day_start - timedelta(days=day_start.weekday())
-    spent_this_week = await session.scalar(
-        select(func.coalesce(func.sum(-PointsLedgerEntry.amount), 0)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES),
-            PointsLedgerEntry.created_at >= week_start,
-        )
-    )
-    return int(spent_this_week or 0)
-
-
-async def get_points_redemptions_spent_this_month(
-    session: AsyncSession,
-    *,
-    user_id: int,
-    now: datetime | None = None,
-) -> int:
-    current_time = now or datetime.now(UTC)
-    month_start = current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    spent_this_month = await session.scalar(
-        select(func.coalesce(func.sum(-PointsLedgerEntry.amount), 0)).where(
-            PointsLedgerEntry.user_id == user_id,
-            PointsLedgerEntry.amount < 0,
-            PointsLedgerEntry.event_type.in_(BOOST_REDEMPTION_EVENT_TYPES),
-            PointsLedgerEntry.created_at >= month_start,
-        )
-    )
-    return int(spent_this_month or 0)
@@ -8,7 +8,7 @@ from enum import StrEnum
 
 from aiogram import Bot
 from aiogram.enums import ChatType
-from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramForbiddenError
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
 from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Message, User as TgUser
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -605,6 +605,7 @@ async def send_user_topic_message(
     message_effect_id: str | None = None,
     notification_event: NotificationEventType | None = None,
     auction_id: uuid.UUID | None = None,
+    raise_retry_after: bool = False,
 ) -> bool:
     async def _record_sent(*, reason: str = "delivered") -> None:
         if notification_event is None:
@@ -742,6 +743,8 @@ async def send_user_topic_message(
             await _record_suppressed(reason="forbidden")
             return False
         except TelegramAPIError as exc:
+            if raise_retry_after and isinstance(exc, TelegramRetryAfter):
+                raise
             _log_notification_failure(
                 tg_user_id=tg_user_id,
                 purpose=purpose,
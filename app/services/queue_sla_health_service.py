@@ -65,6 +65,67 @@ SLA_THRESHOLDS_BY_CONTEXT = {
 }
 
 
+@dataclass(slots=True, frozen=True)
+class QueueSlaBucketRanges:
+    """Column ranges that select each SLA health state and aging bucket at ``now``.
+
+    Buckets are a function of ``sla_deadline_at`` and ``created_at`` only, so list
+    filters can be answered with range predicates on indexed columns instead of
+    loading rows and classifying them with ``decide_queue_sla_health``.
+    """
+
+    queue_context: str
+    now: datetime
+    warning_cutoff: datetime
+    critical_cutoff: datetime
+    fresh_cutoff: datetime
+    aging_cutoff: datetime
+    stale_cutoff: datetime
+
+    def deadline_range(self, health_state: str) -> tuple[datetime | None, datetime | None]:
+        """Returns ``(lower, upper)`` for ``lower < deadline_at <= upper``; ``None`` is unbounded."""
+
+        if health_state == "healthy":
+            return self.warning_cutoff, None
+        if health_state == "warning":
+            return self.critical_cutoff, self.warning_cutoff
+        if health_state == "critical":
+            return self.now, self.critical_cutoff
+        if health_state == "overdue":
+            return None, self.now
+        raise ValueError(f"no deadline range for SLA health state {health_state!r}")
+
+    def created_range(self, aging_bucket: str) -> tuple[datetime | None, datetime | None]:
+        """Returns ``(lower, upper)`` for ``lower <= created_at < upper``; ``None`` is unbounded."""
+
+        if aging_bucket == "fresh":
+            return self.fresh_cutoff, None
+        if aging_bucket == "aging":
+            return self.aging_cutoff, self.fresh_cutoff
+        if aging_bucket == "stale":
+            return self.stale_cutoff, self.aging_cutoff
+        if aging_bucket == "critical":
+            return None, self.stale_cutoff
+        raise ValueError(f"no created_at range for aging bucket {aging_bucket!r}")
+
+
+def queue_sla_bucket_ranges(queue_context: str, *, now: datetime | None = None) -> QueueSlaBucketRanges:
+    normalized_context = queue_context.strip().lower()
+    if normalized_context not in SLA_THRESHOLDS_BY_CONTEXT:
+        normalized_context = _DEFAULT_QUEUE_CONTEXT
+    thresholds = SLA_THRESHOLDS_BY_CONTEXT[normalized_context]
+    current_time = now or datetime.now(UTC)
+    return QueueSlaBucketRanges(
+        queue_context=normalized_context,
+        now=current_time,
+        warning_cutoff=current_time + thresholds.warning_window,
+        critical_cutoff=current_time + thresholds.critical_window,
+        fresh_cutoff=current_time - thresholds.aging_fresh_max,
+        aging_cutoff=current_time - thresholds.aging_aging_max,
+        stale_cutoff=current_time - thresholds.aging_stale_max,
+    )
+
+
 def _coerce_aware_utc(value: datetime | None, *, field_name: str, fallback_notes: list[str]) -> datetime | None:
     if value is None:
         return None
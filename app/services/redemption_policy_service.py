@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+
+from sqlalchemy import Select, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.enums import PointsEventType
+from app.db.models import (
+    Appeal,
+    FeedbackItem,
+    GuarantorRequest,
+    PointsLedgerEntry,
+    User,
+    UserPointsBalance,
+)
+from app.services.points_service import (
+    UserPointsSummary,
+    redemption_period_starts,
+    remaining_seconds,
+)
+
+
+class RedemptionUtility(StrEnum):
+    FEEDBACK = "feedback"
+    GUARANTOR = "guarantor"
+    APPEAL = "appeal"
+
+
+class RedemptionDenialCode(StrEnum):
+    REDEMPTIONS_DISABLED = "redemptions_disabled"
+    ACCOUNT_TOO_NEW = "account_too_new"
+    MIN_EARNED_NOT_REACHED = "min_earned_not_reached"
+    UTILITY_DISABLED = "utility_disabled"
+    UTILITY_COOLDOWN = "utility_cooldown"
+    UTILITY_DAILY_LIMIT = "utility_daily_limit"
+    GLOBAL_DAILY_LIMIT = "global_daily_limit"
+    GLOBAL_WEEKLY_LIMIT = "global_weekly_limit"
+    DAILY_SPEND_CAP = "daily_spend_cap"
+    WEEKLY_SPEND_CAP = "weekly_spend_cap"
+    MONTHLY_SPEND_CAP = "monthly_spend_cap"
+    GLOBAL_COOLDOWN = "global_cooldown"
+    MIN_BALANCE = "min_balance"
+
+
+@dataclass(frozen=True, slots=True)
+class _UtilitySpec:
+    event_type: PointsEventType
+    settings_prefix: str
+    label: str
+
+
+_UTILITY_SPECS: dict[RedemptionUtility, _UtilitySpec] = {
+    RedemptionUtility.FEEDBACK: _UtilitySpec(
+        event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+        settings_prefix="feedback_priority_boost",
+        label="фидбека",
+    ),
+    RedemptionUtility.GUARANTOR: _UtilitySpec(
+        event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
+        settings_prefix="guarantor_priority_boost",
+        label="гаранта",
+    ),
+    RedemptionUtility.APPEAL: _UtilitySpec(
+        event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
+        settings_prefix="appeal_priority_boost",
+        label="апелляции",
+    ),
+}
+
+
+@dataclass(slots=True)
+class BoostUtilityPolicy:
+    enabled: bool
+    cost_points: int
+    daily_limit: int
+    used_today: int
+    remaining_today: int
+    cooldown_seconds: int
+    cooldown_remaining_seconds: int
+
+
+@dataclass(slots=True, frozen=True)
+class RedemptionSnapshot:
+    balance: int
+    total_earned: int
+    total_spent: int
+    operations_count: int
+    account_age_remaining_seconds: int
+    cooldown_remaining_seconds: int
+    used_today: int
+    used_this_week: int
+    spent_today: int
+    spent_this_week: int
+    spent_this_month: int
+    utilities: dict[RedemptionUtility, BoostUtilityPolicy]
+
+    @property
+    def summary(self) -> UserPointsSummary:
+        return UserPointsSummary(
+            balance=self.balance,
+            total_earned=self.total_earned,
+            total_spent=self.total_spent,
+            operations_count=self.operations_count,
+        )
+
+    def utility(self, utility: RedemptionUtility) -> BoostUtilityPolicy:
+        return self.utilities[utility]
+
+
+@dataclass(slots=True, frozen=True)
+class RedemptionDecision:
+    allowed: bool
+    message: str
+    code: RedemptionDenialCode | None
+    cost_points: int
+    snapshot: RedemptionSnapshot
+
+
+def _utility_setting(utility: RedemptionUtility, name: str):
+    return getattr(settings, f"{_UTILITY_SPECS[utility].settings_prefix}_{name}")
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+class RedemptionPolicyEngine:
+    """Evaluates every boost redemption limit from a single SQL round trip.
+
+    ``load_snapshot`` reads the user row, the materialized ``user_points_balances``
+    counters, per-utility boosts made today and the recent ledger spends needed for
+    per-utility cooldowns in one statement; ``evaluate`` is pure and applies the
+    configured limits in the same order the boost commands always have.
+    """
+
+    def _snapshot_statement(self, *, user_id: int, now: datetime) -> Select:
+        day_start_date = redemption_period_starts(now)[0]
+        day_start = datetime.combine(day_start_date, datetime.min.time(), tzinfo=UTC)
+        cooldown_window_seconds = max(
+            max(int(_utility_setting(utility, "cooldown_seconds")), 0) for utility in RedemptionUtility
+        )
+        recent_spends = (
+            select(
+                *(
+                    func.max(PointsLedgerEntry.created_at)
+                    .filter(PointsLedgerEntry.event_type == spec.event_type)
+                    .label(f"{utility.value}_last_at")
+                    for utility, spec in _UTILITY_SPECS.items()
+                )
+            )
+            .where(
+                PointsLedgerEntry.user_id == User.id,
+                PointsLedgerEntry.amount < 0,
+                PointsLedgerEntry.event_type.in_([spec.event_type for spec in _UTILITY_SPECS.values()]),
+                PointsLedgerEntry.created_at >= now - timedelta(seconds=cooldown_window_seconds),
+            )
+            .lateral("recent_boost_spends")
+        )
+        boosted_today = {
+            RedemptionUtility.FEEDBACK: select(func.count(FeedbackItem.id)).where(
+                FeedbackItem.submitter_user_id == User.id,
+                FeedbackItem.priority_boosted_at >= day_start,
+            ),
+            RedemptionUtility.GUARANTOR: select(func.count(GuarantorRequest.id)).where(
+                GuarantorRequest.submitter_user_id == User.id,
+                GuarantorRequest.priority_boosted_at >= day_start,
+            ),
+            RedemptionUtility.APPEAL: select(func.count(Appeal.id)).where(
+                Appeal.appellant_user_id == User.id,
+                Appeal.priority_boosted_at >= day_start,
+            ),
+        }
+        return (
+            select(
+                User.created_at,
+                UserPointsBalance,
+                *(recent_spends.c[f"{utility.value}_last_at"] for utility in RedemptionUtility),
+                *(
+                    boosted_today[utility].scalar_subquery().label(f"{utility.value}_used_today")
+                    for utility in RedemptionUtility
+                ),
+            )
+            .select_from(User)
+            .outerjoin(UserPointsBalance, UserPointsBalance.user_id == User.id)
+            .outerjoin(recent_spends, true())
+            .where(User.id == user_id)
+        )
+
+    async def load_snapshot(
+        self,
+        session: AsyncSession,
+        *,
+        user_id: int,
+        now: datetime | None = None,
+    ) -> RedemptionSnapshot:
+        current_time = now or datetime.now(UTC)
+        row = (await session.execute(self._snapshot_statement(user_id=user_id, now=current_time))).one_or_none()
+        mapping = row._mapping if row is not None else {}
+        balance_row: UserPointsBalance | None = mapping.get(UserPointsBalance)
+        created_at = _as_utc(mapping.get(User.created_at))
+
+        min_account_age = max(int(settings.points_redemption_min_account_age_seconds), 0)
+        account_age_remaining = 0
+        if min_account_age > 0 and created_at is not None:
+            account_age_remaining = remaining_seconds(
+                since=created_at,
+                duration_seconds=min_account_age,
+                now=current_time,
+            )
+
+        global_cooldown = max(int(settings.points_redemption_cooldown_seconds), 0)
+        global_cooldown_remaining = 0
+        last_redemption_at = balance_row.last_redemption_at if balance_row is not None else None
+        if global_cooldown > 0 and last_redemption_at is not None:
+            global_cooldown_remaining = remaining_seconds(
+                since=last_redemption_at,
+                duration_seconds=global_cooldown,
+                now=current_time,
+            )
+
+        utilities: dict[RedemptionUtility, BoostUtilityPolicy] = {}
+        for utility in RedemptionUtility:
+            daily_limit = max(int(_utility_setting(utility, "daily_limit")), 1)
+            cooldown_seconds = max(int(_utility_setting(utility, "cooldown_seconds")), 0)
+            used_today = int(mapping.get(f"{utility.value}_used_today") or 0)
+            last_at = _as_utc(mapping.get(f"{utility.value}_last_at"))
+            cooldown_remaining = 0
+            if cooldown_seconds > 0 and last_at is not None:
+                cooldown_remaining = remaining_seconds(
+                    since=last_at,
+                    duration_seconds=cooldown_seconds,
+                    now=current_time,
+                )
+            utilities[utility] = BoostUtilityPolicy(
+                enabled=bool(_utility_setting(utility, "enabled")),
+                cost_points=max(int(_utility_setting(utility, "cost_points")), 1),
+                daily_limit=daily_limit,
+                used_today=used_today,
+                remaining_today=max(daily_limit - used_today, 0),
+                cooldown_seconds=cooldown_seconds,
+                cooldown_remaining_seconds=cooldown_remaining,
+            )
+
+        if balance_row is None:
+            return RedemptionSnapshot(
+                balance=0,
+                total_earned=0,
+                total_spent=0,
+                operations_count=0,
+                account_age_remaining_seconds=account_age_remaining,
+                cooldown_remaining_seconds=global_cooldown_remaining,
+                used_today=0,
+                used_this_week=0,
+                spent_today=0,
+                spent_this_week=0,
+                spent_this_month=0,
+                utilities=utilities,
+            )
+
+        day_start, week_start, month_start = redemption_period_starts(current_time)
+        same_day = balance_row.redemption_day_start == day_start
+        same_week = balance_row.redemption_week_start == week_start
+        same_month = balance_row.redemption_month_start == month_start
+        return RedemptionSnapshot(
+            balance=int(balance_row.balance),
+            total_earned=int(balance_row.total_earned),
+            total_spent=int(balance_row.total_spent),
+            operations_count=int(balance_row.operations_count),
+            account_age_remaining_seconds=account_age_remaining,
+            cooldown_remaining_seconds=global_cooldown_remaining,
+            used_today=int(balance_row.redemptions_day_count) if same_day else 0,
+            used_this_week=int(balance_row.redemptions_week_count) if same_week else 0,
+            spent_today=int(balance_row.redemptions_day_spent) if same_day else 0,
+            spent_this_week=int(balance_row.redemptions_week_spent) if same_week else 0,
+            spent_this_month=int(balance_row.redemptions_month_spent) if same_month else 0,
+            utilities=utilities,
+        )
+
+    def evaluate(self, snapshot: RedemptionSnapshot, *, utility: RedemptionUtility) -> RedemptionDecision:
+        policy = snapshot.utility(utility)
+        label = _UTILITY_SPECS[utility].label
+        cost = policy.cost_points
+
+        def deny(code: RedemptionDenialCode, message: str) -> RedemptionDecision:
+            return RedemptionDecision(False, message, code, cost, snapshot)
+
+        if not settings.points_redemption_enabled:
+            return deny(RedemptionDenialCode.REDEMPTIONS_DISABLED, "Редимпшены points временно отключены")
+        if snapshot.account_age_remaining_seconds > 0:
+            return deny(
+                RedemptionDenialCode.ACCOUNT_TOO_NEW,
+                f"Бусты станут доступны через {snapshot.account_age_remaining_seconds} сек после регистрации",
+            )
+        min_earned_points = max(settings.points_redemption_min_earned_points, 0)
+        if min_earned_points > 0 and snapshot.total_earned < min_earned_points:
+            return deny(
+                RedemptionDenialCode.MIN_EARNED_NOT_REACHED,
+                (
+                    "Для буста нужно заработать минимум "
+                    f"{min_earned_points} points (сейчас {snapshot.total_earned}, "
+                    f"осталось {min_earned_points - snapshot.total_earned})"
+                ),
+            )
+        if not policy.enabled:
+            return deny(RedemptionDenialCode.UTILITY_DISABLED, f"Буст {label} временно отключен")
+        if policy.cooldown_remaining_seconds > 0:
+            return deny(
+                RedemptionDenialCode.UTILITY_COOLDOWN,
+                f"Повторный буст {label} доступен через {policy.cooldown_remaining_seconds} сек",
+            )
+        if policy.remaining_today <= 0:
+            return deny(
+                RedemptionDenialCode.UTILITY_DAILY_LIMIT,
+                f"Достигнут дневной лимит бустов ({policy.daily_limit})",
+            )
+
+        global_daily_limit = max(settings.points_redemption_daily_limit, 0)
+        if global_daily_limit > 0 and snapshot.used_today >= global_daily_limit:
+            return deny(
+                RedemptionDenialCode.GLOBAL_DAILY_LIMIT,
+                f"Достигнут глобальный дневной лимит бустов ({global_daily_limit})",
+            )
+        global_weekly_limit = max(settings.points_redemption_weekly_limit, 0)
+        if global_weekly_limit > 0 and snapshot.used_this_week >= global_weekly_limit:
+            return deny(
+                RedemptionDenialCode.GLOBAL_WEEKLY_LIMIT,
+                f"Достигнут глобальный недельный лимит бустов ({global_weekly_limit})",
+            )
+
+        spend_caps = (
+            (
+                RedemptionDenialCode.DAILY_SPEND_CAP,
+                settings.points_redemption_daily_spend_cap,
+                snapshot.spent_today,
+                "дневной",
+            ),
+            (
+                RedemptionDenialCode.WEEKLY_SPEND_CAP,
+                settings.points_redemption_weekly_spend_cap,
+                snapshot.spent_this_week,
+                "недельный",
+            ),
+            (
+                RedemptionDenialCode.MONTHLY_SPEND_CAP,
+                settings.points_redemption_monthly_spend_cap,
+                snapshot.spent_this_month,
+                "месячный",
+            ),
+        )
+        for code, raw_cap, spent, period_label in spend_caps:
+            cap = max(raw_cap, 0)
+            if cap > 0 and spent + cost > cap:
+                return deny(code, f"Достигнут глобальный {period_label} лимит списания на бусты ({cap} points)")
+
+        if snapshot.cooldown_remaining_seconds > 0:
+            return deny(
+                RedemptionDenialCode.GLOBAL_COOLDOWN,
+                f"Следующий буст доступен через {snapshot.cooldown_remaining_seconds} сек",
+            )
+        min_balance = max(settings.points_redemption_min_balance, 0)
+        if min_balance > 0 and snapshot.balance - cost < min_balance:
+            return deny(
+                RedemptionDenialCode.MIN_BALANCE,
+                f"Нужно сохранить минимум {min_balance} points после буста (доступно {snapshot.balance})",
+            )
+
+        return RedemptionDecision(True, "OK", None, cost, snapshot)
+
+    async def decide(
+        self,
+        session: AsyncSession,
+        *,
+        user_id: int,
+        utility: RedemptionUtility,
+        now: datetime | None = None,
+    ) -> RedemptionDecision:
+        snapshot = await self.load_snapshot(session, user_id=user_id, now=now)
+        return self.evaluate(snapshot, utility=utility)
+
+
+redemption_policy_engine = RedemptionPolicyEngine()
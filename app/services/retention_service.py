@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, exists, func, insert, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.base import Base
+from app.db.enums import AuctionStatus, IntegrationOutboxStatus
+from app.db.models import (
+    AdminQueuePresetTelemetryEvent,
+    AdminQueuePresetTelemetryHourly,
+    Auction,
+    Bid,
+    BidArchive,
+    ChatOwnerServiceEventAudit,
+    Complaint,
+    FraudSignal,
+    FraudSignalArchive,
+    IntegrationOutbox,
+    ModerationLog,
+    ModerationLogArchive,
+    RetentionRun,
+    UserAuctionNotificationSnooze,
+)
+from app.db.session import read_only
+
+CLOSED_AUCTION_STATUSES: tuple[AuctionStatus, ...] = (
+    AuctionStatus.ENDED,
+    AuctionStatus.BOUGHT_OUT,
+    AuctionStatus.CANCELLED,
+)
+
+
+@dataclass(slots=True)
+class RetentionBatchResult:
+    auctions: int = 0
+    bids: int = 0
+    moderation_logs: int = 0
+    fraud_signals: int = 0
+
+    @property
+    def moved(self) -> int:
+        return self.bids + self.moderation_logs + self.fraud_signals
+
+
+async def _move_rows(session: AsyncSession, source: type[Base], archive: type[Base], *criteria) -> int:
+    """Moves matching rows into ``archive`` with one ``DELETE ... RETURNING`` / ``INSERT ... SELECT``."""
+
+    columns = [column.name for column in source.__table__.columns]
+    moved = delete(source).where(*criteria).returning(*source.__table__.columns).cte("moved")
+    stmt = insert(archive).from_select(columns, select(*(moved.c[name] for name in columns)))
+    result = await session.execute(stmt)
+    return max(int(result.rowcount or 0), 0)
+
+
+async def archive_closed_auctions(
+    session: AsyncSession,
+    *,
+    closed_before: datetime,
+    after_auction_id: uuid.UUID | None = None,
+    limit: int = 200,
+) -> tuple[RetentionBatchResult, uuid.UUID | None]:
+    """Moves history rows of one batch of long-closed auctions into the archive tables.
+
+    Visits auctions closed before ``closed_before`` in id order and moves their
+    moderation logs, resolved fraud signals and bids. Rows still referenced from live
+    data stay put: open fraud signals, and bids a complaint, live moderation log or
+    live fraud signal points at (their ``bid_id`` would otherwise be nulled). Returns
+    ``(result, next_cursor)``; ``next_cursor`` is ``None`` once every candidate was visited.
+    """
+
+    safe_limit = max(int(limit), 1)
+    closed_at = func.coalesce(Auction.ends_at, Auction.updated_at)
+    has_history = or_(
+        exists().where(Bid.auction_id == Auction.id),
+        exists().where(ModerationLog.auction_id == Auction.id),
+        exists().where(FraudSignal.auction_id == Auction.id, FraudSignal.status != "OPEN"),
+    )
+    stmt = (
+        select(Auction.id)
+        .where(Auction.status.in_(CLOSED_AUCTION_STATUSES), closed_at < closed_before, has_history)
+        .order_by(Auction.id)
+        .limit(safe_limit)
+        .with_for_update(skip_locked=True)
+    )
+    if after_auction_id is not None:
+        stmt = stmt.where(Auction.id > after_auction_id)
+    auction_ids = list((await session.execute(stmt)).scalars())
+    if not auction_ids:
+        return RetentionBatchResult(), None
+
+    result = RetentionBatchResult(auctions=len(auction_ids))
+    result.moderation_logs = await _move_rows(
+        session,
+        ModerationLog,
+        ModerationLogArchive,
+        ModerationLog.auction_id.in_(auction_ids),
+    )
+    result.fraud_signals = await _move_rows(
+        session,
+        FraudSignal,
+        FraudSignalArchive,
+        FraudSignal.auction_id.in_(auction_ids),
+        FraudSignal.status != "OPEN",
+    )
+    result.bids = await _move_rows(
+        session,
+        Bid,
+        BidArchive,
+        Bid.auction_id.in_(auction_ids),
+        ~exists().where(Complaint.target_bid_id == Bid.id),
+        ~exists().where(ModerationLog.bid_id == Bid.id),
+        ~exists().where(FraudSignal.bid_id == Bid.id),
+    )
+    next_cursor = auction_ids[-1] if len(auction_ids) == safe_limit else None
+    return result, next_cursor
+
+
+async def _delete_batch(session: AsyncSession, model: type[Base], *criteria, limit: int) -> int:
+    """Deletes up to ``limit`` matching rows, skipping rows other transactions hold locks on."""
+
+    batch_ids = (
+        select(model.id)
+        .where(*criteria)
+        .order_by(model.id)
+        .limit(max(int(limit), 1))
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await session.execute(delete(model).where(model.id.in_(batch_ids)))
+    return max(int(result.rowcount or 0), 0)
+
+
+async def rollup_preset_telemetry_events(
+    session: AsyncSession,
+    *,
+    created_before: datetime,
+    limit: int = 200,
+) -> int:
+    """Folds up to ``limit`` old preset telemetry events into hourly buckets, then deletes them."""
+
+    events = AdminQueuePresetTelemetryEvent
+    batch_ids = list(
+        (
+            await session.execute(
+                select(events.id)
+                .where(events.created_at < created_before)
+                .order_by(events.id)
+                .limit(max(int(limit), 1))
+                .with_for_update(skip_locked=True)
+            )
+        ).scalars()
+    )
+    if not batch_ids:
+        return 0
+
+    hourly = AdminQueuePresetTelemetryHourly
+    bucket_start = func.date_trunc("hour", events.created_at)
+    rollup = (
+        select(
+            bucket_start,
+            events.queue_context,
+            events.queue_key,
+            events.preset_id,
+            events.action,
+            func.count(),
+            func.coalesce(func.sum(events.time_to_action_ms), 0),
+            func.count(events.time_to_action_ms),
+            func.coalesce(func.sum(events.filter_churn_count), 0),
+            func.count().filter(events.reopen_signal.is_(True)),
+        )
+        .where(events.id.in_(batch_ids))
+        .group_by(bucket_start, events.queue_context, events.queue_key, events.preset_id, events.action)
+    )
+    stmt = pg_insert(hourly).from_select(
+        [
+            "bucket_start",
+            "queue_context",
+            "queue_key",
+            "preset_id",
+            "action",
+            "events_total",
+            "time_to_action_sum_ms",
+            "time_to_action_count",
+            "filter_churn_sum",
+            "reopen_total",
+        ],
+        rollup,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            hourly.bucket_start,
+            hourly.queue_context,
+            hourly.queue_key,
+            text("COALESCE(preset_id, 0)"),
+            hourly.action,
+        ],
+        set_={
+            "events_total": hourly.events_total + stmt.excluded.events_total,
+            "time_to_action_sum_ms": hourly.time_to_action_sum_ms + stmt.excluded.time_to_action_sum_ms,
+            "time_to_action_count": hourly.time_to_action_count + stmt.excluded.time_to_action_count,
+            "filter_churn_sum": hourly.filter_churn_sum + stmt.excluded.filter_churn_sum,
+            "reopen_total": hourly.reopen_total + stmt.excluded.reopen_total,
+        },
+    )
+    await session.execute(stmt)
+    result = await session.execute(delete(events).where(events.id.in_(batch_ids)))
+    return max(int(result.rowcount or 0), 0)
+
+
+async def prune_notification_snoozes(session: AsyncSession, *, expired_before: datetime, limit: int = 200) -> int:
+    return await _delete_batch(
+        session,
+        UserAuctionNotificationSnooze,
+        UserAuctionNotificationSnooze.expires_at < expired_before,
+        limit=limit,
+    )
+
+
+async def prune_chat_owner_service_events(
+    session: AsyncSession,
+    *,
+    created_before: datetime,
+    limit: int = 200,
+) -> int:
+    """Deletes old chat owner service events; ones still awaiting confirmation are kept."""
+
+    return await _delete_batch(
+        session,
+        ChatOwnerServiceEventAudit,
+        ChatOwnerServiceEventAudit.created_at < created_before,
+        or_(
+            ChatOwnerServiceEventAudit.requires_confirmation.is_(False),
+            ChatOwnerServiceEventAudit.resolved_at.is_not(None),
+        ),
+        limit=limit,
+    )
+
+
+async def prune_done_outbox_events(session: AsyncSession, *, finished_before: datetime, limit: int = 200) -> int:
+    """Deletes delivered outbox events; failed ones stay for inspection."""
+
+    return await _delete_batch(
+        session,
+        IntegrationOutbox,
+        IntegrationOutbox.status == IntegrationOutboxStatus.DONE,
+        IntegrationOutbox.updated_at < finished_before,
+        limit=limit,
+    )
+
+
+async def prune_retention_runs(session: AsyncSession, *, started_before: datetime, limit: int = 200) -> int:
+    """Deletes old run log rows, keeping the latest run of every policy for ``/retention``."""
+
+    latest_run_ids = select(func.max(RetentionRun.id)).group_by(RetentionRun.policy)
+    return await _delete_batch(
+        session,
+        RetentionRun,
+        RetentionRun.started_at < started_before,
+        RetentionRun.id.not_in(latest_run_ids),
+        limit=limit,
+    )
+
+
+# A batch runs in its own transaction and returns ``(rows_affected, next_cursor)``;
+# ``next_cursor`` is ``None`` once the policy has nothing left below its cutoff.
+RetentionBatch = Callable[[AsyncSession, datetime, int, Any], Awaitable[tuple[int, Any]]]
+
+
+@dataclass(slots=True, frozen=True)
+class RetentionPolicy:
+    name: str
+    tables: tuple[str, ...]
+    mode: str
+    horizon: Callable[[], timedelta]
+    run_batch: RetentionBatch
+    is_enabled: Callable[[], bool] = lambda: True
+
+
+def _drained(rows: int, limit: int) -> bool | None:
+    return True if rows >= limit else None
+
+
+async def _archive_auctions_batch(session: AsyncSession, cutoff: datetime, limit: int, cursor: Any) -> tuple[int, Any]:
+    result, next_cursor = await archive_closed_auctions(
+        session,
+        closed_before=cutoff,
+        after_auction_id=cursor,
+        limit=limit,
+    )
+    return result.moved, next_cursor
+
+
+async def _rollup_telemetry_batch(session: AsyncSession, cutoff: datetime, limit: int, _cursor: Any) -> tuple[int, Any]:
+    rows = await rollup_preset_telemetry_events(session, created_before=cutoff, limit=limit)
+    return rows, _drained(rows, limit)
+
+
+async def _prune_snoozes_batch(session: AsyncSession, cutoff: datetime, limit: int, _cursor: Any) -> tuple[int, Any]:
+    rows = await prune_notification_snoozes(session, expired_before=cutoff, limit=limit)
+    return rows, _drained(rows, limit)
+
+
+async def _prune_chat_owner_events_batch(
+    session: AsyncSession,
+    cutoff: datetime,
+    limit: int,
+    _cursor: Any,
+) -> tuple[int, Any]:
+    rows = await prune_chat_owner_service_events(session, created_before=cutoff, limit=limit)
+    return rows, _drained(rows, limit)
+
+
+async def _prune_outbox_batch(session: AsyncSession, cutoff: datetime, limit: int, _cursor: Any) -> tuple[int, Any]:
+    rows = await prune_done_outbox_events(session, finished_before=cutoff, limit=limit)
+    return rows, _drained(rows, limit)
+
+
+async def _prune_retention_runs_batch(
+    session: AsyncSession,
+    cutoff: datetime,
+    limit: int,
+    _cursor: Any,
+) -> tuple[int, Any]:
+    rows = await prune_retention_runs(session, started_before=cutoff, limit=limit)
+    return rows, _drained(rows, limit)
+
+
+RETENTION_POLICIES: tuple[RetentionPolicy, ...] = (
+    RetentionPolicy(
+        name="auction_history",
+        tables=("bids", "moderation_logs", "fraud_signals"),
+        mode="archive",
+        horizon=lambda: timedelta(days=max(settings.retention_archive_after_days, 1)),
+        run_batch=_archive_auctions_batch,
+        is_enabled=lambda: settings.retention_archive_auctions_enabled,
+    ),
+    RetentionPolicy(
+        name="preset_telemetry",
+        tables=("admin_queue_preset_telemetry_events",),
+        mode="rollup",
+        horizon=lambda: timedelta(days=max(settings.retention_telemetry_rollup_after_days, 1)),
+        run_batch=_rollup_telemetry_batch,
+    ),
+    RetentionPolicy(
+        name="notification_snoozes",
+        tables=("user_auction_notification_snoozes",),
+        mode="delete",
+        horizon=lambda: timedelta(days=max(settings.retention_notification_snooze_days, 0)),
+        run_batch=_prune_snoozes_batch,
+    ),
+    RetentionPolicy(
+        name="chat_owner_service_events",
+        tables=("chat_owner_service_events",),
+        mode="delete",
+        horizon=lambda: timedelta(days=max(settings.retention_chat_owner_events_days, 1)),
+        run_batch=_prune_chat_owner_events_batch,
+    ),
+    RetentionPolicy(
+        name="outbox_done",
+        tables=("integration_outbox",),
+        mode="delete",
+        horizon=lambda: timedelta(days=max(settings.retention_outbox_done_days, 1)),
+        run_batch=_prune_outbox_batch,
+    ),
+    RetentionPolicy(
+        name="retention_runs",
+        tables=("retention_runs",),
+        mode="delete",
+        horizon=lambda: timedelta(days=max(settings.retention_runs_days, 1)),
+        run_batch=_prune_retention_runs_batch,
+    ),
+)
+
+
+def record_retention_run(
+    session: AsyncSession,
+    *,
+    policy: str,
+    rows_affected: int,
+    batches: int,
+    started_at: datetime,
+    finished_at: datetime,
+    error: str | None = None,
+) -> None:
+    session.add(
+        RetentionRun(
+            policy=policy,
+            status="ok" if error is None else "error",
+            rows_affected=rows_affected,
+            batches=batches,
+            error=error[:1000] if error is not None else None,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+    )
+
+
+@dataclass(slots=True)
+class RetentionTableSize:
+    table: str
+    total_bytes: int
+    estimated_rows: int
+
+
+@dataclass(slots=True)
+class RetentionPolicyStatus:
+    policy: RetentionPolicy
+    enabled: bool
+    last_run: RetentionRun | None
+
+
+@read_only
+async def load_retention_overview(
+    session: AsyncSession,
+) -> tuple[list[RetentionPolicyStatus], list[RetentionTableSize]]:
+    """Policies with their latest run, plus sizes of every table retention touches."""
+
+    latest_run_ids = (
+        select(func.max(RetentionRun.id).label("id")).group_by(RetentionRun.policy).subquery()
+    )
+    runs = {
+        run.policy: run
+        for run in (
+            await session.execute(select(RetentionRun).where(RetentionRun.id.in_(select(latest_run_ids.c.id))))
+        ).scalars()
+    }
+    statuses = [
+        RetentionPolicyStatus(policy=policy, enabled=policy.is_enabled(), last_run=runs.get(policy.name))
+        for policy in RETENTION_POLICIES
+    ]
+
+    tables = [table for policy in RETENTION_POLICIES for table in policy.tables]
+    tables.extend(
+        (
+            BidArchive.__tablename__,
+            ModerationLogArchive.__tablename__,
+            FraudSignalArchive.__tablename__,
+            AdminQueuePresetTelemetryHourly.__tablename__,
+        )
+    )
+    rows = (
+        await session.execute(
+            text(
+                "SELECT c.relname AS table_name, pg_total_relation_size(c.oid) AS total_bytes,"
+                " GREATEST(c.reltuples, 0)::bigint AS estimated_rows"
+                " FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace"
+                " WHERE c.relkind IN ('r', 'p') AND n.nspname = current_schema() AND c.relname = ANY(:tables)"
+            ),
+            {"tables": tables},
+        )
+    ).all()
+    sizes_by_table = {
+        row.table_name: RetentionTableSize(
+            table=row.table_name,
+            total_bytes=int(row.total_bytes),
+            estimated_rows=int(row.estimated_rows),
+        )
+        for row in rows
+    }
+    sizes = [sizes_by_table[table] for table in tables if table in sizes_by_table]
+    return statuses, sizes
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+
+from app.config import settings
+from app.db.session import SessionFactory
+from app.infra.metrics import WATCHER_LOOP_SECONDS
+from app.services.retention_service import RETENTION_POLICIES, RetentionPolicy, record_retention_run
+
+logger = logging.getLogger(__name__)
+
+
+async def run_retention_policy(policy: RetentionPolicy, *, now: datetime | None = None) -> int:
+    """Drains one policy in short per-batch transactions and logs the run.
+
+    Each batch commits on its own so row locks are held for one batch only; a failed
+    batch ends the run, keeps what earlier batches did and is recorded as an error.
+    """
+
+    started_at = datetime.now(UTC)
+    cutoff = (now or started_at) - policy.horizon()
+    batch_size = max(settings.retention_batch_size, 1)
+    pause_seconds = max(settings.retention_batch_pause_ms, 0) / 1000
+    rows_affected = 0
+    batches = 0
+    cursor = None
+    error: str | None = None
+    try:
+        while True:
+            async with SessionFactory() as session:
+                async with session.begin():
+                    rows, cursor = await policy.run_batch(session, cutoff, batch_size, cursor)
+            rows_affected += rows
+            batches += 1
+            if cursor is None:
+                break
+            if pause_seconds:
+                await asyncio.sleep(pause_seconds)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        logger.exception("Retention policy failed policy=%s: %s", policy.name, exc)
+
+    async with SessionFactory() as session:
+        async with session.begin():
+            record_retention_run(
+                session,
+                policy=policy.name,
+                rows_affected=rows_affected,
+                batches=batches,
+                started_at=started_at,
+                finished_at=datetime.now(UTC),
+                error=error,
+            )
+    if rows_affected:
+        logger.info("Retention policy=%s rows=%s batches=%s", policy.name, rows_affected, batches)
+    return rows_affected
+
+
+async def run_retention_pass(*, now: datetime | None = None) -> dict[str, int]:
+    """Runs every enabled policy once; returns rows affected per policy."""
+
+    return {
+        policy.name: await run_retention_policy(policy, now=now)
+        for policy in RETENTION_POLICIES
+        if policy.is_enabled()
+    }
+
+
+async def run_retention_watcher() -> None:
+    interval = max(settings.retention_interval_seconds, 1)
+    while True:
+        started = time.perf_counter()
+        try:
+            await run_retention_pass()
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="retention", outcome="ok")
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            WATCHER_LOOP_SECONDS.observe(time.perf_counter() - started, watcher="retention", outcome="error")
+            logger.exception("Retention watcher failed: %s", exc)
+            await asyncio.sleep(interval)
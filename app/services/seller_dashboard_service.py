@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.enums import AuctionStatus
 from app.db.models import Auction, AuctionPost, Bid, User
+from app.db.session import read_only
 
 
 @dataclass(slots=True)
@@ -57,6 +58,7 @@ def is_valid_my_auctions_sort(sort_key: str) -> bool:
     return sort_key in _SORT_OPTIONS
 
 
+@read_only
 async def list_seller_auctions(
     session: AsyncSession,
     *,
@@ -68,38 +70,20 @@ async def list_seller_auctions(
 ) -> tuple[list[SellerAuctionListItem], int]:
     statuses = _FILTER_STATUSES.get(filter_key)
 
-    bid_stats_subquery = (
-        select(
-            Bid.auction_id.label("auction_id"),
-            func.max(Bid.amount).label("max_bid"),
-            func.count(Bid.id).label("bid_count"),
-        )
-        .where(Bid.is_removed.is_(False))
-        .group_by(Bid.auction_id)
-        .subquery()
-    )
-
     count_stmt = select(func.count(Auction.id)).where(Auction.seller_user_id == seller_user_id)
     if statuses is not None:
         count_stmt = count_stmt.where(Auction.status.in_(statuses))
     total_items = int((await session.scalar(count_stmt)) or 0)
 
-    bid_count_expr = func.coalesce(bid_stats_subquery.c.bid_count, 0)
-    current_price_expr = func.coalesce(bid_stats_subquery.c.max_bid, Auction.start_price)
-
-    list_stmt = (
-        select(
-            Auction.id,
-            Auction.status,
-            Auction.start_price,
-            current_price_expr,
-            bid_count_expr,
-            Auction.ends_at,
-            Auction.created_at,
-        )
-        .outerjoin(bid_stats_subquery, bid_stats_subquery.c.auction_id == Auction.id)
-        .where(Auction.seller_user_id == seller_user_id)
-    )
+    list_stmt = select(
+        Auction.id,
+        Auction.status,
+        Auction.start_price,
+        Auction.current_price,
+        Auction.bid_count,
+        Auction.ends_at,
+        Auction.created_at,
+    ).where(Auction.seller_user_id == seller_user_id)
     if statuses is not None:
         list_stmt = list_stmt.where(Auction.status.in_(statuses))
 
@@ -110,7 +94,7 @@ async def list_seller_auctions(
             Auction.created_at.desc(),
         )
     elif sort_key == "b":
-        list_stmt = list_stmt.order_by(bid_count_expr.desc(), Auction.created_at.desc())
+        list_stmt = list_stmt.order_by(Auction.bid_count.desc(), Auction.created_at.desc())
     else:
         list_stmt = list_stmt.order_by(Auction.created_at.desc())
 
@@ -138,29 +122,15 @@ async def load_seller_auction(
     seller_user_id: int,
     auction_id: uuid.UUID,
 ) -> SellerAuctionListItem | None:
-    bid_stats_subquery = (
-        select(
-            Bid.auction_id.label("auction_id"),
-            func.max(Bid.amount).label("max_bid"),
-            func.count(Bid.id).label("bid_count"),
-        )
-        .where(Bid.is_removed.is_(False))
-        .group_by(Bid.auction_id)
-        .subquery()
-    )
-    stmt = (
-        select(
-            Auction.id,
-            Auction.status,
-            Auction.start_price,
-            func.coalesce(bid_stats_subquery.c.max_bid, Auction.start_price),
-            func.coalesce(bid_stats_subquery.c.bid_count, 0),
-            Auction.ends_at,
-            Auction.created_at,
-        )
-        .outerjoin(bid_stats_subquery, bid_stats_subquery.c.auction_id == Auction.id)
-        .where(Auction.id == auction_id, Auction.seller_user_id == seller_user_id)
-    )
+    stmt = select(
+        Auction.id,
+        Auction.status,
+        Auction.start_price,
+        Auction.current_price,
+        Auction.bid_count,
+        Auction.ends_at,
+        Auction.created_at,
+    ).where(Auction.id == auction_id, Auction.seller_user_id == seller_user_id)
     row = (await session.execute(stmt)).first()
     if row is None:
         return None
@@ -208,6 +178,7 @@ async def list_seller_auction_posts(
     ]
 
 
+@read_only
 async def list_seller_auction_bid_logs(
     session: AsyncSession,
     *,
@@ -8,7 +8,18 @@ from typing import Iterable
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Auction, Bid, Complaint, FraudSignal, ModerationLog, User
+from app.db.models import (
+    Auction,
+    Bid,
+    BidArchive,
+    Complaint,
+    FraudSignal,
+    FraudSignalArchive,
+    ModerationLog,
+    ModerationLogArchive,
+    User,
+)
+from app.db.session import read_only
 
 
 @dataclass(slots=True)
@@ -77,6 +88,47 @@ def _normalize_sources(sources: Iterable[str] | None) -> set[str]:
     return normalized
 
 
+async def _count_with_archive(
+    session: AsyncSession,
+    live_model,
+    archive_model,
+    *,
+    auction_id: uuid.UUID,
+    resolved_only: bool = False,
+) -> int:
+    total = 0
+    for model in (live_model, archive_model):
+        stmt = select(func.count(model.id)).where(model.auction_id == auction_id)
+        if resolved_only:
+            stmt = stmt.where(model.resolved_at.is_not(None))
+        total += int(await session.scalar(stmt) or 0)
+    return total
+
+
+async def _load_with_archive(
+    session: AsyncSession,
+    live_model,
+    archive_model,
+    *,
+    auction_id: uuid.UUID,
+    max_per_source: int | None,
+) -> list:
+    """Rows of one source from the live table and its retention archive, oldest first."""
+
+    rows: list = []
+    for model in (live_model, archive_model):
+        query = (
+            select(model)
+            .where(model.auction_id == auction_id)
+            .order_by(model.created_at.asc(), model.id.asc())
+        )
+        if max_per_source is not None:
+            query = query.limit(max_per_source)
+        rows.extend((await session.execute(query)).scalars().all())
+    rows.sort(key=lambda row: (row.created_at, row.id))
+    return rows if max_per_source is None else rows[:max_per_source]
+
+
 async def _count_timeline_events(
     session: AsyncSession,
     auction: Auction,
@@ -90,9 +142,7 @@ async def _count_timeline_events(
             total += 1
 
     if TIMELINE_SOURCE_BID in included_sources:
-        total += int(
-            await session.scalar(select(func.count(Bid.id)).where(Bid.auction_id == auction.id)) or 0
-        )
+        total += await _count_with_archive(session, Bid, BidArchive, auction_id=auction.id)
 
     if TIMELINE_SOURCE_COMPLAINT in included_sources:
         total += int(
@@ -109,27 +159,17 @@ async def _count_timeline_events(
         )
 
     if TIMELINE_SOURCE_FRAUD in included_sources:
-        total += int(
-            await session.scalar(select(func.count(FraudSignal.id)).where(FraudSignal.auction_id == auction.id))
-            or 0
-        )
-        total += int(
-            await session.scalar(
-                select(func.count(FraudSignal.id)).where(
-                    FraudSignal.auction_id == auction.id,
-                    FraudSignal.resolved_at.is_not(None),
-                )
-            )
-            or 0
+        total += await _count_with_archive(session, FraudSignal, FraudSignalArchive, auction_id=auction.id)
+        total += await _count_with_archive(
+            session,
+            FraudSignal,
+            FraudSignalArchive,
+            auction_id=auction.id,
+            resolved_only=True,
         )
 
     if TIMELINE_SOURCE_MODERATION in included_sources:
-        total += int(
-            await session.scalar(
-                select(func.count(ModerationLog.id)).where(ModerationLog.auction_id == auction.id)
-            )
-            or 0
-        )
+        total += await _count_with_archive(session, ModerationLog, ModerationLogArchive, auction_id=auction.id)
 
     return total
 
@@ -141,20 +181,19 @@ async def _build_timeline_events(
     *,
     max_per_source: int | None,
 ) -> list[AuctionTimelineItem]:
-    bids: list[Bid] = []
+    bids: list[Bid | BidArchive] = []
     complaints: list[Complaint] = []
-    signals: list[FraudSignal] = []
-    mod_logs: list[ModerationLog] = []
+    signals: list[FraudSignal | FraudSignalArchive] = []
+    mod_logs: list[ModerationLog | ModerationLogArchive] = []
 
     if TIMELINE_SOURCE_BID in included_sources:
-        bid_query = (
-            select(Bid)
-            .where(Bid.auction_id == auction.id)
-            .order_by(Bid.created_at.asc(), Bid.id.asc())
+        bids = await _load_with_archive(
+            session,
+            Bid,
+            BidArchive,
+            auction_id=auction.id,
+            max_per_source=max_per_source,
         )
-        if max_per_source is not None:
-            bid_query = bid_query.limit(max_per_source)
-        bids = list((await session.execute(bid_query)).scalars().all())
 
     if TIMELINE_SOURCE_COMPLAINT in included_sources:
         complaint_query = (
@@ -167,24 +206,22 @@ async def _build_timeline_events(
         complaints = list((await session.execute(complaint_query)).scalars().all())
 
     if TIMELINE_SOURCE_FRAUD in included_sources:
-        signal_query = (
-            select(FraudSignal)
-            .where(FraudSignal.auction_id == auction.id)
-            .order_by(FraudSignal.created_at.asc(), FraudSignal.id.asc())
+        signals = await _load_with_archive(
+            session,
+            FraudSignal,
+            FraudSignalArchive,
+            auction_id=auction.id,
+            max_per_source=max_per_source,
         )
-        if max_per_source is not None:
-            signal_query = signal_query.limit(max_per_source)
-        signals = list((await session.execute(signal_query)).scalars().all())
 
     if TIMELINE_SOURCE_MODERATION in included_sources:
-        moderation_query = (
-            select(ModerationLog)
-            .where(ModerationLog.auction_id == auction.id)
-            .order_by(ModerationLog.created_at.asc(), ModerationLog.id.asc())
+        mod_logs = await _load_with_archive(
+            session,
+            ModerationLog,
+            ModerationLogArchive,
+            auction_id=auction.id,
+            max_per_source=max_per_source,
         )
-        if max_per_source is not None:
-            moderation_query = moderation_query.limit(max_per_source)
-        mod_logs = list((await session.execute(moderation_query)).scalars().all())
 
     user_ids: set[int] = set()
     if TIMELINE_SOURCE_AUCTION in included_sources:
@@ -329,6 +366,7 @@ async def _build_timeline_events(
     return timeline
 
 
+@read_only
 async def build_auction_timeline_page(
     session: AsyncSession,
     auction_id: uuid.UUID,
@@ -366,6 +404,7 @@ async def build_auction_timeline_page(
     return auction, timeline[offset : offset + limit], total_items
 
 
+@read_only
 async def build_auction_timeline(
     session: AsyncSession,
     auction_id: uuid.UUID,
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import json
+import logging
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.enums import AuctionStatus
-from app.db.models import Auction, TradeFeedback, User
+from app.db.models import Auction, TradeFeedback, User, UserReputationSummary
+from app.infra.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+_RATINGS = range(1, 6)
 
 
 @dataclass(slots=True)
@@ -36,6 +47,7 @@ class TradeFeedbackSummary:
     visible_received: int
     hidden_received: int
     average_visible_rating: float | None
+    visible_rating_histogram: tuple[int, ...] = (0, 0, 0, 0, 0)
 
 
 @dataclass(slots=True, frozen=True)
@@ -56,6 +68,57 @@ def _normalize_comment(comment: str | None) -> str | None:
     return normalized
 
 
+def _summary_delta(*, rating: int, status: str, sign: int) -> dict[str, int]:
+    if status != "VISIBLE":
+        return {"total_received": sign, "hidden_received": sign}
+    return {
+        "total_received": sign,
+        "visible_received": sign,
+        "visible_rating_sum": sign * rating,
+        f"visible_rating_{rating}": sign,
+    }
+
+
+async def _apply_summary_delta(session: AsyncSession, *, user_id: int, delta: dict[str, int]) -> None:
+    """Adds ``delta`` to the user's reputation summary row, creating it if needed."""
+
+    delta = {name: value for name, value in delta.items() if value}
+    if not delta:
+        return
+    now = datetime.now(UTC)
+    await session.execute(
+        insert(UserReputationSummary)
+        .values(user_id=user_id, updated_at=now, **{name: max(value, 0) for name, value in delta.items()})
+        .on_conflict_do_update(
+            index_elements=[UserReputationSummary.user_id],
+            set_={
+                **{name: getattr(UserReputationSummary, name) + value for name, value in delta.items()},
+                "updated_at": now,
+            },
+        )
+    )
+
+
+async def _move_summary_contribution(
+    session: AsyncSession,
+    *,
+    before: tuple[int, int, str] | None,
+    after: tuple[int, int, str],
+) -> None:
+    """Moves one feedback's contribution from ``before`` to ``after`` (target, rating, status)."""
+
+    deltas: dict[int, dict[str, int]] = {}
+    for contribution, sign in ((before, -1), (after, 1)):
+        if contribution is None:
+            continue
+        user_id, rating, status = contribution
+        user_delta = deltas.setdefault(user_id, {})
+        for name, value in _summary_delta(rating=rating, status=status, sign=sign).items():
+            user_delta[name] = user_delta.get(name, 0) + value
+    for user_id, delta in sorted(deltas.items()):
+        await _apply_summary_delta(session, user_id=user_id, delta=delta)
+
+
 async def submit_trade_feedback(
     session: AsyncSession,
     *,
@@ -93,10 +156,12 @@ async def submit_trade_feedback(
         .with_for_update()
     )
     if item is not None:
+        before = (item.target_user_id, item.rating, item.status)
         item.target_user_id = target_user_id
         item.rating = rating
         item.comment = normalized_comment
         item.updated_at = now
+        await _move_summary_contribution(session, before=before, after=(target_user_id, rating, item.status))
         return TradeFeedbackSubmitResult(True, "Отзыв обновлен", item=item, updated=True)
 
     created = TradeFeedback(
@@ -110,6 +175,7 @@ async def submit_trade_feedback(
     )
     session.add(created)
     await session.flush()
+    await _move_summary_contribution(session, before=None, after=(target_user_id, rating, created.status))
     return TradeFeedbackSubmitResult(True, "Отзыв сохранен", item=created, created=True)
 
 
@@ -138,6 +204,11 @@ async def set_trade_feedback_visibility(
         )
 
     now = datetime.now(UTC)
+    await _move_summary_contribution(
+        session,
+        before=(item.target_user_id, item.rating, previous_status),
+        after=(item.target_user_id, item.rating, target_status),
+    )
     item.status = target_status
     item.moderator_user_id = moderator_user_id
     item.moderation_note = (note or "").strip() or None
@@ -153,33 +224,122 @@ async def set_trade_feedback_visibility(
     )
 
 
-async def get_trade_feedback_summary(
-    session: AsyncSession,
-    *,
-    target_user_id: int,
-) -> TradeFeedbackSummary:
-    rows = (
-        await session.execute(
-            select(TradeFeedback.rating, TradeFeedback.status).where(TradeFeedback.target_user_id == target_user_id)
-        )
-    ).all()
+def _summary_cache_key(user_id: int) -> str:
+    return f"trade_feedback:summary:{user_id}"
+
 
-    total_received = len(rows)
-    visible_ratings = [int(rating) for rating, status in rows if status == "VISIBLE"]
-    visible_received = len(visible_ratings)
-    hidden_received = total_received - visible_received
+def _summary_from_row(row: UserReputationSummary | None) -> TradeFeedbackSummary:
+    if row is None:
+        return TradeFeedbackSummary(
+            total_received=0,
+            visible_received=0,
+            hidden_received=0,
+            average_visible_rating=None,
+        )
     average_visible_rating = None
-    if visible_ratings:
-        average_visible_rating = sum(visible_ratings) / len(visible_ratings)
+    if row.visible_received > 0:
+        average_visible_rating = row.visible_rating_sum / row.visible_received
+    return TradeFeedbackSummary(
+        total_received=row.total_received,
+        visible_received=row.visible_received,
+        hidden_received=row.hidden_received,
+        average_visible_rating=average_visible_rating,
+        visible_rating_histogram=tuple(getattr(row, f"visible_rating_{rating}") for rating in _RATINGS),
+    )
 
+
+async def _rollup_summary(session: AsyncSession, user_id: int) -> TradeFeedbackSummary:
+    """Aggregates feedback rows of a user who has no summary row yet (normally none)."""
+
+    visible = TradeFeedback.status == "VISIBLE"
+    row = (
+        await session.execute(
+            select(
+                func.count(),
+                func.count().filter(visible),
+                func.coalesce(func.sum(TradeFeedback.rating).filter(visible), 0),
+                *(func.count().filter(visible, TradeFeedback.rating == rating) for rating in _RATINGS),
+            ).where(TradeFeedback.target_user_id == user_id)
+        )
+    ).one()
+    total_received, visible_received, visible_rating_sum, *histogram = (int(value) for value in row)
     return TradeFeedbackSummary(
         total_received=total_received,
         visible_received=visible_received,
-        hidden_received=hidden_received,
-        average_visible_rating=average_visible_rating,
+        hidden_received=total_received - visible_received,
+        average_visible_rating=visible_rating_sum / visible_received if visible_received else None,
+        visible_rating_histogram=tuple(histogram),
     )
 
 
+async def _read_cached_summary(user_id: int) -> TradeFeedbackSummary | None:
+    try:
+        raw = await redis_client.get(_summary_cache_key(user_id))
+    except RedisError as exc:
+        logger.warning("trade_feedback_summary_cache_unavailable op=get user_id=%s error=%s", user_id, exc)
+        return None
+    if raw is None:
+        return None
+    payload = json.loads(raw)
+    payload["visible_rating_histogram"] = tuple(payload["visible_rating_histogram"])
+    return TradeFeedbackSummary(**payload)
+
+
+async def _write_cached_summary(user_id: int, summary: TradeFeedbackSummary) -> None:
+    payload = {
+        "total_received": summary.total_received,
+        "visible_received": summary.visible_received,
+        "hidden_received": summary.hidden_received,
+        "average_visible_rating": summary.average_visible_rating,
+        "visible_rating_histogram": list(summary.visible_rating_histogram),
+    }
+    try:
+        await redis_client.set(
+            _summary_cache_key(user_id),
+            json.dumps(payload),
+            ex=settings.trade_feedback_summary_cache_ttl_seconds,
+        )
+    except RedisError as exc:
+        logger.warning("trade_feedback_summary_cache_unavailable op=set user_id=%s error=%s", user_id, exc)
+
+
+async def invalidate_trade_feedback_summary_cache(user_ids: Iterable[int]) -> None:
+    """Drops cached summaries; call after the transaction that changed feedback commits."""
+
+    keys = [_summary_cache_key(user_id) for user_id in sorted(set(user_ids))]
+    if not keys or settings.trade_feedback_summary_cache_ttl_seconds <= 0:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except RedisError as exc:
+        logger.warning("trade_feedback_summary_cache_unavailable op=delete users=%s error=%s", len(keys), exc)
+
+
+async def get_trade_feedback_summary(
+    session: AsyncSession,
+    *,
+    target_user_id: int,
+) -> TradeFeedbackSummary:
+    """Reads the user's reputation summary through the Redis cache.
+
+    A cache miss costs one primary-key read of ``user_reputation_summaries``, however
+    much feedback the user has received. Users without a summary row fall back to
+    aggregating their feedback rows, of which there are normally none.
+    """
+
+    cache_enabled = settings.trade_feedback_summary_cache_ttl_seconds > 0
+    if cache_enabled:
+        cached = await _read_cached_summary(target_user_id)
+        if cached is not None:
+            return cached
+
+    row = await session.get(UserReputationSummary, target_user_id)
+    summary = _summary_from_row(row) if row is not None else await _rollup_summary(session, target_user_id)
+    if cache_enabled:
+        await _write_cached_summary(target_user_id, summary)
+    return summary
+
+
 async def list_received_trade_feedback(
     session: AsyncSession,
     *,
@@ -38,6 +38,11 @@ from app.db.models import (
     UserRoleAssignment,
 )
 from app.db.session import SessionFactory
+from app.infra.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    REGISTRY as METRICS_REGISTRY,
+    is_metrics_request_authorized,
+)
 from app.services.appeal_service import (
     mark_appeal_in_review,
     reject_appeal,
@@ -92,18 +97,13 @@ from app.services.moderation_service import (
 )
 from app.services.points_service import (
     count_user_points_entries,
-    get_points_redemption_account_age_remaining_seconds,
-    get_points_redemptions_spent_today,
-    get_points_redemptions_spent_this_week,
-    get_points_redemptions_spent_this_month,
-    get_points_redemptions_used_today,
-    get_points_redemptions_used_this_week,
-    get_user_points_summary,
     grant_points,
     list_user_points_entries,
 )
-from app.services.queue_sla_health_service import SLA_THRESHOLDS_BY_CONTEXT, decide_queue_sla_health
+from app.services.queue_sla_health_service import decide_queue_sla_health, queue_sla_bucket_ranges
+from app.services.redemption_policy_service import redemption_policy_engine
 from app.services.risk_eval_service import UserRiskSnapshot, evaluate_user_risk_snapshot, format_risk_reason_label
+from app.services.retention_service import load_retention_overview
 from app.services.runtime_settings_service import (
     build_runtime_settings_snapshot,
     delete_runtime_setting_override,
@@ -111,6 +111,7 @@ from app.services.runtime_settings_service import (
 )
 from app.services.trade_feedback_service import (
     get_trade_feedback_summary,
+    invalidate_trade_feedback_summary_cache,
     list_received_trade_feedback,
     set_trade_feedback_visibility,
 )
@@ -148,7 +149,7 @@ _QUEUE_ALLOWED_COLUMNS: dict[str, tuple[str, ...]] = {
         "moderated",
         "actions",
     ),
-    "auctions": ("id", "seller", "risk", "start", "buyout", "status", "ends_at", "actions"),
+    "auctions": ("id", "seller", "risk", "start", "buyout", "price", "bids", "status", "ends_at", "actions"),
     "manage_users": (
         "id",
         "tg_user_id",
@@ -193,6 +194,15 @@ def _fmt_ts(value: datetime | None) -> str:
     return value.astimezone(_timezone()).strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _fmt_bytes(value: int) -> str:
+    size = float(value)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
 def _pct(numerator: int, denominator: int) -> str:
     if denominator <= 0:
         return "0.0%"
@@ -1666,6 +1676,15 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics(request: Request) -> Response:
+    if not METRICS_REGISTRY.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    if not is_metrics_request_authorized(request.headers.get("authorization")):
+        return Response(status_code=401, content="unauthorized\n", media_type="text/plain")
+    return Response(content=METRICS_REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request) -> Response:
     auth = get_admin_auth_context(request)
@@ -1801,6 +1820,7 @@ async def dashboard(request: Request) -> Response:
     if auth.role == "owner":
         owner_settings_link = (
             f"<a class='link-tile' href='{escape(_path_with_auth(request, '/settings'))}'>Runtime settings</a>"
+            f"<a class='link-tile' href='{escape(_path_with_auth(request, '/retention'))}'>Retention</a>"
         )
 
     overview_cards = _kpi_grid(
@@ -2093,6 +2113,76 @@ async def action_delete_runtime_setting(
     return RedirectResponse(_path_with_auth(request, target), status_code=303)
 
 
+@app.get("/retention", response_class=HTMLResponse)
+async def retention_page(request: Request) -> Response:
+    response, auth = _require_owner_permission(request)
+    if response is not None:
+        return response
+
+    async with SessionFactory() as session:
+        statuses, sizes = await load_retention_overview(session)
+
+    policy_rows: list[str] = []
+    for status in statuses:
+        policy = status.policy
+        run = status.last_run
+        if run is None:
+            run_cells = "<td colspan=4><span class='empty-state'>never run</span></td>"
+        else:
+            outcome = escape(run.status) if run.error is None else f"{escape(run.status)}: {escape(run.error)}"
+            run_cells = (
+                f"<td>{escape(_fmt_ts(run.finished_at))}</td>"
+                f"<td>{run.rows_affected}</td>"
+                f"<td>{run.batches}</td>"
+                f"<td>{outcome}</td>"
+            )
+        policy_rows.append(
+            "<tr>"
+            f"<td><code>{escape(policy.name)}</code></td>"
+            f"<td>{escape(', '.join(policy.tables))}</td>"
+            f"<td>{escape(policy.mode)}</td>"
+            f"<td>{policy.horizon().days}d</td>"
+            f"<td>{'yes' if status.enabled else 'no'}</td>"
+            f"{run_cells}"
+            "</tr>"
+        )
+
+    size_rows = [
+        "<tr>"
+        f"<td><code>{escape(size.table)}</code></td>"
+        f"<td>{escape(_fmt_bytes(size.total_bytes))}</td>"
+        f"<td>~{size.estimated_rows}</td>"
+        "</tr>"
+        for size in sizes
+    ]
+
+    empty_sizes_row = "<tr><td colspan=3><span class='empty-state'>Нет данных</span></td></tr>"
+    watcher_state = "enabled" if settings.retention_enabled else "disabled (RETENTION_ENABLED=false)"
+    body = (
+        f"{_render_app_header('Retention', auth, 'Per-table retention policies and compaction runs')}"
+        "<div class='section-card'>"
+        f"<div class='notice'><p>Retention watcher: {escape(watcher_state)}, "
+        f"every {settings.retention_interval_seconds}s in batches of {settings.retention_batch_size}.</p></div>"
+        "<div class='table-wrap'><table><thead><tr>"
+        "<th>Policy</th><th>Tables</th><th>Mode</th><th>Horizon</th><th>Enabled</th>"
+        "<th>Last run</th><th>Rows</th><th>Batches</th><th>Outcome</th>"
+        "</tr></thead>"
+        f"<tbody>{''.join(policy_rows)}</tbody>"
+        "</table></div>"
+        "</div>"
+        "<div class='section-card'>"
+        "<h2>Table sizes</h2>"
+        "<div class='table-wrap'><table><thead><tr>"
+        "<th>Table</th><th>Total size</th><th>Rows (estimate)</th>"
+        "</tr></thead>"
+        f"<tbody>{''.join(size_rows) or empty_sizes_row}</tbody>"
+        "</table></div>"
+        f"<p class='page-links'><a href='{escape(_path_with_auth(request, '/'))}'>На главную</a></p>"
+        "</div>"
+    )
+    return HTMLResponse(_render_page("Retention", body))
+
+
 @app.get("/complaints", response_class=HTMLResponse)
 async def complaints(
     request: Request,
@@ -2752,13 +2842,15 @@ async def auctions(
             f"<td data-col='risk'>{_risk_snapshot_inline_html(seller_risk)}</td>"
             f"<td data-col='start'>${item.start_price}</td>"
             f"<td data-col='buyout'>${item.buyout_price if item.buyout_price is not None else '-'}</td>"
+            f"<td data-col='price'>${item.current_price}</td>"
+            f"<td data-col='bids'>{item.bid_count}</td>"
             f"<td data-col='status'>{escape(str(item.status))}</td>"
             f"<td data-col='ends_at'>{escape(_fmt_ts(item.ends_at))}</td>"
             f"<td data-col='actions'><a href='{escape(_path_with_auth(request, f'/manage/auction/{item.id}'))}'>Управлять</a></td>"
             "</tr>"
         )
     if not table_rows:
-        table_rows = "<tr><td colspan='8'><span class='empty-state'>Нет записей</span></td></tr>"
+        table_rows = "<tr><td colspan='10'><span class='empty-state'>Нет записей</span></td></tr>"
 
     prev_link = (
         f"<a href='{escape(_path_with_auth(request, _auctions_path(page_value=page-1, status_value=status)))}'>← Назад</a>"
@@ -2790,7 +2882,7 @@ async def auctions(
         f"<p class='page-links'><a href='{escape(_path_with_auth(request, '/'))}'>На главную</a></p>"
         f"{dense_toolbar}"
         f"<div class='toolbar'><span>Фильтр:</span> {status_chips}</div>"
-        f"<div class='table-wrap dense-list-shell' data-dense-list='{escape(dense_config.table_id)}' data-density='{escape(dense_config.density)}'><table id='{escape(dense_config.table_id)}'><thead><tr><th data-col='id'>ID</th><th data-col='seller'>Seller UID</th><th data-col='risk'>Seller Risk</th><th data-col='start'>Start</th><th data-col='buyout'>Buyout</th><th data-col='status'>Status</th><th data-col='ends_at'>Ends At</th><th data-col='actions'>Actions</th></tr></thead>"
+        f"<div class='table-wrap dense-list-shell' data-dense-list='{escape(dense_config.table_id)}' data-density='{escape(dense_config.density)}'><table id='{escape(dense_config.table_id)}'><thead><tr><th data-col='id'>ID</th><th data-col='seller'>Seller UID</th><th data-col='risk'>Seller Risk</th><th data-col='start'>Start</th><th data-col='buyout'>Buyout</th><th data-col='price'>Price</th><th data-col='bids'>Bids</th><th data-col='status'>Status</th><th data-col='ends_at'>Ends At</th><th data-col='actions'>Actions</th></tr></thead>"
         f"<tbody>{table_rows}</tbody></table></div>"
         f"{_pager_html(prev_link, next_link)}"
         f"{render_dense_list_script(dense_config)}"
@@ -3117,7 +3209,8 @@ async def manage_user(
             )
         ).scalars().all()
 
-        points_summary = await get_user_points_summary(session, user_id=user.id)
+        redemption_snapshot = await redemption_policy_engine.load_snapshot(session, user_id=user.id, now=now)
+        points_summary = redemption_snapshot.summary
         points_total_items = await count_user_points_entries(
             session,
             user_id=user.id,
@@ -3193,37 +3286,12 @@ async def manage_user(
             + boost_guarantor_points_spent_total
             + boost_appeal_points_spent_total
         )
-        redemptions_used_today = await get_points_redemptions_used_today(
-            session,
-            user_id=user.id,
-            now=now,
-        )
-        redemptions_used_this_week = await get_points_redemptions_used_this_week(
-            session,
-            user_id=user.id,
-            now=now,
-        )
-        redemptions_spent_today = await get_points_redemptions_spent_today(
-            session,
-            user_id=user.id,
-            now=now,
-        )
-        redemptions_spent_this_week = await get_points_redemptions_spent_this_week(
-            session,
-            user_id=user.id,
-            now=now,
-        )
-        redemptions_spent_this_month = await get_points_redemptions_spent_this_month(
-            session,
-            user_id=user.id,
-            now=now,
-        )
-        min_account_age_remaining = await get_points_redemption_account_age_remaining_seconds(
-            session,
-            user_id=user.id,
-            min_account_age_seconds=settings.points_redemption_min_account_age_seconds,
-            now=now,
-        )
+        redemptions_used_today = redemption_snapshot.used_today
+        redemptions_used_this_week = redemption_snapshot.used_this_week
+        redemptions_spent_today = redemption_snapshot.spent_today
+        redemptions_spent_this_week = redemption_snapshot.spent_this_week
+        redemptions_spent_this_month = redemption_snapshot.spent_this_month
+        min_account_age_remaining = redemption_snapshot.account_age_remaining_seconds
 
         trade_feedback_summary = await get_trade_feedback_summary(session, target_user_id=user.id)
         trade_feedback_received = await list_received_trade_feedback(session, target_user_id=user.id, limit=10)
@@ -4011,7 +4079,7 @@ async def appeals(
     sla_health_value = _parse_appeal_sla_health_filter(sla_health)
     aging_value = _parse_appeal_aging_bucket_filter(aging)
     now = datetime.now(UTC)
-    appeal_sla_thresholds = SLA_THRESHOLDS_BY_CONTEXT["appeals"]
+    appeal_sla_ranges = queue_sla_bucket_ranges("appeals", now=now)
     active_appeal_statuses = [AppealStatus.OPEN, AppealStatus.IN_REVIEW]
     overdue_clause = and_(
         Appeal.status.in_(active_appeal_statuses),
@@ -4045,28 +4113,13 @@ async def appeals(
             )
         )
 
-    warning_cutoff = now + appeal_sla_thresholds.warning_window
-    critical_cutoff = now + appeal_sla_thresholds.critical_window
-    if sla_health_value == "healthy":
-        stmt = stmt.where(
-            Appeal.status.in_(active_appeal_statuses),
-            Appeal.sla_deadline_at.is_not(None),
-            Appeal.sla_deadline_at > warning_cutoff,
-        )
-    elif sla_health_value == "warning":
-        stmt = stmt.where(
-            Appeal.status.in_(active_appeal_statuses),
-            Appeal.sla_deadline_at.is_not(None),
-            Appeal.sla_deadline_at > critical_cutoff,
-            Appeal.sla_deadline_at <= warning_cutoff,
-        )
-    elif sla_health_value == "critical":
-        stmt = stmt.where(
-            Appeal.status.in_(active_appeal_statuses),
-            Appeal.sla_deadline_at.is_not(None),
-            Appeal.sla_deadline_at > now,
-            Appeal.sla_deadline_at <= critical_cutoff,
-        )
+    if sla_health_value in {"healthy", "warning", "critical"}:
+        deadline_lower, deadline_upper = appeal_sla_ranges.deadline_range(sla_health_value)
+        stmt = stmt.where(Appeal.status.in_(active_appeal_statuses), Appeal.sla_deadline_at.is_not(None))
+        if deadline_lower is not None:
+            stmt = stmt.where(Appeal.sla_deadline_at > deadline_lower)
+        if deadline_upper is not None:
+            stmt = stmt.where(Appeal.sla_deadline_at <= deadline_upper)
     elif sla_health_value == "overdue":
         stmt = stmt.where(overdue_clause)
     elif sla_health_value == "no_sla":
@@ -4075,17 +4128,13 @@ async def appeals(
             Appeal.sla_deadline_at.is_(None),
         )
 
-    fresh_cutoff = now - appeal_sla_thresholds.aging_fresh_max
-    aging_cutoff = now - appeal_sla_thresholds.aging_aging_max
-    stale_cutoff = now - appeal_sla_thresholds.aging_stale_max
-    if aging_value == "fresh":
-        stmt = stmt.where(Appeal.created_at.is_not(None), Appeal.created_at >= fresh_cutoff)
-    elif aging_value == "aging":
-        stmt = stmt.where(Appeal.created_at.is_not(None), Appeal.created_at < fresh_cutoff, Appeal.created_at >= aging_cutoff)
-    elif aging_value == "stale":
-        stmt = stmt.where(Appeal.created_at.is_not(None), Appeal.created_at < aging_cutoff, Appeal.created_at >= stale_cutoff)
-    elif aging_value == "critical":
-        stmt = stmt.where(Appeal.created_at.is_not(None), Appeal.created_at < stale_cutoff)
+    if aging_value in {"fresh", "aging", "stale", "critical"}:
+        created_lower, created_upper = appeal_sla_ranges.created_range(aging_value)
+        stmt = stmt.where(Appeal.created_at.is_not(None))
+        if created_lower is not None:
+            stmt = stmt.where(Appeal.created_at >= created_lower)
+        if created_upper is not None:
+            stmt = stmt.where(Appeal.created_at < created_upper)
     elif aging_value == "overdue":
         stmt = stmt.where(overdue_clause)
     elif aging_value == "unknown":
@@ -4726,6 +4775,7 @@ async def action_triage_bulk(request: Request) -> dict[str, object]:
     actor_user_id = await _resolve_actor_user_id(auth)
     now = datetime.now(UTC)
     results: list[dict[str, object]] = []
+    feedback_target_user_ids: set[int] = set()
 
     async with SessionFactory() as session:
         async with session.begin():
@@ -4780,6 +4830,8 @@ async def action_triage_bulk(request: Request) -> dict[str, object]:
                         note=reason or f"bulk {bulk_action}",
                     )
                     if action_result.ok:
+                        if action_result.changed and action_result.item is not None:
+                            feedback_target_user_ids.add(action_result.item.target_user_id)
                         next_status = "VISIBLE" if bulk_action == "unhide" else "HIDDEN"
                         results.append({"id": row_id, "ok": True, "next_status": next_status})
                     else:
@@ -4820,6 +4872,7 @@ async def action_triage_bulk(request: Request) -> dict[str, object]:
                     else:
                         results.append({"id": row_id, "ok": False, "reason_code": "service_error", "message": action_result.message})
 
+    await invalidate_trade_feedback_summary_cache(feedback_target_user_ids)
     return {"ok": True, "results": results}
 
 
@@ -4874,6 +4927,8 @@ async def action_hide_trade_feedback(
 
     if not result.ok:
         return _action_error_page(request, result.message, back_to=target)
+    if result.changed and result.item is not None:
+        await invalidate_trade_feedback_summary_cache([result.item.target_user_id])
     return RedirectResponse(url=_path_with_auth(request, target), status_code=303)
 
 
@@ -4928,6 +4983,8 @@ async def action_unhide_trade_feedback(
 
     if not result.ok:
         return _action_error_page(request, result.message, back_to=target)
+    if result.changed and result.item is not None:
+        await invalidate_trade_feedback_summary_cache([result.item.target_user_id])
     return RedirectResponse(url=_path_with_auth(request, target), status_code=303)
 
 
@@ -0,0 +1,130 @@
+"""Measures time-to-publish of one lot across several chats.
+
+Runs the Telegram side of ``/publish`` (album chunks plus the lot post, built from
+the lot's stored ``file_id``s) against ``benchmarks/telegram_stub_server.py`` with
+``--telegram-latency-ms`` of simulated latency, for ``--chats`` target chats and
+``--photos`` photos. The same publish runs once with chats handled one after
+another (the behaviour before mirror publishing) and once concurrently under
+``--send-concurrency``. No database, Redis or token is needed; the activation
+transaction is not included.
+
+    python benchmarks/auction_publish_bench.py --chats 10 --photos 23 --telegram-latency-ms 80
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import os
+import statistics
+import time
+import uuid
+
+_CHAT_ID_BASE = -100_978_000_000
+
+
+def _build_view():
+    from app.db.enums import AuctionStatus
+    from app.db.models import Auction, User
+    from app.services.auction_service import AuctionView
+
+    seller = User(id=1, tg_user_id=978_000_000, username="bench_seller")
+    auction = Auction(
+        id=uuid.uuid4(),
+        seller_user_id=seller.id,
+        description="publish bench lot",
+        photo_file_id="photo-0",
+        start_price=100,
+        buyout_price=None,
+        min_step=5,
+        duration_hours=24,
+        anti_sniper_enabled=True,
+        status=AuctionStatus.DRAFT,
+        ends_at=datetime.now(timezone.utc),
+    )
+    return AuctionView(
+        auction=auction,
+        seller=seller,
+        winner=None,
+        top_bids=[],
+        current_price=auction.start_price,
+        minimum_next_bid=auction.start_price,
+        open_complaints=0,
+        photo_count=1,
+    )
+
+
+async def _publish_once(bot, *, chat_ids: list[int], photo_ids: list[str], view, sequential: bool) -> float:
+    from app.bot.handlers.publish_auction import _publish_to_chats
+
+    targets: list[tuple[int, int | None]] = [(chat_id, None) for chat_id in chat_ids]
+    started = time.perf_counter()
+    if sequential:
+        for target in targets:
+            await _publish_to_chats(bot, [target], view=view, photo_ids=photo_ids)
+    else:
+        await _publish_to_chats(bot, targets, view=view, photo_ids=photo_ids)
+    return time.perf_counter() - started
+
+
+async def run(*, chats: int, photos: int, rounds: int, send_concurrency: int, telegram_latency_ms: float) -> None:
+    os.environ.setdefault("BOT_TOKEN", "123456:benchmark")
+
+    from aiogram import Bot
+    from aiogram.client.default import DefaultBotProperties
+    from aiogram.enums import ParseMode
+
+    from app.config import settings
+    from telegram_stub_server import TelegramStubServer
+
+    settings.auction_publish_send_concurrency = send_concurrency
+    chat_ids = [_CHAT_ID_BASE - index for index in range(chats)]
+    photo_ids = [f"photo-{index}" for index in range(photos)]
+    view = _build_view()
+
+    async with TelegramStubServer(latency_seconds=telegram_latency_ms / 1000) as telegram:
+        bot = Bot(
+            token=os.environ["BOT_TOKEN"],
+            session=telegram.session(),
+            default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+        )
+        try:
+            print(
+                f"{chats} chats, {photos} photos, telegram latency {telegram_latency_ms:.0f} ms, "
+                f"send concurrency {send_concurrency}"
+            )
+            print(f"{'mode':<12} {'p50 s':>8} {'min s':>8} {'tg calls/publish':>17}")
+            for label, sequential in (("sequential", True), ("concurrent", False)):
+                telegram.calls.clear()
+                durations = [
+                    await _publish_once(bot, chat_ids=chat_ids, photo_ids=photo_ids, view=view, sequential=sequential)
+                    for _ in range(rounds)
+                ]
+                calls = sum(telegram.calls.values()) / rounds
+                print(f"{label:<12} {statistics.median(durations):>8.2f} {min(durations):>8.2f} {calls:>17.1f}")
+        finally:
+            await bot.session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chats", type=int, default=10)
+    parser.add_argument("--photos", type=int, default=23)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--send-concurrency", type=int, default=8)
+    parser.add_argument("--telegram-latency-ms", type=float, default=80.0)
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            chats=args.chats,
+            photos=args.photos,
+            rounds=args.rounds,
+            send_concurrency=args.send_concurrency,
+            telegram_latency_ms=args.telegram_latency_ms,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
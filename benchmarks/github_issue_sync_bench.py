@@ -0,0 +1,85 @@
+"""Measures feedback-to-issue sync throughput against a local GitHub stub.
+
+Starts ``GitHubStubServer`` from ``benchmarks/github_stub_server.py`` with
+``--latency-ms`` of simulated API latency and creates ``--issues`` issues three
+ways: a fresh client per call (the previous per-batch behaviour), one pooled
+client used sequentially, and one pooled client with ``--concurrency`` requests
+in flight. No network or GitHub token is needed.
+
+    python benchmarks/github_issue_sync_bench.py --issues 200 --concurrency 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+
+
+async def _timed(label: str, issues: int, server, create_all) -> None:
+    requests_before = server.requests
+    peers_before = len(server.peers)
+    started = time.perf_counter()
+    await create_all()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{label:<28} {issues / elapsed:8.1f} issues/s total={elapsed * 1000:8.1f}ms "
+        f"requests={server.requests - requests_before} "
+        f"new_connections={len(server.peers) - peers_before}"
+    )
+
+
+async def run(*, issues: int, concurrency: int, latency_ms: float) -> None:
+    os.environ.setdefault("BOT_TOKEN", "benchmark")
+
+    from github_stub_server import GitHubStubServer
+    from app.services.github_automation_service import GitHubApiIssueClient
+
+    def _client(base_url: str) -> GitHubApiIssueClient:
+        return GitHubApiIssueClient(
+            token="benchmark",
+            repo_owner="owner",
+            repo_name="repo",
+            api_base_url=base_url,
+            pool_size=concurrency,
+        )
+
+    async with GitHubStubServer(latency_seconds=latency_ms / 1000) as server:
+
+        async def _client_per_call() -> None:
+            for index in range(issues):
+                async with _client(server.base_url) as client:
+                    await client.create_issue(title=f"per-call {index}", body="b", labels=["bug-approved"])
+
+        async def _pooled_sequential() -> None:
+            async with _client(server.base_url) as client:
+                for index in range(issues):
+                    await client.create_issue(title=f"pooled {index}", body="b", labels=["bug-approved"])
+
+        async def _pooled_concurrent() -> None:
+            semaphore = asyncio.Semaphore(concurrency)
+            async with _client(server.base_url) as client:
+
+                async def _create(index: int) -> None:
+                    async with semaphore:
+                        await client.create_issue(title=f"concurrent {index}", body="b", labels=["bug-approved"])
+
+                await asyncio.gather(*(_create(index) for index in range(issues)))
+
+        await _timed("client per call", issues, server, _client_per_call)
+        await _timed("pooled, sequential", issues, server, _pooled_sequential)
+        await _timed(f"pooled, concurrency={concurrency}", issues, server, _pooled_concurrent)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--issues", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(run(issues=args.issues, concurrency=args.concurrency, latency_ms=args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from aiohttp import web
+
+
+class GitHubStubServer:
+    """In-process stand-in for the GitHub issues REST endpoints.
+
+    Serves ``POST``/``GET /repos/{owner}/{repo}/issues`` on ``127.0.0.1`` with
+    optional per-request latency, ETag-based conditional GETs, a primary rate-limit
+    budget (``X-RateLimit-*`` headers, 403 once spent) and one-shot secondary rate
+    limits (403 with ``Retry-After``). Used by tests and by
+    ``benchmarks/github_issue_sync_bench.py`` to exercise the client offline.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_seconds: float = 0.0,
+        rate_limit_budget: int | None = None,
+        rate_limit_reset_seconds: int = 60,
+    ) -> None:
+        self.latency_seconds = latency_seconds
+        self.rate_limit_budget = rate_limit_budget
+        self.rate_limit_reset_seconds = rate_limit_reset_seconds
+        self.issues: list[dict] = []
+        self.requests = 0
+        self.not_modified = 0
+        self.peers: set[tuple] = set()
+        self._secondary_retry_after: int | None = None
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/repos/{owner}/{repo}/issues", self._create_issue)
+        app.router.add_get("/repos/{owner}/{repo}/issues", self._list_issues)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = site._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> GitHubStubServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.stop()
+
+    def trigger_secondary_rate_limit(self, *, retry_after_seconds: int) -> None:
+        self._secondary_retry_after = retry_after_seconds
+
+    def _etag(self) -> str:
+        return f'"issues-{len(self.issues)}"'
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        if self.rate_limit_budget is None:
+            return {}
+        return {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": str(max(self.rate_limit_budget, 0)),
+            "X-RateLimit-Reset": str(int(time.time()) + self.rate_limit_reset_seconds),
+        }
+
+    async def _admit(self, request: web.Request) -> web.Response | None:
+        self.requests += 1
+        peer = request.transport.get_extra_info("peername") if request.transport else None
+        if peer is not None:
+            self.peers.add(tuple(peer))
+        if self.latency_seconds > 0:
+            await asyncio.sleep(self.latency_seconds)
+
+        if self._secondary_retry_after is not None:
+            retry_after, self._secondary_retry_after = self._secondary_retry_after, None
+            return web.json_response(
+                {"message": "You have exceeded a secondary rate limit."},
+                status=403,
+                headers={"Retry-After": str(retry_after)},
+            )
+        if self.rate_limit_budget is not None and self.rate_limit_budget <= 0:
+            return web.json_response(
+                {"message": "API rate limit exceeded."},
+                status=403,
+                headers=self._rate_limit_headers(),
+            )
+        return None
+
+    def _spend(self) -> None:
+        if self.rate_limit_budget is not None:
+            self.rate_limit_budget -= 1
+
+    async def _create_issue(self, request: web.Request) -> web.Response:
+        if (rejected := await self._admit(request)) is not None:
+            return rejected
+        payload = await request.json()
+        number = len(self.issues) + 1
+        issue = {
+            "number": number,
+            "title": payload["title"],
+            "body": payload.get("body", ""),
+            "labels": [{"name": label} for label in payload.get("labels", [])],
+            "html_url": (
+                f"https://github.com/{request.match_info['owner']}/{request.match_info['repo']}/issues/{number}"
+            ),
+        }
+        self.issues.append(issue)
+        self._spend()
+        return web.json_response(issue, status=201, headers=self._rate_limit_headers())
+
+    async def _list_issues(self, request: web.Request) -> web.Response:
+        if (rejected := await self._admit(request)) is not None:
+            return rejected
+        etag = self._etag()
+        if request.headers.get("If-None-Match") == etag:
+            # Like GitHub, a 304 does not count against the rate limit.
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag, **self._rate_limit_headers()})
+        wanted = {label for label in request.query.get("labels", "").split(",") if label}
+        issues = [
+            issue
+            for issue in reversed(self.issues)
+            if wanted <= {label["name"] for label in issue["labels"]}
+        ]
+        self._spend()
+        return web.json_response(issues, headers={"ETag": etag, **self._rate_limit_headers()})
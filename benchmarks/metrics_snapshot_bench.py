@@ -0,0 +1,122 @@
+"""Compares the legacy SCAN+MGET metric snapshot with the hash-based layout.
+
+Seeds a Redis database with ``--noise-keys`` unrelated keys plus ten days of hourly
+notification counters and the bot funnel counters in both layouts, then times
+``--runs`` snapshot loads of each. Point it at a throwaway database: the target DB
+is flushed before seeding.
+
+    python benchmarks/metrics_snapshot_bench.py --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+import os
+import statistics
+import time
+
+_SEED_BATCH = 10_000
+_HOURS = 240
+_NOTIFICATION_FIELDS = tuple(
+    f"{kind}:{event}:{reason}"
+    for kind in ("sent", "suppressed", "aggregated")
+    for event in ("auction_outbid", "auction_finish", "support")
+    for reason in ("delivered", "blocked_master", "forbidden", "debounce_gate")
+)
+_FUNNEL_FIELDS = tuple(
+    f"{journey}:{step}:{role}:{context}:ok"
+    for journey, role in (("bid", "bidder"), ("auction_create", "seller"), ("complaint", "bidder"))
+    for step in ("start", "complete", "fail")
+    for context in ("callback_bid", "command_newauction", "wizard_finalize", "callback_report")
+)
+
+
+async def _seed(redis, *, noise_keys: int, now_utc: datetime) -> None:
+    await redis.flushdb()
+    for offset in range(0, noise_keys, _SEED_BATCH):
+        async with redis.pipeline(transaction=False) as pipe:
+            for index in range(offset, min(offset + _SEED_BATCH, noise_keys)):
+                pipe.set(f"bench:noise:{index}", "x")
+            await pipe.execute()
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for field in _NOTIFICATION_FIELDS:
+            pipe.set(f"notif:metrics:{field}", 100)
+            pipe.hset("notif:metrics:totals", field, 100)
+        for hour in range(_HOURS):
+            bucket = (now_utc - timedelta(hours=hour)).strftime("%Y%m%d%H")
+            for field in _NOTIFICATION_FIELDS:
+                pipe.set(f"notif:metrics:h:{bucket}:{field}", 1)
+                pipe.hset(f"notif:metrics:hourly:{bucket}", field, 1)
+        for field in _FUNNEL_FIELDS:
+            pipe.set(f"bot:funnel:{field}", 10)
+            pipe.hset("bot:funnel:totals", field, 10)
+        await pipe.execute()
+
+
+async def _legacy_snapshot(redis, match: str) -> int:
+    cursor: int | str = 0
+    keys: list[str] = []
+    while True:
+        cursor, batch = await redis.scan(cursor=cursor, match=match, count=500)
+        keys.extend(batch)
+        if int(cursor) == 0:
+            break
+    if keys:
+        await redis.mget(keys)
+    return len(keys)
+
+
+async def _timed(label: str, runs: int, load) -> None:
+    samples: list[float] = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await load()
+        samples.append((time.perf_counter() - started) * 1000)
+    print(
+        f"{label:<34} median={statistics.median(samples):9.2f}ms "
+        f"max={max(samples):9.2f}ms runs={runs}"
+    )
+
+
+async def run(*, redis_url: str, noise_keys: int, runs: int) -> None:
+    os.environ["REDIS_URL"] = redis_url
+    os.environ.setdefault("BOT_TOKEN", "benchmark")
+
+    from app.infra.redis_client import close_redis, redis_client
+    from app.services.bot_funnel_metrics_service import load_bot_funnel_snapshot
+    from app.services.notification_metrics_service import load_notification_metrics_snapshot
+
+    now_utc = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    await _seed(redis_client, noise_keys=noise_keys, now_utc=now_utc)
+    dbsize = await redis_client.dbsize()
+    print(f"seeded {dbsize} keys in {time.perf_counter() - started:.1f}s")
+
+    try:
+        await _timed("legacy notif SCAN+MGET", runs, lambda: _legacy_snapshot(redis_client, "notif:metrics:*"))
+        await _timed("legacy funnel SCAN+MGET", runs, lambda: _legacy_snapshot(redis_client, "bot:funnel:*"))
+        await _timed(
+            "hash notification snapshot",
+            runs,
+            lambda: load_notification_metrics_snapshot(now_utc=now_utc),
+        )
+        await _timed("hash funnel snapshot", runs, load_bot_funnel_snapshot)
+    finally:
+        await redis_client.flushdb()
+        await close_redis()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--noise-keys", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(redis_url=args.redis_url, noise_keys=args.noise_keys, runs=args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiohttp import web
+
+_MESSAGE_PREFIXES = ("send", "edit", "copy", "forward")
+
+
+class TelegramStubServer:
+    """In-process fake of the Telegram Bot API for load tests.
+
+    Answers every ``/bot<token>/<method>`` call on ``127.0.0.1`` with a minimal
+    well-formed result: a ``Message`` for ``send*``/``edit*``/``copy*``/``forward*``,
+    a list of messages for ``sendMediaGroup``, a bot ``User`` for ``getMe`` and
+    ``True`` otherwise. ``latency_seconds`` simulates the API round trip and
+    ``calls`` counts requests per method.
+    """
+
+    def __init__(self, *, latency_seconds: float = 0.0, bot_id: int = 1, bot_username: str = "stub_bot") -> None:
+        self.latency_seconds = latency_seconds
+        self.bot_id = bot_id
+        self.bot_username = bot_username
+        self.calls: Counter[str] = Counter()
+        self._message_id = 0
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = site._server.sockets[0].getsockname()[:2]  # type: ignore[union-attr]
+        self.base_url = f"http://{host}:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            await runner.cleanup()
+
+    async def __aenter__(self) -> TelegramStubServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.stop()
+
+    def session(self) -> AiohttpSession:
+        """An aiogram session whose requests go to this server instead of api.telegram.org."""
+
+        return AiohttpSession(api=TelegramAPIServer.from_base(self.base_url))
+
+    def _message(self, chat_id: str | None) -> dict:
+        self._message_id += 1
+        try:
+            parsed_chat_id = int(chat_id) if chat_id is not None else 1
+        except ValueError:
+            parsed_chat_id = 1
+        return {
+            "message_id": self._message_id,
+            "date": int(time.time()),
+            "chat": {"id": parsed_chat_id, "type": "private" if parsed_chat_id > 0 else "supergroup"},
+            "from": {"id": self.bot_id, "is_bot": True, "first_name": "Stub", "username": self.bot_username},
+        }
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        self.calls[method] += 1
+        form = await request.post()
+        if self.latency_seconds > 0:
+            await asyncio.sleep(self.latency_seconds)
+
+        chat_id = form.get("chat_id")
+        chat_id = chat_id if isinstance(chat_id, str) else None
+        result: object = True
+        if method == "getMe":
+            result = {"id": self.bot_id, "is_bot": True, "first_name": "Stub", "username": self.bot_username}
+        elif method == "sendMediaGroup":
+            result = [self._message(chat_id)]
+        elif method.startswith(_MESSAGE_PREFIXES) and not form.get("inline_message_id"):
+            result = self._message(chat_id)
+        return web.json_response({"ok": True, "result": result})
@@ -13,20 +13,22 @@ if os.getenv("RUN_INTEGRATION_TESTS") != "1":
     pytest.skip("Integration tests are disabled (set RUN_INTEGRATION_TESTS=1)", allow_module_level=True)
 
 
-@pytest_asyncio.fixture
-async def integration_engine():
-    db_url = (os.getenv("TEST_DATABASE_URL") or "").strip()
+def _require_test_database(env_name: str) -> str:
+    db_url = (os.getenv(env_name) or "").strip()
     if not db_url:
-        pytest.skip("No TEST_DATABASE_URL set")
+        pytest.skip(f"No {env_name} set")
 
     parsed = urlsplit(db_url)
     db_name = parsed.path.lstrip("/").lower()
     if "test" not in db_name:
         pytest.exit(
-            "Refusing to run integration tests: TEST_DATABASE_URL must point to a dedicated test database",
+            f"Refusing to run integration tests: {env_name} must point to a dedicated test database",
             returncode=2,
         )
+    return db_url
 
+
+async def _create_schema_engine(db_url: str):
     engine = create_async_engine(db_url, future=True)
     try:
         async with engine.begin() as conn:
@@ -35,14 +37,34 @@ async def integration_engine():
     except Exception as exc:  # pragma: no cover
         await engine.dispose()
         pytest.skip(f"Integration database is unavailable: {exc}")
+    return engine
 
-    yield engine
 
+async def _drop_schema_engine(engine) -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
 
+@pytest_asyncio.fixture
+async def integration_engine():
+    engine = await _create_schema_engine(_require_test_database("TEST_DATABASE_URL"))
+    yield engine
+    await _drop_schema_engine(engine)
+
+
+@pytest_asyncio.fixture
+async def integration_replica_engine(integration_engine):
+    """Second database standing in for a read replica (same schema, independent data)."""
+
+    db_url = _require_test_database("TEST_REPLICA_DATABASE_URL")
+    if db_url == (os.getenv("TEST_DATABASE_URL") or "").strip():
+        pytest.skip("TEST_REPLICA_DATABASE_URL must differ from TEST_DATABASE_URL")
+    engine = await _create_schema_engine(db_url)
+    yield engine
+    await _drop_schema_engine(engine)
+
+
 @pytest_asyncio.fixture
 async def db_session(integration_engine) -> AsyncSession:
     session_factory = async_sessionmaker(
@@ -8,6 +8,7 @@ from app.bot.handlers.start import command_boost_appeal
 from app.db.enums import PointsEventType
 from app.db.models import Appeal, PointsLedgerEntry, User
 from app.services.appeal_service import create_appeal_from_ref
+from app.services.points_service import grant_points
 
 
 class _DummyFromUser:
@@ -58,15 +59,14 @@ async def test_boostappeal_command_spends_points_and_notifies(monkeypatch, integ
                 appeal_ref="manual_boost_command",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=35,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:command",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=35,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:command",
+                reason="seed",
+                payload=None,
             )
             appeal_id = appeal.id
 
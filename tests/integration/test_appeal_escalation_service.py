@@ -7,10 +7,14 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.db.enums import AppealSourceType, AppealStatus, ModerationAction
-from app.db.models import Appeal, ModerationLog, User
+from app.db.enums import AppealSourceType, AppealStatus, AuctionStatus, ModerationAction
+from app.db.models import Appeal, Auction, Complaint, ModerationLog, User
 from aiogram import Bot
-from app.services.appeal_escalation_service import process_overdue_appeal_escalations
+from app.infra.deadline_scheduler import DeadlineScheduler
+from app.services.appeal_escalation_service import (
+    process_overdue_appeal_escalations,
+    refresh_appeal_escalation_schedule,
+)
 
 
 class _DummyBot:
@@ -66,6 +70,7 @@ async def test_process_overdue_appeal_escalations_marks_and_notifies(monkeypatch
     monkeypatch.setattr(settings, "moderation_thread_id", "42")
     monkeypatch.setattr(settings, "moderation_topic_appeals_id", "")
     monkeypatch.setattr(settings, "admin_user_ids", "99710,99711")
+    monkeypatch.setattr(settings, "appeal_escalation_digest_min_items", 3)
 
     bot = _DummyBot()
     escalated_count = await process_overdue_appeal_escalations(cast(Bot, bot))
@@ -103,3 +108,175 @@ async def test_process_overdue_appeal_escalations_marks_and_notifies(monkeypatch
     assert logs[0].payload is not None
     assert logs[0].payload.get("appeal_id") == appeals[0].id
     assert logs[0].payload.get("escalation_level") == 1
+
+
+@pytest.mark.asyncio
+async def test_process_overdue_appeal_escalations_posts_single_digest(monkeypatch, integration_engine) -> None:
+    from app.config import settings
+
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        async with session.begin():
+            appellant = User(tg_user_id=99801, username="digest_user")
+            seller = User(tg_user_id=99802, username="digest_seller")
+            session.add_all([appellant, seller])
+            await session.flush()
+
+            auction = Auction(
+                seller_user_id=seller.id,
+                description="digest lot",
+                photo_file_id="photo",
+                start_price=100,
+                buyout_price=None,
+                min_step=5,
+                duration_hours=24,
+                status=AuctionStatus.ACTIVE,
+            )
+            session.add(auction)
+            await session.flush()
+
+            complaint = Complaint(
+                auction_id=auction.id,
+                reporter_user_id=appellant.id,
+                target_user_id=seller.id,
+                reason="digest complaint",
+                status="OPEN",
+            )
+            session.add(complaint)
+            await session.flush()
+
+            session.add_all(
+                [
+                    Appeal(
+                        appeal_ref="complaint_overdue_digest",
+                        source_type=AppealSourceType.COMPLAINT,
+                        source_id=complaint.id,
+                        appellant_user_id=appellant.id,
+                        status=AppealStatus.OPEN,
+                        sla_deadline_at=now - timedelta(minutes=30),
+                    ),
+                    *[
+                        Appeal(
+                            appeal_ref=f"manual_overdue_digest_{idx}",
+                            source_type=AppealSourceType.MANUAL,
+                            source_id=None,
+                            appellant_user_id=appellant.id,
+                            status=AppealStatus.OPEN,
+                            sla_deadline_at=now - timedelta(minutes=10 - idx),
+                        )
+                        for idx in range(3)
+                    ],
+                ]
+            )
+
+    monkeypatch.setattr("app.services.appeal_escalation_service.SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "appeal_escalation_enabled", True)
+    monkeypatch.setattr(settings, "appeal_escalation_batch_size", 20)
+    monkeypatch.setattr(settings, "appeal_escalation_actor_tg_user_id", -99800)
+    monkeypatch.setattr(settings, "appeal_escalation_digest_enabled", True)
+    monkeypatch.setattr(settings, "appeal_escalation_digest_min_items", 3)
+    monkeypatch.setattr(settings, "appeal_escalation_digest_max_lines", 3)
+    monkeypatch.setattr(settings, "admin_web_base_url", "https://admin.example.com/")
+    monkeypatch.setattr(settings, "moderation_chat_id", "-1007002")
+    monkeypatch.setattr(settings, "moderation_thread_id", "")
+    monkeypatch.setattr(settings, "moderation_topic_appeals_id", "")
+
+    bot = _DummyBot()
+    escalated_count = await process_overdue_appeal_escalations(cast(Bot, bot))
+
+    assert escalated_count == 4
+    assert len(bot.sent_messages) == 1
+    _chat_id, sent_text, sent_kwargs = bot.sent_messages[0]
+    assert sent_text.startswith("Эскалация апелляций: 4")
+    assert "complaint_overdue_digest" in sent_text
+    assert "manual_overdue_digest_2" not in sent_text
+    assert "…и ещё 1" in sent_text
+    button = sent_kwargs["reply_markup"].inline_keyboard[0][0]
+    assert button.url == "https://admin.example.com/appeals?overdue=only"
+
+    async with session_factory() as session:
+        logs = (
+            await session.execute(
+                select(ModerationLog)
+                .where(ModerationLog.action == ModerationAction.ESCALATE_APPEAL)
+                .order_by(ModerationLog.id.asc())
+            )
+        ).scalars().all()
+
+    assert len(logs) == 4
+    assert [log.auction_id for log in logs].count(auction.id) == 1
+    assert {log.payload["appeal_ref"] for log in logs if log.auction_id is None} == {
+        f"manual_overdue_digest_{idx}" for idx in range(3)
+    }
+
+
+@pytest.mark.asyncio
+async def test_refresh_appeal_escalation_schedule_loads_deadlines_within_horizon(monkeypatch, integration_engine) -> None:
+    from app.config import settings
+
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+
+    now = datetime.now(UTC)
+    async with session_factory() as session:
+        async with session.begin():
+            appellant = User(tg_user_id=99901, username="schedule_user")
+            session.add(appellant)
+            await session.flush()
+
+            due_soon = Appeal(
+                appeal_ref="manual_due_soon",
+                source_type=AppealSourceType.MANUAL,
+                source_id=None,
+                appellant_user_id=appellant.id,
+                status=AppealStatus.OPEN,
+                sla_deadline_at=now + timedelta(seconds=20),
+            )
+            session.add_all(
+                [
+                    due_soon,
+                    Appeal(
+                        appeal_ref="manual_due_later",
+                        source_type=AppealSourceType.MANUAL,
+                        source_id=None,
+                        appellant_user_id=appellant.id,
+                        status=AppealStatus.OPEN,
+                        sla_deadline_at=now + timedelta(hours=2),
+                    ),
+                    Appeal(
+                        appeal_ref="manual_already_overdue",
+                        source_type=AppealSourceType.MANUAL,
+                        source_id=None,
+                        appellant_user_id=appellant.id,
+                        status=AppealStatus.OPEN,
+                        sla_deadline_at=now - timedelta(seconds=5),
+                    ),
+                    Appeal(
+                        appeal_ref="manual_resolved_due_soon",
+                        source_type=AppealSourceType.MANUAL,
+                        source_id=None,
+                        appellant_user_id=appellant.id,
+                        status=AppealStatus.RESOLVED,
+                        sla_deadline_at=now + timedelta(seconds=30),
+                    ),
+                ]
+            )
+
+    monkeypatch.setattr("app.services.appeal_escalation_service.SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "appeal_escalation_enabled", True)
+
+    scheduler = DeadlineScheduler()
+    scheduler.schedule(("appeals", -1), now + timedelta(seconds=10))
+    loaded = await refresh_appeal_escalation_schedule(scheduler, horizon_seconds=60)
+
+    assert loaded == 1
+    assert len(scheduler) == 1
+    assert scheduler.next_deadline() == due_soon.sla_deadline_at
+    scheduler.cancel(("appeals", due_soon.id))
+    assert scheduler.next_deadline() is None
+
+    monkeypatch.setattr(settings, "appeal_escalation_enabled", False)
+    scheduler.schedule(("appeals", due_soon.id), now + timedelta(seconds=20))
+    assert await refresh_appeal_escalation_schedule(scheduler, horizon_seconds=60) == 0
+    assert len(scheduler) == 0
@@ -17,6 +17,7 @@ from app.services.appeal_service import (
     reject_appeal,
     resolve_appeal,
 )
+from app.services.points_service import grant_points
 
 
 def test_parse_appeal_ref_mapping() -> None:
@@ -270,15 +271,14 @@ async def test_appeal_priority_boost_spends_points_and_marks_item(monkeypatch, i
                 appeal_ref="manual_boost_one",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=30,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:points",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=30,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:points",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -333,15 +333,14 @@ async def test_appeal_priority_boost_daily_limit(monkeypatch, integration_engine
                 appeal_ref="manual_boost_limit_b",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=50,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:limit",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=50,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:limit",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -383,15 +382,14 @@ async def test_appeal_priority_boost_disabled_by_policy(monkeypatch, integration
                 appeal_ref="manual_boost_disabled",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:disabled",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:disabled",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -439,15 +437,14 @@ async def test_appeal_priority_boost_disabled_by_global_redemption_toggle(monkey
                 appeal_ref="manual_global_redemption_disabled",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:global_disabled",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:global_disabled",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -485,15 +482,14 @@ async def test_appeal_priority_boost_requires_min_account_age(monkeypatch, integ
                 appeal_ref="manual_min_account_age",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:min_account_age",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:min_account_age",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -543,15 +539,14 @@ async def test_appeal_priority_boost_requires_min_earned_points(monkeypatch, int
                 appeal_ref="manual_min_earned_points",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:min_earned_points",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:min_earned_points",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -604,25 +599,23 @@ async def test_appeal_priority_boost_respects_weekly_spend_cap(monkeypatch, inte
                 appeal_ref="manual_weekly_spend_cap",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:weekly_cap:balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:weekly_cap:balance",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=-10,
-                    event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
-                    dedupe_key="seed:appeal:boost:weekly_cap:spent",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=-10,
+                event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
+                dedupe_key="seed:appeal:boost:weekly_cap:spent",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -679,25 +672,23 @@ async def test_appeal_priority_boost_respects_weekly_redemption_limit(monkeypatc
                 appeal_ref="manual_weekly_redemption_limit",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:weekly_limit:balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:weekly_limit:balance",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=-10,
-                    event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
-                    dedupe_key="seed:appeal:boost:weekly_limit:used",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=-10,
+                event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
+                dedupe_key="seed:appeal:boost:weekly_limit:used",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -753,25 +744,23 @@ async def test_appeal_priority_boost_respects_monthly_spend_cap(monkeypatch, int
                 appeal_ref="manual_monthly_spend_cap",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:boost:monthly_cap:balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:boost:monthly_cap:balance",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=-10,
-                    event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
-                    dedupe_key="seed:appeal:boost:monthly_cap:spent",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=-10,
+                event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
+                dedupe_key="seed:appeal:boost:monthly_cap:spent",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -826,15 +815,14 @@ async def test_appeal_priority_boost_utility_cooldown(monkeypatch, integration_e
                 appeal_ref="manual_utility_cooldown_b",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=50,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:utility:cooldown",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=50,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:utility:cooldown",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -879,26 +867,23 @@ async def test_appeal_priority_boost_respects_global_daily_limit(monkeypatch, in
                 appeal_ref="manual_global_daily_limit",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:global:daily:balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:global:daily:balance",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=-10,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="seed:appeal:global:daily:used",
-                    reason="seed",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=-10,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="seed:appeal:global:daily:used",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -937,26 +922,23 @@ async def test_appeal_priority_boost_respects_global_daily_spend_cap(monkeypatch
                 appeal_ref="manual_global_daily_spend_cap",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:global:spend:balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:global:spend:balance",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=-10,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="seed:appeal:global:spend:used",
-                    reason="seed",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=-10,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="seed:appeal:global:spend:used",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -995,15 +977,14 @@ async def test_appeal_priority_boost_respects_min_balance_guardrail(monkeypatch,
                 appeal_ref="manual_min_balance_guardrail",
             )
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=appellant.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:appeal:min_balance:balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=appellant.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:appeal:min_balance:balance",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.enums import AuctionStatus
+from app.db.models import Auction, Bid, User
+from app.services.auction_aggregates_watcher import reconcile_all_auction_bid_aggregates
+from app.services.auction_service import load_auction_view, process_bid_action
+from app.services.moderation_service import remove_bid
+from app.services.seller_dashboard_service import list_seller_auctions
+
+
+async def _aggregates(session_factory, auction_id) -> tuple:
+    async with session_factory() as session:
+        auction = await session.scalar(select(Auction).where(Auction.id == auction_id))
+        return auction.bid_count, auction.current_price, auction.top_bidder_user_id, auction.last_bid_at
+
+
+@pytest.mark.asyncio
+async def test_bid_aggregates_follow_bids_removals_and_reconciliation(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.services.auction_aggregates_watcher.SessionFactory", session_factory)
+    now = datetime.now(UTC)
+
+    async with session_factory() as session:
+        async with session.begin():
+            seller = User(tg_user_id=97101, username="aggregates_seller")
+            first = User(tg_user_id=97102, username="aggregates_first")
+            second = User(tg_user_id=97103, username="aggregates_second")
+            moderator = User(tg_user_id=97104, username="aggregates_mod")
+            session.add_all([seller, first, second, moderator])
+            await session.flush()
+            auction = Auction(
+                seller_user_id=seller.id,
+                description="aggregates lot",
+                photo_file_id="photo",
+                start_price=100,
+                min_step=10,
+                duration_hours=24,
+                status=AuctionStatus.ACTIVE,
+                starts_at=now,
+                ends_at=now + timedelta(hours=24),
+            )
+            session.add(auction)
+            await session.flush()
+            ids = (seller.id, first.id, second.id, moderator.id, auction.id)
+    seller_id, first_id, second_id, moderator_id, auction_id = ids
+
+    assert await _aggregates(session_factory, auction_id) == (0, 100, None, None)
+
+    for bidder_id in (first_id, second_id):
+        async with session_factory() as session:
+            async with session.begin():
+                result = await process_bid_action(
+                    session,
+                    auction_id=auction_id,
+                    bidder_user_id=bidder_id,
+                    multiplier=1,
+                    is_buyout=False,
+                )
+        assert result.success, result.alert_text
+
+    bid_count, current_price, top_bidder, last_bid_at = await _aggregates(session_factory, auction_id)
+    assert (bid_count, current_price, top_bidder) == (2, 120, second_id)
+    async with session_factory() as session:
+        top_bid = await session.scalar(select(Bid).where(Bid.amount == 120))
+        view = await load_auction_view(session, auction_id)
+    assert last_bid_at == top_bid.created_at
+    assert view is not None and view.current_price == 120
+    assert [bid.amount for bid in view.top_bids] == [120, 110]
+
+    async with session_factory() as session:
+        async with session.begin():
+            removal = await remove_bid(session, actor_user_id=moderator_id, bid_id=top_bid.id, reason="shill")
+    assert removal.ok
+    assert (await _aggregates(session_factory, auction_id))[:3] == (1, 110, first_id)
+
+    # Drift: a bid written outside the bid path and a corrupted counter.
+    async with session_factory() as session:
+        async with session.begin():
+            session.add(Bid(auction_id=auction_id, user_id=second_id, amount=150, created_at=now))
+            auction = await session.scalar(select(Auction).where(Auction.id == auction_id))
+            auction.bid_count = 9
+
+    assert await reconcile_all_auction_bid_aggregates() == 1
+    assert (await _aggregates(session_factory, auction_id))[:3] == (2, 150, second_id)
+    assert await reconcile_all_auction_bid_aggregates() == 0
+
+    async with session_factory() as session:
+        items, total = await list_seller_auctions(
+            session,
+            seller_user_id=seller_id,
+            filter_key="a",
+            sort_key="b",
+            page=0,
+            page_size=10,
+        )
+    assert total == 1
+    assert (items[0].bid_count, items[0].current_price) == (2, 150)
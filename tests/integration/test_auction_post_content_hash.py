@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.enums import AuctionStatus
+from app.db.models import Auction, AuctionPost, User
+from app.services import auction_service
+from app.services.auction_service import process_bid_action, refresh_auction_posts
+
+
+class _BotStub:
+    def __init__(self) -> None:
+        self.caption_edits: list[tuple[int | None, str | None]] = []
+
+    async def edit_message_caption(self, *, caption: str, reply_markup=None, **target) -> bool:
+        self.caption_edits.append((target.get("message_id"), target.get("inline_message_id")))
+        return True
+
+
+async def _post_hashes(session_factory, auction_id) -> list[str | None]:
+    async with session_factory() as session:
+        rows = await session.execute(
+            select(AuctionPost.content_hash).where(AuctionPost.auction_id == auction_id).order_by(AuctionPost.id)
+        )
+        return list(rows.scalars())
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_posts_whose_content_is_unchanged(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(auction_service, "SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "inline_query_cache_ttl_seconds", 0)
+    now = datetime.now(UTC)
+
+    async with session_factory() as session:
+        async with session.begin():
+            seller = User(tg_user_id=97301, username="hash_seller")
+            bidder = User(tg_user_id=97302, username="hash_bidder")
+            session.add_all([seller, bidder])
+            await session.flush()
+            auction = Auction(
+                seller_user_id=seller.id,
+                description="hash lot",
+                photo_file_id="photo",
+                start_price=100,
+                min_step=10,
+                duration_hours=24,
+                status=AuctionStatus.ACTIVE,
+                starts_at=now,
+                ends_at=now + timedelta(hours=24),
+            )
+            session.add(auction)
+            await session.flush()
+            session.add_all(
+                [
+                    AuctionPost(auction_id=auction.id, chat_id=-100973, message_id=11),
+                    AuctionPost(auction_id=auction.id, inline_message_id="inline-973"),
+                ]
+            )
+            auction_id, bidder_id = auction.id, bidder.id
+
+    bot = _BotStub()
+    await refresh_auction_posts(bot, auction_id)
+    assert bot.caption_edits == [(11, None), (None, "inline-973")]
+    first_hashes = await _post_hashes(session_factory, auction_id)
+    assert first_hashes[0] is not None and first_hashes == [first_hashes[0]] * 2
+
+    # Nothing visible changed: no edits at all.
+    await refresh_auction_posts(bot, auction_id)
+    assert len(bot.caption_edits) == 2
+
+    async with session_factory() as session:
+        async with session.begin():
+            result = await process_bid_action(
+                session,
+                auction_id=auction_id,
+                bidder_user_id=bidder_id,
+                multiplier=1,
+                is_buyout=False,
+            )
+    assert result.success, result.alert_text
+
+    await refresh_auction_posts(bot, auction_id)
+    assert len(bot.caption_edits) == 4
+    second_hashes = await _post_hashes(session_factory, auction_id)
+    assert second_hashes[0] != first_hashes[0]
+
+    # A refresh that raced with another one cannot tell which edit won: it clears the hash.
+    async with session_factory() as session:
+        stale_post = await session.scalar(
+            select(AuctionPost).where(AuctionPost.auction_id == auction_id, AuctionPost.message_id == 11)
+        )
+    stale_post.content_hash = first_hashes[0]
+    await auction_service._store_post_content_hashes([stale_post], content_hash="0" * 64)
+    assert (await _post_hashes(session_factory, auction_id))[0] is None
+
+    await refresh_auction_posts(bot, auction_id)
+    assert bot.caption_edits[4:] == [(11, None)]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError
+from aiogram.methods import GetChat
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.bot.handlers.chat_metadata import track_bot_chat_membership
+from app.config import settings
+from app.db.models import ChatMetadata
+from app.services import chat_metadata_service
+from app.services.chat_metadata_service import get_chat_metadata, get_chat_username
+
+
+class _RedisStub:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, *, ex: int) -> bool:
+        self.values[key] = value
+        return True
+
+
+class _BotStub:
+    def __init__(self) -> None:
+        self.chats: dict[int, SimpleNamespace] = {}
+        self.calls: list[int] = []
+
+    async def get_chat(self, chat_id: int) -> SimpleNamespace:
+        self.calls.append(chat_id)
+        chat = self.chats.get(chat_id)
+        if chat is None:
+            raise TelegramForbiddenError(method=GetChat(chat_id=chat_id), message="Forbidden: bot was kicked")
+        return chat
+
+
+@pytest.mark.asyncio
+async def test_chat_metadata_registry_spares_get_chat_calls(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    redis_stub = _RedisStub()
+    monkeypatch.setattr(chat_metadata_service, "SessionFactory", session_factory)
+    monkeypatch.setattr(chat_metadata_service, "redis_client", redis_stub)
+    monkeypatch.setattr(settings, "chat_metadata_cache_ttl_seconds", 3600)
+    monkeypatch.setattr(settings, "chat_metadata_refresh_seconds", 86400)
+
+    bot = _BotStub()
+    bot.chats[-1001] = SimpleNamespace(id=-1001, type="supergroup", title="Lots", username="lots_chat", is_forum=True)
+
+    entry = await get_chat_metadata(bot, -1001)
+    assert entry is not None and (entry.username, entry.chat_type, entry.is_forum) == ("lots_chat", "supergroup", True)
+    assert await get_chat_username(bot, -1001) == "lots_chat"
+    assert bot.calls == [-1001]
+
+    # Redis is gone: the registry row is still fresh, so Telegram is not asked.
+    redis_stub.values.clear()
+    assert await get_chat_username(bot, -1001) == "lots_chat"
+    assert bot.calls == [-1001]
+
+    # Unknown chats are cached as missing.
+    assert await get_chat_metadata(bot, -1002) is None
+    assert await get_chat_metadata(bot, -1002) is None
+    assert bot.calls == [-1001, -1002]
+
+    # A membership update fills the registry without getChat and replaces the miss.
+    event = SimpleNamespace(
+        chat=SimpleNamespace(id=-1002, type="channel", title="Channel", username="lots_channel", is_forum=None),
+        new_chat_member=SimpleNamespace(status="administrator"),
+    )
+    await track_bot_chat_membership(event)
+    assert await get_chat_username(bot, -1002) == "lots_channel"
+    assert bot.calls == [-1001, -1002]
+
+    # Stale rows are refreshed; if Telegram refuses, the stale row is served.
+    async with session_factory() as session:
+        async with session.begin():
+            row = await session.scalar(select(ChatMetadata).where(ChatMetadata.chat_id == -1002))
+            assert row.bot_status == "administrator"
+            row.refreshed_at = datetime.now(UTC) - timedelta(days=2)
+    redis_stub.values.clear()
+    assert await get_chat_username(bot, -1002) == "lots_channel"
+    assert bot.calls == [-1001, -1002, -1002]
+
+    bot.chats[-1001] = SimpleNamespace(id=-1001, type="supergroup", title="Lots", username="renamed", is_forum=True)
+    monkeypatch.setattr(settings, "chat_metadata_refresh_seconds", 0)
+    redis_stub.values.clear()
+    assert await get_chat_username(bot, -1001) == "renamed"
+    async with session_factory() as session:
+        row = await session.scalar(select(ChatMetadata).where(ChatMetadata.chat_id == -1001))
+    assert row.username == "renamed"
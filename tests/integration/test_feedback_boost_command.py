@@ -8,6 +8,7 @@ from app.bot.handlers.feedback import command_boost_feedback
 from app.db.enums import FeedbackType, PointsEventType
 from app.db.models import FeedbackItem, PointsLedgerEntry, User
 from app.services.feedback_service import create_feedback
+from app.services.points_service import grant_points
 
 
 class _DummyFromUser:
@@ -61,15 +62,14 @@ async def test_boostfeedback_command_spends_points_and_updates_queue(monkeypatch
             created.item.queue_chat_id = -100123
             created.item.queue_message_id = 55
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=30,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:boost:command",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=30,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:boost:command",
+                reason="seed",
+                payload=None,
             )
             feedback_id = created.item.id
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -9,7 +10,18 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.db.enums import FeedbackStatus, FeedbackType, IntegrationOutboxStatus, ModerationAction
 from app.db.models import FeedbackItem, IntegrationOutbox, ModerationLog, User
 from app.services.github_automation_service import GitHubIssueRef
-from app.services.outbox_service import enqueue_feedback_issue_event, process_pending_outbox_events
+from app.services.outbox_service import (
+    OutboxDeliveryContext,
+    OutboxHandler,
+    OutboxJob,
+    OutboxLane,
+    _claim_outbox_batch,
+    deliver_each,
+    dispatch_outbox_event,
+    enqueue_feedback_issue_event,
+    process_pending_outbox_events,
+)
+from app.services.outbox_watcher import OutboxNotifyListener
 
 
 class _StaticIssueClient:
@@ -40,6 +52,24 @@ class _FlakyIssueClient:
         return GitHubIssueRef(number=7002, url="https://github.com/Nombah501/LiteAuction/issues/7002")
 
 
+class _ConcurrencyTrackingIssueClient:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create_issue(self, *, title: str, body: str, labels: list[str]) -> GitHubIssueRef:
+        self.calls += 1
+        number = 7100 + self.calls
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+        return GitHubIssueRef(number=number, url=f"https://github.com/Nombah501/LiteAuction/issues/{number}")
+
+
 class _AlwaysFailIssueClient:
     def __init__(self) -> None:
         self.calls = 0
@@ -250,3 +280,166 @@ async def test_outbox_worker_marks_event_failed_after_max_attempts(monkeypatch,
     assert outbox_row.last_error is not None
     assert item_row is not None
     assert item_row.github_issue_url is None
+
+
+async def _create_approved_feedback_events(session_factory, *, base_tg_user_id: int, count: int) -> list[int]:
+    feedback_ids: list[int] = []
+    async with session_factory() as session:
+        async with session.begin():
+            submitter = User(tg_user_id=base_tg_user_id)
+            session.add(submitter)
+            await session.flush()
+            for idx in range(count):
+                item = FeedbackItem(
+                    type=FeedbackType.BUG,
+                    status=FeedbackStatus.APPROVED,
+                    submitter_user_id=submitter.id,
+                    content=f"Пакетный фидбек номер {idx}",
+                    reward_points=30,
+                    resolved_at=datetime.now(UTC),
+                )
+                session.add(item)
+                await session.flush()
+                feedback_ids.append(item.id)
+                await enqueue_feedback_issue_event(session, feedback_id=item.id)
+    return feedback_ids
+
+
+@pytest.mark.asyncio
+async def test_outbox_worker_processes_claimed_batch_concurrently(monkeypatch, integration_engine) -> None:
+    from app.config import settings
+
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.services.outbox_service.SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "github_automation_enabled", True)
+    monkeypatch.setattr(settings, "outbox_batch_size", 4)
+    monkeypatch.setattr(settings, "outbox_concurrency", 2)
+
+    feedback_ids = await _create_approved_feedback_events(session_factory, base_tg_user_id=93231, count=5)
+
+    client = _ConcurrencyTrackingIssueClient()
+    first_run = await process_pending_outbox_events(issue_client=client)
+    second_run = await process_pending_outbox_events(issue_client=client)
+
+    assert first_run == 4
+    assert second_run == 1
+    assert client.calls == 5
+    assert client.max_in_flight == 2
+
+    async with session_factory() as session:
+        items = (
+            await session.execute(select(FeedbackItem).where(FeedbackItem.id.in_(feedback_ids)))
+        ).scalars().all()
+        outbox_rows = (await session.execute(select(IntegrationOutbox))).scalars().all()
+        logs = (
+            await session.execute(
+                select(ModerationLog).where(ModerationLog.action == ModerationAction.CREATE_FEEDBACK_GITHUB_ISSUE)
+            )
+        ).scalars().all()
+
+    assert len({item.github_issue_url for item in items}) == 5
+    assert all(row.status == IntegrationOutboxStatus.DONE and row.attempts == 1 for row in outbox_rows)
+    assert sorted(log.payload["feedback_id"] for log in logs) == sorted(feedback_ids)
+
+
+@pytest.mark.asyncio
+async def test_outbox_claim_leases_events_away_from_other_workers(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    await _create_approved_feedback_events(session_factory, base_tg_user_id=93241, count=3)
+
+    now = datetime.now(UTC)
+    lease_until = now + timedelta(minutes=5)
+    async with session_factory() as session:
+        async with session.begin():
+            first = await _claim_outbox_batch(session, now=now, lease_until=lease_until, limit=2)
+    async with session_factory() as session:
+        async with session.begin():
+            second = await _claim_outbox_batch(session, now=now, lease_until=lease_until, limit=10)
+    async with session_factory() as session:
+        async with session.begin():
+            after_lease = await _claim_outbox_batch(
+                session,
+                now=lease_until,
+                lease_until=lease_until + timedelta(minutes=5),
+                limit=10,
+            )
+
+    assert len(first) == 2
+    assert len(second) == 1
+    assert {event.id for event in first}.isdisjoint(event.id for event in second)
+    assert len(after_lease) == 3
+
+
+@pytest.mark.asyncio
+async def test_outbox_listener_wakes_up_on_enqueue(integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    listener = OutboxNotifyListener(integration_engine)
+    loop = asyncio.get_running_loop()
+    try:
+        await listener.wait(timeout=0)
+        assert listener.listening
+
+        started = loop.time()
+        waiter = asyncio.create_task(listener.wait(timeout=10))
+        await _create_approved_feedback_events(session_factory, base_tg_user_id=93251, count=1)
+        await asyncio.wait_for(waiter, timeout=5)
+
+        assert loop.time() - started < 5
+    finally:
+        await listener.close()
+
+
+@pytest.mark.asyncio
+async def test_outbox_claims_realtime_lane_first_and_dispatches_registered_handler(
+    monkeypatch,
+    integration_engine,
+) -> None:
+    from app.config import settings
+    from app.services import outbox_service
+
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.services.outbox_service.SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "outbox_batch_size", 1)
+    monkeypatch.setattr(outbox_service, "_HANDLERS", dict(outbox_service._HANDLERS))
+
+    delivered: list[dict] = []
+
+    async def _deliver(job: OutboxJob, context: OutboxDeliveryContext) -> None:
+        assert context.bot == "bot"
+        delivered.append(job.event.payload)
+
+    outbox_service.register_outbox_handler(
+        OutboxHandler(
+            event_type="test.realtime",
+            handle_batch=deliver_each(_deliver),
+            lane=OutboxLane.REALTIME,
+            is_enabled=lambda bot: bot is not None,
+        )
+    )
+
+    await _create_approved_feedback_events(session_factory, base_tg_user_id=93261, count=1)
+    assert await dispatch_outbox_event(event_type="test.realtime", payload={"n": 1}, dedupe_key="test:1") is True
+    assert await dispatch_outbox_event(event_type="test.realtime", payload={"n": 1}, dedupe_key="test:1") is False
+
+    async with session_factory() as session:
+        async with session.begin():
+            claimed = await _claim_outbox_batch(
+                session,
+                now=datetime.now(UTC),
+                lease_until=datetime.now(UTC),
+                limit=1,
+            )
+    assert [event.event_type for event in claimed] == ["test.realtime"]
+
+    # Without a bot the Telegram-style handler is disabled and its event stays pending.
+    monkeypatch.setattr(settings, "github_automation_enabled", False)
+    assert await process_pending_outbox_events() == 0
+    assert await process_pending_outbox_events(bot="bot") == 1
+
+    async with session_factory() as session:
+        row = await session.scalar(select(IntegrationOutbox).where(IntegrationOutbox.dedupe_key == "test:1"))
+
+    assert delivered == [{"n": 1}]
+    assert row is not None
+    assert row.status == IntegrationOutboxStatus.DONE
+    assert row.priority == 0
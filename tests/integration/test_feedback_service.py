@@ -14,7 +14,7 @@ from app.services.feedback_service import (
     take_feedback_in_review,
 )
 from app.services.outbox_service import OUTBOX_EVENT_FEEDBACK_APPROVED
-from app.services.points_service import feedback_reward_dedupe_key
+from app.services.points_service import feedback_reward_dedupe_key, grant_points
 
 
 @pytest.mark.asyncio
@@ -147,15 +147,14 @@ async def test_feedback_priority_boost_spends_points_and_marks_item(monkeypatch,
             assert created.ok is True
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=40,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:boost:points",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=40,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:boost:points",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -211,15 +210,14 @@ async def test_feedback_priority_boost_daily_limit(monkeypatch, integration_engi
             )
             assert feedback_a.item is not None and feedback_b.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:boost:limit",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:boost:limit",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -262,15 +260,14 @@ async def test_feedback_priority_boost_disabled_by_policy(monkeypatch, integrati
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:disabled",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:disabled",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -319,15 +316,14 @@ async def test_feedback_priority_boost_disabled_by_global_redemption_toggle(monk
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:global_disabled",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:global_disabled",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -366,15 +362,14 @@ async def test_feedback_priority_boost_requires_min_account_age(monkeypatch, int
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:min_account_age",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:min_account_age",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -425,15 +420,14 @@ async def test_feedback_priority_boost_requires_min_earned_points(monkeypatch, i
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:min_earned_points",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:min_earned_points",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -488,25 +482,23 @@ async def test_feedback_priority_boost_respects_weekly_spend_cap(monkeypatch, in
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:weekly_cap:balance",
-                    reason="seed",
-                    payload=None,
-                )
-            )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=-10,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="seed:feedback:boost:weekly_cap:spent",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:weekly_cap:balance",
+                reason="seed",
+                payload=None,
+            )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=-10,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="seed:feedback:boost:weekly_cap:spent",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -565,25 +557,23 @@ async def test_feedback_priority_boost_respects_weekly_redemption_limit(monkeypa
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:weekly_limit:balance",
-                    reason="seed",
-                    payload=None,
-                )
-            )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=-10,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="seed:feedback:boost:weekly_limit:used",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:weekly_limit:balance",
+                reason="seed",
+                payload=None,
+            )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=-10,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="seed:feedback:boost:weekly_limit:used",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -641,25 +631,23 @@ async def test_feedback_priority_boost_respects_monthly_spend_cap(monkeypatch, i
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:boost:monthly_cap:balance",
-                    reason="seed",
-                    payload=None,
-                )
-            )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=-10,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="seed:feedback:boost:monthly_cap:spent",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:boost:monthly_cap:balance",
+                reason="seed",
+                payload=None,
+            )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=-10,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="seed:feedback:boost:monthly_cap:spent",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -718,15 +706,14 @@ async def test_feedback_priority_boost_utility_cooldown(monkeypatch, integration
             )
             assert feedback_a.item is not None and feedback_b.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=50,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:feedback:utility:cooldown",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=50,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:feedback:utility:cooldown",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
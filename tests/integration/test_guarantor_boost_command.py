@@ -8,6 +8,7 @@ from app.bot.handlers.guarantor import command_boost_guarant
 from app.db.enums import PointsEventType
 from app.db.models import GuarantorRequest, PointsLedgerEntry, User
 from app.services.guarantor_service import create_guarantor_request
+from app.services.points_service import grant_points
 
 
 class _DummyFromUser:
@@ -60,15 +61,14 @@ async def test_boostguarant_command_spends_points_and_updates_queue(monkeypatch,
             created.item.queue_chat_id = -100223
             created.item.queue_message_id = 65
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=70,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:command",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=70,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:command",
+                reason="seed",
+                payload=None,
             )
             request_id = created.item.id
 
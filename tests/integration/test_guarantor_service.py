@@ -12,6 +12,7 @@ from app.services.guarantor_service import (
     redeem_guarantor_priority_boost,
     reject_guarantor_request,
 )
+from app.services.points_service import grant_points
 
 
 @pytest.mark.asyncio
@@ -120,15 +121,14 @@ async def test_guarantor_priority_boost_spends_points_and_marks_item(monkeypatch
             assert created.ok is True
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=60,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:points",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=60,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:points",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -183,15 +183,14 @@ async def test_guarantor_priority_boost_daily_limit(monkeypatch, integration_eng
             )
             assert request_a.item is not None and request_b.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=30,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:limit",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=30,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:limit",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -234,15 +233,14 @@ async def test_guarantor_priority_boost_disabled_by_policy(monkeypatch, integrat
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=25,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:disabled",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=25,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:disabled",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -293,15 +291,14 @@ async def test_guarantor_priority_boost_disabled_by_global_redemption_toggle(mon
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=25,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:global_disabled",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=25,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:global_disabled",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -340,15 +337,14 @@ async def test_guarantor_priority_boost_requires_min_account_age(monkeypatch, in
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=25,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:min_account_age",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=25,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:min_account_age",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -401,15 +397,14 @@ async def test_guarantor_priority_boost_requires_min_earned_points(monkeypatch,
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=25,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:min_earned_points",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=25,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:min_earned_points",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -466,25 +461,23 @@ async def test_guarantor_priority_boost_respects_weekly_spend_cap(monkeypatch, i
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:weekly_cap:balance",
-                    reason="seed",
-                    payload=None,
-                )
-            )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=-10,
-                    event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
-                    dedupe_key="seed:guarant:boost:weekly_cap:spent",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:weekly_cap:balance",
+                reason="seed",
+                payload=None,
+            )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=-10,
+                event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
+                dedupe_key="seed:guarant:boost:weekly_cap:spent",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -545,25 +538,23 @@ async def test_guarantor_priority_boost_respects_weekly_redemption_limit(monkeyp
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:weekly_limit:balance",
-                    reason="seed",
-                    payload=None,
-                )
-            )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=-10,
-                    event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
-                    dedupe_key="seed:guarant:boost:weekly_limit:used",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:weekly_limit:balance",
+                reason="seed",
+                payload=None,
+            )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=-10,
+                event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
+                dedupe_key="seed:guarant:boost:weekly_limit:used",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -623,25 +614,23 @@ async def test_guarantor_priority_boost_respects_monthly_spend_cap(monkeypatch,
             )
             assert created.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:boost:monthly_cap:balance",
-                    reason="seed",
-                    payload=None,
-                )
-            )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=-10,
-                    event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
-                    dedupe_key="seed:guarant:boost:monthly_cap:spent",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:boost:monthly_cap:balance",
+                reason="seed",
+                payload=None,
+            )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=-10,
+                event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
+                dedupe_key="seed:guarant:boost:monthly_cap:spent",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -700,15 +689,14 @@ async def test_guarantor_priority_boost_utility_cooldown(monkeypatch, integratio
             )
             assert request_a.item is not None and request_b.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=50,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:guarant:utility:cooldown",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=50,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:guarant:utility:cooldown",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
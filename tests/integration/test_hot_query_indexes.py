@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.enums import AuctionStatus, ModerationAction
+from app.db.models import Auction, AuctionPost, Bid, ModerationLog, User
+from app.services import (
+    auction_aggregates_service,
+    auction_service,
+    fraud_service,
+    moderation_service,
+    seller_dashboard_service,
+)
+
+
+class _BotStub:
+    async def get_chat(self, chat_id: int) -> SimpleNamespace:
+        return SimpleNamespace(id=chat_id, username="index_channel")
+
+
+class _StatementRecorder:
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, object]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+
+def _table_scans(plan: dict, table: str, *, bitmap_on_table: bool = False) -> set[str]:
+    """Index names (or ``"Seq Scan"``) used to read ``table`` anywhere in the plan."""
+
+    scans: set[str] = set()
+    node_type = plan["Node Type"]
+    on_table = plan.get("Relation Name") == table
+    if on_table and node_type != "Bitmap Heap Scan":
+        scans.add(plan.get("Index Name", node_type))
+    if bitmap_on_table and node_type == "Bitmap Index Scan":
+        scans.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        scans |= _table_scans(
+            child,
+            table,
+            bitmap_on_table=bitmap_on_table or (on_table and node_type == "Bitmap Heap Scan"),
+        )
+    return scans
+
+
+async def _used_indexes(integration_engine, recorder: _StatementRecorder, table: str) -> set[str]:
+    """EXPLAINs every recorded SELECT with sequential scans disabled.
+
+    The test tables are tiny, so the planner would otherwise prefer a seq scan; with
+    it disabled, a query still falls back to one when no index can serve it.
+    """
+
+    used: set[str] = set()
+    async with integration_engine.connect() as conn:
+        await conn.execute(text("SET enable_seqscan = off"))
+        for statement, parameters in recorder.statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            scans = _table_scans(result.scalar_one()[0]["Plan"], table)
+            assert "Seq Scan" not in scans, statement
+            used |= scans
+    return used
+
+
+async def _seed(session_factory) -> tuple[uuid.UUID, int, int, uuid.UUID]:
+    async with session_factory() as session:
+        async with session.begin():
+            seller = User(tg_user_id=94101, username="index_seller")
+            bidder = User(tg_user_id=94102, username="index_bidder")
+            session.add_all([seller, bidder])
+            await session.flush()
+            auction = Auction(
+                seller_user_id=seller.id,
+                description="index lot",
+                photo_file_id="photo",
+                start_price=100,
+                min_step=10,
+                duration_hours=24,
+                status=AuctionStatus.ACTIVE,
+                starts_at=datetime.now(UTC),
+                ends_at=datetime.now(UTC),
+            )
+            session.add(auction)
+            await session.flush()
+            bid = Bid(auction_id=auction.id, user_id=bidder.id, amount=110)
+            session.add_all(
+                [
+                    bid,
+                    AuctionPost(auction_id=auction.id, chat_id=-100123, message_id=5),
+                    ModerationLog(
+                        actor_user_id=seller.id,
+                        auction_id=auction.id,
+                        action=ModerationAction.REMOVE_BID,
+                        reason="index test",
+                    ),
+                ]
+            )
+            await session.flush()
+            return auction.id, seller.id, bidder.id, bid.id
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_their_indexes(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.services.auction_service.SessionFactory", session_factory)
+    monkeypatch.setattr("app.services.chat_metadata_service.SessionFactory", session_factory)
+    auction_id, seller_id, bidder_id, bid_id = await _seed(session_factory)
+
+    async def _record(call) -> _StatementRecorder:
+        recorder = _StatementRecorder()
+        event.listen(integration_engine.sync_engine, "before_cursor_execute", recorder)
+        try:
+            async with session_factory() as session:
+                async with session.begin():
+                    await call(session)
+        finally:
+            event.remove(integration_engine.sync_engine, "before_cursor_execute", recorder)
+        return recorder
+
+    async def _recompute_aggregates(session: AsyncSession) -> None:
+        auction = await session.get(Auction, auction_id)
+        await auction_aggregates_service.recompute_auction_bid_aggregates(session, auction)
+
+    cases = [
+        (
+            _recompute_aggregates,
+            "bids",
+            "ix_bids_auction_live_amount",
+        ),
+        (
+            lambda session: auction_service._top_bids_for_auction(session, auction_id),
+            "bids",
+            "ix_bids_auction_live_amount",
+        ),
+        (
+            lambda session: moderation_service.list_recent_bids(session, auction_id),
+            "bids",
+            "ix_bids_auction_created_at",
+        ),
+        (
+            lambda session: seller_dashboard_service.list_seller_auction_bid_logs(
+                session,
+                seller_user_id=seller_id,
+                auction_id=auction_id,
+            ),
+            "bids",
+            "ix_bids_auction_created_at",
+        ),
+        (
+            lambda session: fraud_service.evaluate_and_store_bid_fraud_signal(
+                session,
+                auction_id=auction_id,
+                user_id=bidder_id,
+                bid_id=bid_id,
+            ),
+            "bids",
+            "ix_bids_auction_created_at",
+        ),
+        (
+            lambda session: moderation_service.list_moderation_logs(session, auction_id=auction_id),
+            "moderation_logs",
+            "ix_moderation_logs_auction_created_at",
+        ),
+        (
+            lambda _session: auction_service.resolve_auction_post_url(_BotStub(), auction_id=auction_id),
+            "auction_posts",
+            "uq_auction_posts_message",
+        ),
+    ]
+    for call, table, expected_index in cases:
+        recorder = await _record(call)
+        used = await _used_indexes(integration_engine, recorder, table)
+        assert expected_index in used, (expected_index, used)
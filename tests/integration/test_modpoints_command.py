@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
-
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -9,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.bot.handlers.moderation import mod_points, mod_points_history, mod_stats
 from app.db.enums import ModerationAction, PointsEventType
 from app.db.models import ModerationLog, PointsLedgerEntry, User
-from app.services.points_service import get_user_points_balance
+from app.services.points_service import get_user_points_balance, grant_points
 
 
 class _DummyFromUser:
@@ -119,25 +117,23 @@ async def test_modpoints_view_shows_balance(monkeypatch, integration_engine) ->
             session.add(target_user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target_user.id,
-                    amount=20,
-                    event_type=PointsEventType.MANUAL_ADJUSTMENT,
-                    dedupe_key="manual:view:1",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=20,
+                event_type=PointsEventType.MANUAL_ADJUSTMENT,
+                dedupe_key="manual:view:1",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target_user.id,
-                    amount=-3,
-                    event_type=PointsEventType.MANUAL_ADJUSTMENT,
-                    dedupe_key="manual:view:2",
-                    reason="seed2",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=-3,
+                event_type=PointsEventType.MANUAL_ADJUSTMENT,
+                dedupe_key="manual:view:2",
+                reason="seed2",
+                payload=None,
             )
 
     message = _DummyMessage(text=f"/modpoints {target_tg_user_id} 1", from_user_id=owner_tg_user_id)
@@ -232,25 +228,23 @@ async def test_modpoints_history_supports_filter_and_page(monkeypatch, integrati
             await session.flush()
 
             for idx in range(12):
-                session.add(
-                    PointsLedgerEntry(
-                        user_id=target_user.id,
-                        amount=1,
-                        event_type=PointsEventType.MANUAL_ADJUSTMENT,
-                        dedupe_key=f"manual:history:{idx}",
-                        reason=f"manual-{idx}",
-                        payload=None,
-                    )
-                )
-            session.add(
-                PointsLedgerEntry(
+                await grant_points(
+                    session,
                     user_id=target_user.id,
-                    amount=30,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="feedback:history:1",
-                    reason="feedback",
+                    amount=1,
+                    event_type=PointsEventType.MANUAL_ADJUSTMENT,
+                    dedupe_key=f"manual:history:{idx}",
+                    reason=f"manual-{idx}",
                     payload=None,
                 )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=30,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="feedback:history:1",
+                reason="feedback",
+                payload=None,
             )
 
     message = _DummyMessage(
@@ -355,27 +349,23 @@ async def test_modstats_includes_points_utility_block(monkeypatch, integration_e
             session.add(target_user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target_user.id,
-                    amount=12,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="stats:points:earned",
-                    reason="seed",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=12,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="stats:points:earned",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target_user.id,
-                    amount=-4,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="stats:points:boost",
-                    reason="seed",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=-4,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="stats:points:boost",
+                reason="seed",
+                payload=None,
             )
 
     message = _DummyMessage(text="/modstats", from_user_id=owner_tg_user_id)
@@ -429,15 +419,14 @@ async def test_modpoints_history_supports_guarantor_boost_filter(monkeypatch, in
             session.add(target_user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target_user.id,
-                    amount=-9,
-                    event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
-                    dedupe_key="history:gboost:1",
-                    reason="guarant boost",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=-9,
+                event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
+                dedupe_key="history:gboost:1",
+                reason="guarant boost",
+                payload=None,
             )
 
     message = _DummyMessage(
@@ -470,15 +459,14 @@ async def test_modpoints_history_supports_appeal_boost_filter(monkeypatch, integ
             session.add(target_user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target_user.id,
-                    amount=-7,
-                    event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
-                    dedupe_key="history:aboost:1",
-                    reason="appeal boost",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=target_user.id,
+                amount=-7,
+                event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
+                dedupe_key="history:aboost:1",
+                reason="appeal boost",
+                payload=None,
             )
 
     message = _DummyMessage(
@@ -4,10 +4,11 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.db.enums import FeedbackType, PointsEventType
-from app.db.models import PointsLedgerEntry, User
+from app.db.models import User
 from app.services.appeal_service import create_appeal_from_ref, redeem_appeal_priority_boost
 from app.services.feedback_service import create_feedback, redeem_feedback_priority_boost
 from app.services.guarantor_service import create_guarantor_request, redeem_guarantor_priority_boost
+from app.services.points_service import grant_points
 
 
 @pytest.mark.asyncio
@@ -45,15 +46,14 @@ async def test_points_redemption_global_cooldown_blocks_second_boost(monkeypatch
             )
             assert feedback.item is not None and guarantor.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:redemption:cooldown",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:redemption:cooldown",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -108,15 +108,14 @@ async def test_points_redemption_cooldown_zero_allows_multiple_boosts(monkeypatc
             )
             assert feedback.item is not None and guarantor.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:redemption:no_cooldown",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:redemption:no_cooldown",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -169,15 +168,14 @@ async def test_points_redemption_cooldown_applies_to_appeal_boost(monkeypatch, i
             )
             assert feedback.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:redemption:appeal_cooldown",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:redemption:appeal_cooldown",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -232,15 +230,14 @@ async def test_points_redemption_daily_limit_blocks_second_boost(monkeypatch, in
             )
             assert feedback.item is not None and guarantor.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:redemption:daily_limit",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:redemption:daily_limit",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -295,15 +292,14 @@ async def test_points_redemption_daily_spend_cap_blocks_second_boost(monkeypatch
             )
             assert feedback.item is not None and guarantor.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:redemption:daily_spend_cap",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:redemption:daily_spend_cap",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -350,15 +346,14 @@ async def test_points_redemption_min_balance_blocks_redemption(monkeypatch, inte
             )
             assert feedback.item is not None
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=submitter.id,
-                    amount=100,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="seed:redemption:min_balance",
-                    reason="seed",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=submitter.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="seed:redemption:min_balance",
+                reason="seed",
+                payload=None,
             )
             await session.flush()
 
@@ -15,8 +15,9 @@ from sqlalchemy import Table, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.bot.handlers.publish_auction import publish_auction_to_current_chat
+from app.config import settings
 from app.db.enums import AuctionStatus
-from app.db.models import Auction, AuctionPhoto, AuctionPost, Bid, Complaint, User
+from app.db.models import Auction, AuctionPhoto, AuctionPost, Bid, ChatMetadata, Complaint, User
 from app.services.auction_service import create_draft_auction
 from app.services.moderation_topic_router import ModerationTopicSection
 
@@ -40,6 +41,7 @@ async def publish_flow_session_factory() -> AsyncGenerator[async_sessionmaker[As
         cast(Table, Bid.__table__),
         cast(Table, Complaint.__table__),
         cast(Table, AuctionPost.__table__),
+        cast(Table, ChatMetadata.__table__),
     ]
     try:
         async with engine.begin() as conn:
@@ -308,3 +310,59 @@ async def test_publish_command_rolls_back_album_and_post_when_activation_fails(
     assert auction is not None
     assert auction.status == AuctionStatus.DRAFT
     assert post is None
+
+
+@pytest.mark.asyncio
+async def test_publish_command_mirrors_lot_to_configured_chats(
+    monkeypatch,
+    publish_flow_session_factory,
+) -> None:
+    session_factory = publish_flow_session_factory
+    monkeypatch.setattr("app.bot.handlers.publish_auction.SessionFactory", session_factory)
+
+    async def _allow_publish(*_args, **_kwargs):
+        return SimpleNamespace(allowed=True, block_message=None)
+
+    async def _refresh_stub(_bot, _auction_id):
+        return None
+
+    async def _send_section_stub(_bot, **_kwargs):
+        return (999, 111)
+
+    monkeypatch.setattr("app.bot.handlers.publish_auction.evaluate_seller_publish_gate", _allow_publish)
+    monkeypatch.setattr("app.bot.handlers.publish_auction.refresh_auction_posts", _refresh_stub)
+    monkeypatch.setattr("app.bot.handlers.publish_auction.send_section_message", _send_section_stub)
+
+    seller_tg_user_id, auction_id = await _seed_draft_auction(session_factory, seller_tg_user_id=94531)
+    chat_id = -10094531
+    mirror_chat_ids = [-10094532, -10094533]
+    monkeypatch.setattr(
+        settings,
+        "auction_publish_mirror_chat_ids",
+        ",".join(str(mirror_chat_id) for mirror_chat_id in [chat_id, *mirror_chat_ids]),
+    )
+
+    message = _DummyMessage(
+        text=f"/publish {auction_id}",
+        from_user_id=seller_tg_user_id,
+        chat_id=chat_id,
+        message_id=84,
+    )
+    bot = _DummyBot(album_message_ids=[631, 632], post_message_id=731)
+
+    await publish_auction_to_current_chat(message, bot)
+
+    assert message.answers == []
+    assert bot.sent_media_group_calls == 3
+    assert bot.sent_photo_calls == 3
+
+    async with session_factory() as session:
+        posts = (
+            await session.execute(
+                select(AuctionPost.chat_id, AuctionPost.message_id).where(AuctionPost.auction_id == auction_id)
+            )
+        ).all()
+        registered_chat_ids = set((await session.execute(select(ChatMetadata.chat_id))).scalars())
+
+    assert sorted(posts) == sorted((target, 731) for target in [chat_id, *mirror_chat_ids])
+    assert {chat_id, *mirror_chat_ids} <= registered_chat_ids
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db import session as session_module
+from app.db.enums import AuctionStatus
+from app.db.models import Auction, User
+from app.services.moderation_dashboard_service import get_moderation_dashboard_snapshot
+from app.services.seller_dashboard_service import list_seller_auctions
+
+
+async def _seed_users(engine, *, tg_user_ids: list[int]) -> None:
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        async with session.begin():
+            session.add_all([User(tg_user_id=tg_user_id) for tg_user_id in tg_user_ids])
+
+
+def _routing_factory(primary_engine, replica_engine, monkeypatch, *, max_lag_seconds: int = 10):
+    monkeypatch.setattr(session_module, "replica_engine", replica_engine)
+    monkeypatch.setattr(session_module.settings, "db_replica_max_lag_seconds", max_lag_seconds)
+    monkeypatch.setattr(session_module.settings, "db_replica_lag_check_interval_seconds", 60)
+    session_module.reset_replica_health()
+    return async_sessionmaker(
+        bind=primary_engine,
+        class_=AsyncSession,
+        sync_session_class=session_module.RoutingSession,
+        expire_on_commit=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_only_dashboard_snapshot_is_served_by_replica(
+    monkeypatch,
+    integration_engine,
+    integration_replica_engine,
+) -> None:
+    await _seed_users(integration_engine, tg_user_ids=[71001, 71002])
+    await _seed_users(integration_replica_engine, tg_user_ids=[72001, 72002, 72003, 72004, 72005])
+    session_factory = _routing_factory(integration_engine, integration_replica_engine, monkeypatch)
+
+    async with session_factory() as session:
+        snapshot = await get_moderation_dashboard_snapshot(session)
+        primary_users = await session.scalar(select(func.count(User.id)))
+
+    assert snapshot.total_users == 5
+    assert primary_users == 2
+    assert session_module._replica_health.usable is True
+    assert session_module._replica_health.lag_seconds == 0
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_primary(
+    monkeypatch,
+    integration_engine,
+    integration_replica_engine,
+) -> None:
+    await _seed_users(integration_engine, tg_user_ids=[73001, 73002])
+    await _seed_users(integration_replica_engine, tg_user_ids=[74001])
+    session_factory = _routing_factory(integration_engine, integration_replica_engine, monkeypatch)
+
+    async def _lagging_probe() -> float:
+        return 120.0
+
+    monkeypatch.setattr(session_module, "_probe_replica_lag_seconds", _lagging_probe)
+
+    async with session_factory() as session:
+        snapshot = await get_moderation_dashboard_snapshot(session)
+
+    assert snapshot.total_users == 2
+    assert session_module._replica_health.usable is False
+
+
+@pytest.mark.asyncio
+async def test_writes_inside_read_scope_stay_on_primary(
+    monkeypatch,
+    integration_engine,
+    integration_replica_engine,
+) -> None:
+    session_factory = _routing_factory(integration_engine, integration_replica_engine, monkeypatch)
+
+    async with session_factory() as session:
+        async with session.begin():
+            seller = User(tg_user_id=75001, username="seller")
+            session.add(seller)
+            await session.flush()
+            async with session_module.read_replica_scope() as on_replica:
+                assert on_replica is True
+                session.add(
+                    Auction(
+                        seller_user_id=seller.id,
+                        description="lot",
+                        photo_file_id="photo",
+                        start_price=100,
+                        buyout_price=None,
+                        min_step=10,
+                        duration_hours=24,
+                        status=AuctionStatus.ACTIVE,
+                    )
+                )
+                await session.flush()
+            seller_user_id = seller.id
+
+    async with session_factory() as session:
+        replica_items, replica_total = await list_seller_auctions(
+            session,
+            seller_user_id=seller_user_id,
+            filter_key="l",
+            sort_key="n",
+            page=0,
+            page_size=5,
+        )
+        primary_total = await session.scalar(
+            select(func.count(Auction.id)).where(Auction.seller_user_id == seller_user_id)
+        )
+
+    assert replica_items == []
+    assert replica_total == 0
+    assert primary_total == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stay_on_primary_until_commit(
+    monkeypatch,
+    integration_engine,
+    integration_replica_engine,
+) -> None:
+    await _seed_users(integration_replica_engine, tg_user_ids=[76001, 76002, 76003])
+    session_factory = _routing_factory(integration_engine, integration_replica_engine, monkeypatch)
+
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(insert(User).values(tg_user_id=76101))
+            snapshot = await get_moderation_dashboard_snapshot(session)
+        assert snapshot.total_users == 1
+
+        # A new transaction that has not written yet may use the replica again.
+        async with session.begin():
+            snapshot = await get_moderation_dashboard_snapshot(session)
+        assert snapshot.total_users == 3
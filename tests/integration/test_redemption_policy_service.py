@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.enums import FeedbackType, PointsEventType
+from app.db.models import User
+from app.services.feedback_service import create_feedback, redeem_feedback_priority_boost
+from app.services.guarantor_service import create_guarantor_request
+from app.services.points_service import grant_points
+from app.services.redemption_policy_service import (
+    RedemptionDenialCode,
+    RedemptionUtility,
+    redemption_policy_engine,
+)
+
+
+@pytest.mark.asyncio
+async def test_load_snapshot_reads_all_limits_in_one_statement(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(settings, "feedback_intake_cooldown_seconds", 0)
+    monkeypatch.setattr(settings, "feedback_priority_boost_cost_points", 10)
+    monkeypatch.setattr(settings, "feedback_priority_boost_daily_limit", 3)
+    monkeypatch.setattr(settings, "feedback_priority_boost_cooldown_seconds", 600)
+    monkeypatch.setattr(settings, "guarantor_priority_boost_cooldown_seconds", 600)
+    monkeypatch.setattr(settings, "points_redemption_cooldown_seconds", 0)
+    monkeypatch.setattr(settings, "points_redemption_min_account_age_seconds", 3600)
+
+    async with session_factory() as session:
+        async with session.begin():
+            user = User(
+                tg_user_id=94101,
+                username="policy_snapshot",
+                created_at=datetime.now(UTC) - timedelta(days=2),
+            )
+            session.add(user)
+            await session.flush()
+            feedback = await create_feedback(
+                session,
+                submitter_user_id=user.id,
+                feedback_type=FeedbackType.BUG,
+                content="Проверка снапшота лимитов редимпшена",
+            )
+            assert feedback.item is not None
+            await grant_points(
+                session,
+                user_id=user.id,
+                amount=100,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="policy:snapshot:seed",
+                reason="seed",
+            )
+            boosted = await redeem_feedback_priority_boost(
+                session,
+                feedback_id=feedback.item.id,
+                submitter_user_id=user.id,
+            )
+            assert boosted.ok is True
+
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    async with session_factory() as session:
+        event.listen(integration_engine.sync_engine, "before_cursor_execute", _record)
+        try:
+            snapshot = await redemption_policy_engine.load_snapshot(session, user_id=user.id)
+        finally:
+            event.remove(integration_engine.sync_engine, "before_cursor_execute", _record)
+
+    assert len([statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]) == 1
+    assert (snapshot.balance, snapshot.total_earned, snapshot.total_spent) == (90, 100, 10)
+    assert snapshot.account_age_remaining_seconds == 0
+    assert (snapshot.used_today, snapshot.spent_today, snapshot.spent_this_month) == (1, 10, 10)
+
+    feedback_policy = snapshot.utility(RedemptionUtility.FEEDBACK)
+    assert (feedback_policy.used_today, feedback_policy.remaining_today) == (1, 2)
+    assert 0 < feedback_policy.cooldown_remaining_seconds <= 600
+    guarantor_policy = snapshot.utility(RedemptionUtility.GUARANTOR)
+    assert (guarantor_policy.used_today, guarantor_policy.cooldown_remaining_seconds) == (0, 0)
+
+    decision = redemption_policy_engine.evaluate(snapshot, utility=RedemptionUtility.FEEDBACK)
+    assert decision.allowed is False
+    assert decision.code == RedemptionDenialCode.UTILITY_COOLDOWN
+    assert redemption_policy_engine.evaluate(snapshot, utility=RedemptionUtility.GUARANTOR).allowed is True
+
+
+@pytest.mark.asyncio
+async def test_decide_handles_user_without_points_or_boosts(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(settings, "guarantor_intake_cooldown_seconds", 0)
+    monkeypatch.setattr(settings, "points_redemption_min_account_age_seconds", 0)
+    monkeypatch.setattr(settings, "points_redemption_min_earned_points", 0)
+    monkeypatch.setattr(settings, "points_redemption_min_balance", 5)
+
+    async with session_factory() as session:
+        async with session.begin():
+            user = User(tg_user_id=94102, username="policy_empty")
+            session.add(user)
+            await session.flush()
+            request = await create_guarantor_request(
+                session,
+                submitter_user_id=user.id,
+                details="Запрос без начисленных points",
+            )
+            assert request.item is not None
+
+    async with session_factory() as session:
+        decision = await redemption_policy_engine.decide(
+            session,
+            user_id=user.id,
+            utility=RedemptionUtility.GUARANTOR,
+        )
+
+    assert decision.allowed is False
+    assert decision.code == RedemptionDenialCode.MIN_BALANCE
+    assert decision.snapshot.summary.operations_count == 0
+    assert decision.snapshot.utility(RedemptionUtility.GUARANTOR).used_today == 0
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.enums import AuctionStatus, ModerationAction
+from app.db.models import (
+    Auction,
+    Bid,
+    BidArchive,
+    Complaint,
+    FraudSignal,
+    FraudSignalArchive,
+    ModerationLog,
+    ModerationLogArchive,
+    User,
+)
+from app.services.moderation_service import list_moderation_logs
+from app.services.retention_watcher import run_retention_pass
+from app.services.timeline_service import build_auction_timeline_page
+
+
+def _auction(seller_id: int, *, status: AuctionStatus, ends_at: datetime) -> Auction:
+    return Auction(
+        seller_user_id=seller_id,
+        description="retention lot",
+        photo_file_id="photo",
+        start_price=100,
+        min_step=10,
+        duration_hours=24,
+        status=status,
+        starts_at=ends_at - timedelta(hours=24),
+        ends_at=ends_at,
+    )
+
+
+async def _count(session: AsyncSession, model) -> int:
+    return int(await session.scalar(select(func.count()).select_from(model)) or 0)
+
+
+@pytest.mark.asyncio
+async def test_retention_pass_archives_closed_auction_history(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.services.retention_watcher.SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "retention_batch_size", 1)
+    monkeypatch.setattr(settings, "retention_batch_pause_ms", 0)
+    monkeypatch.setattr(settings, "retention_archive_auctions_enabled", True)
+    monkeypatch.setattr(settings, "retention_archive_after_days", 30)
+    now = datetime(2026, 6, 1, 12, 0, tzinfo=UTC)
+    old = now - timedelta(days=60)
+
+    async with session_factory() as session:
+        async with session.begin():
+            seller = User(tg_user_id=95101, username="retention_seller")
+            bidder = User(tg_user_id=95102, username="retention_bidder")
+            moderator = User(tg_user_id=95103, username="retention_mod")
+            session.add_all([seller, bidder, moderator])
+            await session.flush()
+
+            closed = _auction(seller.id, status=AuctionStatus.ENDED, ends_at=old)
+            recent = _auction(seller.id, status=AuctionStatus.ENDED, ends_at=now - timedelta(days=1))
+            active = _auction(seller.id, status=AuctionStatus.ACTIVE, ends_at=old)
+            session.add_all([closed, recent, active])
+            await session.flush()
+
+            archived_bid = Bid(auction_id=closed.id, user_id=bidder.id, amount=110, created_at=old - timedelta(hours=2))
+            removed_bid = Bid(
+                auction_id=closed.id,
+                user_id=bidder.id,
+                amount=120,
+                is_removed=True,
+                removed_by_user_id=moderator.id,
+                created_at=old - timedelta(hours=1),
+            )
+            complained_bid = Bid(auction_id=closed.id, user_id=bidder.id, amount=130, created_at=old)
+            session.add_all(
+                [
+                    archived_bid,
+                    removed_bid,
+                    complained_bid,
+                    Bid(auction_id=recent.id, user_id=bidder.id, amount=110),
+                    Bid(auction_id=active.id, user_id=bidder.id, amount=110),
+                ]
+            )
+            await session.flush()
+            session.add_all(
+                [
+                    ModerationLog(
+                        actor_user_id=moderator.id,
+                        auction_id=closed.id,
+                        bid_id=removed_bid.id,
+                        action=ModerationAction.REMOVE_BID,
+                        reason="archived removal",
+                        created_at=old - timedelta(minutes=30),
+                    ),
+                    ModerationLog(
+                        actor_user_id=moderator.id,
+                        auction_id=recent.id,
+                        action=ModerationAction.FREEZE_AUCTION,
+                        reason="live freeze",
+                        created_at=now - timedelta(days=2),
+                    ),
+                    FraudSignal(
+                        auction_id=closed.id,
+                        user_id=bidder.id,
+                        score=80,
+                        reasons={"rules": []},
+                        status="DISMISSED",
+                        resolved_at=old,
+                        created_at=old - timedelta(minutes=10),
+                    ),
+                    FraudSignal(
+                        auction_id=closed.id,
+                        user_id=bidder.id,
+                        score=90,
+                        reasons={"rules": []},
+                        status="OPEN",
+                        created_at=old - timedelta(minutes=5),
+                    ),
+                    Complaint(
+                        auction_id=closed.id,
+                        reporter_user_id=seller.id,
+                        target_user_id=bidder.id,
+                        target_bid_id=complained_bid.id,
+                        reason="shill bid",
+                        status="OPEN",
+                    ),
+                ]
+            )
+            closed_id = closed.id
+            removed_bid_id = removed_bid.id
+            complained_bid_id = complained_bid.id
+
+    async with session_factory() as session:
+        _, timeline_before, total_before = await build_auction_timeline_page(session, closed_id, page=0, limit=50)
+
+    result = await run_retention_pass(now=now)
+
+    assert result["auction_history"] == 4
+
+    async with session_factory() as session:
+        assert await _count(session, BidArchive) == 2
+        assert await _count(session, ModerationLogArchive) == 1
+        assert await _count(session, FraudSignalArchive) == 1
+        # The bid a complaint points at stays live, and so does the open signal.
+        live_closed_bids = (await session.execute(select(Bid.id).where(Bid.auction_id == closed_id))).scalars().all()
+        assert live_closed_bids == [complained_bid_id]
+        assert await session.scalar(select(Complaint.target_bid_id)) == complained_bid_id
+        archived_log = await session.scalar(select(ModerationLogArchive))
+        assert archived_log.bid_id == removed_bid_id
+        assert archived_log.action == ModerationAction.REMOVE_BID
+
+        _, timeline_after, total_after = await build_auction_timeline_page(session, closed_id, page=0, limit=50)
+        audit = await list_moderation_logs(session, auction_id=closed_id)
+        recent_audit = await list_moderation_logs(session, auction_id=None)
+
+    assert total_after == total_before
+    assert [(item.happened_at, item.title, item.details) for item in timeline_after] == [
+        (item.happened_at, item.title, item.details) for item in timeline_before
+    ]
+    assert [log.reason for log in audit] == ["archived removal"]
+    assert [log.reason for log in recent_audit] == ["live freeze", "archived removal"]
+
+    second = await run_retention_pass(now=now)
+    assert second["auction_history"] == 0
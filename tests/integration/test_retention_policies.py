@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.enums import IntegrationOutboxStatus
+from app.db.models import (
+    AdminQueuePresetTelemetryEvent,
+    AdminQueuePresetTelemetryHourly,
+    ChatOwnerServiceEventAudit,
+    IntegrationOutbox,
+    RetentionRun,
+    User,
+    UserAuctionNotificationSnooze,
+)
+from app.services.admin_queue_preset_telemetry_service import (
+    load_workflow_preset_telemetry_segments,
+)
+from app.services.retention_service import load_retention_overview
+from app.services.retention_watcher import run_retention_pass
+
+
+def _telemetry(created_at: datetime, *, preset_id: int | None, time_to_action_ms: int | None, reopen: bool):
+    return AdminQueuePresetTelemetryEvent(
+        queue_context="moderation",
+        queue_key="complaints",
+        preset_id=preset_id,
+        action="select",
+        actor_subject_key="tg:96001",
+        time_to_action_ms=time_to_action_ms,
+        reopen_signal=reopen,
+        filter_churn_count=3 if reopen else 1,
+        created_at=created_at,
+    )
+
+
+def _outbox(key: str, status: IntegrationOutboxStatus, updated_at: datetime) -> IntegrationOutbox:
+    return IntegrationOutbox(
+        event_type="feedback.approved",
+        payload={},
+        dedupe_key=key,
+        status=status,
+        updated_at=updated_at,
+    )
+
+
+def _run(policy: str, started_at: datetime) -> RetentionRun:
+    return RetentionRun(
+        policy=policy,
+        status="ok",
+        rows_affected=0,
+        batches=1,
+        started_at=started_at,
+        finished_at=started_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retention_pass_applies_table_policies(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.services.retention_watcher.SessionFactory", session_factory)
+    monkeypatch.setattr(settings, "retention_batch_size", 2)
+    monkeypatch.setattr(settings, "retention_batch_pause_ms", 0)
+    now = datetime.now(UTC)
+    old = (now - timedelta(days=40)).replace(minute=10)
+
+    async with session_factory() as session:
+        async with session.begin():
+            user = User(tg_user_id=96001, username="retention_user")
+            session.add(user)
+            await session.flush()
+            session.add_all(
+                [
+                    # Five old events in one hour bucket: they roll up across three batches.
+                    _telemetry(old, preset_id=7, time_to_action_ms=1000, reopen=False),
+                    _telemetry(old + timedelta(minutes=1), preset_id=7, time_to_action_ms=3000, reopen=True),
+                    _telemetry(old + timedelta(minutes=2), preset_id=7, time_to_action_ms=None, reopen=False),
+                    _telemetry(old + timedelta(minutes=3), preset_id=None, time_to_action_ms=500, reopen=False),
+                    _telemetry(old + timedelta(minutes=4), preset_id=None, time_to_action_ms=700, reopen=True),
+                    _telemetry(now - timedelta(hours=2), preset_id=7, time_to_action_ms=2000, reopen=False),
+                    UserAuctionNotificationSnooze(
+                        user_id=user.id,
+                        auction_id=uuid.uuid4(),
+                        expires_at=now - timedelta(days=10),
+                    ),
+                    UserAuctionNotificationSnooze(
+                        user_id=user.id,
+                        auction_id=uuid.uuid4(),
+                        expires_at=now + timedelta(hours=1),
+                    ),
+                    ChatOwnerServiceEventAudit(
+                        chat_id=-1001,
+                        message_id=1,
+                        event_type="owner_changed",
+                        requires_confirmation=True,
+                        resolved_at=now - timedelta(days=300),
+                        created_at=now - timedelta(days=300),
+                    ),
+                    ChatOwnerServiceEventAudit(
+                        chat_id=-1001,
+                        message_id=2,
+                        event_type="owner_changed",
+                        requires_confirmation=True,
+                        created_at=now - timedelta(days=300),
+                    ),
+                    ChatOwnerServiceEventAudit(
+                        chat_id=-1001,
+                        message_id=3,
+                        event_type="owner_changed",
+                        requires_confirmation=False,
+                        created_at=now - timedelta(days=1),
+                    ),
+                    _outbox("done-old", IntegrationOutboxStatus.DONE, now - timedelta(days=30)),
+                    _outbox("failed-old", IntegrationOutboxStatus.FAILED, now - timedelta(days=30)),
+                    _outbox("done-recent", IntegrationOutboxStatus.DONE, now - timedelta(days=1)),
+                    # This pass logs a newer outbox_done run; the disabled policy keeps its latest one.
+                    _run("outbox_done", now - timedelta(days=60)),
+                    _run("auction_history", now - timedelta(days=61)),
+                    _run("auction_history", now - timedelta(days=60)),
+                ]
+            )
+
+    async with session_factory() as session:
+        segments_before = await load_workflow_preset_telemetry_segments(session, lookback_hours=24 * 60)
+
+    result = await run_retention_pass(now=now)
+
+    assert result == {
+        "preset_telemetry": 5,
+        "notification_snoozes": 1,
+        "chat_owner_service_events": 1,
+        "outbox_done": 1,
+        "retention_runs": 2,
+    }
+
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count(AdminQueuePresetTelemetryEvent.id))) == 1
+        buckets = (
+            await session.execute(
+                select(AdminQueuePresetTelemetryHourly).order_by(AdminQueuePresetTelemetryHourly.preset_id)
+            )
+        ).scalars().all()
+        assert [(b.preset_id, b.events_total, b.time_to_action_sum_ms, b.time_to_action_count) for b in buckets] == [
+            (7, 3, 4000, 2),
+            (None, 2, 1200, 2),
+        ]
+        assert sorted(
+            (await session.execute(select(ChatOwnerServiceEventAudit.message_id))).scalars().all()
+        ) == [2, 3]
+        assert sorted((await session.execute(select(IntegrationOutbox.dedupe_key))).scalars().all()) == [
+            "done-recent",
+            "failed-old",
+        ]
+        assert await session.scalar(select(func.count(UserAuctionNotificationSnooze.id))) == 1
+
+        segments_after = await load_workflow_preset_telemetry_segments(session, lookback_hours=24 * 60)
+        statuses, sizes = await load_retention_overview(session)
+        run_count = await session.scalar(select(func.count(RetentionRun.id)))
+
+    assert len(segments_after) == len(segments_before) == 2
+    for after, before in zip(segments_after, segments_before, strict=True):
+        assert after == pytest.approx(before)
+    assert run_count == 6
+    by_policy = {status.policy.name: status for status in statuses}
+    assert by_policy["auction_history"].enabled is False
+    kept_run = by_policy["auction_history"].last_run
+    assert kept_run is not None and kept_run.started_at == now - timedelta(days=60)
+    telemetry_run = by_policy["preset_telemetry"].last_run
+    assert telemetry_run is not None
+    assert (telemetry_run.status, telemetry_run.rows_affected, telemetry_run.batches) == ("ok", 5, 3)
+    assert {"admin_queue_preset_telemetry_events", "bids_archive", "integration_outbox"} <= {
+        size.table for size in sizes
+    }
+
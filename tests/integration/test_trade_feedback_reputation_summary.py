@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.db.enums import AuctionStatus
+from app.db.models import Auction, User
+from app.services import trade_feedback_service
+from app.services.trade_feedback_service import (
+    get_trade_feedback_summary,
+    invalidate_trade_feedback_summary_cache,
+    set_trade_feedback_visibility,
+    submit_trade_feedback,
+)
+
+
+class _RedisStub:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.gets = 0
+
+    async def get(self, key: str) -> str | None:
+        self.gets += 1
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, *, ex: int) -> bool:
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self.values.pop(key, None) is not None)
+
+
+def _ended_auction(seller_id: int, winner_id: int) -> Auction:
+    return Auction(
+        seller_user_id=seller_id,
+        winner_user_id=winner_id,
+        description="reputation lot",
+        photo_file_id="photo",
+        start_price=100,
+        min_step=5,
+        duration_hours=24,
+        status=AuctionStatus.ENDED,
+    )
+
+
+@pytest.mark.asyncio
+async def test_reputation_summary_follows_feedback_and_reads_through_cache(monkeypatch, integration_engine) -> None:
+    session_factory = async_sessionmaker(bind=integration_engine, class_=AsyncSession, expire_on_commit=False)
+    redis_stub = _RedisStub()
+    monkeypatch.setattr(trade_feedback_service, "redis_client", redis_stub)
+    monkeypatch.setattr(settings, "trade_feedback_summary_cache_ttl_seconds", 300)
+
+    async with session_factory() as session:
+        async with session.begin():
+            seller = User(tg_user_id=99801, username="rep_seller")
+            buyers = [User(tg_user_id=99802 + index, username=f"rep_buyer_{index}") for index in range(3)]
+            session.add_all([seller, *buyers])
+            await session.flush()
+            auctions = [_ended_auction(seller.id, buyer.id) for buyer in buyers]
+            session.add_all(auctions)
+            await session.flush()
+            seller_id = seller.id
+            pairs = [(auction.id, buyer.id) for auction, buyer in zip(auctions, buyers, strict=True)]
+
+    feedback_ids: list[int] = []
+    for (auction_id, buyer_id), rating in zip(pairs, (5, 4, 2), strict=True):
+        async with session_factory() as session:
+            async with session.begin():
+                result = await submit_trade_feedback(
+                    session,
+                    auction_id=auction_id,
+                    author_user_id=buyer_id,
+                    rating=rating,
+                    comment=None,
+                )
+        assert result.ok and result.item is not None
+        feedback_ids.append(result.item.id)
+
+    async with session_factory() as session:
+        async with session.begin():
+            # Re-rating an existing feedback moves it between histogram buckets.
+            await submit_trade_feedback(session, auction_id=pairs[2][0], author_user_id=pairs[2][1], rating=3, comment=None)
+            await set_trade_feedback_visibility(
+                session,
+                feedback_id=feedback_ids[1],
+                visible=False,
+                moderator_user_id=seller_id,
+                note="spam",
+            )
+
+    async with session_factory() as session:
+        summary = await get_trade_feedback_summary(session, target_user_id=seller_id)
+
+    assert (summary.total_received, summary.visible_received, summary.hidden_received) == (3, 2, 1)
+    assert summary.average_visible_rating == pytest.approx(4.0)
+    assert summary.visible_rating_histogram == (0, 0, 1, 0, 1)
+
+    async with session_factory() as session:
+        async with session.begin():
+            await set_trade_feedback_visibility(
+                session,
+                feedback_id=feedback_ids[1],
+                visible=True,
+                moderator_user_id=seller_id,
+                note="restored",
+            )
+
+    # Served from the cache until the writer invalidates it after commit.
+    async with session_factory() as session:
+        assert await get_trade_feedback_summary(session, target_user_id=seller_id) == summary
+    await invalidate_trade_feedback_summary_cache([seller_id])
+    async with session_factory() as session:
+        refreshed = await get_trade_feedback_summary(session, target_user_id=seller_id)
+
+    assert (refreshed.total_received, refreshed.visible_received, refreshed.hidden_received) == (3, 3, 0)
+    assert refreshed.visible_rating_histogram == (0, 0, 1, 1, 1)
+    assert refreshed.average_visible_rating == pytest.approx(4.0)
+
+    async with session_factory() as session:
+        empty = await get_trade_feedback_summary(session, target_user_id=pairs[0][1])
+    assert (empty.total_received, empty.average_visible_rating) == (0, None)
@@ -18,6 +18,7 @@ from app.services.rbac_service import (
 )
 from app.web.auth import AdminAuthContext
 from app.web.main import action_adjust_user_points, dashboard, manage_user
+from app.services.points_service import grant_points
 
 
 def _make_request(path: str, query: str = "", *, method: str = "GET") -> Request:
@@ -64,27 +65,23 @@ async def test_manage_user_shows_points_widget(monkeypatch, integration_engine)
             session.add(user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=user.id,
-                    amount=30,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="feedback:web:1",
-                    reason="Награда",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=user.id,
+                amount=30,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="feedback:web:1",
+                reason="Награда",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=user.id,
-                    amount=-5,
-                    event_type=PointsEventType.MANUAL_ADJUSTMENT,
-                    dedupe_key="manual:web:1",
-                    reason="Корректировка",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=user.id,
+                amount=-5,
+                event_type=PointsEventType.MANUAL_ADJUSTMENT,
+                dedupe_key="manual:web:1",
+                reason="Корректировка",
+                payload=None,
             )
             user_id = user.id
 
@@ -196,27 +193,23 @@ async def test_dashboard_shows_points_utility_metrics(monkeypatch, integration_e
             session.add_all([recent_user, old_user])
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=recent_user.id,
-                    amount=30,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="dashboard:points:earned",
-                    reason="seed",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=recent_user.id,
+                amount=30,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="dashboard:points:earned",
+                reason="seed",
+                payload=None,
             )
-            session.add(
-                PointsLedgerEntry(
-                    user_id=recent_user.id,
-                    amount=-10,
-                    event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
-                    dedupe_key="dashboard:points:boost",
-                    reason="seed",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=recent_user.id,
+                amount=-10,
+                event_type=PointsEventType.FEEDBACK_PRIORITY_BOOST,
+                dedupe_key="dashboard:points:boost",
+                reason="seed",
+                payload=None,
             )
             session.add(
                 PointsLedgerEntry(
@@ -321,15 +314,14 @@ async def test_manage_user_points_filter_supports_guarantor_boost(monkeypatch, i
             session.add(user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=user.id,
-                    amount=-11,
-                    event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
-                    dedupe_key="web:gboost:1",
-                    reason="gboost reason",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=user.id,
+                amount=-11,
+                event_type=PointsEventType.GUARANTOR_PRIORITY_BOOST,
+                dedupe_key="web:gboost:1",
+                reason="gboost reason",
+                payload=None,
             )
             user_id = user.id
 
@@ -357,15 +349,14 @@ async def test_manage_user_points_filter_supports_appeal_boost(monkeypatch, inte
             session.add(user)
             await session.flush()
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=user.id,
-                    amount=-13,
-                    event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
-                    dedupe_key="web:aboost:1",
-                    reason="aboost reason",
-                    payload=None,
-                )
+            await grant_points(
+                session,
+                user_id=user.id,
+                amount=-13,
+                event_type=PointsEventType.APPEAL_PRIORITY_BOOST,
+                dedupe_key="web:aboost:1",
+                reason="aboost reason",
+                payload=None,
             )
             user_id = user.id
 
@@ -394,25 +385,23 @@ async def test_manage_user_points_filter_and_paging(monkeypatch, integration_eng
             await session.flush()
 
             for idx in range(11):
-                session.add(
-                    PointsLedgerEntry(
-                        user_id=user.id,
-                        amount=1,
-                        event_type=PointsEventType.MANUAL_ADJUSTMENT,
-                        dedupe_key=f"manual:web:{idx}",
-                        reason=f"manual-{idx}",
-                        payload=None,
-                    )
-                )
-            session.add(
-                PointsLedgerEntry(
+                await grant_points(
+                    session,
                     user_id=user.id,
-                    amount=20,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="feedback:web:2",
-                    reason="feedback",
+                    amount=1,
+                    event_type=PointsEventType.MANUAL_ADJUSTMENT,
+                    dedupe_key=f"manual:web:{idx}",
+                    reason=f"manual-{idx}",
                     payload=None,
                 )
+            await grant_points(
+                session,
+                user_id=user.id,
+                amount=20,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="feedback:web:2",
+                reason="feedback",
+                payload=None,
             )
             user_id = user.id
 
@@ -526,16 +515,14 @@ async def test_web_adjust_points_updates_totals_and_audit(monkeypatch, integrati
             actor_user_id = actor.id
             target_user_id = target.id
 
-            session.add(
-                PointsLedgerEntry(
-                    user_id=target.id,
-                    amount=10,
-                    event_type=PointsEventType.FEEDBACK_APPROVED,
-                    dedupe_key="feedback:web-adjust:seed",
-                    reason="Награда",
-                    payload=None,
-                    created_at=datetime.now(UTC),
-                )
+            await grant_points(
+                session,
+                user_id=target.id,
+                amount=10,
+                event_type=PointsEventType.FEEDBACK_APPROVED,
+                dedupe_key="feedback:web-adjust:seed",
+                reason="Награда",
+                payload=None,
             )
 
     monkeypatch.setattr("app.web.main.SessionFactory", session_factory)
@@ -451,6 +451,8 @@ async def test_bulk_endpoint_returns_mixed_results(monkeypatch) -> None:
         def __init__(self, *, ok: bool, message: str):
             self.ok = ok
             self.message = message
+            self.changed = False
+            self.item = None
 
     class _BulkSessionFactoryCtx:
         async def __aenter__(self):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+from types import SimpleNamespace
 
 import pytest
 
@@ -214,3 +215,25 @@ async def test_save_accepts_hashed_token_subject() -> None:
 
     assert session.executed_statement is not None
     assert session.executed_statement.compile().params["subject_key"] == f"tok:{expected_digest}"
+
+
+@pytest.mark.asyncio
+async def test_load_adds_columns_introduced_after_preference_was_saved() -> None:
+    stored = SimpleNamespace(
+        density="compact",
+        columns_json={"visible": ["id", "status"], "order": ["status", "id", "buyout", "ends_at"], "pinned": ["id"]},
+    )
+    session = _DummySession(scalar_result=stored)
+
+    result = await load_admin_list_preference(
+        session,
+        auth=_telegram_auth(),
+        queue_key="auctions",
+        allowed_columns=["id", "buyout", "price", "bids", "status", "ends_at"],
+    )
+
+    assert result["columns"] == {
+        "visible": ["id", "status", "price", "bids"],
+        "order": ["status", "id", "buyout", "price", "bids", "ends_at"],
+        "pinned": ["id"],
+    }
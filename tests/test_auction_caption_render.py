@@ -4,8 +4,14 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
+from app.bot.keyboards.auction import auction_active_keyboard
 from app.db.enums import AuctionStatus
-from app.services.auction_service import AuctionView, TopBidView, render_auction_caption
+from app.services.auction_service import (
+    AuctionView,
+    TopBidView,
+    auction_post_content_hash,
+    render_auction_caption,
+)
 
 
 def _build_view(*, top_bids: list[TopBidView]) -> AuctionView:
@@ -79,3 +85,25 @@ def test_render_auction_caption_shows_empty_top_with_medals() -> None:
     assert "🥇 —" in caption
     assert "🥈 —" in caption
     assert "🥉 —" in caption
+
+
+def test_auction_post_content_hash_tracks_caption_keyboard_and_photo() -> None:
+    view = _build_view(top_bids=[])
+    caption = render_auction_caption(view)
+    keyboard = auction_active_keyboard(auction_id=str(view.auction.id), min_step=5, has_buyout=True)
+
+    base = auction_post_content_hash(caption=caption, reply_markup=keyboard, photo_file_id="photo")
+
+    assert base == auction_post_content_hash(
+        caption=render_auction_caption(view),
+        reply_markup=auction_active_keyboard(auction_id=str(view.auction.id), min_step=5, has_buyout=True),
+        photo_file_id="photo",
+    )
+    assert base != auction_post_content_hash(caption=caption, reply_markup=None, photo_file_id="photo")
+    assert base != auction_post_content_hash(caption=caption, reply_markup=keyboard, photo_file_id="other")
+    view.current_price = 100
+    assert base != auction_post_content_hash(
+        caption=render_auction_caption(view),
+        reply_markup=keyboard,
+        photo_file_id="photo",
+    )
@@ -212,3 +212,57 @@ async def test_notify_auction_finish_reports_closed_lot_to_moderation_topic(monk
     assert len(moderation_notifications) == 1
     assert moderation_notifications[0]["section"] == bid_actions.ModerationTopicSection.AUCTIONS_CLOSED
     assert "завершен выкупом" in str(moderation_notifications[0]["text"])
+
+
+@pytest.mark.asyncio
+async def test_notify_outbid_retry_skips_debounce_gate_already_passed(monkeypatch) -> None:
+    sent_calls: list[dict[str, object]] = []
+
+    async def _raise_if_called_debounce(_auction_id: UUID, _tg_user_id: int) -> bool:
+        raise AssertionError("retried delivery must not consume the debounce gate again")
+
+    async def _capture_send(*_args, **kwargs):
+        sent_calls.append(kwargs)
+        return True
+
+    monkeypatch.setattr(bid_actions, "acquire_outbid_notification_debounce", _raise_if_called_debounce)
+    monkeypatch.setattr(bid_actions, "send_user_topic_message", _capture_send)
+
+    await bid_actions._notify_outbid(
+        cast(Bot, _BotStub()),
+        outbid_user_tg_id=10,
+        actor_tg_id=20,
+        auction_id=UUID("12345678-1234-5678-1234-567812345678"),
+        post_url="https://t.me/example/10",
+        retrying=True,
+        raise_retry_after=True,
+    )
+
+    assert len(sent_calls) == 1
+    assert sent_calls[0]["raise_retry_after"] is True
+
+
+@pytest.mark.asyncio
+async def test_enqueue_outbid_notification_falls_back_to_inline_delivery(monkeypatch) -> None:
+    delivered: list[tuple[int | None, int]] = []
+
+    async def _failing_dispatch(**_kwargs) -> bool:
+        raise RuntimeError("database unavailable")
+
+    async def _capture_notify(_bot, outbid_user_tg_id, actor_tg_id, **_kwargs) -> None:
+        delivered.append((outbid_user_tg_id, actor_tg_id))
+
+    monkeypatch.setattr(bid_actions.settings, "telegram_outbox_enabled", True)
+    monkeypatch.setattr(bid_actions, "dispatch_outbox_event", _failing_dispatch)
+    monkeypatch.setattr(bid_actions, "_notify_outbid", _capture_notify)
+
+    await bid_actions._enqueue_outbid_notification(
+        cast(Bot, _BotStub()),
+        10,
+        20,
+        auction_id=UUID("12345678-1234-5678-1234-567812345678"),
+        post_url=None,
+        delivery_key="bid-1",
+    )
+
+    assert delivered == [(10, 20)]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 import fnmatch
 import logging
 
 import pytest
+from redis.exceptions import WatchError
 
 from app.services import bot_funnel_metrics_service
 
@@ -12,30 +14,90 @@ class _RedisIncrStub:
     def __init__(self, *, total: int = 1, fail: bool = False) -> None:
         self.total = total
         self.fail = fail
-        self.calls: list[tuple[str, int]] = []
+        self.calls: list[tuple[str, str, int]] = []
 
-    async def incrby(self, key: str, count: int) -> int:
-        self.calls.append((key, count))
+    async def hincrby(self, key: str, field: str, count: int) -> int:
+        self.calls.append((key, field, count))
         if self.fail:
             raise RuntimeError("boom")
         return self.total
 
 
+class _PipelineStub:
+    def __init__(self, owner: _RedisSnapshotStub) -> None:
+        self.owner = owner
+        self.commands: list[tuple] = []
+        self.watched: dict[str, str | None] = {}
+
+    async def __aenter__(self) -> _PipelineStub:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def hincrby(self, key: str, field: str, amount: int) -> _PipelineStub:
+        self.commands.append(("hincrby", key, field, amount))
+        return self
+
+    def delete(self, key: str) -> _PipelineStub:
+        self.commands.append(("delete", key))
+        return self
+
+    async def watch(self, *keys: str) -> None:
+        self.watched = {key: self.owner.strings.get(key) for key in keys}
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return await self.owner.mget(keys)
+
+    def multi(self) -> None:
+        self.commands = []
+
+    async def execute(self) -> list[int]:
+        if self.owner.before_exec is not None:
+            self.owner.before_exec()
+            self.owner.before_exec = None
+        if any(self.owner.strings.get(key) != value for key, value in self.watched.items()):
+            self.commands, self.watched = [], {}
+            raise WatchError("watched key changed")
+        for command in self.commands:
+            if command[0] == "hincrby":
+                fields = self.owner.hashes.setdefault(command[1], {})
+                fields[command[2]] = str(int(fields.get(command[2], 0)) + command[3])
+            else:
+                self.owner.strings.pop(command[1], None)
+        return [1] * len(self.commands)
+
+
 class _RedisSnapshotStub:
-    def __init__(self, entries: dict[str, str] | None = None, *, fail_scan: bool = False) -> None:
-        self.entries = entries or {}
-        self.fail_scan = fail_scan
+    def __init__(
+        self,
+        hashes: dict[str, dict[str, str]] | None = None,
+        *,
+        strings: dict[str, str] | None = None,
+        fail: bool = False,
+    ) -> None:
+        self.hashes = hashes or {}
+        self.strings = strings or {}
+        self.fail = fail
+        self.transactions: list[bool] = []
+        self.before_exec: Callable[[], None] | None = None
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        if self.fail:
+            raise RuntimeError("hgetall boom")
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, *, transaction: bool = True) -> _PipelineStub:
+        self.transactions.append(transaction)
+        return _PipelineStub(self)
 
     async def scan(self, *, cursor: int | str, match: str, count: int) -> tuple[int, list[str]]:  # noqa: ARG002
-        if self.fail_scan:
-            raise RuntimeError("scan boom")
         if int(cursor) != 0:
             return 0, []
-        keys = [key for key in self.entries if fnmatch.fnmatch(key, match)]
-        return 0, keys
+        return 0, [key for key in [*self.strings, *self.hashes] if fnmatch.fnmatch(key, match)]
 
     async def mget(self, keys: list[str]) -> list[str | None]:
-        return [self.entries.get(key) for key in keys]
+        return [self.strings.get(key) for key in keys]
 
 
 @pytest.mark.asyncio
@@ -52,7 +114,7 @@ async def test_record_bot_funnel_event_normalizes_context_and_failure_reason(mon
     )
 
     assert total == 7
-    assert redis_stub.calls == [("bot:funnel:bid:fail:bidder:callback_bid_x3:duplicate_bid", 1)]
+    assert redis_stub.calls == [("bot:funnel:totals", "bid:fail:bidder:callback_bid_x3:duplicate_bid", 1)]
 
 
 @pytest.mark.asyncio
@@ -79,16 +141,18 @@ async def test_record_bot_funnel_event_logs_warning_on_redis_error(
 async def test_load_bot_funnel_snapshot_returns_conversion_and_dropoffs(monkeypatch) -> None:
     redis_stub = _RedisSnapshotStub(
         {
-            "bot:funnel:auction_create:start:seller:command_newauction:ok": "10",
-            "bot:funnel:auction_create:complete:seller:wizard_finalize:ok": "7",
-            "bot:funnel:auction_create:fail:seller:command_newauction:blacklisted": "2",
-            "bot:funnel:auction_create:fail:seller:wizard_finalize:preview_unavailable": "1",
-            "bot:funnel:bid:start:bidder:callback_bid:ok": "20",
-            "bot:funnel:bid:complete:bidder:callback_bid:ok": "12",
-            "bot:funnel:bid:fail:bidder:callback_bid:cooldown": "5",
-            "bot:funnel:bid:fail:bidder:callback_bid:action_rejected": "3",
-            "bot:funnel:broken": "99",
-            "bot:funnel:complaint:fail:bidder:callback_report:service_error": "oops",
+            "bot:funnel:totals": {
+                "auction_create:start:seller:command_newauction:ok": "10",
+                "auction_create:complete:seller:wizard_finalize:ok": "7",
+                "auction_create:fail:seller:command_newauction:blacklisted": "2",
+                "auction_create:fail:seller:wizard_finalize:preview_unavailable": "1",
+                "bid:start:bidder:callback_bid:ok": "20",
+                "bid:complete:bidder:callback_bid:ok": "12",
+                "bid:fail:bidder:callback_bid:cooldown": "5",
+                "bid:fail:bidder:callback_bid:action_rejected": "3",
+                "broken": "99",
+                "complaint:fail:bidder:callback_report:service_error": "oops",
+            },
         }
     )
     monkeypatch.setattr(bot_funnel_metrics_service, "redis_client", redis_stub)
@@ -125,8 +189,8 @@ async def test_load_bot_funnel_snapshot_returns_conversion_and_dropoffs(monkeypa
 
 
 @pytest.mark.asyncio
-async def test_load_bot_funnel_snapshot_returns_empty_on_scan_failure(monkeypatch) -> None:
-    redis_stub = _RedisSnapshotStub(fail_scan=True)
+async def test_load_bot_funnel_snapshot_returns_empty_on_redis_failure(monkeypatch) -> None:
+    redis_stub = _RedisSnapshotStub(fail=True)
     monkeypatch.setattr(bot_funnel_metrics_service, "redis_client", redis_stub)
 
     snapshot = await bot_funnel_metrics_service.load_bot_funnel_snapshot()
@@ -136,3 +200,44 @@ async def test_load_bot_funnel_snapshot_returns_empty_on_scan_failure(monkeypatc
     assert snapshot.total_starts == 0
     assert snapshot.total_completes == 0
     assert snapshot.total_fails == 0
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_bot_funnel_keys_folds_strings_into_hash(monkeypatch) -> None:
+    redis_stub = _RedisSnapshotStub(
+        {"bot:funnel:totals": {"bid:start:bidder:callback_bid:ok": "1"}},
+        strings={
+            "bot:funnel:bid:start:bidder:callback_bid:ok": "20",
+            "bot:funnel:bid:fail:bidder:callback_bid:cooldown": "5",
+            "bot:funnel:broken": "99",
+            "fsm:state:1": "x",
+        },
+    )
+    monkeypatch.setattr(bot_funnel_metrics_service, "redis_client", redis_stub)
+
+    assert await bot_funnel_metrics_service.migrate_legacy_bot_funnel_keys(dry_run=True) == 2
+    assert len(redis_stub.strings) == 4
+
+    assert await bot_funnel_metrics_service.migrate_legacy_bot_funnel_keys() == 2
+    assert redis_stub.transactions == [True]
+    assert redis_stub.strings == {"bot:funnel:broken": "99", "fsm:state:1": "x"}
+    assert redis_stub.hashes["bot:funnel:totals"] == {
+        "bid:start:bidder:callback_bid:ok": "21",
+        "bid:fail:bidder:callback_bid:cooldown": "5",
+    }
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_bot_funnel_keys_keeps_increment_racing_with_batch(monkeypatch) -> None:
+    legacy_key = "bot:funnel:bid:start:bidder:callback_bid:ok"
+    redis_stub = _RedisSnapshotStub(strings={legacy_key: "20"})
+    monkeypatch.setattr(bot_funnel_metrics_service, "redis_client", redis_stub)
+
+    def _old_bot_increments() -> None:
+        redis_stub.strings[legacy_key] = "21"
+
+    redis_stub.before_exec = _old_bot_increments
+
+    assert await bot_funnel_metrics_service.migrate_legacy_bot_funnel_keys() == 1
+    assert redis_stub.strings == {}
+    assert redis_stub.hashes["bot:funnel:totals"] == {"bid:start:bidder:callback_bid:ok": "21"}
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from aiogram.types import Chat, ChatMemberBanned, ChatMemberMember, ChatMemberUpdated, User
+
+from app.bot.handlers.chat_metadata import router
+
+_USER = User(id=1, is_bot=False, first_name="Seller")
+_BOT = User(id=2, is_bot=True, first_name="Bot")
+
+
+def _membership_update(chat_type: str) -> ChatMemberUpdated:
+    return ChatMemberUpdated(
+        chat=Chat(id=-1005, type=chat_type),
+        from_user=_USER,
+        date=datetime.now(UTC),
+        old_chat_member=ChatMemberMember(user=_BOT),
+        new_chat_member=ChatMemberBanned(user=_BOT, until_date=datetime.now(UTC)),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("chat_type", "tracked"),
+    [("private", False), ("group", True), ("supergroup", True), ("channel", True)],
+)
+async def test_membership_tracking_skips_private_chats(chat_type: str, tracked: bool) -> None:
+    (handler,) = router.my_chat_member.handlers
+
+    matched, _data = await handler.check(_membership_update(chat_type))
+
+    assert matched is tracked
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+
 import pytest
 
 from app.bot.handlers.create_auction import (
@@ -8,6 +11,10 @@ from app.bot.handlers.create_auction import (
     create_photos_done,
 )
 from app.bot.states.auction_create import AuctionCreateStates
+from app.config import settings
+from app.infra.media_group_buffer import media_group_buffer
+
+_message_ids = itertools.count(1)
 
 
 class _DummyPhoto:
@@ -22,7 +29,9 @@ class _DummyMessage:
         text: str | None = None,
         photo_file_id: str | None = None,
         media_group_id: str | None = None,
+        message_id: int | None = None,
     ) -> None:
+        self.message_id = message_id if message_id is not None else next(_message_ids)
         self.text = text
         self.photo = [_DummyPhoto(photo_file_id)] if photo_file_id is not None else []
         self.media_group_id = media_group_id
@@ -47,6 +56,7 @@ class _DummyState:
     def __init__(self) -> None:
         self.state = None
         self.data: dict[str, object] = {}
+        self.update_calls = 0
 
     async def clear(self) -> None:
         self.state = None
@@ -55,7 +65,11 @@ class _DummyState:
     async def set_state(self, state) -> None:
         self.state = state
 
+    async def get_state(self):
+        return self.state
+
     async def update_data(self, data: dict[str, object] | None = None, **kwargs) -> None:
+        self.update_calls += 1
         if isinstance(data, dict):
             self.data.update(data)
         self.data.update(kwargs)
@@ -80,6 +94,7 @@ async def test_album_flow_prompts_description_once() -> None:
 
     trailing_album_photo = _DummyMessage(photo_file_id="photo-3", media_group_id="album-1")
     await create_description_collect_photo(trailing_album_photo, state)
+    await media_group_buffer.stop()
 
     assert state.state == AuctionCreateStates.waiting_description
     assert callback_message.answers == []
@@ -109,8 +124,10 @@ async def test_album_feedback_does_not_show_stale_single_count() -> None:
 
     await create_photo_step(first_photo, state)
     await create_photo_step(second_photo, state)
+    assert "photo_file_ids" not in state.data
+    await media_group_buffer.stop()
 
-    assert state.data.get("create_wizard_last_event") == "Принят альбом. Фото сейчас: 1/10."
+    assert state.data.get("create_wizard_last_event") == "Принят альбом: +2 фото. Фото сейчас: 2/10."
     assert state.data.get("photo_file_ids") == ["photo-1", "photo-2"]
     assert second_photo.answers == []
 
@@ -125,3 +142,40 @@ async def test_single_photo_feedback_keeps_exact_counter() -> None:
 
     assert state.data.get("create_wizard_last_event") == "Добавлено фото: 1/10."
     assert state.data.get("photo_file_ids") == ["photo-1"]
+
+
+@pytest.mark.asyncio
+async def test_album_is_saved_in_message_order_with_one_state_write(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "auction_photo_album_window_ms", 20)
+    state = _DummyState()
+    await state.set_state(AuctionCreateStates.waiting_photo)
+    state.data["photo_file_ids"] = ["photo-0"]
+
+    parts = [
+        _DummyMessage(photo_file_id=f"photo-{index}", media_group_id="album-2", message_id=100 + index)
+        for index in (3, 1, 2)
+    ]
+    for part in parts:
+        await create_photo_step(part, state)
+    for _ in range(50):
+        if media_group_buffer.pending_albums == 0:
+            break
+        await asyncio.sleep(0.01)
+    await media_group_buffer.stop()
+
+    assert state.data.get("photo_file_ids") == ["photo-0", "photo-1", "photo-2", "photo-3"]
+    assert state.data.get("photo_media_group_ids") == ["album-2"]
+    # One write for the album itself plus one for the wizard progress fingerprint.
+    assert state.update_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_album_is_dropped_when_wizard_moved_on() -> None:
+    state = _DummyState()
+    await state.set_state(AuctionCreateStates.waiting_photo)
+
+    await create_photo_step(_DummyMessage(photo_file_id="photo-1", media_group_id="album-3"), state)
+    await state.clear()
+    await media_group_buffer.stop()
+
+    assert state.data == {}
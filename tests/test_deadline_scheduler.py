@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.infra.deadline_scheduler import DeadlineScheduler
+
+
+def test_next_deadline_skips_replaced_and_cancelled_entries() -> None:
+    now = datetime(2026, 2, 20, 12, 0, tzinfo=UTC)
+    scheduler = DeadlineScheduler()
+    scheduler.schedule("late", now + timedelta(minutes=5))
+    scheduler.schedule("b", now - timedelta(seconds=10))
+    scheduler.schedule("a", now - timedelta(seconds=20))
+    scheduler.schedule("late", now - timedelta(seconds=5))
+    scheduler.schedule("gone", now - timedelta(seconds=30))
+    scheduler.cancel("gone")
+
+    assert scheduler.next_deadline() == now - timedelta(seconds=20)
+    scheduler.cancel("a")
+    scheduler.cancel("b")
+    assert scheduler.next_deadline() == now - timedelta(seconds=5)
+    scheduler.cancel("late")
+    assert scheduler.next_deadline() is None
+    assert len(scheduler) == 0
+
+
+def test_replace_drops_keys_missing_from_new_schedule() -> None:
+    now = datetime(2026, 2, 20, 12, 0, tzinfo=UTC)
+    scheduler = DeadlineScheduler()
+    scheduler.replace({1: now + timedelta(minutes=1), 2: now + timedelta(minutes=2)})
+    scheduler.replace({2: now + timedelta(minutes=3), 3: now + timedelta(minutes=4)})
+
+    assert len(scheduler) == 2
+    assert scheduler.next_deadline() == now + timedelta(minutes=3)
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_up_for_earlier_deadline_scheduled_meanwhile() -> None:
+    scheduler = DeadlineScheduler()
+    scheduler.schedule("far", datetime.now(UTC) + timedelta(minutes=5))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    waiter = asyncio.create_task(scheduler.wait(timeout=5))
+    await asyncio.sleep(0.01)
+    scheduler.schedule("near", datetime.now(UTC) + timedelta(milliseconds=50))
+    await asyncio.wait_for(waiter, timeout=1)
+
+    assert loop.time() - started < 1
+    assert scheduler.next_deadline() <= datetime.now(UTC)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage, SimpleEventIsolation
+
+from app.bot.fsm_storage import UpdateScopedEventIsolation, UpdateScopedStorage
+from app.bot.handlers.create_auction import create_description_step
+from app.bot.states.auction_create import AuctionCreateStates
+
+_KEY = StorageKey(bot_id=1, chat_id=10, user_id=10)
+_OTHER_KEY = StorageKey(bot_id=1, chat_id=20, user_id=20)
+
+
+class _CountingStorage(MemoryStorage):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: Counter[str] = Counter()
+
+    async def set_state(self, key, state=None) -> None:
+        self.calls["set_state"] += 1
+        await super().set_state(key, state)
+
+    async def get_state(self, key):
+        self.calls["get_state"] += 1
+        return await super().get_state(key)
+
+    async def set_data(self, key, data) -> None:
+        self.calls["set_data"] += 1
+        await super().set_data(key, data)
+
+    async def get_data(self, key):
+        self.calls["get_data"] += 1
+        return await super().get_data(key)
+
+
+def _build() -> tuple[_CountingStorage, UpdateScopedStorage, UpdateScopedEventIsolation]:
+    backend = _CountingStorage()
+    storage = UpdateScopedStorage(backend)
+    return backend, storage, UpdateScopedEventIsolation(SimpleEventIsolation(), storage)
+
+
+@pytest.mark.asyncio
+async def test_locked_update_reads_once_and_flushes_merged_writes() -> None:
+    backend, storage, isolation = _build()
+    await backend.set_data(_KEY, {"photo_file_ids": ["a"]})
+    backend.calls.clear()
+    state = FSMContext(storage=storage, key=_KEY)
+
+    async with isolation.lock(_KEY):
+        assert await state.get_state() is None
+        data = await state.get_data()
+        data["photo_file_ids"].append("mutated")
+        await state.update_data(description="lot")
+        await state.update_data(start_price=10)
+        await state.set_state(AuctionCreateStates.waiting_start_price)
+        assert await state.get_state() == AuctionCreateStates.waiting_start_price.state
+        assert (await state.get_data())["photo_file_ids"] == ["a"]
+        assert backend.calls == Counter(get_state=1, get_data=1)
+
+    assert backend.calls == Counter(get_state=1, get_data=1, set_state=1, set_data=1)
+    assert await backend.get_data(_KEY) == {"photo_file_ids": ["a"], "description": "lot", "start_price": 10}
+    assert await backend.get_state(_KEY) == AuctionCreateStates.waiting_start_price.state
+
+
+@pytest.mark.asyncio
+async def test_other_keys_and_calls_outside_lock_go_to_backend() -> None:
+    backend, storage, isolation = _build()
+
+    await storage.update_data(_KEY, {"a": 1})
+    assert backend.calls == Counter(get_data=1, set_data=1)
+
+    async with isolation.lock(_KEY):
+        await storage.update_data(_OTHER_KEY, {"b": 2})
+        assert await backend.get_data(_OTHER_KEY) == {"b": 2}
+
+    assert await storage.get_data(_KEY) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_writes_are_flushed_when_handler_fails() -> None:
+    backend, storage, isolation = _build()
+
+    with pytest.raises(RuntimeError):
+        async with isolation.lock(_KEY):
+            await storage.set_data(_KEY, {"saved": True})
+            raise RuntimeError("handler failed")
+
+    assert await backend.get_data(_KEY) == {"saved": True}
+
+
+class _DummyMessage:
+    chat = None
+    from_user = None
+    message_thread_id = None
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    async def answer(self, *_args, **_kwargs) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_wizard_description_step_costs_one_read_and_one_write_per_kind() -> None:
+    backend, storage, isolation = _build()
+    await backend.set_state(_KEY, AuctionCreateStates.waiting_description)
+    await backend.set_data(_KEY, {"photo_file_id": "p1", "photo_file_ids": ["p1"]})
+    backend.calls.clear()
+    state = FSMContext(storage=storage, key=_KEY)
+
+    async with isolation.lock(_KEY):
+        await create_description_step(_DummyMessage("Винтажная камера"), state)
+
+    assert backend.calls == Counter(get_data=1, set_data=1, set_state=1)
+    assert await backend.get_state(_KEY) == AuctionCreateStates.waiting_start_price.state
+    assert (await backend.get_data(_KEY))["description"] == "Винтажная камера"
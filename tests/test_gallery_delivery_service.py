@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from aiogram.methods import SendMessage, SendPhoto
+
+from app.services import gallery_delivery_service
+from app.services.gallery_delivery_service import GalleryDeliveryStatus, deliver_auction_gallery
+
+_AUCTION_ID = UUID("12345678-1234-5678-1234-567812345678")
+_OTHER_AUCTION_ID = UUID("87654321-4321-8765-4321-876543218765")
+_CHAT_ID = 4242
+
+
+class _RedisStub:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str, *, ex: int, nx: bool = False) -> bool | None:
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self.values.pop(key, None) is not None)
+
+
+class _BotStub:
+    def __init__(self) -> None:
+        self.media_groups: list[list[str]] = []
+        self.photos: list[str] = []
+        self.replies: list[int] = []
+        self.deleted_albums: set[int] = set()
+        self.forbidden = False
+        self._message_id = 100
+
+    def _next_message(self) -> SimpleNamespace:
+        self._message_id += 1
+        return SimpleNamespace(message_id=self._message_id)
+
+    async def send_media_group(self, *, chat_id: int, media):
+        if self.forbidden:
+            raise TelegramForbiddenError(method=SendPhoto(chat_id=chat_id, photo="x"), message="Forbidden")
+        self.media_groups.append([item.media for item in media])
+        return [self._next_message() for _ in media]
+
+    async def send_photo(self, chat_id: int, *, photo: str, caption: str):
+        self.photos.append(photo)
+        return self._next_message()
+
+    async def send_message(self, chat_id: int, text: str, *, reply_parameters):
+        if self.forbidden:
+            raise TelegramForbiddenError(method=SendMessage(chat_id=chat_id, text=text), message="Forbidden")
+        if reply_parameters.message_id in self.deleted_albums:
+            raise TelegramBadRequest(
+                method=SendMessage(chat_id=chat_id, text=text),
+                message="Bad Request: message to be replied not found",
+            )
+        self.replies.append(reply_parameters.message_id)
+        return self._next_message()
+
+
+@pytest.fixture
+def redis_stub(monkeypatch) -> _RedisStub:
+    stub = _RedisStub()
+    monkeypatch.setattr(gallery_delivery_service, "redis_client", stub)
+    monkeypatch.setattr(gallery_delivery_service.settings, "gallery_repeat_window_seconds", 600)
+    monkeypatch.setattr(gallery_delivery_service.settings, "gallery_chat_cooldown_seconds", 3)
+    monkeypatch.setattr(gallery_delivery_service.settings, "gallery_photo_cache_ttl_seconds", 3600)
+    return stub
+
+
+@pytest.mark.asyncio
+async def test_repeat_gallery_tap_points_to_previous_album(monkeypatch, redis_stub) -> None:
+    redis_stub.values[f"gallery:photos:{_AUCTION_ID}"] = json.dumps([f"photo-{idx}" for idx in range(12)])
+    redis_stub.values[f"gallery:photos:{_OTHER_AUCTION_ID}"] = json.dumps(["solo"])
+    bot = _BotStub()
+
+    first = await deliver_auction_gallery(bot, auction_id=_AUCTION_ID, chat_id=_CHAT_ID)
+    assert first.status == GalleryDeliveryStatus.SENT
+    assert [len(group) for group in bot.media_groups] == [10, 2]
+
+    repeat = await deliver_auction_gallery(bot, auction_id=_AUCTION_ID, chat_id=_CHAT_ID)
+    assert (repeat.status, repeat.message_id) == (GalleryDeliveryStatus.POINTED, first.message_id)
+    assert bot.replies == [first.message_id]
+    assert len(bot.media_groups) == 2
+
+    # A different lot right away is spaced out by the per-chat cooldown.
+    throttled = await deliver_auction_gallery(bot, auction_id=_OTHER_AUCTION_ID, chat_id=_CHAT_ID)
+    assert throttled.status == GalleryDeliveryStatus.THROTTLED
+    assert bot.photos == []
+
+    # Once the user deleted the album, the next tap sends it again.
+    redis_stub.values.pop(f"gallery:throttle:{_CHAT_ID}")
+    bot.deleted_albums.add(first.message_id)
+    resent = await deliver_auction_gallery(bot, auction_id=_AUCTION_ID, chat_id=_CHAT_ID)
+    assert resent.status == GalleryDeliveryStatus.SENT
+    assert len(bot.media_groups) == 4
+    assert redis_stub.values[f"gallery:sent:{_CHAT_ID}:{_AUCTION_ID}"] == str(resent.message_id)
+
+
+@pytest.mark.asyncio
+async def test_failed_gallery_delivery_releases_repeat_claim(monkeypatch, redis_stub) -> None:
+    redis_stub.values[f"gallery:photos:{_AUCTION_ID}"] = json.dumps(["photo-1", "photo-2"])
+    bot = _BotStub()
+    bot.forbidden = True
+
+    result = await deliver_auction_gallery(bot, auction_id=_AUCTION_ID, chat_id=_CHAT_ID)
+
+    assert result.status == GalleryDeliveryStatus.FORBIDDEN
+    assert f"gallery:sent:{_CHAT_ID}:{_AUCTION_ID}" not in redis_stub.values
+
+
+@pytest.mark.asyncio
+async def test_repeat_tap_after_user_blocked_bot_is_forbidden(monkeypatch, redis_stub) -> None:
+    redis_stub.values[f"gallery:sent:{_CHAT_ID}:{_AUCTION_ID}"] = "555"
+    bot = _BotStub()
+    bot.forbidden = True
+
+    result = await deliver_auction_gallery(bot, auction_id=_AUCTION_ID, chat_id=_CHAT_ID)
+
+    assert result.status == GalleryDeliveryStatus.FORBIDDEN
+    assert f"gallery:sent:{_CHAT_ID}:{_AUCTION_ID}" not in redis_stub.values
+    assert bot.media_groups == []
+
+
+@pytest.mark.asyncio
+async def test_unknown_lot_is_not_found(monkeypatch, redis_stub) -> None:
+    async def _missing(_auction_id):
+        return None
+
+    monkeypatch.setattr(gallery_delivery_service, "load_gallery_photo_ids", _missing)
+
+    result = await deliver_auction_gallery(_BotStub(), auction_id=_AUCTION_ID, chat_id=_CHAT_ID)
+
+    assert result.status == GalleryDeliveryStatus.NOT_FOUND
+    assert f"gallery:sent:{_CHAT_ID}:{_AUCTION_ID}" not in redis_stub.values
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.github_stub_server import GitHubStubServer
+from app.services import outbox_service
+from app.services.github_automation_service import GitHubApiIssueClient, GitHubRateLimitError
+from app.services.outbox_service import (
+    ClaimedOutboxEvent,
+    OutboxHandler,
+    OutboxJob,
+    OutboxLane,
+    _deliver_outbox_jobs,
+    outbox_lane_paused_for,
+)
+
+
+def _client(base_url: str) -> GitHubApiIssueClient:
+    return GitHubApiIssueClient(
+        token="test-token",
+        repo_owner="owner",
+        repo_name="repo",
+        api_base_url=base_url,
+        pool_size=1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_one_keepalive_connection_for_sequential_calls() -> None:
+    async with GitHubStubServer() as server, _client(server.base_url) as client:
+        refs = [
+            await client.create_issue(title=f"issue {index}", body="b", labels=["bug-approved"])
+            for index in range(5)
+        ]
+
+    assert [ref.number for ref in refs] == [1, 2, 3, 4, 5]
+    assert refs[0].url == "https://github.com/owner/repo/issues/1"
+    assert len(server.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_find_issue_uses_conditional_requests() -> None:
+    async with GitHubStubServer() as server, _client(server.base_url) as client:
+        await client.create_issue(title="[Баг] Feedback #1", body="b", labels=["bug-approved"])
+
+        first = await client.find_issue(title="[Баг] Feedback #1", labels=["bug-approved"])
+        second = await client.find_issue(title="[Баг] Feedback #1", labels=["bug-approved"])
+        missing = await client.find_issue(title="[Баг] Feedback #2", labels=["bug-approved"])
+
+    assert first is not None and first.number == 1
+    assert second == first
+    assert missing is None
+    assert server.not_modified == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_pause_the_client_without_further_requests() -> None:
+    async with GitHubStubServer(rate_limit_budget=1, rate_limit_reset_seconds=120) as server:
+        async with _client(server.base_url) as client:
+            await client.create_issue(title="first", body="b", labels=[])
+            with pytest.raises(GitHubRateLimitError) as exc_info:
+                await client.create_issue(title="second", body="b", labels=[])
+
+        assert server.requests == 1
+        assert 100 < exc_info.value.retry_after_seconds <= 120
+
+        server.rate_limit_budget = None
+        server.trigger_secondary_rate_limit(retry_after_seconds=30)
+        async with _client(server.base_url) as client:
+            with pytest.raises(GitHubRateLimitError) as exc_info:
+                await client.create_issue(title="third", body="b", labels=[])
+            assert 25 < client.paused_for_seconds <= 30
+
+    assert exc_info.value.retry_after_seconds == 30
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_batch_pauses_its_outbox_lane(monkeypatch) -> None:
+    monkeypatch.setattr(outbox_service, "_LANE_PAUSED_UNTIL", {})
+
+    async def _rate_limited(jobs: list[OutboxJob], _context) -> None:
+        jobs[0].fail(GitHubRateLimitError("limited", retry_after_seconds=90))
+
+    handler = OutboxHandler(event_type="test.github", handle_batch=_rate_limited, lane=OutboxLane.BACKGROUND)
+    event = ClaimedOutboxEvent(
+        id=1,
+        event_type="test.github",
+        payload={},
+        dedupe_key="test:1",
+        attempts=0,
+        created_at=None,  # type: ignore[arg-type]
+    )
+    job = OutboxJob(event=event)
+
+    await _deliver_outbox_jobs(handler, [job], bot=None, issue_client=None)
+
+    assert job.retry_after_seconds == 90
+    assert 85 < outbox_lane_paused_for(OutboxLane.BACKGROUND) <= 90
+    assert outbox_lane_paused_for(OutboxLane.REALTIME) == 0
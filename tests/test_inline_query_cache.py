@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.bot.handlers import inline_auction
+from app.services import inline_query_cache_service
+from app.services.inline_query_cache_service import InlineAuctionEntry, bump_inline_auction_version
+
+_AUCTION_ID = UUID("12345678-1234-5678-1234-567812345678")
+_SELLER_TG_ID = 501
+
+
+class _RedisStub:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def mget(self, *keys: str) -> list[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, *, ex: int) -> bool:
+        self.values[key] = value
+        return True
+
+
+class _InlineQueryStub:
+    def __init__(self, query: str, *, tg_user_id: int = _SELLER_TG_ID) -> None:
+        self.query = query
+        self.from_user = SimpleNamespace(id=tg_user_id)
+        self.answers: list[tuple[list, int, bool]] = []
+
+    async def answer(self, results, *, cache_time: int, is_personal: bool) -> None:
+        self.answers.append((results, cache_time, is_personal))
+
+
+def _entry(status: str = "DRAFT") -> InlineAuctionEntry:
+    return InlineAuctionEntry(
+        seller_tg_user_id=_SELLER_TG_ID,
+        status=status,
+        publish_allowed=True,
+        photo_file_id="photo",
+        caption="caption",
+        min_step=10,
+        has_buyout=False,
+    )
+
+
+@pytest.fixture
+def loader(monkeypatch) -> SimpleNamespace:
+    monkeypatch.setattr(inline_query_cache_service, "redis_client", _RedisStub())
+    monkeypatch.setattr(inline_auction.settings, "inline_query_cache_ttl_seconds", 60)
+    monkeypatch.setattr(inline_auction.settings, "inline_query_result_cache_time_seconds", 10)
+    monkeypatch.setattr(inline_auction.settings, "inline_query_empty_cache_time_seconds", 300)
+    state = SimpleNamespace(calls=[], status="DRAFT")
+
+    async def fake_load(auction_uuid: UUID) -> InlineAuctionEntry:
+        state.calls.append(auction_uuid)
+        return _entry(state.status)
+
+    monkeypatch.setattr(inline_auction, "_load_inline_auction_entry", fake_load)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_partial_queries_answer_without_lookup(loader) -> None:
+    full = f"auc_{_AUCTION_ID}"
+    for length in (3, 4, 12, len(full) - 5):
+        query = _InlineQueryStub(full[:length])
+        await inline_auction.handle_inline_auction_query(query)
+        assert query.answers == [([], 300, False)]
+
+    assert loader.calls == []
+
+
+@pytest.mark.asyncio
+async def test_repeated_queries_reuse_cached_entry_until_version_bump(loader) -> None:
+    seller_query = _InlineQueryStub(f"auc_{_AUCTION_ID}")
+    for _ in range(5):
+        await inline_auction.handle_inline_auction_query(seller_query)
+
+    assert len(loader.calls) == 1
+    results, cache_time, is_personal = seller_query.answers[-1]
+    assert [result.id for result in results] == [f"auc:{_AUCTION_ID}"]
+    assert (cache_time, is_personal) == (10, True)
+
+    stranger_query = _InlineQueryStub(f"auc_{_AUCTION_ID}", tg_user_id=777)
+    await inline_auction.handle_inline_auction_query(stranger_query)
+    assert stranger_query.answers == [([], 10, True)]
+    assert len(loader.calls) == 1
+
+    loader.status = "ACTIVE"
+    await bump_inline_auction_version(_AUCTION_ID)
+    after_bump = _InlineQueryStub(f"auc_{_AUCTION_ID}")
+    await inline_auction.handle_inline_auction_query(after_bump)
+
+    assert len(loader.calls) == 2
+    assert after_bump.answers == [([], 10, True)]
+
+
+@pytest.mark.asyncio
+async def test_entry_is_not_served_again_after_version_key_expires(loader) -> None:
+    redis = inline_query_cache_service.redis_client
+    version_key = f"inline:auction:{_AUCTION_ID}:version"
+
+    await bump_inline_auction_version(_AUCTION_ID)
+    first_version = redis.values[version_key]
+    await inline_auction.handle_inline_auction_query(_InlineQueryStub(f"auc_{_AUCTION_ID}"))
+    await bump_inline_auction_version(_AUCTION_ID)
+    assert redis.values[version_key] != first_version
+
+    # The version key expired; the entry stored under the first version must not match.
+    del redis.values[version_key]
+    await inline_auction.handle_inline_auction_query(_InlineQueryStub(f"auc_{_AUCTION_ID}"))
+
+    assert len(loader.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_loads_every_query(monkeypatch, loader) -> None:
+    monkeypatch.setattr(inline_auction.settings, "inline_query_cache_ttl_seconds", 0)
+
+    for _ in range(3):
+        await inline_auction.handle_inline_auction_query(_InlineQueryStub(f"auc_{_AUCTION_ID}"))
+
+    assert len(loader.calls) == 3
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 from aiogram.fsm.storage.redis import RedisEventIsolation, RedisStorage
 
+from app.bot.fsm_storage import UpdateScopedEventIsolation, UpdateScopedStorage
 from app.main import build_dispatcher
 
 
@@ -11,7 +12,11 @@ async def test_build_dispatcher_uses_redis_storage_and_event_isolation() -> None
     dp = build_dispatcher()
 
     try:
-        assert isinstance(dp.storage, RedisStorage)
-        assert isinstance(dp.fsm.events_isolation, RedisEventIsolation)
+        assert isinstance(dp.storage, UpdateScopedStorage)
+        assert isinstance(dp.storage.backend, RedisStorage)
+        assert isinstance(dp.fsm.events_isolation, UpdateScopedEventIsolation)
+        assert isinstance(dp.fsm.events_isolation.backend, RedisEventIsolation)
+        assert dp.fsm.events_isolation.storage is dp.storage
     finally:
         await dp.fsm.close()
+
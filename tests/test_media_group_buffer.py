@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.infra.media_group_buffer import MediaGroupBuffer
+
+
+@pytest.mark.asyncio
+async def test_album_flushes_once_after_quiet_window() -> None:
+    buffer = MediaGroupBuffer()
+    flushed: list[list[str]] = []
+
+    async def _on_flush(items: list[str]) -> None:
+        flushed.append(items)
+
+    assert buffer.add("chat", "album", message_id=12, item="b") is True
+    buffer.schedule("chat", "album", _on_flush, window_seconds=0.05)
+    await asyncio.sleep(0.03)
+    assert buffer.add("chat", "album", message_id=11, item="a") is False
+    assert buffer.add("chat", "album", message_id=12, item="duplicate") is False
+    await asyncio.sleep(0.03)
+    assert flushed == []
+
+    for _ in range(50):
+        if flushed:
+            break
+        await asyncio.sleep(0.01)
+
+    assert flushed == [["a", "b"]]
+    assert buffer.pending_albums == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_scope_delivers_only_that_scope_and_discard_drops_album() -> None:
+    buffer = MediaGroupBuffer()
+    flushed: list[tuple[str, list[str]]] = []
+
+    def _collector(name: str):
+        async def _on_flush(items: list[str]) -> None:
+            flushed.append((name, items))
+
+        return _on_flush
+
+    for scope, group in (("chat-1", "a"), ("chat-1", "b"), ("chat-2", "c"), ("chat-2", "d")):
+        buffer.add(scope, group, message_id=1, item=f"{group}-1")
+        buffer.schedule(scope, group, _collector(group), window_seconds=60)
+    buffer.discard("chat-2", "d")
+
+    assert await buffer.flush_scope("chat-1") == 2
+    assert sorted(flushed) == [("a", ["a-1"]), ("b", ["b-1"])]
+
+    await buffer.stop()
+    assert sorted(flushed) == [("a", ["a-1"]), ("b", ["b-1"]), ("c", ["c-1"])]
+    assert buffer.pending_albums == 0
+
+
+@pytest.mark.asyncio
+async def test_timed_flush_waits_for_guard_held_by_a_handler() -> None:
+    buffer = MediaGroupBuffer()
+    lock = asyncio.Lock()
+    flushed: list[tuple[bool, list[str]]] = []
+
+    async def _on_flush(items: list[str]) -> None:
+        flushed.append((lock.locked(), items))
+
+    buffer.add("chat", "album", message_id=1, item="a")
+    buffer.schedule("chat", "album", _on_flush, window_seconds=0.01, guard=lambda: lock)
+
+    # A handler holds the wizard lock past the quiet window and flushes the album itself.
+    async with lock:
+        await asyncio.sleep(0.05)
+        assert flushed == []
+        assert await buffer.flush_scope("chat") == 1
+    await asyncio.sleep(0.02)
+
+    assert flushed == [(True, ["a"])]
+
+    buffer.add("chat", "album-2", message_id=2, item="b")
+    buffer.schedule("chat", "album-2", _on_flush, window_seconds=0.01, guard=lambda: lock)
+    for _ in range(50):
+        if len(flushed) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert flushed[1] == (True, ["b"])
+    assert buffer.pending_albums == 0
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiogram.methods import SendMessage
+from aiogram.types import Update
+
+from app.bot.middlewares import TelegramApiMetricsMiddleware, UpdateMetricsMiddleware
+from app.db.pool_metrics import DatabasePoolSnapshot
+from app.infra import metrics as metrics_module
+from app.infra.metrics import MetricsRegistry, count_db_queries
+
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = MetricsRegistry(enabled=False)
+    histogram = registry.histogram("test_seconds", "Test latency.", ("phase",))
+    counter = registry.counter("test_total", "Test counter.", ("kind",))
+
+    histogram.observe(0.2, phase="upsert")
+    counter.inc(kind="x")
+    with histogram.time(phase="notify"):
+        pass
+
+    assert registry.render() == (
+        "# HELP test_seconds Test latency.\n"
+        "# TYPE test_seconds histogram\n"
+        "# HELP test_total Test counter.\n"
+        "# TYPE test_total counter\n"
+    )
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry(enabled=True)
+    histogram = registry.histogram("test_seconds", "Test latency.", ("phase",), buckets=(0.1, 1.0))
+
+    histogram.observe(0.05, phase="upsert")
+    histogram.observe(0.5, phase="upsert")
+    histogram.observe(3.0, phase="upsert")
+
+    rendered = registry.render()
+
+    assert 'test_seconds_bucket{phase="upsert",le="0.1"} 1' in rendered
+    assert 'test_seconds_bucket{phase="upsert",le="1"} 2' in rendered
+    assert 'test_seconds_bucket{phase="upsert",le="+Inf"} 3' in rendered
+    assert 'test_seconds_sum{phase="upsert"} 3.55' in rendered
+    assert 'test_seconds_count{phase="upsert"} 3' in rendered
+
+
+def test_counter_escapes_label_values_and_rejects_wrong_labels() -> None:
+    registry = MetricsRegistry(enabled=True)
+    counter = registry.counter("test_total", "Test counter.", ("error",))
+
+    counter.inc(error='Bad "quote"')
+    counter.inc(2, error='Bad "quote"')
+
+    assert 'test_total{error="Bad \\"quote\\""} 3' in registry.render()
+    with pytest.raises(ValueError):
+        counter.inc(kind="x")
+
+
+def test_count_db_queries_only_counts_inside_scope() -> None:
+    metrics_module._count_cursor_execute(None, None, "SELECT 1", None, None, False)
+
+    with count_db_queries() as queries:
+        metrics_module._count_cursor_execute(None, None, "SELECT 1", None, None, False)
+        metrics_module._count_cursor_execute(None, None, "SELECT 2", None, None, False)
+
+    assert queries.count == 2
+
+
+def test_render_collects_database_pool_gauges(monkeypatch) -> None:
+    snapshot = DatabasePoolSnapshot(
+        bind="primary",
+        process_role="bot",
+        pool_size=5,
+        max_overflow=10,
+        checked_out=7,
+        overflow=2,
+        checkouts_total=40,
+        checkout_timeouts_total=0,
+        checkout_wait_avg_ms=12.5,
+        checkout_wait_max_ms=250.0,
+    )
+    monkeypatch.setattr(metrics_module.REGISTRY, "enabled", True)
+    monkeypatch.setattr("app.db.session.load_database_pool_snapshots", lambda: (snapshot,))
+
+    rendered = metrics_module.REGISTRY.render()
+
+    labels = '{bind="primary",process_role="bot"}'
+    assert f"liteauction_db_pool_connections_in_use{labels} 7" in rendered
+    assert f"liteauction_db_pool_overflow{labels} 2" in rendered
+    assert f"liteauction_db_pool_capacity{labels} 15" in rendered
+    assert f"liteauction_db_pool_checkout_wait_avg_seconds{labels} 0.0125" in rendered
+    assert f"liteauction_db_pool_checkout_wait_max_seconds{labels} 0.25" in rendered
+
+
+@pytest.mark.asyncio
+async def test_update_middleware_observes_queries_per_update(monkeypatch) -> None:
+    registry = MetricsRegistry(enabled=True)
+    queries_histogram = registry.histogram("q", "q", ("update_type",), buckets=(1, 5))
+    seconds_histogram = registry.histogram("s", "s", ("update_type",))
+    monkeypatch.setattr("app.bot.middlewares.REGISTRY", registry)
+    monkeypatch.setattr("app.bot.middlewares.DB_QUERIES_PER_UPDATE", queries_histogram)
+    monkeypatch.setattr("app.bot.middlewares.UPDATE_HANDLING_SECONDS", seconds_histogram)
+
+    async def _handler(event, data):
+        for _ in range(3):
+            metrics_module._count_cursor_execute(None, None, "SELECT 1", None, None, False)
+        return "handled"
+
+    update = Update.model_validate(
+        {
+            "update_id": 1,
+            "callback_query": {
+                "id": "cb",
+                "from": {"id": 10, "is_bot": False, "first_name": "A"},
+                "chat_instance": "ci",
+                "data": "bid:x",
+            },
+        }
+    )
+
+    assert await UpdateMetricsMiddleware()(_handler, update, {}) == "handled"
+    assert 'q_bucket{update_type="callback_query",le="5"} 1' in registry.render()
+    assert 'q_sum{update_type="callback_query"} 3' in registry.render()
+    assert 's_count{update_type="callback_query"} 1' in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_telegram_api_middleware_counts_errors_by_method(monkeypatch) -> None:
+    registry = MetricsRegistry(enabled=True)
+    seconds_histogram = registry.histogram("tg_seconds", "tg", ("method",))
+    errors_counter = registry.counter("tg_errors_total", "tg", ("method", "error"))
+    monkeypatch.setattr("app.bot.middlewares.REGISTRY", registry)
+    monkeypatch.setattr("app.bot.middlewares.TELEGRAM_API_SECONDS", seconds_histogram)
+    monkeypatch.setattr("app.bot.middlewares.TELEGRAM_API_ERRORS_TOTAL", errors_counter)
+
+    async def _failing_request(bot, method):
+        raise TimeoutError("slow")
+
+    with pytest.raises(TimeoutError):
+        await TelegramApiMetricsMiddleware()(_failing_request, None, SendMessage(chat_id=1, text="x"))
+
+    rendered = registry.render()
+    assert 'tg_errors_total{method="sendMessage",error="TimeoutError"} 1' in rendered
+    assert 'tg_seconds_count{method="sendMessage"} 1' in rendered
+
+
+@pytest.mark.asyncio
+async def test_metrics_http_server_serves_prometheus_text(monkeypatch) -> None:
+    registry = MetricsRegistry(enabled=True)
+    registry.counter("served_total", "Served.").inc()
+    monkeypatch.setattr(metrics_module, "REGISTRY", registry)
+    monkeypatch.setattr(metrics_module.settings, "metrics_bind_host", "127.0.0.1")
+    monkeypatch.setattr(metrics_module.settings, "metrics_port", 0)
+    monkeypatch.setattr(metrics_module.settings, "metrics_auth_token", "secret")
+
+    server = await metrics_module.start_metrics_http_server()
+    assert server is not None
+    port = server.sockets[0].getsockname()[1]
+
+    async def _get(path: str, *, token: str | None) -> str:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        headers = f"Authorization: Bearer {token}\r\n" if token else ""
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n{headers}\r\n".encode())
+        await writer.drain()
+        payload = (await reader.read()).decode()
+        writer.close()
+        return payload
+
+    try:
+        ok = await _get("/metrics", token="secret")
+        denied = await _get("/metrics", token=None)
+        missing = await _get("/other", token="secret")
+    finally:
+        await metrics_module.stop_metrics_http_server(server)
+
+    assert ok.startswith("HTTP/1.1 200 OK")
+    assert "served_total 1" in ok
+    assert denied.startswith("HTTP/1.1 401")
+    assert missing.startswith("HTTP/1.1 404")
+
+
+@pytest.mark.asyncio
+async def test_metrics_http_server_is_not_started_when_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(metrics_module, "REGISTRY", MetricsRegistry(enabled=False))
+
+    assert await metrics_module.start_metrics_http_server() is None
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.infra.metrics_buffer import RedisCounterBuffer
+from app.services import bot_funnel_metrics_service, notification_metrics_service
+from app.services.notification_policy_service import NotificationEventType
+
+
+class _PipelineStub:
+    def __init__(self, owner: _RedisPipelineStub) -> None:
+        self.owner = owner
+        self.commands: list[tuple] = []
+
+    async def __aenter__(self) -> _PipelineStub:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def incrby(self, key: str, amount: int) -> _PipelineStub:
+        self.commands.append(("incrby", key, amount))
+        return self
+
+    def hincrby(self, key: str, field: str, amount: int) -> _PipelineStub:
+        self.commands.append(("hincrby", key, field, amount))
+        return self
+
+    def expire(self, key: str, ttl_seconds: int) -> _PipelineStub:
+        self.commands.append(("expire", key, ttl_seconds))
+        return self
+
+    async def execute(self) -> list[int]:
+        if self.owner.fail:
+            raise RuntimeError("redis down")
+        self.owner.executed.append(list(self.commands))
+        return [1] * len(self.commands)
+
+
+class _RedisPipelineStub:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.executed: list[list[tuple]] = []
+        self.transactions: list[bool] = []
+
+    def pipeline(self, *, transaction: bool = True) -> _PipelineStub:
+        self.transactions.append(transaction)
+        return _PipelineStub(self)
+
+
+@pytest.mark.asyncio
+async def test_flush_merges_increments_into_one_pipeline() -> None:
+    redis_stub = _RedisPipelineStub()
+    buffer = RedisCounterBuffer(redis_stub)
+
+    buffer.incr("a", 1)
+    buffer.incr("a", 2)
+    buffer.incr("h", 1, field="x", expire_seconds=60)
+    buffer.incr("h", 1, field="x", expire_seconds=60)
+    buffer.incr("h", 5, field="y", expire_seconds=60)
+
+    assert await buffer.flush() == 3
+    assert redis_stub.transactions == [False]
+    assert redis_stub.executed == [
+        [("incrby", "a", 3), ("hincrby", "h", "x", 2), ("hincrby", "h", "y", 5), ("expire", "h", 60)]
+    ]
+    assert await buffer.flush() == 0
+    assert len(redis_stub.executed) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_up_to_key_limit() -> None:
+    redis_stub = _RedisPipelineStub(fail=True)
+    buffer = RedisCounterBuffer(redis_stub, max_pending_keys=2)
+
+    buffer.incr("a", 1)
+    buffer.incr("b", 1, expire_seconds=30)
+    buffer.incr("c", 1)
+    assert await buffer.flush() == 0
+    assert buffer.pending_keys == 2
+
+    buffer.incr("a", 4)
+    redis_stub.fail = False
+    assert await buffer.flush() == 2
+    assert redis_stub.executed == [[("incrby", "a", 5), ("incrby", "b", 1), ("expire", "b", 30)]]
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_increments() -> None:
+    redis_stub = _RedisPipelineStub()
+    buffer = RedisCounterBuffer(redis_stub)
+
+    buffer.start(interval_seconds=60)
+    assert buffer.is_running is True
+    buffer.incr("a", 1)
+    await buffer.stop()
+
+    assert buffer.is_running is False
+    assert redis_stub.executed == [[("incrby", "a", 1)]]
+
+
+@pytest.mark.asyncio
+async def test_flush_loop_writes_periodically() -> None:
+    redis_stub = _RedisPipelineStub()
+    buffer = RedisCounterBuffer(redis_stub)
+
+    buffer.start(interval_seconds=0.01)
+    buffer.incr("a", 1)
+    for _ in range(50):
+        if redis_stub.executed:
+            break
+        await asyncio.sleep(0.01)
+    await buffer.stop()
+
+    assert redis_stub.executed[0] == [("incrby", "a", 1)]
+
+
+@pytest.mark.asyncio
+async def test_funnel_and_notification_metrics_use_running_buffer(monkeypatch) -> None:
+    redis_stub = _RedisPipelineStub()
+    buffer = RedisCounterBuffer(redis_stub)
+    monkeypatch.setattr(bot_funnel_metrics_service, "metrics_buffer", buffer)
+    monkeypatch.setattr(notification_metrics_service, "metrics_buffer", buffer)
+
+    class _NoDirectRedis:
+        async def hincrby(self, key: str, field: str, count: int) -> int:
+            raise AssertionError("write-through while buffering")
+
+    monkeypatch.setattr(bot_funnel_metrics_service, "redis_client", _NoDirectRedis())
+    monkeypatch.setattr(notification_metrics_service, "redis_client", _NoDirectRedis())
+
+    buffer.start(interval_seconds=60)
+    try:
+        for _ in range(2):
+            total = await bot_funnel_metrics_service.record_bot_funnel_event(
+                journey=bot_funnel_metrics_service.BotFunnelJourney.BID,
+                step=bot_funnel_metrics_service.BotFunnelStep.START,
+                actor_role=bot_funnel_metrics_service.BotFunnelActorRole.BIDDER,
+                context_key="callback_bid_x1",
+            )
+            assert total is None
+        await notification_metrics_service.record_notification_sent(
+            event_type=NotificationEventType.AUCTION_OUTBID,
+        )
+    finally:
+        await buffer.stop()
+
+    commands = redis_stub.executed[0]
+    assert ("hincrby", "bot:funnel:totals", "bid:start:bidder:callback_bid_x1:ok", 2) in commands
+    assert ("hincrby", "notif:metrics:totals", "sent:auction_outbid:delivered", 1) in commands
+    hourly = [command for command in commands if command[1].startswith("notif:metrics:hourly:")]
+    assert [command[0] for command in hourly] == ["hincrby", "expire"]
+    assert hourly[0][2] == "sent:auction_outbid:delivered"
+    assert hourly[1][2] == notification_metrics_service._METRIC_HOURLY_RETENTION_SECONDS
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 import fnmatch
 import logging
 
 import pytest
+from redis.exceptions import WatchError
 
 from app.services import notification_metrics_service
 from app.services.notification_policy_service import NotificationEventType
@@ -14,11 +16,11 @@ class _RedisIncrStub:
     def __init__(self, *, total: int = 1, fail: bool = False) -> None:
         self.total = total
         self.fail = fail
-        self.calls: list[tuple[str, int]] = []
+        self.calls: list[tuple[str, str, int]] = []
         self.expire_calls: list[tuple[str, int]] = []
 
-    async def incrby(self, key: str, count: int) -> int:
-        self.calls.append((key, count))
+    async def hincrby(self, key: str, field: str, count: int) -> int:
+        self.calls.append((key, field, count))
         if self.fail:
             raise RuntimeError("boom")
         return self.total
@@ -28,25 +30,99 @@ class _RedisIncrStub:
         return True
 
 
+class _PipelineStub:
+    def __init__(self, owner: _RedisSnapshotStub) -> None:
+        self.owner = owner
+        self.commands: list[tuple] = []
+        self.watched: dict[str, str | None] = {}
+
+    async def __aenter__(self) -> _PipelineStub:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def hgetall(self, key: str) -> _PipelineStub:
+        self.commands.append(("hgetall", key))
+        return self
+
+    def hincrby(self, key: str, field: str, amount: int) -> _PipelineStub:
+        self.commands.append(("hincrby", key, field, amount))
+        return self
+
+    def expire(self, key: str, ttl_seconds: int) -> _PipelineStub:
+        self.commands.append(("expire", key, ttl_seconds))
+        return self
+
+    def delete(self, key: str) -> _PipelineStub:
+        self.commands.append(("delete", key))
+        return self
+
+    async def watch(self, *keys: str) -> None:
+        self.watched = {key: self.owner.strings.get(key) for key in keys}
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return await self.owner.mget(keys)
+
+    def multi(self) -> None:
+        self.commands = []
+
+    async def execute(self) -> list:
+        if self.owner.before_exec is not None:
+            self.owner.before_exec()
+            self.owner.before_exec = None
+        if any(self.owner.strings.get(key) != value for key, value in self.watched.items()):
+            self.commands, self.watched = [], {}
+            raise WatchError("watched key changed")
+        if self.owner.fail:
+            raise RuntimeError("redis boom")
+        results: list = []
+        for command in self.commands:
+            name, key = command[0], command[1]
+            if name == "hgetall":
+                results.append(dict(self.owner.hashes.get(key, {})))
+            elif name == "hincrby":
+                fields = self.owner.hashes.setdefault(key, {})
+                fields[command[2]] = str(int(fields.get(command[2], 0)) + command[3])
+                results.append(int(fields[command[2]]))
+            elif name == "expire":
+                self.owner.ttls[key] = command[2]
+                results.append(True)
+            else:
+                results.append(int(self.owner.strings.pop(key, None) is not None))
+        return results
+
+
 class _RedisSnapshotStub:
-    def __init__(self, entries: dict[str, str] | None = None, *, fail_scan: bool = False) -> None:
-        self.entries = entries or {}
-        self.fail_scan = fail_scan
-        self.scan_calls: list[tuple[int | str, str, int]] = []
-        self.mget_calls: list[tuple[str, ...]] = []
-
-    async def scan(self, *, cursor: int | str, match: str, count: int) -> tuple[int, list[str]]:
-        self.scan_calls.append((cursor, match, count))
-        if self.fail_scan:
-            raise RuntimeError("scan boom")
+    def __init__(
+        self,
+        hashes: dict[str, dict[str, str]] | None = None,
+        *,
+        strings: dict[str, str] | None = None,
+        ttls: dict[str, int] | None = None,
+        fail: bool = False,
+    ) -> None:
+        self.hashes = hashes or {}
+        self.strings = strings or {}
+        self.ttls = ttls or {}
+        self.fail = fail
+        self.transactions: list[bool] = []
+        self.before_exec: Callable[[], None] | None = None
+
+    def pipeline(self, *, transaction: bool = True) -> _PipelineStub:
+        self.transactions.append(transaction)
+        return _PipelineStub(self)
+
+    async def scan(self, *, cursor: int | str, match: str, count: int) -> tuple[int, list[str]]:  # noqa: ARG002
         if int(cursor) != 0:
             return 0, []
-        keys = [key for key in self.entries if fnmatch.fnmatch(key, match)]
-        return 0, keys
+        return 0, [key for key in [*self.strings, *self.hashes] if fnmatch.fnmatch(key, match)]
 
     async def mget(self, keys: list[str]) -> list[str | None]:
-        self.mget_calls.append(tuple(keys))
-        return [self.entries.get(key) for key in keys]
+        return [self.strings.get(key) for key in keys]
+
+    async def ttl(self, key: str) -> int:
+        return self.ttls.get(key, -1)
 
 
 def _alert_codes(snapshot: notification_metrics_service.NotificationMetricsSnapshot) -> set[notification_metrics_service.NotificationAlertCode]:
@@ -64,10 +140,9 @@ async def test_record_notification_sent_increments_counter_with_normalized_reaso
     )
 
     assert total == 7
-    assert redis_stub.calls[0] == ("notif:metrics:sent:auction_outbid:delivered_ok", 1)
-    assert redis_stub.calls[1][0].startswith("notif:metrics:h:")
-    assert redis_stub.calls[1][0].endswith(":sent:auction_outbid:delivered_ok")
-    assert redis_stub.calls[1][1] == 1
+    assert redis_stub.calls[0] == ("notif:metrics:totals", "sent:auction_outbid:delivered_ok", 1)
+    assert redis_stub.calls[1][0].startswith("notif:metrics:hourly:")
+    assert redis_stub.calls[1][1:] == ("sent:auction_outbid:delivered_ok", 1)
     assert redis_stub.expire_calls == [
         (redis_stub.calls[1][0], notification_metrics_service._METRIC_HOURLY_RETENTION_SECONDS),
     ]
@@ -85,10 +160,9 @@ async def test_record_notification_aggregated_uses_count(monkeypatch) -> None:
     )
 
     assert total == 9
-    assert redis_stub.calls[0] == ("notif:metrics:aggregated:auction_outbid:debounce_gate", 3)
-    assert redis_stub.calls[1][0].startswith("notif:metrics:h:")
-    assert redis_stub.calls[1][0].endswith(":aggregated:auction_outbid:debounce_gate")
-    assert redis_stub.calls[1][1] == 3
+    assert redis_stub.calls[0] == ("notif:metrics:totals", "aggregated:auction_outbid:debounce_gate", 3)
+    assert redis_stub.calls[1][0].startswith("notif:metrics:hourly:")
+    assert redis_stub.calls[1][1:] == ("aggregated:auction_outbid:debounce_gate", 3)
 
 
 @pytest.mark.asyncio
@@ -121,17 +195,29 @@ async def test_load_notification_metrics_snapshot_returns_totals_and_top_suppres
 
     redis_stub = _RedisSnapshotStub(
         {
-            "notif:metrics:sent:auction_outbid:delivered": "40",
-            "notif:metrics:suppressed:auction_outbid:blocked_master": "12",
-            "notif:metrics:suppressed:support:forbidden": "8",
-            "notif:metrics:aggregated:auction_outbid:debounce_gate": "20",
-            "notif:metrics:suppressed:support:bad_value": "oops",
-            "notif:metrics:unknown:support:bad": "9",
-            f"notif:metrics:h:{h_now}:sent:auction_outbid:delivered": "5",
-            f"notif:metrics:h:{h_minus_2}:suppressed:auction_outbid:blocked_master": "2",
-            f"notif:metrics:h:{h_minus_25}:aggregated:auction_outbid:debounce_gate": "4",
-            f"notif:metrics:h:{h_minus_160}:sent:support:delivered": "3",
-            f"notif:metrics:h:{h_minus_190}:suppressed:support:forbidden": "9",
+            "notif:metrics:totals": {
+                "sent:auction_outbid:delivered": "40",
+                "suppressed:auction_outbid:blocked_master": "12",
+                "suppressed:support:forbidden": "8",
+                "aggregated:auction_outbid:debounce_gate": "20",
+                "suppressed:support:bad_value": "oops",
+                "unknown:support:bad": "9",
+            },
+            f"notif:metrics:hourly:{h_now}": {
+                "sent:auction_outbid:delivered": "5",
+            },
+            f"notif:metrics:hourly:{h_minus_2}": {
+                "suppressed:auction_outbid:blocked_master": "2",
+            },
+            f"notif:metrics:hourly:{h_minus_25}": {
+                "aggregated:auction_outbid:debounce_gate": "4",
+            },
+            f"notif:metrics:hourly:{h_minus_160}": {
+                "sent:support:delivered": "3",
+            },
+            f"notif:metrics:hourly:{h_minus_190}": {
+                "suppressed:support:forbidden": "9",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -223,15 +309,21 @@ async def test_load_notification_metrics_snapshot_applies_event_and_reason_filte
 
     redis_stub = _RedisSnapshotStub(
         {
-            "notif:metrics:sent:auction_outbid:delivered": "10",
-            "notif:metrics:sent:support:delivered": "7",
-            "notif:metrics:suppressed:auction_outbid:blocked_master": "5",
-            "notif:metrics:suppressed:support:forbidden": "4",
-            "notif:metrics:aggregated:auction_outbid:debounce_gate": "3",
-            f"notif:metrics:h:{h_now}:sent:support:delivered": "2",
-            f"notif:metrics:h:{h_now}:suppressed:support:forbidden": "1",
-            f"notif:metrics:h:{h_now}:aggregated:auction_outbid:debounce_gate": "2",
-            f"notif:metrics:h:{h_minus_30}:suppressed:support:forbidden": "8",
+            "notif:metrics:totals": {
+                "sent:auction_outbid:delivered": "10",
+                "sent:support:delivered": "7",
+                "suppressed:auction_outbid:blocked_master": "5",
+                "suppressed:support:forbidden": "4",
+                "aggregated:auction_outbid:debounce_gate": "3",
+            },
+            f"notif:metrics:hourly:{h_now}": {
+                "sent:support:delivered": "2",
+                "suppressed:support:forbidden": "1",
+                "aggregated:auction_outbid:debounce_gate": "2",
+            },
+            f"notif:metrics:hourly:{h_minus_30}": {
+                "suppressed:support:forbidden": "8",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -294,12 +386,16 @@ async def test_load_notification_metrics_snapshot_delta_supports_positive_negati
 
     redis_stub = _RedisSnapshotStub(
         {
-            f"notif:metrics:h:{h_now}:sent:auction_outbid:delivered": "5",
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:blocked_master": "3",
-            f"notif:metrics:h:{h_now}:aggregated:auction_outbid:debounce_gate": "2",
-            f"notif:metrics:h:{h_prev}:sent:auction_outbid:delivered": "2",
-            f"notif:metrics:h:{h_prev}:suppressed:auction_outbid:blocked_master": "4",
-            f"notif:metrics:h:{h_prev}:aggregated:auction_outbid:debounce_gate": "2",
+            f"notif:metrics:hourly:{h_now}": {
+                "sent:auction_outbid:delivered": "5",
+                "suppressed:auction_outbid:blocked_master": "3",
+                "aggregated:auction_outbid:debounce_gate": "2",
+            },
+            f"notif:metrics:hourly:{h_prev}": {
+                "sent:auction_outbid:delivered": "2",
+                "suppressed:auction_outbid:blocked_master": "4",
+                "aggregated:auction_outbid:debounce_gate": "2",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -343,9 +439,11 @@ async def test_load_notification_metrics_snapshot_window_top_suppressed_sorting_
 
     redis_stub = _RedisSnapshotStub(
         {
-            f"notif:metrics:h:{h_now}:suppressed:support:forbidden": "5",
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:zzz": "5",
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:aaa": "5",
+            f"notif:metrics:hourly:{h_now}": {
+                "suppressed:support:forbidden": "5",
+                "suppressed:auction_outbid:zzz": "5",
+                "suppressed:auction_outbid:aaa": "5",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -382,8 +480,12 @@ async def test_load_notification_metrics_snapshot_emits_warning_delta_alert(monk
 
     redis_stub = _RedisSnapshotStub(
         {
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:blocked_master": "35",
-            f"notif:metrics:h:{h_prev}:suppressed:auction_outbid:blocked_master": "5",
+            f"notif:metrics:hourly:{h_now}": {
+                "suppressed:auction_outbid:blocked_master": "35",
+            },
+            f"notif:metrics:hourly:{h_prev}": {
+                "suppressed:auction_outbid:blocked_master": "5",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -401,12 +503,16 @@ async def test_load_notification_metrics_snapshot_emits_high_for_forbidden_bad_r
 
     redis_stub = _RedisSnapshotStub(
         {
-            f"notif:metrics:h:{h_now}:suppressed:support:forbidden": "4",
-            f"notif:metrics:h:{h_now}:suppressed:support:bad_request": "3",
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:blocked_master": "13",
-            f"notif:metrics:h:{h_prev}:suppressed:support:forbidden": "4",
-            f"notif:metrics:h:{h_prev}:suppressed:support:bad_request": "3",
-            f"notif:metrics:h:{h_prev}:suppressed:auction_outbid:blocked_master": "13",
+            f"notif:metrics:hourly:{h_now}": {
+                "suppressed:support:forbidden": "4",
+                "suppressed:support:bad_request": "3",
+                "suppressed:auction_outbid:blocked_master": "13",
+            },
+            f"notif:metrics:hourly:{h_prev}": {
+                "suppressed:support:forbidden": "4",
+                "suppressed:support:bad_request": "3",
+                "suppressed:auction_outbid:blocked_master": "13",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -424,8 +530,12 @@ async def test_load_notification_metrics_snapshot_emits_critical_alert(monkeypat
 
     redis_stub = _RedisSnapshotStub(
         {
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:blocked_master": "190",
-            f"notif:metrics:h:{h_prev}:suppressed:auction_outbid:blocked_master": "10",
+            f"notif:metrics:hourly:{h_now}": {
+                "suppressed:auction_outbid:blocked_master": "190",
+            },
+            f"notif:metrics:hourly:{h_prev}": {
+                "suppressed:auction_outbid:blocked_master": "10",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -443,14 +553,18 @@ async def test_load_notification_metrics_snapshot_no_alerts_when_thresholds_not_
 
     redis_stub = _RedisSnapshotStub(
         {
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:r1": "3",
-            f"notif:metrics:h:{h_now}:suppressed:auction_outbid:r2": "3",
-            f"notif:metrics:h:{h_now}:suppressed:support:r3": "2",
-            f"notif:metrics:h:{h_now}:suppressed:support:r4": "2",
-            f"notif:metrics:h:{h_prev}:suppressed:auction_outbid:r1": "3",
-            f"notif:metrics:h:{h_prev}:suppressed:auction_outbid:r2": "3",
-            f"notif:metrics:h:{h_prev}:suppressed:support:r3": "2",
-            f"notif:metrics:h:{h_prev}:suppressed:support:r4": "2",
+            f"notif:metrics:hourly:{h_now}": {
+                "suppressed:auction_outbid:r1": "3",
+                "suppressed:auction_outbid:r2": "3",
+                "suppressed:support:r3": "2",
+                "suppressed:support:r4": "2",
+            },
+            f"notif:metrics:hourly:{h_prev}": {
+                "suppressed:auction_outbid:r1": "3",
+                "suppressed:auction_outbid:r2": "3",
+                "suppressed:support:r3": "2",
+                "suppressed:support:r4": "2",
+            },
         }
     )
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
@@ -465,7 +579,7 @@ async def test_load_notification_metrics_snapshot_returns_empty_snapshot_on_redi
     monkeypatch,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
-    redis_stub = _RedisSnapshotStub(fail_scan=True)
+    redis_stub = _RedisSnapshotStub(fail=True)
     monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
     caplog.set_level(logging.WARNING)
 
@@ -491,3 +605,63 @@ async def test_load_notification_metrics_snapshot_returns_empty_snapshot_on_redi
     assert snapshot.top_suppressed == ()
     assert snapshot.alert_hints == ()
     assert "notification_metrics_snapshot_failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_notification_metric_keys_folds_strings_into_hashes(monkeypatch) -> None:
+    fixed_now = datetime(2026, 2, 18, 12, 30, tzinfo=timezone.utc)
+    h_now = fixed_now.strftime("%Y%m%d%H")
+    h_expired = (fixed_now - timedelta(hours=400)).strftime("%Y%m%d%H")
+
+    redis_stub = _RedisSnapshotStub(
+        {"notif:metrics:totals": {"sent:auction_outbid:delivered": "2"}},
+        strings={
+            "notif:metrics:sent:auction_outbid:delivered": "40",
+            "notif:metrics:suppressed:support:forbidden": "8",
+            f"notif:metrics:h:{h_now}:sent:auction_outbid:delivered": "5",
+            f"notif:metrics:h:{h_expired}:sent:auction_outbid:delivered": "9",
+            "notif:metrics:unknown:support:bad": "1",
+            "session:unrelated": "x",
+        },
+    )
+    monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
+
+    assert await notification_metrics_service.migrate_legacy_notification_metric_keys(
+        dry_run=True,
+        now_utc=fixed_now,
+    ) == 4
+    assert len(redis_stub.strings) == 6
+
+    migrated = await notification_metrics_service.migrate_legacy_notification_metric_keys(now_utc=fixed_now)
+
+    assert migrated == 4
+    assert redis_stub.transactions == [True]
+    assert redis_stub.strings == {"notif:metrics:unknown:support:bad": "1", "session:unrelated": "x"}
+    assert redis_stub.hashes["notif:metrics:totals"] == {
+        "sent:auction_outbid:delivered": "42",
+        "suppressed:support:forbidden": "8",
+    }
+    assert redis_stub.hashes[f"notif:metrics:hourly:{h_now}"] == {"sent:auction_outbid:delivered": "5"}
+    assert f"notif:metrics:hourly:{h_expired}" not in redis_stub.hashes
+    assert 0 < redis_stub.ttls[f"notif:metrics:hourly:{h_now}"] <= notification_metrics_service._METRIC_HOURLY_RETENTION_SECONDS + 3600
+
+    snapshot = await notification_metrics_service.load_notification_metrics_snapshot(now_utc=fixed_now)
+
+    assert snapshot.all_time.sent_total == 42
+    assert snapshot.last_24h.sent_total == 5
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_notification_metric_keys_keeps_increment_racing_with_batch(monkeypatch) -> None:
+    legacy_key = "notif:metrics:sent:auction_outbid:delivered"
+    redis_stub = _RedisSnapshotStub(strings={legacy_key: "40"})
+    monkeypatch.setattr(notification_metrics_service, "redis_client", redis_stub)
+
+    def _old_bot_increments() -> None:
+        redis_stub.strings[legacy_key] = "41"
+
+    redis_stub.before_exec = _old_bot_increments
+
+    assert await notification_metrics_service.migrate_legacy_notification_metric_keys() == 1
+    assert redis_stub.strings == {}
+    assert redis_stub.hashes["notif:metrics:totals"] == {"sent:auction_outbid:delivered": "41"}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from app.db.enums import IntegrationOutboxStatus
+from app.services.outbox_service import (
+    ClaimedOutboxEvent,
+    OutboxDeliveryContext,
+    OutboxJob,
+    OutboxRetryPolicy,
+    _outbox_result_values,
+    deliver_each,
+)
+
+_NOW = datetime(2026, 1, 1, tzinfo=UTC)
+_POLICY = OutboxRetryPolicy(max_attempts=3, base_seconds=5, max_seconds=60)
+
+
+def _job(*, attempts: int = 0, event_id: int = 1) -> OutboxJob:
+    event = ClaimedOutboxEvent(
+        id=event_id,
+        event_type="test.event",
+        payload={"n": event_id},
+        dedupe_key=f"test:{event_id}",
+        attempts=attempts,
+        created_at=_NOW,
+    )
+    return OutboxJob(event=event)
+
+
+def _retry_after(seconds: int) -> TelegramRetryAfter:
+    return TelegramRetryAfter(SendMessage(chat_id=1, text="x"), "Too Many Requests", seconds)
+
+
+@pytest.mark.asyncio
+async def test_deliver_each_bounds_concurrency_and_records_failures() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _handle(job: OutboxJob, _context: OutboxDeliveryContext) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            in_flight -= 1
+        if job.event.id == 3:
+            raise _retry_after(40)
+
+    jobs = [_job(event_id=event_id) for event_id in range(1, 6)]
+    context = OutboxDeliveryContext(bot=None, issue_client=None, semaphore=asyncio.Semaphore(2))
+    await deliver_each(_handle)(jobs, context)
+
+    assert max_in_flight == 2
+    assert [job.event.id for job in jobs if job.error is not None] == [3]
+    assert jobs[2].retry_after_seconds == 40
+
+
+def test_result_values_defer_rate_limits_without_spending_an_attempt() -> None:
+    job = _job(attempts=2)
+    job.fail(_retry_after(40))
+
+    values = _outbox_result_values(job, now=_NOW, policy=_POLICY)
+
+    assert values["status"] == IntegrationOutboxStatus.PENDING
+    assert values["attempts"] == 2
+    assert values["next_retry_at"] == _NOW + timedelta(seconds=40)
+
+
+def test_result_values_use_backoff_and_fail_after_max_attempts() -> None:
+    retried = _job(attempts=1)
+    retried.fail(RuntimeError("boom"))
+    exhausted = _job(attempts=2)
+    exhausted.fail(RuntimeError("boom"))
+
+    retried_values = _outbox_result_values(retried, now=_NOW, policy=_POLICY)
+    exhausted_values = _outbox_result_values(exhausted, now=_NOW, policy=_POLICY)
+
+    assert retried_values["next_retry_at"] == _NOW + timedelta(seconds=10)
+    assert exhausted_values["status"] == IntegrationOutboxStatus.FAILED
+    assert exhausted_values["last_error"] == "boom"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.services import outbox_watcher
+from app.services.outbox_service import OutboxLane
+
+
+class _IssueClientStub:
+    async def close(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_slow_background_batch_does_not_hold_back_realtime_lane(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "outbox_listen_enabled", False)
+    monkeypatch.setattr(settings, "outbox_watcher_interval_seconds", 1)
+    monkeypatch.setattr(outbox_watcher.GitHubApiIssueClient, "from_settings", classmethod(lambda cls: _IssueClientStub()))
+    background_started = asyncio.Event()
+    release_background = asyncio.Event()
+    realtime_runs: list[bool] = []
+
+    async def _process(*, bot, issue_client, lanes) -> int:
+        (lane,) = lanes
+        if lane == OutboxLane.BACKGROUND:
+            background_started.set()
+            await release_background.wait()
+        elif lane == OutboxLane.REALTIME and not realtime_runs:
+            await background_started.wait()
+            realtime_runs.append(not release_background.is_set())
+        return 0
+
+    monkeypatch.setattr(outbox_watcher, "process_pending_outbox_events", _process)
+
+    watcher = asyncio.create_task(outbox_watcher.run_outbox_watcher())
+    try:
+        for _ in range(50):
+            if realtime_runs:
+                break
+            await asyncio.sleep(0.01)
+        assert realtime_runs == [True]
+    finally:
+        release_background.set()
+        watcher.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await watcher
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from types import SimpleNamespace
 
 import pytest
-from aiogram.exceptions import TelegramBadRequest
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
 from aiogram.methods import SendPhoto
 
 from app.bot.handlers.publish_auction import (
     _chunk_photo_ids,
     _extract_publish_auction_id,
+    _publish_to_chats,
     _safe_delete_messages,
     _send_auction_album,
 )
 from app.bot.keyboards.auction import draft_publish_keyboard
+from app.config import settings
 
 
 def test_extract_publish_auction_id_parses_uuid() -> None:
@@ -100,3 +103,96 @@ async def test_safe_delete_messages_deduplicates_ids() -> None:
     await _safe_delete_messages(bot, chat_id=-100900, message_ids=[201, 201, 202])
 
     assert bot.deleted_messages == [(-100900, 201), (-100900, 202)]
+
+
+@pytest.mark.asyncio
+async def test_publish_to_chats_runs_chats_concurrently_under_send_budget(monkeypatch) -> None:
+    class _DummyBot:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.sends: list[tuple[int, str]] = []
+            self.deleted_messages: list[tuple[int, int]] = []
+            self._message_id = 0
+
+        async def _send(self, chat_id: int, kind: str) -> SimpleNamespace:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            self._message_id += 1
+            self.sends.append((chat_id, kind))
+            return SimpleNamespace(chat=SimpleNamespace(id=chat_id), message_id=self._message_id)
+
+        async def send_media_group(self, *, chat_id: int, media, message_thread_id: int | None = None):
+            _ = message_thread_id
+            return [await self._send(chat_id, f"album:{len(media)}")]
+
+        async def send_photo(self, *, chat_id: int, photo: str, **_kwargs):
+            if chat_id == -103:
+                raise TelegramBadRequest(method=SendPhoto(chat_id=chat_id, photo=photo), message="Bad Request: no rights")
+            return await self._send(chat_id, "post")
+
+        async def delete_message(self, *, chat_id: int, message_id: int) -> None:
+            self.deleted_messages.append((chat_id, message_id))
+
+    monkeypatch.setattr(settings, "auction_publish_send_concurrency", 2)
+    monkeypatch.setattr("app.bot.handlers.publish_auction.render_auction_caption", lambda *_args, **_kwargs: "lot")
+    view = SimpleNamespace(
+        auction=SimpleNamespace(id=uuid.uuid4(), photo_file_id="photo-0", min_step=5, buyout_price=None),
+    )
+    bot = _DummyBot()
+
+    results = await _publish_to_chats(
+        bot,
+        [(-101, None), (-102, 7), (-103, None)],
+        view=view,
+        photo_ids=[f"photo-{idx}" for idx in range(12)],
+    )
+
+    assert bot.max_in_flight == 2
+    for chat_id in (-101, -102):
+        assert [kind for sent_chat_id, kind in bot.sends if sent_chat_id == chat_id] == ["album:10", "album:2", "post"]
+    assert [result.post is not None for result in results] == [True, True, False]
+    assert isinstance(results[2].error, TelegramBadRequest)
+    assert len(results[0].message_ids()) == 3
+    assert sorted(chat_id for chat_id, _message_id in bot.deleted_messages) == [-103, -103]
+
+
+@pytest.mark.asyncio
+async def test_publish_to_chats_keeps_going_when_one_chat_is_rate_limited(monkeypatch) -> None:
+    class _DummyBot:
+        def __init__(self) -> None:
+            self.deleted_messages: list[tuple[int, int]] = []
+            self._message_id = 0
+
+        async def send_photo(self, *, chat_id: int, photo: str, **_kwargs):
+            if chat_id == -102:
+                raise TelegramRetryAfter(
+                    method=SendPhoto(chat_id=chat_id, photo=photo),
+                    message="Too Many Requests",
+                    retry_after=5,
+                )
+            if chat_id == -103:
+                raise RuntimeError("connection reset")
+            self._message_id += 1
+            return SimpleNamespace(chat=SimpleNamespace(id=chat_id), message_id=self._message_id)
+
+        async def delete_message(self, *, chat_id: int, message_id: int) -> None:
+            self.deleted_messages.append((chat_id, message_id))
+
+    monkeypatch.setattr("app.bot.handlers.publish_auction.render_auction_caption", lambda *_args, **_kwargs: "lot")
+    view = SimpleNamespace(
+        auction=SimpleNamespace(id=uuid.uuid4(), photo_file_id="photo-0", min_step=5, buyout_price=None),
+    )
+    bot = _DummyBot()
+
+    results = await _publish_to_chats(bot, [(-101, None), (-102, None)], view=view, photo_ids=["photo-0"])
+
+    assert [result.post is not None for result in results] == [True, False]
+    assert isinstance(results[1].error, TelegramRetryAfter)
+
+    # Anything that is not a Bot API error still aborts, but nothing is left behind.
+    with pytest.raises(RuntimeError):
+        await _publish_to_chats(bot, [(-101, None), (-103, None)], view=view, photo_ids=["photo-0"])
+    assert bot.deleted_messages == [(-101, 2)]
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
-from app.services.queue_sla_health_service import SLA_THRESHOLDS_BY_CONTEXT, decide_queue_sla_health
+from app.services.queue_sla_health_service import (
+    SLA_THRESHOLDS_BY_CONTEXT,
+    decide_queue_sla_health,
+    queue_sla_bucket_ranges,
+)
 
 
 def _now() -> datetime:
@@ -144,3 +148,50 @@ def test_decide_queue_sla_health_marks_invalid_timing_inputs() -> None:
     assert decision.fallback_applied is True
     assert "created_at_in_future" in decision.fallback_notes
     assert "deadline_before_created_at" in decision.fallback_notes
+
+
+def _in_range(value: datetime, bounds: tuple[datetime | None, datetime | None], *, upper_inclusive: bool) -> bool:
+    lower, upper = bounds
+    if upper_inclusive:
+        return (lower is None or value > lower) and (upper is None or value <= upper)
+    return (lower is None or value >= lower) and (upper is None or value < upper)
+
+
+def test_bucket_ranges_agree_with_row_classification_at_boundaries() -> None:
+    now = _now()
+    for queue_context, thresholds in SLA_THRESHOLDS_BY_CONTEXT.items():
+        ranges = queue_sla_bucket_ranges(queue_context, now=now)
+        deadline_offsets = [timedelta(0), thresholds.critical_window, thresholds.warning_window]
+        created_offsets = [thresholds.aging_fresh_max, thresholds.aging_aging_max, thresholds.aging_stale_max]
+        for offset in deadline_offsets:
+            for delta in (timedelta(seconds=-1), timedelta(0), timedelta(seconds=1)):
+                deadline_at = now + offset + delta
+                decision = decide_queue_sla_health(
+                    queue_context=queue_context,
+                    status="OPEN",
+                    created_at=now,
+                    deadline_at=deadline_at,
+                    now=now,
+                )
+                matches = [
+                    state
+                    for state in ("healthy", "warning", "critical", "overdue")
+                    if _in_range(deadline_at, ranges.deadline_range(state), upper_inclusive=True)
+                ]
+                assert matches == [decision.health_state]
+        for offset in created_offsets:
+            for delta in (timedelta(seconds=-1), timedelta(0), timedelta(seconds=1)):
+                created_at = now - offset + delta
+                decision = decide_queue_sla_health(
+                    queue_context=queue_context,
+                    status="OPEN",
+                    created_at=created_at,
+                    deadline_at=None,
+                    now=now,
+                )
+                matches = [
+                    bucket
+                    for bucket in ("fresh", "aging", "stale", "critical")
+                    if _in_range(created_at, ranges.created_range(bucket), upper_inclusive=False)
+                ]
+                assert matches == [decision.aging_bucket]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from app.config import settings
+from app.services.redemption_policy_service import (
+    BoostUtilityPolicy,
+    RedemptionDenialCode,
+    RedemptionPolicyEngine,
+    RedemptionSnapshot,
+    RedemptionUtility,
+)
+
+
+def _policy(**overrides) -> BoostUtilityPolicy:
+    values = {
+        "enabled": True,
+        "cost_points": 10,
+        "daily_limit": 2,
+        "used_today": 0,
+        "remaining_today": 2,
+        "cooldown_seconds": 0,
+        "cooldown_remaining_seconds": 0,
+    }
+    values.update(overrides)
+    return BoostUtilityPolicy(**values)
+
+
+def _snapshot(**overrides) -> RedemptionSnapshot:
+    values = {
+        "balance": 100,
+        "total_earned": 100,
+        "total_spent": 0,
+        "operations_count": 1,
+        "account_age_remaining_seconds": 0,
+        "cooldown_remaining_seconds": 0,
+        "used_today": 0,
+        "used_this_week": 0,
+        "spent_today": 0,
+        "spent_this_week": 0,
+        "spent_this_month": 0,
+        "utilities": {utility: _policy() for utility in RedemptionUtility},
+    }
+    values.update(overrides)
+    return RedemptionSnapshot(**values)
+
+
+@pytest.fixture
+def open_limits(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "points_redemption_enabled", True)
+    monkeypatch.setattr(settings, "points_redemption_min_earned_points", 0)
+    monkeypatch.setattr(settings, "points_redemption_daily_limit", 0)
+    monkeypatch.setattr(settings, "points_redemption_weekly_limit", 0)
+    monkeypatch.setattr(settings, "points_redemption_daily_spend_cap", 0)
+    monkeypatch.setattr(settings, "points_redemption_weekly_spend_cap", 0)
+    monkeypatch.setattr(settings, "points_redemption_monthly_spend_cap", 0)
+    monkeypatch.setattr(settings, "points_redemption_min_balance", 0)
+
+
+def test_evaluate_allows_when_no_limit_is_hit(open_limits) -> None:
+    decision = RedemptionPolicyEngine().evaluate(_snapshot(), utility=RedemptionUtility.APPEAL)
+
+    assert decision.allowed is True
+    assert decision.code is None
+    assert decision.cost_points == 10
+
+
+def test_evaluate_reports_utility_limits_before_global_ones(monkeypatch, open_limits) -> None:
+    monkeypatch.setattr(settings, "points_redemption_daily_limit", 1)
+    snapshot = _snapshot(
+        used_today=1,
+        cooldown_remaining_seconds=30,
+        utilities={
+            **{utility: _policy() for utility in RedemptionUtility},
+            RedemptionUtility.FEEDBACK: _policy(cooldown_remaining_seconds=45),
+        },
+    )
+    engine = RedemptionPolicyEngine()
+
+    feedback = engine.evaluate(snapshot, utility=RedemptionUtility.FEEDBACK)
+    guarantor = engine.evaluate(snapshot, utility=RedemptionUtility.GUARANTOR)
+    without_global_limit = engine.evaluate(replace(snapshot, used_today=0), utility=RedemptionUtility.GUARANTOR)
+
+    assert feedback.code == RedemptionDenialCode.UTILITY_COOLDOWN
+    assert feedback.message == "Повторный буст фидбека доступен через 45 сек"
+    assert guarantor.code == RedemptionDenialCode.GLOBAL_DAILY_LIMIT
+    assert without_global_limit.code == RedemptionDenialCode.GLOBAL_COOLDOWN
+    assert without_global_limit.message == "Следующий буст доступен через 30 сек"
+
+
+def test_evaluate_spend_caps_account_for_boost_cost(monkeypatch, open_limits) -> None:
+    monkeypatch.setattr(settings, "points_redemption_weekly_spend_cap", 50)
+    engine = RedemptionPolicyEngine()
+
+    at_cap = engine.evaluate(_snapshot(spent_this_week=41), utility=RedemptionUtility.FEEDBACK)
+    under_cap = engine.evaluate(_snapshot(spent_this_week=40), utility=RedemptionUtility.FEEDBACK)
+
+    assert at_cap.code == RedemptionDenialCode.WEEKLY_SPEND_CAP
+    assert at_cap.message == "Достигнут глобальный недельный лимит списания на бусты (50 points)"
+    assert under_cap.allowed is True
+
+
+def test_evaluate_checks_account_age_and_min_balance(monkeypatch, open_limits) -> None:
+    monkeypatch.setattr(settings, "points_redemption_min_balance", 95)
+    engine = RedemptionPolicyEngine()
+
+    too_new = engine.evaluate(_snapshot(account_age_remaining_seconds=12), utility=RedemptionUtility.APPEAL)
+    low_balance = engine.evaluate(_snapshot(), utility=RedemptionUtility.APPEAL)
+
+    assert too_new.message == "Бусты станут доступны через 12 сек после регистрации"
+    assert low_balance.code == RedemptionDenialCode.MIN_BALANCE
+    assert low_balance.message == "Нужно сохранить минимум 95 points после буста (доступно 100)"
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.types import CallbackQuery, Update, User
+
+from benchmarks.telegram_stub_server import TelegramStubServer
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_handles_callback_against_stub_api() -> None:
+    router = Router()
+
+    @router.callback_query(F.data.startswith("bid:"))
+    async def _handle(callback: CallbackQuery, bot: Bot) -> None:
+        message = await bot.send_message(callback.from_user.id, "outbid")
+        assert message.chat.id == callback.from_user.id
+        assert await bot.edit_message_caption(inline_message_id="post-1", caption="new price") is True
+        await callback.answer("ok")
+
+    dp = Dispatcher()
+    dp.include_router(router)
+    update = Update(
+        update_id=1,
+        callback_query=CallbackQuery(
+            id="cb-1",
+            from_user=User(id=42, is_bot=False, first_name="Bidder"),
+            chat_instance="bench",
+            data="bid:lot:1",
+        ),
+    )
+
+    async with TelegramStubServer() as server:
+        bot = Bot(token="123456:stub", session=server.session())
+        try:
+            await dp.feed_update(bot, update)
+            assert (await bot.get_me()).username == "stub_bot"
+        finally:
+            await bot.session.close()
+
+    assert server.calls == {"sendMessage": 1, "editMessageCaption": 1, "answerCallbackQuery": 1, "getMe": 1}
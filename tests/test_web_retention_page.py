@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from starlette.requests import Request
+
+from app.db.models import RetentionRun
+from app.services.retention_service import (
+    RETENTION_POLICIES,
+    RetentionPolicyStatus,
+    RetentionTableSize,
+)
+from app.web.auth import AdminAuthContext
+from app.web.main import retention_page
+
+
+class _DummySessionFactoryCtx:
+    async def __aenter__(self):
+        return object()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+class _DummySessionFactory:
+    def __call__(self) -> _DummySessionFactoryCtx:
+        return _DummySessionFactoryCtx()
+
+
+def _make_request(path: str) -> Request:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": b"",
+        "headers": [],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    return Request(scope, receive)
+
+
+def _auth(role: str) -> AdminAuthContext:
+    return AdminAuthContext(
+        authorized=True,
+        via="token",
+        role=role,
+        can_manage=True,
+        scopes=frozenset(),
+        tg_user_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retention_page_lists_policy_runs_and_table_sizes(monkeypatch) -> None:
+    monkeypatch.setattr("app.web.main._auth_context_or_unauthorized", lambda _req: (None, _auth("owner")))
+    monkeypatch.setattr("app.web.main.SessionFactory", _DummySessionFactory())
+    finished_at = datetime(2026, 2, 25, 9, 0, tzinfo=UTC)
+
+    async def fake_overview(_session):
+        statuses = [
+            RetentionPolicyStatus(
+                policy=policy,
+                enabled=policy.name != "auction_history",
+                last_run=(
+                    RetentionRun(
+                        policy=policy.name,
+                        status="error",
+                        rows_affected=1200,
+                        batches=6,
+                        error="OperationalError: lock timeout",
+                        started_at=finished_at,
+                        finished_at=finished_at,
+                    )
+                    if policy.name == "outbox_done"
+                    else None
+                ),
+            )
+            for policy in RETENTION_POLICIES
+        ]
+        sizes = [RetentionTableSize(table="integration_outbox", total_bytes=3 * 1024 * 1024, estimated_rows=42000)]
+        return statuses, sizes
+
+    monkeypatch.setattr("app.web.main.load_retention_overview", fake_overview)
+
+    response = await retention_page(_make_request("/retention"))
+
+    assert response.status_code == 200
+    body = bytes(response.body).decode("utf-8")
+    assert "<code>preset_telemetry</code>" in body
+    assert "admin_queue_preset_telemetry_events" in body
+    assert "never run" in body
+    assert "error: OperationalError: lock timeout" in body
+    assert "<td>1200</td>" in body
+    assert "3.0 MB" in body
+    assert "~42000" in body
+
+
+@pytest.mark.asyncio
+async def test_retention_page_is_owner_only(monkeypatch) -> None:
+    monkeypatch.setattr("app.web.main._auth_context_or_unauthorized", lambda _req: (None, _auth("moderator")))
+
+    async def fail_overview(_session):
+        raise AssertionError("overview must not load for non-owners")
+
+    monkeypatch.setattr("app.web.main.load_retention_overview", fail_overview)
+
+    response = await retention_page(_make_request("/retention"))
+
+    assert response.status_code == 403